@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Throughput benchmark for TelemetryAnomalyDetector (IMP-PERF-025).
+
+Feeds synthetic phase outcomes through ``record_phase_outcome`` and reports
+the cost per recorded outcome and the memory the detector retains (measured
+with tracemalloc in a separate pass so tracing doesn't skew timings). The
+list-based implementation the streaming windows replaced is replayed on
+the same data for comparison.
+
+Usage:
+    python benchmarks/anomaly_detector_benchmark.py
+    python benchmarks/anomaly_detector_benchmark.py --outcomes 200000 --window 100
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import mean, quantiles
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from autopack.telemetry.anomaly_detector import TelemetryAnomalyDetector  # noqa: E402
+
+CHUNK_SIZE = 100_000
+
+
+class LegacyListDetector:
+    """Token/duration/failure checks as computed before IMP-PERF-025."""
+
+    def __init__(self, window_size: int):
+        self.window_size = window_size
+        self.token_history = {}
+        self.duration_history = {}
+        self.outcome_history = {}
+
+    def record_phase_outcome(self, key, success, tokens_used, duration_seconds):
+        if key not in self.token_history:
+            self.token_history[key] = []
+            self.duration_history[key] = []
+            self.outcome_history[key] = []
+        self.token_history[key].append(tokens_used)
+        self.duration_history[key].append(duration_seconds)
+        self.outcome_history[key].append(success)
+        for hist in (
+            self.token_history[key],
+            self.duration_history[key],
+            self.outcome_history[key],
+        ):
+            while len(hist) > self.window_size:
+                hist.pop(0)
+
+        alerts = 0
+        if len(self.token_history[key]) >= 5:
+            history = self.token_history[key][:-1]
+            if tokens_used > mean(history) * 2.0:
+                alerts += 1
+            history = self.duration_history[key][:-1]
+            if len(history) >= 5 and duration_seconds > quantiles(history, n=20)[18] * 1.5:
+                alerts += 1
+            outcomes = self.outcome_history[key]
+            if 1 - (sum(outcomes) / len(outcomes)) > 0.20:
+                alerts += 1
+        return alerts
+
+
+def synthetic_outcomes(count: int, keys: int, seed: int):
+    """Yield chunks of (phase_type, success, tokens, duration) tuples."""
+    rng = random.Random(seed)
+    phase_types = [f"phase_type_{i}" for i in range(keys)]
+    remaining = count
+    while remaining > 0:
+        size = min(CHUNK_SIZE, remaining)
+        remaining -= size
+        yield [
+            (
+                rng.choice(phase_types),
+                rng.random() > 0.1,
+                rng.randint(500, 5000) * (4 if rng.random() < 0.01 else 1),
+                rng.lognormvariate(3, 0.5),
+            )
+            for _ in range(size)
+        ]
+
+
+def _streaming_recorder(window: int):
+    detector = TelemetryAnomalyDetector(window_size=window)
+
+    def record(key, success, tokens, duration):
+        return len(detector.record_phase_outcome("phase", key, success, tokens, duration))
+
+    # Drain like the executor does, so pending alerts don't skew retained memory
+    return detector, record, detector.get_pending_alerts
+
+
+def _legacy_recorder(window: int):
+    detector = LegacyListDetector(window)
+    return detector, detector.record_phase_outcome, lambda: None
+
+
+def run(make_recorder, count: int, keys: int, window: int, seed: int) -> dict:
+    """Feed outcomes through a detector, timing only the record calls."""
+    detector, record, drain = make_recorder(window)
+    elapsed = 0.0
+    alerts = 0
+
+    for chunk in synthetic_outcomes(count, keys, seed):
+        start = time.perf_counter()
+        for key, success, tokens, duration in chunk:
+            alerts += record(key, success, tokens, duration)
+        elapsed += time.perf_counter() - start
+        drain()
+
+    return {"elapsed": elapsed, "alerts": alerts}
+
+
+def retained_bytes(make_recorder, count: int, keys: int, window: int, seed: int) -> int:
+    """Memory still held by a detector after recording count outcomes."""
+    tracemalloc.start()
+    detector, record, drain = make_recorder(window)
+    for chunk in synthetic_outcomes(count, keys, seed):
+        for key, success, tokens, duration in chunk:
+            record(key, success, tokens, duration)
+        drain()
+    del chunk
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def report(name: str, count: int, keys: int, result: dict) -> None:
+    """Print a one-block summary for a run."""
+    per_record_us = result["elapsed"] / count * 1e6
+    print(f"\n{name}:")
+    print(f"  - Time: {result['elapsed']:.2f}s ({per_record_us:.2f} us/outcome)")
+    print(f"  - Throughput: {count / result['elapsed']:,.0f} outcomes/s")
+    print(f"  - Alerts: {result['alerts']:,}")
+    if "retained_bytes" in result:
+        print(
+            f"  - Retained memory: {result['retained_bytes'] / 1024:.1f} KiB "
+            f"({result['retained_bytes'] / keys:.0f} bytes/key)"
+        )
+
+
+def main():
+    """Run the anomaly detector benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark TelemetryAnomalyDetector throughput")
+    parser.add_argument("--outcomes", type=int, default=1_000_000, help="Synthetic outcomes")
+    parser.add_argument("--keys", type=int, default=50, help="Distinct phase types")
+    parser.add_argument("--window", type=int, default=20, help="Detector window size")
+    parser.add_argument(
+        "--legacy-outcomes",
+        type=int,
+        default=200_000,
+        help="Outcomes replayed through the list-based reference (0 to skip)",
+    )
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    # Alerts are logged at WARNING; keep the measurement about the checks
+    logging.disable(logging.CRITICAL)
+
+    print("\n" + "=" * 70)
+    print("TELEMETRY ANOMALY DETECTOR BENCHMARK")
+    print("=" * 70)
+    print("\nTest Setup:")
+    print(f"  - Outcomes: {args.outcomes:,}")
+    print(f"  - Phase types: {args.keys}")
+    print(f"  - Window size: {args.window}")
+
+    try:
+        streaming = run(_streaming_recorder, args.outcomes, args.keys, args.window, args.seed)
+        streaming["retained_bytes"] = retained_bytes(
+            _streaming_recorder, CHUNK_SIZE, args.keys, args.window, args.seed
+        )
+        report("Streaming windows", args.outcomes, args.keys, streaming)
+
+        if args.legacy_outcomes:
+            count = min(args.legacy_outcomes, args.outcomes)
+            comparison = run(_streaming_recorder, count, args.keys, args.window, args.seed)
+            legacy = run(_legacy_recorder, count, args.keys, args.window, args.seed)
+            legacy["retained_bytes"] = retained_bytes(
+                _legacy_recorder, CHUNK_SIZE, args.keys, args.window, args.seed
+            )
+            report(f"List-based reference ({count:,} outcomes)", count, args.keys, legacy)
+
+            print("\n" + "=" * 70)
+            print("COMPARISON")
+            print("=" * 70)
+            speedup = legacy["elapsed"] / comparison["elapsed"] if comparison["elapsed"] else 0
+            print(f"  - Speedup on {count:,} outcomes: {speedup:.2f}x")
+            if comparison["alerts"] != legacy["alerts"]:
+                print(
+                    f"  - Alert count mismatch: {comparison['alerts']:,} streaming vs "
+                    f"{legacy['alerts']:,} list-based"
+                )
+                return 1
+            print("  - Alerts identical to list-based reference")
+    except Exception as e:
+        print(f"\nError running benchmarks: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
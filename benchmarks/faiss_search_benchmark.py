@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark script for FaissStore search latency.
+
+Measures per-query search latency as the collection grows, alongside the cost of
+the per-query reverse id map rebuild that FaissStore.search used to perform
+(IMP-PERF-009).
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from autopack.memory.faiss_store import FAISS_AVAILABLE, FaissStore
+
+DIM = 256
+COLLECTION_SIZES = [1_000, 5_000, 10_000, 25_000, 50_000]
+QUERIES_PER_SIZE = 200
+UPSERT_BATCH = 1_000
+
+
+def random_vector(rng: random.Random) -> list:
+    """Create a random query/document vector."""
+    return [rng.uniform(-1.0, 1.0) for _ in range(DIM)]
+
+
+def populate(store: FaissStore, collection: str, start: int, end: int, rng: random.Random) -> None:
+    """Upsert points [start, end) in batches."""
+    for batch_start in range(start, end, UPSERT_BATCH):
+        batch_end = min(batch_start + UPSERT_BATCH, end)
+        store.upsert(
+            collection,
+            [
+                {
+                    "id": f"point_{i}",
+                    "vector": random_vector(rng),
+                    "payload": {"project_id": f"project_{i % 10}", "n": i},
+                }
+                for i in range(batch_start, batch_end)
+            ],
+        )
+
+
+def time_queries(store: FaissStore, collection: str, queries: list) -> list:
+    """Return per-query latencies in milliseconds."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        store.search(collection, query, limit=5)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def time_legacy_reverse_map(store: FaissStore, collection: str, repeats: int = 20) -> float:
+    """Return the mean cost (ms) of rebuilding the reverse map from id_map per query."""
+    id_map = store._collections[collection]["id_map"]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        {v: k for k, v in id_map.items()}
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def benchmark_search_latency():
+    """Benchmark per-query latency vs collection size."""
+    print("\n" + "=" * 70)
+    print("BENCHMARK: FaissStore search latency vs collection size")
+    print("=" * 70)
+    print("\nTest Setup:")
+    print(f"  - Backend: {'faiss' if FAISS_AVAILABLE else 'in-memory fallback'}")
+    print(f"  - Vector dimension: {DIM}")
+    print(f"  - Queries per size: {QUERIES_PER_SIZE}")
+
+    rng = random.Random(42)
+    queries = [random_vector(rng) for _ in range(QUERIES_PER_SIZE)]
+
+    print(
+        f"\n{'points':>8} | {'p50 ms':>8} | {'p95 ms':>8} | {'mean ms':>8} | "
+        f"{'legacy rev-map ms':>17}"
+    )
+    print("-" * 62)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FaissStore(index_dir=tmpdir)
+        store.MAX_PAYLOAD_ENTRIES = max(COLLECTION_SIZES)
+        collection = "bench"
+        store.ensure_collection(collection, DIM)
+
+        populated = 0
+        for size in COLLECTION_SIZES:
+            populate(store, collection, populated, size, rng)
+            populated = size
+
+            latencies = sorted(time_queries(store, collection, queries))
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            legacy = time_legacy_reverse_map(store, collection)
+            print(
+                f"{size:>8} | {p50:>8.3f} | {p95:>8.3f} | "
+                f"{statistics.mean(latencies):>8.3f} | {legacy:>17.3f}"
+            )
+
+    print("\nThe last column is the per-query overhead removed by keeping rev_ids")
+    print("in step with id_map instead of rebuilding it on every search.")
+
+
+def main():
+    """Run all benchmarks."""
+    try:
+        benchmark_search_latency()
+    except Exception as e:
+        print(f"\nError running benchmarks: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
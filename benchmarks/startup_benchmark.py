@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for Autopack entry points (IMP-PERF-024).
+
+Imports each entry point in a fresh interpreter with ``python -X importtime``
+and reports the cumulative import time of the entry module, the slowest
+self-time imports, and whether importing created the database engine.
+
+Usage:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --runs 10 --json startup.json
+    python benchmarks/startup_benchmark.py --baseline startup.json --max-regression-pct 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Common entry points: the unified CLI, ``python -m autopack`` and the
+# modules every command/script pulls in.
+ENTRY_POINTS = [
+    "autopack.__main__",
+    "autopack.cli",
+    "autopack.models",
+    "autopack.database",
+]
+
+# Printed by the child after the import so we can tell whether importing
+# the entry point forced engine creation.
+_PROBE = (
+    "import sys; import {module}; "
+    "db = sys.modules.get('autopack.database'); "
+    "print('ENGINE_CREATED=' + str(db is not None and 'engine' in vars(db)))"
+)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Parse ``-X importtime`` output into {module: (self_us, cumulative_us)}."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure_entry_point(module: str) -> dict:
+    """Import module in a fresh interpreter and collect its import timings."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "unknown error"
+        raise RuntimeError(f"import {module} failed: {error}")
+
+    timings = parse_importtime(proc.stderr)
+    return {
+        "cumulative_ms": timings[module][1] / 1000,
+        "timings": timings,
+        "engine_created": "ENGINE_CREATED=True" in proc.stdout,
+    }
+
+
+def benchmark_entry_points(modules: list, runs: int, top: int) -> dict:
+    """Measure each entry point `runs` times and print a summary table."""
+    print("\n" + "=" * 70)
+    print("AUTOPACK STARTUP BENCHMARK (python -X importtime)")
+    print("=" * 70)
+    print(f"\nRuns per entry point: {runs}\n")
+    print(f"{'entry point':<22} | {'min ms':>8} | {'median ms':>9} | {'max ms':>8} | engine")
+    print("-" * 70)
+
+    results = {}
+    for module in modules:
+        samples = [measure_entry_point(module) for _ in range(runs)]
+        totals = [s["cumulative_ms"] for s in samples]
+        results[module] = {
+            "min_ms": min(totals),
+            "median_ms": statistics.median(totals),
+            "max_ms": max(totals),
+            "engine_created_on_import": any(s["engine_created"] for s in samples),
+        }
+        engine = "created" if results[module]["engine_created_on_import"] else "lazy"
+        print(
+            f"{module:<22} | {min(totals):>8.1f} | {statistics.median(totals):>9.1f} | "
+            f"{max(totals):>8.1f} | {engine}"
+        )
+
+        # Slowest self-time imports from the last sample
+        slowest = sorted(samples[-1]["timings"].items(), key=lambda kv: kv[1][0], reverse=True)
+        results[module]["slowest_imports"] = [
+            {"module": name, "self_ms": self_us / 1000} for name, (self_us, _) in slowest[:top]
+        ]
+
+    for module, result in results.items():
+        print(f"\nSlowest imports (self time) for {module}:")
+        for entry in result["slowest_imports"]:
+            print(f"  {entry['self_ms']:>8.1f} ms  {entry['module']}")
+
+    return results
+
+
+def compare_to_baseline(results: dict, baseline_path: Path, max_regression_pct: float) -> bool:
+    """Compare median cold-start times against a saved baseline.
+
+    Returns:
+        True if no entry point regressed by more than max_regression_pct.
+    """
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    print("\n" + "=" * 70)
+    print(f"COMPARISON WITH BASELINE ({baseline_path})")
+    print("=" * 70)
+
+    ok = True
+    for module, result in results.items():
+        if module not in baseline:
+            print(f"{module:<22} | no baseline")
+            continue
+        before = baseline[module]["median_ms"]
+        after = result["median_ms"]
+        change_pct = (after - before) / before * 100 if before > 0 else 0.0
+        regressed = change_pct > max_regression_pct
+        ok = ok and not regressed
+        marker = "REGRESSION" if regressed else "ok"
+        print(f"{module:<22} | {before:>8.1f} -> {after:>8.1f} ms ({change_pct:+.1f}%) {marker}")
+    return ok
+
+
+def main():
+    """Run the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Measure Autopack entry point cold-start time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument(
+        "--module",
+        action="append",
+        dest="modules",
+        help="Entry point module to measure (repeatable; default: common entry points)",
+    )
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --json output")
+    parser.add_argument(
+        "--max-regression-pct",
+        type=float,
+        default=20.0,
+        help="Fail if a median regresses by more than this percentage (default: 20)",
+    )
+    args = parser.parse_args()
+
+    try:
+        results = benchmark_entry_points(args.modules or ENTRY_POINTS, args.runs, args.top)
+    except Exception as e:
+        print(f"\nError running benchmarks: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return 1
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+
+    if args.baseline and not compare_to_baseline(results, args.baseline, args.max_regression_pct):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -680,6 +680,7 @@ class AnthropicBuilderClient:
         config: Optional[Any] = None,
         stop_reason: Optional[str] = None,
         was_truncated: bool = False,
+        ndjson_stream: Optional[Any] = None,
     ) -> BuilderResult:
         """
         Parse NDJSON format output (BUILD-129 Phase 3).
@@ -696,6 +697,8 @@ class AnthropicBuilderClient:
             config: Builder configuration
             stop_reason: Stop reason from API
             was_truncated: Whether output was truncated
+            ndjson_stream: NDJSONStreamPipeline that already consumed the streamed
+                output (IMP-PERF-030), or None to parse content in one pass
 
         Returns:
             BuilderResult with success/failure status
@@ -727,6 +730,7 @@ class AnthropicBuilderClient:
             stop_reason=stop_reason,
             was_truncated=was_truncated,
             fallback_structured_edit=fallback_structured_edit,
+            ndjson_stream=ndjson_stream,
         )
 
     def review_patch(
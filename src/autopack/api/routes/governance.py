@@ -77,6 +77,17 @@ async def approve_governance_request(
         if approved:
             success = approve_request(db, request_id, approved_by=user_id)
             status = "approved"
+            if success:
+                # IMP-PERF-020: Approved work can resume without waiting for the next poll
+                from autopack.executor.loop_wakeup import notify_loop_wakeup
+                from autopack.models import GovernanceRequest as GovernanceRequestDB
+
+                run_id = (
+                    db.query(GovernanceRequestDB.run_id)
+                    .filter(GovernanceRequestDB.request_id == request_id)
+                    .scalar()
+                )
+                notify_loop_wakeup("governance_approved", run_id=run_id)
         else:
             success = deny_request(db, request_id, denied_by=user_id)
             status = "denied"
@@ -20,7 +20,7 @@ from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 
 from autopack import models
-from autopack.database import engine, get_db, get_pool_health
+from autopack.database import get_db, get_engine, get_pool_health
 from autopack.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -392,7 +392,7 @@ def _check_schema_initialized() -> Dict[str, object]:
         Dict with 'ready' bool and 'details' about schema state
     """
     try:
-        inspector = inspect(engine)
+        inspector = inspect(get_engine())
         existing_tables = inspector.get_table_names()
 
         # Core tables that must exist for the app to function
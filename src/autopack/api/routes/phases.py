@@ -188,6 +188,12 @@ def update_phase_status(
     db.commit()
     db.refresh(phase)
 
+    # IMP-PERF-020: A (re-)queued phase is new work for a waiting executor loop
+    if phase.state == models.PhaseState.QUEUED:
+        from autopack.executor.loop_wakeup import notify_loop_wakeup
+
+        notify_loop_wakeup("phase_queued", run_id=run_id)
+
     return {"message": f"Phase {phase_id} updated to state {phase.state.value}", "phase": phase}
 
 
@@ -271,3 +271,53 @@ def validate_yaml_file(file_path: Path) -> Tuple[bool, Optional[str]]:
         return True, None
     except Exception as e:
         return False, f"Invalid YAML: {e}"
+
+
+def validate_file_content(file_path: str, content: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate in-memory file content before it is written.
+
+    IMP-PERF-031: Same checks as GovernedApplyPath._validate_applied_files
+    (merge conflict markers, then Python/JSON/YAML syntax by extension), run on
+    staged content instead of re-reading the file from disk.
+
+    Args:
+        file_path: Relative file path (used for the extension and messages)
+        content: File content to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    for line_num, line in enumerate(content.split("\n"), 1):
+        for marker in ("<<<<<<<", ">>>>>>>"):
+            if marker in line:
+                return False, f"Line {line_num}: merge conflict marker '{marker}' found"
+
+    suffix = Path(file_path).suffix
+    if suffix == ".py":
+        try:
+            compile(content, file_path, "exec")
+        except SyntaxError as e:
+            return False, f"Line {e.lineno}: {e.msg}"
+        except Exception as e:
+            return False, str(e)
+    elif suffix == ".json":
+        import json
+
+        try:
+            json.loads(content)
+        except json.JSONDecodeError as e:
+            return False, f"Invalid JSON: {e}"
+    elif suffix in (".yaml", ".yml"):
+        import yaml
+
+        # Allow leading comments without explicit document start by prepending '---'
+        stripped = content.lstrip()
+        if stripped.startswith("#") and not stripped.startswith("---"):
+            content = "---\n" + content
+        try:
+            yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            return False, f"Invalid YAML: {e}"
+
+    return True, None
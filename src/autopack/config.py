@@ -345,6 +345,16 @@ class Settings(BaseSettings):
         description="Enable git-based rollback on patch application failure",
     )
 
+    # IMP-PERF-031: Apply patches to an in-memory overlay, validate, then write atomically.
+    # Patches that cannot be applied exactly (fuzz, renames, binary) fall back to git apply.
+    governed_apply_staged_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_GOVERNED_APPLY_STAGED_ENABLED", "GOVERNED_APPLY_STAGED_ENABLED"
+        ),
+        description="Apply and validate patches in memory before writing, skipping git apply and backups",
+    )
+
     # BUILD-145 P2: Extended artifact-first substitution (opt-in, disabled by default)
     # When enabled, automatically pins run/tier/phase summaries as 'history pack' in context
     # and optionally substitutes large SOT docs with their summaries
@@ -505,6 +515,25 @@ class Settings(BaseSettings):
         description="Cheaper model for secondary auditor (optional)",
     )
 
+    # IMP-PERF-027: Hedged concurrent dual audit
+    # Launch the secondary auditor alongside the primary (after an optional hedge
+    # delay) instead of after it; the secondary is cancelled or discarded when the
+    # primary clears the early-exit threshold
+    dual_audit_concurrent: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("AUTOPACK_DUAL_AUDIT_CONCURRENT", "DUAL_AUDIT_CONCURRENT"),
+        description="Run primary and secondary auditors concurrently",
+    )
+
+    # Seconds to wait for the primary before launching the secondary (0 = together)
+    dual_audit_hedge_delay_seconds: float = Field(
+        default=0.0,
+        validation_alias=AliasChoices(
+            "AUTOPACK_DUAL_AUDIT_HEDGE_DELAY_SECONDS", "DUAL_AUDIT_HEDGE_DELAY_SECONDS"
+        ),
+        description="Hedge delay before launching the concurrent secondary auditor",
+    )
+
     # IMP-PERF-002: Context injection ceiling
     # Maximum total tokens for context injection across all phases in a run
     # Prevents unbounded context accumulation (1500 tokens/phase x 100 phases = 150K tokens)
@@ -666,6 +695,105 @@ class Settings(BaseSettings):
         description="Maximum number of phases to execute in parallel (default: 2, max: 4)",
     )
 
+    # IMP-PERF-019: Prefetch memory context for upcoming phases while others execute
+    context_prefetch_depth: int = Field(
+        default=4,
+        ge=0,
+        le=16,
+        validation_alias=AliasChoices("AUTOPACK_CONTEXT_PREFETCH_DEPTH", "CONTEXT_PREFETCH_DEPTH"),
+        description="Number of queued phases whose memory context is prefetched (0 disables)",
+    )
+
+    # IMP-PERF-022: Record LLM usage through a background batched writer
+    usage_buffer_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("AUTOPACK_USAGE_BUFFER_ENABLED", "USAGE_BUFFER_ENABLED"),
+        description="Queue LLM usage events and bulk-insert them off the LLM call path",
+    )
+    usage_buffer_flush_events: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        validation_alias=AliasChoices(
+            "AUTOPACK_USAGE_BUFFER_FLUSH_EVENTS", "USAGE_BUFFER_FLUSH_EVENTS"
+        ),
+        description="Flush buffered usage events once this many are queued",
+    )
+    usage_buffer_flush_interval_ms: int = Field(
+        default=500,
+        ge=10,
+        le=60000,
+        validation_alias=AliasChoices(
+            "AUTOPACK_USAGE_BUFFER_FLUSH_INTERVAL_MS", "USAGE_BUFFER_FLUSH_INTERVAL_MS"
+        ),
+        description="Maximum time a usage event waits in the buffer before being flushed",
+    )
+
+    # IMP-PERF-028: Content-addressed on-disk cache for LLM responses (opt-in)
+    llm_response_cache_enabled: bool = Field(
+        default=False,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_ENABLED", "LLM_RESPONSE_CACHE_ENABLED"
+        ),
+        description="Serve identical builder/auditor/doctor calls from an on-disk cache",
+    )
+    llm_response_cache_builder: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_BUILDER", "LLM_RESPONSE_CACHE_BUILDER"
+        ),
+        description="Cache builder responses when the response cache is enabled",
+    )
+    llm_response_cache_auditor: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_AUDITOR", "LLM_RESPONSE_CACHE_AUDITOR"
+        ),
+        description="Cache single-auditor responses when the response cache is enabled",
+    )
+    llm_response_cache_doctor: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_DOCTOR", "LLM_RESPONSE_CACHE_DOCTOR"
+        ),
+        description="Cache Doctor responses when the response cache is enabled",
+    )
+    llm_response_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=1,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_TTL_SECONDS", "LLM_RESPONSE_CACHE_TTL_SECONDS"
+        ),
+        description="Seconds a cached LLM response stays valid",
+    )
+    llm_response_cache_max_mb: int = Field(
+        default=256,
+        ge=1,
+        le=102400,
+        validation_alias=AliasChoices(
+            "AUTOPACK_LLM_RESPONSE_CACHE_MAX_MB", "LLM_RESPONSE_CACHE_MAX_MB"
+        ),
+        description="Size limit of the response cache; least recently used entries are evicted",
+    )
+
+    # IMP-PERF-029: Anthropic prompt caching for the builder's stable prompt prefix
+    anthropic_prompt_caching_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_ANTHROPIC_PROMPT_CACHING_ENABLED", "ANTHROPIC_PROMPT_CACHING_ENABLED"
+        ),
+        description="Mark the stable system/user prompt segments of Anthropic builder calls as cacheable",
+    )
+
+    # IMP-PERF-030: Parse, validate and stage NDJSON builder output while it streams
+    ndjson_streaming_apply_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "AUTOPACK_NDJSON_STREAMING_APPLY_ENABLED", "NDJSON_STREAMING_APPLY_ENABLED"
+        ),
+        description="Stage NDJSON operations as they stream and stop generation on the first bad operation",
+    )
+
     # IMP-REL-001: Multi-channel notification fallback configuration
     # Email notification settings (secondary fallback after Telegram)
     notification_email_enabled: bool = Field(
@@ -907,6 +1035,12 @@ def validate_config(config: Settings) -> list[str]:
     if config.db_operation_timeout <= 0:
         errors.append(f"db_operation_timeout must be > 0, got {config.db_operation_timeout}")
 
+    if config.dual_audit_hedge_delay_seconds < 0:
+        errors.append(
+            f"dual_audit_hedge_delay_seconds must be >= 0, got "
+            f"{config.dual_audit_hedge_delay_seconds}"
+        )
+
     # SOT retrieval validations
     if config.autopack_sot_retrieval_max_chars < 100:
         errors.append(
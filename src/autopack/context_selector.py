@@ -7,6 +7,10 @@ Phase 1 Enhancement: Added ranking heuristics from chatbot_project
 - Relevance scoring (keyword/path matching)
 - Recency scoring (git history, mtime)
 - Type priority scoring (tests > core > misc)
+
+IMP-PERF-017: Glob patterns resolve against a WorkspaceFileIndex and file
+contents come from its mtime-keyed cache instead of re-walking and re-reading
+the workspace for every phase.
 """
 
 import logging
@@ -16,6 +20,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .workspace_file_index import WorkspaceFileIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,14 +33,17 @@ class ContextSelector:
     Measure token counts and success rates to validate effectiveness.
     """
 
-    def __init__(self, repo_root: Path):
+    def __init__(self, repo_root: Path, file_index: Optional[WorkspaceFileIndex] = None):
         """
         Initialize context selector.
 
         Args:
             repo_root: Repository root directory
+            file_index: Optional shared index for repo_root (IMP-PERF-017);
+                a private one is created if omitted
         """
         self.root = repo_root
+        self.file_index = file_index or WorkspaceFileIndex(repo_root)
 
         # File categories by task type
         self.category_patterns = {
@@ -76,6 +85,12 @@ class ContextSelector:
             )
 
         # Fallback: Original heuristic-based loading for backward compatibility
+        # IMP-PERF-017: Pick up workspace changes once; globs below are index lookups
+        try:
+            self.file_index.refresh()
+        except OSError as e:
+            logger.error("OS error indexing workspace %s: %s", self.root, e)
+
         context = {}
         task_category = phase_spec.get("task_category", "general")
         complexity = phase_spec.get("complexity", "medium")
@@ -145,7 +160,7 @@ class ContextSelector:
             path = self.root / path_str
             if path.exists() and path.is_file():
                 try:
-                    content = path.read_text(encoding="utf-8")
+                    content = self.file_index.read_text(path)
                     files[str(path.relative_to(self.root))] = content
                 except PermissionError as e:
                     logger.warning("Permission denied reading %s: %s", path, e)
@@ -162,10 +177,13 @@ class ContextSelector:
         count = 0
 
         try:
-            for path in self.root.glob(pattern):
-                if path.is_file() and count < max_files:
+            for rel_path in self.file_index.glob(pattern):
+                if count >= max_files:
+                    break
+                path = self.root / rel_path
+                if path.is_file():
                     try:
-                        content = path.read_text(encoding="utf-8")
+                        content = self.file_index.read_text(path)
                         files[str(path.relative_to(self.root))] = content
                         count += 1
                     except PermissionError as e:
@@ -463,7 +481,7 @@ class ContextSelector:
             for file_path in directory.rglob("*"):
                 if file_path.is_file():
                     try:
-                        content = file_path.read_text(encoding="utf-8")
+                        content = self.file_index.read_text(file_path)
                         relative_path = str(file_path.relative_to(self.root))
                         if relative_path not in context:
                             context[relative_path] = content
@@ -506,7 +524,7 @@ class ContextSelector:
         for path in normalized_scope:
             if path.exists() and path.is_file():
                 try:
-                    content = path.read_text(encoding="utf-8")
+                    content = self.file_index.read_text(path)
                     relative_path = str(path.relative_to(self.root))
                     context[relative_path] = content
                 except PermissionError as e:
@@ -525,7 +543,7 @@ class ContextSelector:
             for path in normalized_readonly:
                 if path.exists() and path.is_file():
                     try:
-                        content = path.read_text(encoding="utf-8")
+                        content = self.file_index.read_text(path)
                         relative_path = str(path.relative_to(self.root))
                         # Don't overwrite modifiable files
                         if relative_path not in context:
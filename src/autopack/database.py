@@ -31,13 +31,18 @@ Session Management Patterns:
 
     4. SessionLocal() - Direct session creation (AVOID in loops)
        Creates a new session each call. Use get_session() instead.
+
+IMP-PERF-024: The engine is created lazily by get_engine() on first use, not at
+import time. `engine` remains importable from this module.
 """
 
 import logging
+import threading
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, Optional
 
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, declarative_base, scoped_session, sessionmaker
 
 from .config import get_database_url
@@ -63,43 +68,15 @@ _pool_metrics: dict[str, Any] = {
     "utilization_pct": 0.0,
 }
 
-# Enable pool_pre_ping so dropped/closed connections are detected and re-established.
-# pool_recycle guards against server-side timeouts on long-lived processes.
-# Use get_database_url() for runtime binding (respects DATABASE_URL env var)
-
-_db_url = get_database_url()
-_is_postgres = _db_url.startswith("postgresql")
-
-# Pool configuration only applies to PostgreSQL (SQLite uses SingletonThreadPool)
-_engine_kwargs = {
-    "pool_pre_ping": True,
-    "pool_recycle": 1800,
-}
-
-if _is_postgres:
-    # Explicit pool configuration for PostgreSQL to prevent exhaustion under high load
-    # SQLite's SingletonThreadPool doesn't support these options
-    #   - pool_size=20: Base pool size for normal operations
-    #   - max_overflow=10: Allow 10 additional connections under peak load
-    #   - pool_timeout=30: Wait max 30s for connection before raising TimeoutError
-    _engine_kwargs.update(
-        {
-            "pool_size": 20,
-            "max_overflow": 10,
-            "pool_timeout": 30,
-        }
-    )
-
-engine = create_engine(_db_url, **_engine_kwargs)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
-# IMP-PERF-001: Scoped session for thread-local session management
-# This ensures the same thread reuses the same session, reducing connection churn
-ScopedSession = scoped_session(SessionLocal)
-
-# Initialize connection pool leak detector
-leak_detector = ConnectionLeakDetector(engine.pool)
+# IMP-PERF-024: Lazy engine initialization
+# The engine (and therefore the DB driver import, URL resolution and pool event
+# listeners) is created on first use via get_engine() rather than at import
+# time, so importing autopack.models / the CLI does not pay for engine setup.
+# `engine` and `leak_detector` remain importable module attributes: the first
+# access goes through the module-level __getattr__ below, which creates them.
+_engine_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_leak_detector: Optional[ConnectionLeakDetector] = None
 
 # IMP-PERF-001: Track session checkout/checkin metrics
 _session_metrics = {
@@ -110,7 +87,32 @@ _session_metrics = {
 }
 
 
-@event.listens_for(engine, "checkout")
+def _engine_kwargs_for(db_url: str) -> dict[str, Any]:
+    """Build create_engine() keyword arguments for a database URL."""
+    # Enable pool_pre_ping so dropped/closed connections are detected and re-established.
+    # pool_recycle guards against server-side timeouts on long-lived processes.
+    engine_kwargs: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+    # Pool configuration only applies to PostgreSQL (SQLite uses SingletonThreadPool)
+    if db_url.startswith("postgresql"):
+        # Explicit pool configuration for PostgreSQL to prevent exhaustion under high load
+        # SQLite's SingletonThreadPool doesn't support these options
+        #   - pool_size=20: Base pool size for normal operations
+        #   - max_overflow=10: Allow 10 additional connections under peak load
+        #   - pool_timeout=30: Wait max 30s for connection before raising TimeoutError
+        engine_kwargs.update(
+            {
+                "pool_size": 20,
+                "max_overflow": 10,
+                "pool_timeout": 30,
+            }
+        )
+    return engine_kwargs
+
+
 def _on_checkout(dbapi_conn, connection_record, connection_proxy):
     """Track connection checkouts from pool."""
     _session_metrics["total_checkouts"] += 1
@@ -119,13 +121,94 @@ def _on_checkout(dbapi_conn, connection_record, connection_proxy):
         _session_metrics["peak_active_sessions"] = _session_metrics["active_sessions"]
 
 
-@event.listens_for(engine, "checkin")
 def _on_checkin(dbapi_conn, connection_record):
     """Track connection checkins to pool."""
     _session_metrics["total_checkins"] += 1
     _session_metrics["active_sessions"] = max(0, _session_metrics["active_sessions"] - 1)
 
 
+def _get_or_create_engine() -> Engine:
+    """Return the engine owned by this module, creating it on first use."""
+    global _engine
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            db_url = get_database_url()
+            _engine = create_engine(db_url, **_engine_kwargs_for(db_url))
+            event.listen(_engine, "checkout", _on_checkout)
+            event.listen(_engine, "checkin", _on_checkin)
+        return _engine
+
+
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use (IMP-PERF-024).
+
+    Uses get_database_url() at call time, so DATABASE_URL is respected even if
+    it is set after this module was imported. A replaced or patched
+    `autopack.database.engine` (e.g. in tests) is returned as-is.
+
+    Returns:
+        The shared SQLAlchemy Engine.
+    """
+    published = globals().get("engine")
+    if published is not None:
+        return published
+
+    created = _get_or_create_engine()
+    # Publish as a plain module attribute so later accesses skip __getattr__.
+    # Re-publishing after mock.patch removed the attribute reuses the same engine.
+    globals().setdefault("engine", created)
+    return globals()["engine"]
+
+
+def get_leak_detector() -> ConnectionLeakDetector:
+    """Return the pool leak detector, creating it with the engine on first use."""
+    global _leak_detector
+    published = globals().get("leak_detector")
+    if published is not None:
+        return published
+
+    pool = _get_or_create_engine().pool
+    with _engine_lock:
+        if _leak_detector is None:
+            # Initialize connection pool leak detector
+            _leak_detector = ConnectionLeakDetector(pool)
+    globals().setdefault("leak_detector", _leak_detector)
+    return globals()["leak_detector"]
+
+
+def __getattr__(name: str) -> Any:
+    """Create `engine` / `leak_detector` lazily on first attribute access."""
+    if name == "engine":
+        return get_engine()
+    if name == "leak_detector":
+        return get_leak_detector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyEngineSession(Session):
+    """Session that binds to the module's engine when no explicit bind is given.
+
+    Like the eagerly bound sessionmaker it replaces, sessions are unaffected by
+    later reassignment of `autopack.database.engine`.
+    """
+
+    def __init__(self, bind=None, **kwargs):
+        if bind is None and not kwargs.get("binds"):
+            bind = _get_or_create_engine()
+        super().__init__(bind=bind, **kwargs)
+
+
+SessionLocal = sessionmaker(class_=_LazyEngineSession, autocommit=False, autoflush=False)
+Base = declarative_base()
+
+# IMP-PERF-001: Scoped session for thread-local session management
+# This ensures the same thread reuses the same session, reducing connection churn
+ScopedSession = scoped_session(SessionLocal)
+
+
 def get_session_metrics() -> dict:
     """Get session pool metrics for monitoring.
 
@@ -189,13 +272,13 @@ def get_pool_health():
     from .dashboard_schemas import DatabasePoolStats
 
     # Get basic pool health from detector
-    pool_health = leak_detector.check_pool_health()
+    pool_health = get_leak_detector().check_pool_health()
 
     # Extract pool configuration
     pool_size = pool_health.get("pool_size", 0)
     checked_out = pool_health.get("checked_out", 0)
     overflow = pool_health.get("overflow", 0)
-    max_overflow = getattr(engine.pool, "_max_overflow", 10)
+    max_overflow = getattr(get_engine().pool, "_max_overflow", 10)
 
     # Calculate derived metrics
     checked_in = pool_size - checked_out
@@ -255,7 +338,7 @@ def get_pool_stats() -> dict[str, Any]:
     """
     global _pool_metrics
 
-    pool = engine.pool
+    pool = get_engine().pool
     pool_size = pool.size()
     checked_out = pool.checkedout()
     overflow = pool.overflow()
@@ -361,6 +444,7 @@ def _bootstrap_with_lock():
     For SQLite: Runs create_all() directly (SQLite has inherent file-level locking).
     """
     # Check dialect at runtime (not module-level) to support test mocking
+    engine = get_engine()
     is_postgres = engine.dialect.name == "postgresql"
     if is_postgres:
         # PostgreSQL: Use advisory lock to prevent concurrent schema modifications
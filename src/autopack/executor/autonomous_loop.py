@@ -12,7 +12,6 @@ IMP-MAINT-002: FeedbackContextRetriever and TelemetryPersistenceManager extracte
 import logging
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
@@ -32,9 +31,15 @@ from autopack.executor.circuit_breaker import (
     CircuitBreakerState,
     SOTDriftError,
 )
+from autopack.executor.context_prefetcher import (
+    DEFAULT_PREFETCH_WORKERS,
+    PhaseContextPrefetcher,
+)
 from autopack.executor.feedback_context import FeedbackContextRetriever
 from autopack.executor.log_sanitizer import LogSanitizer
 from autopack.executor.loop_telemetry_integration import LoopTelemetryIntegration
+from autopack.executor.loop_wakeup import LoopWakeupChannel
+from autopack.executor.phase_scheduler import PhaseScheduler
 from autopack.executor.telemetry_persistence import TelemetryPersistenceManager
 from autopack.feedback_pipeline import FeedbackPipeline
 from autopack.generation.autonomous_wave_planner import AutonomousWavePlanner, WavePlan
@@ -83,6 +88,8 @@ class AutonomousLoop:
         self.poll_interval = 0.5  # Base polling interval
         self.idle_backoff_multiplier = 2.0  # Backoff when idle
         self.max_idle_sleep = 5.0  # Maximum sleep time when idle
+        # IMP-PERF-020: Wakeup channel so waits end as soon as work arrives (set up in run())
+        self._wakeup_channel: Optional[LoopWakeupChannel] = None
         self._last_session_health_check = time.time()  # Track last health check
         self._telemetry_analyzer: Optional[TelemetryAnalyzer] = None
 
@@ -122,6 +129,11 @@ class AutonomousLoop:
         self._max_parallel_phases = getattr(settings, "max_parallel_phases", 2)
         self._parallel_phases_executed = 0
         self._parallel_phases_skipped = 0
+        # IMP-PERF-018: Long-lived work-queue scheduler, created on first parallel dispatch
+        self._phase_scheduler: Optional[PhaseScheduler] = None
+        # IMP-PERF-019: Memory context prefetch for upcoming parallel phases
+        self._context_prefetch_depth = int(getattr(settings, "context_prefetch_depth", 4))
+        self._context_prefetcher: Optional[PhaseContextPrefetcher] = None
 
         # IMP-LOOP-011: Feedback pipeline is MANDATORY for self-improvement loop
         self._feedback_pipeline: Optional[FeedbackPipeline] = None
@@ -297,6 +309,18 @@ class AutonomousLoop:
             "parallel_phases_executed": self._parallel_phases_executed,
             "parallel_phases_skipped": self._parallel_phases_skipped,
         }
+        # IMP-PERF-018: Per-slot utilization and queue-wait metrics
+        if self._phase_scheduler is not None:
+            stats["parallel_execution"]["scheduler"] = self._phase_scheduler.get_stats()
+        # IMP-PERF-019: Context prefetch hit rate
+        if self._context_prefetcher is not None:
+            stats["parallel_execution"]["context_prefetch"] = self._context_prefetcher.get_stats()
+
+        # IMP-PERF-020: Wakeup counts and task pickup latency
+        if self._wakeup_channel is not None:
+            stats["wakeup"] = self._wakeup_channel.get_stats()
+        else:
+            stats["wakeup"] = {"enabled": False}
 
         # IMP-LOOP-001: Add feedback pipeline statistics
         if self._feedback_pipeline is not None:
@@ -1002,74 +1026,6 @@ class AutonomousLoop:
 
         return queued_phases
 
-    def _execute_phases_parallel(
-        self, phases: List[Dict], phase_adjustments_map: Dict[str, Dict]
-    ) -> List[Tuple[Dict, bool, str]]:
-        """Execute multiple phases in parallel using ThreadPoolExecutor.
-
-        IMP-AUTO-002: Executes phases with non-overlapping scopes concurrently.
-
-        Args:
-            phases: List of phases to execute in parallel
-            phase_adjustments_map: Map of phase_id -> adjustments dict
-
-        Returns:
-            List of (phase, success, status) tuples for each executed phase
-        """
-        results: List[Tuple[Dict, bool, str]] = []
-
-        if len(phases) == 1:
-            # Single phase - execute directly
-            phase = phases[0]
-            adjustments = phase_adjustments_map.get(phase.get("phase_id", ""), {})
-            success, status = self.executor.execute_phase(phase, **adjustments)
-            return [(phase, success, status)]
-
-        # IMP-REL-015: Cap thread pool size to prevent thread exhaustion
-        max_workers = min(len(phases), os.cpu_count() or 4, 10)
-        logger.info(
-            f"[IMP-AUTO-002] Executing {len(phases)} phases in parallel "
-            f"(max_workers={max_workers}): "
-            f"{[p.get('phase_id', 'unknown') for p in phases]}"
-        )
-
-        # Use ThreadPoolExecutor for parallel execution
-        # Note: Using threads (not processes) to share executor state
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all phases for execution
-            future_to_phase = {}
-            for phase in phases:
-                phase_id = phase.get("phase_id", "unknown")
-                adjustments = phase_adjustments_map.get(phase_id, {})
-
-                future = executor.submit(
-                    self._execute_single_phase_thread_safe,
-                    phase,
-                    adjustments,
-                )
-                future_to_phase[future] = phase
-
-            # Collect results as they complete
-            for future in as_completed(future_to_phase):
-                phase = future_to_phase[future]
-                phase_id = phase.get("phase_id", "unknown")
-
-                try:
-                    success, status = future.result()
-                    results.append((phase, success, status))
-                    logger.info(
-                        f"[IMP-AUTO-002] Parallel phase {phase_id} completed: "
-                        f"success={success}, status={status}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"[IMP-AUTO-002] Parallel phase {phase_id} failed with error: {LogSanitizer.sanitize_exception(e)}"
-                    )
-                    results.append((phase, False, f"PARALLEL_EXECUTION_ERROR: {e}"))
-
-        self._parallel_phases_executed += len(phases)
-        return results
-
     def _execute_single_phase_thread_safe(self, phase: Dict, adjustments: Dict) -> Tuple[bool, str]:
         """Execute a single phase in a thread-safe manner.
 
@@ -1095,106 +1051,263 @@ class AutonomousLoop:
             )
             return False, f"THREAD_ERROR: {str(e)}"
 
+    def _get_phase_scheduler(self) -> PhaseScheduler:
+        """Get or create the long-lived parallel phase scheduler.
+
+        IMP-PERF-018: The scheduler keeps its worker slots across loop
+        iterations so freed slots can be refilled immediately.
+
+        Returns:
+            PhaseScheduler instance
+        """
+        if self._phase_scheduler is None:
+            # IMP-REL-015: Cap thread pool size to prevent thread exhaustion. Phases are
+            # I/O-bound (LLM and API calls), so slots are not limited by CPU count.
+            max_slots = min(self._max_parallel_phases, 10)
+            compatibility_check = (
+                self._parallelism_checker.can_execute_parallel
+                if self._parallelism_checker is not None
+                else None
+            )
+            self._phase_scheduler = PhaseScheduler(
+                execute_fn=self._execute_single_phase_thread_safe,
+                max_slots=max_slots,
+                compatibility_check=compatibility_check,
+            )
+            logger.info(f"[IMP-PERF-018] Phase scheduler started with {max_slots} worker slots")
+        return self._phase_scheduler
+
+    def _get_running_phase_ids(self) -> set:
+        """Get IDs of phases currently executing in scheduler slots (IMP-PERF-018)."""
+        if self._phase_scheduler is None:
+            return set()
+        return self._phase_scheduler.running_phase_ids
+
+    def _exclude_running_phases(self, run_data: Dict) -> Dict:
+        """Return a shallow copy of run_data without phases running in scheduler slots.
+
+        IMP-PERF-018: The loop keeps iterating while scheduled phases run, so
+        stale-phase detection must not reset phases that are still executing
+        in this process.
+
+        Args:
+            run_data: Current run data
+
+        Returns:
+            run_data with running phases removed from tiers and phases
+        """
+        running_ids = self._get_running_phase_ids()
+        if not running_ids:
+            return run_data
+
+        def _keep(phases: List[Dict]) -> List[Dict]:
+            return [p for p in phases if p.get("phase_id") not in running_ids]
+
+        filtered = dict(run_data)
+        filtered["phases"] = _keep(run_data.get("phases", []))
+        filtered["tiers"] = [
+            {**tier, "phases": _keep(tier.get("phases", []))} for tier in run_data.get("tiers", [])
+        ]
+        return filtered
+
+    def _get_context_prefetcher(self) -> Optional[PhaseContextPrefetcher]:
+        """Get or create the memory context prefetcher (IMP-PERF-019).
+
+        Returns:
+            PhaseContextPrefetcher instance, or None if prefetch is disabled
+        """
+        if self._context_prefetch_depth <= 0:
+            return None
+        if self._context_prefetcher is None:
+            self._context_prefetcher = PhaseContextPrefetcher(
+                build_fn=self._get_phase_memory_context,
+                max_workers=min(self._context_prefetch_depth, DEFAULT_PREFETCH_WORKERS),
+            )
+        return self._context_prefetcher
+
+    def _get_phase_memory_context(self, phase: Dict) -> str:
+        """Retrieve memory context for a phase (prefetch build function).
+
+        Args:
+            phase: Phase specification
+
+        Returns:
+            Formatted memory context string
+        """
+        return self._get_memory_context(phase.get("phase_type"), phase.get("description", ""))
+
+    def _build_parallel_phase_adjustments(
+        self, phase: Dict, memory_context: Optional[str] = None
+    ) -> Dict:
+        """Build telemetry adjustments and memory context for a parallel phase.
+
+        Args:
+            phase: Phase about to be dispatched
+            memory_context: Prefetched memory context (IMP-PERF-019); retrieved
+                here when None
+
+        Returns:
+            Adjustments dict passed to execute_phase
+        """
+        phase_id = phase.get("phase_id", "unknown")
+        phase_type = phase.get("phase_type")
+        phase_goal = phase.get("description", "")
+
+        # Get telemetry adjustments
+        adjustments = self._get_telemetry_adjustments(phase_type)
+
+        # Get memory context
+        if memory_context is None:
+            memory_context = self._get_memory_context(phase_type, phase_goal)
+        improvement_context = self._get_improvement_task_context()
+
+        combined_context = ""
+        if memory_context:
+            combined_context = memory_context
+        if improvement_context:
+            combined_context = (
+                combined_context + "\n\n" + improvement_context
+                if combined_context
+                else improvement_context
+            )
+
+        # IMP-LOOP-028: Warn when all context sources return empty (parallel path)
+        if not combined_context.strip():
+            logger.warning(
+                "All context sources returned empty - phase executing without historical guidance",
+                extra={
+                    "phase": phase_id,
+                    "memory_empty": not memory_context,
+                    "improvement_empty": not improvement_context,
+                },
+            )
+
+        if combined_context:
+            combined_context = self._inject_context_with_ceiling(combined_context)
+            if combined_context:
+                adjustments["memory_context"] = combined_context
+
+        return adjustments
+
     def _try_parallel_execution(
         self, run_data: Dict, next_phase: Dict
     ) -> Optional[Tuple[List[Tuple[Dict, bool, str]], int]]:
-        """Attempt to find and execute phases in parallel.
+        """Dispatch phases into free scheduler slots and collect finished phases.
 
         IMP-AUTO-002: Checks if there are additional phases that can run in parallel
         with the next_phase based on scope isolation.
 
+        IMP-PERF-018: Phases are dispatched into a long-lived PhaseScheduler
+        instead of a one-shot group. Each candidate is checked against the
+        scopes currently running, and this call returns as soon as any phase
+        finishes so its slot can be refilled on the next iteration. While
+        phases are running, every phase goes through the scheduler (a phase
+        that conflicts with running scopes waits for a slot rather than
+        running sequentially alongside them).
+
         Args:
             run_data: Current run data
             next_phase: The primary phase to execute
 
         Returns:
-            If parallel execution occurred: (results, phases_count)
+            If parallel execution occurred: (results, phases_count) for the
+            phases that finished
             If sequential execution needed: None
         """
         if not self._parallel_execution_enabled or self._parallelism_checker is None:
             return None
 
-        # Get all queued phases
-        queued_phases = self._get_queued_phases_for_parallel_check(run_data)
+        scheduler = self._get_phase_scheduler()
+        running_ids = scheduler.running_phase_ids
 
-        if len(queued_phases) < 2:
-            return None
-
-        # Put next_phase first, then find compatible phases
+        # Get all queued phases that are not already running, next_phase first
+        queued_phases = [
+            p
+            for p in self._get_queued_phases_for_parallel_check(run_data)
+            if p.get("phase_id") not in running_ids
+        ]
         next_phase_id = next_phase.get("phase_id")
-        other_phases = [p for p in queued_phases if p.get("phase_id") != next_phase_id]
+        candidates = [next_phase] if next_phase_id not in running_ids else []
+        candidates += [p for p in queued_phases if p.get("phase_id") != next_phase_id]
+        scheduler.note_queued(p.get("phase_id") for p in candidates)
 
-        if not other_phases:
+        if not running_ids and len(queued_phases) < 2:
             return None
 
-        # Find phases that can run in parallel with next_phase
-        parallel_group = [next_phase]
-
-        for candidate in other_phases:
-            if len(parallel_group) >= self._max_parallel_phases:
+        # Find phases that can run alongside the currently running scopes
+        to_dispatch: List[Dict] = []
+        for candidate in candidates:
+            if scheduler.free_slots - len(to_dispatch) <= 0:
                 break
 
-            can_parallel, reason = self._parallelism_checker.can_execute_parallel(
-                parallel_group + [candidate]
-            )
+            can_parallel, reason = scheduler.can_admit(candidate, pending=to_dispatch)
 
             if can_parallel:
-                parallel_group.append(candidate)
+                to_dispatch.append(candidate)
             else:
                 logger.debug(
                     f"[IMP-AUTO-002] Cannot add phase {candidate.get('phase_id')} "
                     f"to parallel group: {reason}"
                 )
 
-        if len(parallel_group) < 2:
+        if not running_ids and len(to_dispatch) < 2:
             self._parallel_phases_skipped += 1
+            scheduler.record_rejection()
             return None
 
-        # Prepare adjustments for all phases in the group
-        phase_adjustments_map: Dict[str, Dict] = {}
-        for phase in parallel_group:
-            phase_id = phase.get("phase_id", "unknown")
-            phase_type = phase.get("phase_type")
-            phase_goal = phase.get("description", "")
+        # IMP-PERF-019: Memory context is retrieved concurrently (or served from
+        # prefetch); telemetry adjustments stay on this thread with the DB session
+        prefetcher = self._get_context_prefetcher()
+        memory_contexts = prefetcher.get_many(to_dispatch) if prefetcher is not None else {}
+        for phase in to_dispatch:
+            adjustments = self._build_parallel_phase_adjustments(
+                phase, memory_contexts.get(phase.get("phase_id", "unknown"))
+            )
+            scheduler.submit(phase, adjustments)
 
-            # Get telemetry adjustments
-            adjustments = self._get_telemetry_adjustments(phase_type)
+        # IMP-PERF-019: Warm context for the next queued phases while these execute
+        if prefetcher is not None:
+            dispatched_ids = {p.get("phase_id") for p in to_dispatch}
+            upcoming = [p for p in candidates if p.get("phase_id") not in dispatched_ids]
+            prefetcher.prefetch(upcoming[: self._context_prefetch_depth])
 
-            # Get memory context
-            memory_context = self._get_memory_context(phase_type, phase_goal)
-            improvement_context = self._get_improvement_task_context()
+        return self._await_parallel_completions()
 
-            combined_context = ""
-            if memory_context:
-                combined_context = memory_context
-            if improvement_context:
-                combined_context = (
-                    combined_context + "\n\n" + improvement_context
-                    if combined_context
-                    else improvement_context
-                )
+    def _await_parallel_completions(self) -> Optional[Tuple[List[Tuple[Dict, bool, str]], int]]:
+        """Block until at least one scheduled phase finishes (IMP-PERF-018).
 
-            # IMP-LOOP-028: Warn when all context sources return empty (parallel path)
-            if not combined_context.strip():
-                logger.warning(
-                    "All context sources returned empty - phase executing without historical guidance",
-                    extra={
-                        "phase": phase_id,
-                        "memory_empty": not memory_context,
-                        "improvement_empty": not improvement_context,
-                    },
-                )
+        Returns:
+            (results, phases_count) for finished phases, or None if nothing is running
+        """
+        if self._phase_scheduler is None or not self._phase_scheduler.has_running:
+            return None
 
-            if combined_context:
-                combined_context = self._inject_context_with_ceiling(combined_context)
-                if combined_context:
-                    adjustments["memory_context"] = combined_context
+        completions = self._phase_scheduler.wait_for_completions()
+        results = [(c.phase, c.success, c.status) for c in completions]
+        self._parallel_phases_executed += len(results)
+        return results, len(results)
+
+    def _drain_phase_scheduler(self) -> List[Tuple[Dict, bool, str]]:
+        """Wait for in-flight scheduled phases and release worker slots.
+
+        IMP-PERF-018: Called when the loop exits so no phase thread outlives it.
 
-            phase_adjustments_map[phase_id] = adjustments
+        Returns:
+            List of (phase, success, status) tuples for the drained phases
+        """
+        if self._phase_scheduler is None:
+            return []
 
-        # Execute phases in parallel
-        results = self._execute_phases_parallel(parallel_group, phase_adjustments_map)
-        return results, len(parallel_group)
+        running_ids = self._phase_scheduler.running_phase_ids
+        if running_ids:
+            logger.info(
+                f"[IMP-PERF-018] Waiting for {len(running_ids)} in-flight phase(s) "
+                f"before exit: {sorted(running_ids)}"
+            )
+        results = [(c.phase, c.success, c.status) for c in self._phase_scheduler.drain()]
+        self._parallel_phases_executed += len(results)
+        self._phase_scheduler.shutdown(wait=True)
+        return results
 
     def _get_telemetry_analyzer(self) -> Optional[TelemetryAnalyzer]:
         """Get or create the telemetry analyzer instance.
@@ -1897,15 +2010,45 @@ class AutonomousLoop:
             base_interval: Override base interval for this sleep (defaults to self.poll_interval)
         """
         interval = base_interval if base_interval is not None else self.poll_interval
-        if is_idle:
+        if is_idle and self._wakeup_channel is not None and self._wakeup_channel.registered:
+            # IMP-PERF-020: Producers in any process wake a registered channel, so an
+            # idle wait blocks until work arrives; max_idle_sleep is only a safety timeout
+            sleep_time = self.max_idle_sleep
+        elif is_idle:
             # Apply backoff multiplier and cap at max_idle_sleep
             sleep_time = min(interval * self.idle_backoff_multiplier, self.max_idle_sleep)
         else:
             sleep_time = interval
+
+        # IMP-PERF-020: Block on the wakeup channel so newly arrived work ends the wait early
+        if self._wakeup_channel is not None:
+            self._wakeup_channel.wait(sleep_time)
+            return sleep_time
+
         # NOTE: time.sleep() intentional - autonomous loop runs in sync context
         time.sleep(sleep_time)
         return sleep_time
 
+    def _initialize_wakeup_channel(self) -> None:
+        """Create and register the wakeup channel used by _adaptive_sleep (IMP-PERF-020)."""
+        run_id = getattr(self.executor, "run_id", None)
+        self._wakeup_channel = LoopWakeupChannel(run_id=run_id if isinstance(run_id, str) else None)
+        if self._wakeup_channel.register():
+            logger.info(
+                f"[IMP-PERF-020] Wakeup channel registered at {self._wakeup_channel.registration_file}"
+            )
+
+    def notify_work_available(self, reason: str) -> None:
+        """Wake the loop if it is waiting between iterations (IMP-PERF-020).
+
+        Thread-safe; call from any in-process producer of new work.
+
+        Args:
+            reason: Short label for what arrived (e.g. "generated_tasks")
+        """
+        if self._wakeup_channel is not None:
+            self._wakeup_channel.notify(reason)
+
     def _log_db_pool_health(self) -> None:
         """Log database pool health to telemetry (IMP-DB-001).
 
@@ -2046,8 +2189,19 @@ class AutonomousLoop:
         # IMP-LOOP-027: Initialize wave planner for parallel IMP execution
         self._initialize_wave_planner()
 
+        # IMP-PERF-020: Event-driven wakeups between iterations
+        self._initialize_wakeup_channel()
+
         # Main execution loop
-        stats = self._execute_loop(poll_interval, max_iterations, stop_on_first_failure)
+        try:
+            stats = self._execute_loop(poll_interval, max_iterations, stop_on_first_failure)
+        finally:
+            # IMP-PERF-018: No-op after a normal exit; joins phase threads on error exits
+            self._drain_phase_scheduler()
+            if self._context_prefetcher is not None:
+                self._context_prefetcher.shutdown()
+            if self._wakeup_channel is not None:
+                self._wakeup_channel.close()
 
         # Handle cleanup and finalization
         self._finalize_execution(stats)
@@ -2340,6 +2494,8 @@ class AutonomousLoop:
         logger.info(
             f"[IMP-LOOP-004] Injected {len(generated_phases)} generated task phases into backlog"
         )
+        # IMP-PERF-020: New work is queued - don't wait out the next poll interval
+        self.notify_work_available("generated_tasks")
         return run_data
 
     # =========================================================================
@@ -2933,7 +3089,8 @@ class AutonomousLoop:
 
             # Phase 1.6-1.7: Detect and reset stale EXECUTING phases
             try:
-                self.executor._detect_and_reset_stale_phases(run_data)
+                # IMP-PERF-018: Never reset phases still executing in scheduler slots
+                self.executor._detect_and_reset_stale_phases(self._exclude_running_phases(run_data))
             except Exception as e:
                 logger.warning(f"Stale phase detection failed: {e}")
                 # Continue even if stale detection fails
@@ -2941,33 +3098,50 @@ class AutonomousLoop:
             # BUILD-115: Use API-based phase selection instead of obsolete database queries
             next_phase = self.executor.get_next_queued_phase(run_data)
 
-            if not next_phase:
-                logger.info("No more executable phases, execution complete")
-                stop_reason = "no_more_executable_phases"
-                break
-
-            phase_id = next_phase.get("phase_id")
-            phase_type = next_phase.get("phase_type")
-            logger.info(f"[BUILD-041] Next phase: {phase_id}")
+            parallel_result = None
+            # IMP-PERF-018: A phase still running in a scheduler slot may not have
+            # been marked EXECUTING by the API yet - never select it twice, but
+            # still offer the other queued phases to the free slots
+            if next_phase and next_phase.get("phase_id") in self._get_running_phase_ids():
+                try:
+                    parallel_result = self._try_parallel_execution(run_data, next_phase)
+                except Exception as parallel_err:
+                    logger.warning(
+                        f"[IMP-PERF-018] Refilling free scheduler slots failed: {parallel_err}"
+                    )
+                next_phase = None
 
-            # Log budget status before each phase (budget check moved to top of loop per IMP-SAFETY-005)
-            tokens_used = getattr(self.executor, "_run_tokens_used", 0)
-            token_cap = settings.run_token_cap
-            budget_pct = get_budget_remaining_pct(token_cap, tokens_used) * 100
-            logger.info(
-                f"Phase {phase_id}: Budget remaining {budget_pct:.1f}% ({tokens_used}/{token_cap} tokens)"
-            )
+            if not next_phase:
+                # IMP-PERF-018: Wait for in-flight phases before declaring the run done;
+                # their completion may unblock further phases
+                if parallel_result is None:
+                    parallel_result = self._await_parallel_completions()
+                if parallel_result is None:
+                    logger.info("No more executable phases, execution complete")
+                    stop_reason = "no_more_executable_phases"
+                    break
+            else:
+                phase_id = next_phase.get("phase_id")
+                phase_type = next_phase.get("phase_type")
+                logger.info(f"[BUILD-041] Next phase: {phase_id}")
 
-            # IMP-AUTO-002: Try parallel execution if enabled and possible
-            parallel_result = None
-            try:
-                parallel_result = self._try_parallel_execution(run_data, next_phase)
-            except Exception as parallel_err:
-                logger.warning(
-                    f"[IMP-AUTO-002] Parallel execution attempt failed (falling back to sequential): "
-                    f"{parallel_err}"
+                # Log budget status before each phase (budget check moved to top of loop per IMP-SAFETY-005)
+                tokens_used = getattr(self.executor, "_run_tokens_used", 0)
+                token_cap = settings.run_token_cap
+                budget_pct = get_budget_remaining_pct(token_cap, tokens_used) * 100
+                logger.info(
+                    f"Phase {phase_id}: Budget remaining {budget_pct:.1f}% ({tokens_used}/{token_cap} tokens)"
                 )
 
+                # IMP-AUTO-002: Try parallel execution if enabled and possible
+                try:
+                    parallel_result = self._try_parallel_execution(run_data, next_phase)
+                except Exception as parallel_err:
+                    logger.warning(
+                        f"[IMP-AUTO-002] Parallel execution attempt failed (falling back to sequential): "
+                        f"{parallel_err}"
+                    )
+
             if parallel_result is not None:
                 # Parallel execution occurred
                 results, parallel_count = parallel_result
@@ -3076,6 +3250,11 @@ class AutonomousLoop:
                     stop_reason = "cost_limit_reached"
                     break
 
+                # IMP-PERF-018: Refill freed slots immediately while phases are in flight;
+                # wait_for_completions() already blocked until a slot freed up
+                if self._get_running_phase_ids():
+                    continue
+
                 # Skip to next iteration since we handled all phases in parallel
                 if iteration < max_iterations:
                     logger.info(f"Waiting {poll_interval}s before next phase...")
@@ -3316,6 +3495,18 @@ class AutonomousLoop:
             )
             stop_reason = "max_iterations"
 
+        # IMP-PERF-018: Let phases still running in scheduler slots finish
+        for phase, success, status in self._drain_phase_scheduler():
+            if success:
+                phases_executed += 1
+                self.executor._phase_failure_counts[phase.get("phase_id", "unknown")] = 0
+            else:
+                logger.warning(
+                    f"Phase {phase.get('phase_id', 'unknown')} finished with status: "
+                    f"{status} (parallel, drained at exit)"
+                )
+                phases_failed += 1
+
         logger.info("Autonomous execution loop finished")
 
         # IMP-LOOP-006: Update instance-level counters
@@ -0,0 +1,242 @@
+"""Concurrent memory-context prefetch for queued phases.
+
+IMP-PERF-019: Retrieving memory context for a phase costs several vector
+store round trips. The parallel path used to retrieve it serially for every
+phase in a group before any of them started. PhaseContextPrefetcher retrieves
+context for upcoming queued phases on background threads while other phases
+execute, and caches the result per phase until one of the (collection, project)
+pairs it read is written to again.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from autopack.memory.write_generation import ReadKey, reads_are_current, track_memory_reads
+
+logger = logging.getLogger(__name__)
+
+# Callable that retrieves memory context for a phase: phase -> context string
+ContextBuildFn = Callable[[Dict], str]
+
+DEFAULT_PREFETCH_WORKERS = 4
+DEFAULT_PREFETCH_TTL_SECONDS = 300.0
+DEFAULT_MAX_CACHED_PHASES = 64
+
+
+@dataclass
+class _PrefetchEntry:
+    """A cached (or in-flight) context retrieval for one phase.
+
+    The future resolves to (context, reads), where reads maps each
+    (collection, project) the retrieval read to the generation it saw.
+    """
+
+    fingerprint: Tuple[str, str]
+    created_at: float
+    future: Future
+
+
+class PhaseContextPrefetcher:
+    """Per-phase memory context cache filled by background retrieval.
+
+    IMP-PERF-019: Entries are keyed by phase_id and are valid while the
+    phase's type and description are unchanged, none of the collections the
+    retrieval read (for the project it read) has been written since, and the
+    entry is younger than the TTL.
+    """
+
+    def __init__(
+        self,
+        build_fn: ContextBuildFn,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        ttl_seconds: float = DEFAULT_PREFETCH_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_CACHED_PHASES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            build_fn: Function that retrieves memory context for a phase
+            max_workers: Number of background retrieval threads
+            ttl_seconds: Maximum age of a cached entry
+            max_entries: Maximum number of cached phases
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._build_fn = build_fn
+        self._max_workers = max(1, int(max_workers))
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._entries: Dict[str, _PrefetchEntry] = {}
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._prefetches_started = 0
+
+    @staticmethod
+    def _fingerprint(phase: Dict) -> Tuple[str, str]:
+        return (str(phase.get("phase_type") or ""), str(phase.get("description") or ""))
+
+    def _is_valid(self, entry: _PrefetchEntry, phase: Dict, now: float) -> bool:
+        if entry.fingerprint != self._fingerprint(phase):
+            return False
+        if now - entry.created_at > self._ttl_seconds:
+            return False
+        if not entry.future.done():
+            # In flight: freshness is checked once the reads are known
+            return True
+        # A retrieval that raised is never served from cache
+        if entry.future.exception() is not None:
+            return False
+        return reads_are_current(entry.future.result()[1])
+
+    def _build(self, phase: Dict) -> Tuple[str, Dict[ReadKey, int]]:
+        """Retrieve context for phase, recording the memory reads it made."""
+        with track_memory_reads() as reads:
+            context = self._build_fn(phase)
+        return context, dict(reads)
+
+    def _start(self, phase_id: str, phase: Dict) -> None:
+        """Submit a retrieval for phase. Caller must hold the lock."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="context-prefetch"
+            )
+        self._entries.pop(phase_id, None)
+        self._entries[phase_id] = _PrefetchEntry(
+            fingerprint=self._fingerprint(phase),
+            created_at=self._clock(),
+            future=self._pool.submit(self._build, phase),
+        )
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._entries.pop(oldest).future.cancel()
+
+    def prefetch(self, phases: Iterable[Dict]) -> int:
+        """Start background retrieval for phases without a valid cached entry.
+
+        Args:
+            phases: Upcoming phases
+
+        Returns:
+            Number of retrievals started
+        """
+        now = self._clock()
+        started = 0
+        with self._lock:
+            for phase in phases:
+                phase_id = phase.get("phase_id")
+                if not phase_id:
+                    continue
+                entry = self._entries.get(phase_id)
+                if entry is not None and self._is_valid(entry, phase, now):
+                    continue
+                self._start(phase_id, phase)
+                started += 1
+            self._prefetches_started += started
+
+        if started:
+            logger.debug(f"[IMP-PERF-019] Prefetching memory context for {started} phase(s)")
+        return started
+
+    def get_many(self, phases: List[Dict]) -> Dict[str, str]:
+        """Get memory context for phases, retrieving missing entries concurrently.
+
+        Args:
+            phases: Phases about to be dispatched
+
+        Returns:
+            Map of phase_id -> memory context
+        """
+        now = self._clock()
+        futures: Dict[str, Tuple[Dict, Future]] = {}
+        with self._lock:
+            for phase in phases:
+                phase_id = phase.get("phase_id", "unknown")
+                entry = self._entries.get(phase_id)
+                if entry is not None and self._is_valid(entry, phase, now):
+                    self._hits += 1
+                else:
+                    if entry is not None:
+                        self._stale += 1
+                    self._misses += 1
+                    self._start(phase_id, phase)
+                    entry = self._entries[phase_id]
+                futures[phase_id] = (phase, entry.future)
+
+        return {
+            phase_id: self._result(phase_id, phase, future)
+            for phase_id, (phase, future) in futures.items()
+        }
+
+    def _result(self, phase_id: str, phase: Dict, future: Future) -> str:
+        """Wait for a retrieval, retrieving again if memory it read changed meanwhile."""
+        try:
+            context, reads = future.result()
+            if reads_are_current(reads):
+                return context
+            with self._lock:
+                self._stale += 1
+                self._start(phase_id, phase)
+                future = self._entries[phase_id].future
+            return future.result()[0]
+        except Exception as e:
+            logger.warning(f"[IMP-PERF-019] Context retrieval failed for {phase_id}: {e}")
+            return ""
+
+    def get(self, phase: Dict) -> str:
+        """Get memory context for a single phase."""
+        return self.get_many([phase])[phase.get("phase_id", "unknown")]
+
+    def invalidate(self, phase_id: Optional[str] = None) -> None:
+        """Drop cached context for one phase, or for all phases.
+
+        Args:
+            phase_id: Phase to invalidate (None clears the whole cache)
+        """
+        with self._lock:
+            if phase_id is None:
+                entries = list(self._entries.values())
+                self._entries.clear()
+            else:
+                entry = self._entries.pop(phase_id, None)
+                entries = [entry] if entry is not None else []
+        for entry in entries:
+            entry.future.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop background retrieval threads.
+
+        Args:
+            wait: Whether to wait for in-flight retrievals
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._entries.clear()
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> Dict:
+        """Get prefetch cache metrics.
+
+        Returns:
+            Dictionary with hit/miss counts, stale entries and hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale": self._stale,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "prefetches_started": self._prefetches_started,
+                "cached_phases": len(self._entries),
+            }
@@ -0,0 +1,335 @@
+"""Wakeup channel for the autonomous loop.
+
+IMP-PERF-020: AutonomousLoop used to wait between iterations with a plain
+time.sleep, so work that arrived mid-sleep (injected tasks, approvals,
+re-queued phases) waited out the full interval before the loop noticed.
+LoopWakeupChannel lets the loop block until either the interval elapses or
+work is announced:
+
+- In-process producers call LoopWakeupChannel.notify(), which signals a
+  condition variable.
+- A running loop registers its channel: it binds a loopback UDP socket and
+  records the port in a per-run file under {autonomous_runs_dir}/.wakeup/.
+  Producers in any process call notify_loop_wakeup(), which notifies
+  registered in-process channels directly and sends a datagram to every
+  other registered loop for the run. The waiting loop blocks in select() on
+  that socket, so it wakes only when a notification arrives or the timeout
+  elapses. With no loop registered, notify_loop_wakeup() is a no-op.
+
+Pickup latency (time from notification to the loop waking up) is recorded
+for every wakeup.
+"""
+
+import json
+import logging
+import os
+import re
+import select
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+WAKEUP_REGISTRY_DIRNAME = ".wakeup"
+# Registration file name for a loop that was started without a run ID
+ANY_RUN_REGISTRATION = "_any.json"
+_LOOPBACK = "127.0.0.1"
+# Datagram sent by notify() to break a waiter out of select()
+_POKE = b"\0"
+
+# Registered channels in this process, keyed by registration file path
+_local_channels: Dict[Path, "LoopWakeupChannel"] = {}
+_local_channels_lock = threading.Lock()
+
+
+def default_wakeup_registry_dir() -> Path:
+    """Get the directory holding per-run wakeup registrations."""
+    from autopack.config import settings
+
+    return Path(settings.autonomous_runs_dir) / WAKEUP_REGISTRY_DIRNAME
+
+
+def _registration_name(run_id: Optional[str]) -> str:
+    if not run_id:
+        return ANY_RUN_REGISTRATION
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", run_id) + ".json"
+
+
+@dataclass
+class WakeupEvent:
+    """A notification that new work may be available."""
+
+    reason: str
+    created_at: float
+    run_id: Optional[str] = None
+
+
+def notify_loop_wakeup(
+    reason: str,
+    run_id: Optional[str] = None,
+    registry_dir: Optional[Path] = None,
+) -> int:
+    """Wake registered autonomous loops, in this process or others.
+
+    Safe to call from request handlers and library code: nothing is written,
+    and failures are logged and swallowed.
+
+    Args:
+        reason: Short label for what arrived (e.g. "phase_queued")
+        run_id: Run the work belongs to (None wakes the loops of every run)
+        registry_dir: Registration directory (defaults to default_wakeup_registry_dir())
+
+    Returns:
+        Number of loops notified
+    """
+    directory = registry_dir or default_wakeup_registry_dir()
+    if not directory.is_dir():
+        return 0
+
+    if run_id:
+        paths = [directory / _registration_name(run_id), directory / ANY_RUN_REGISTRATION]
+    else:
+        paths = sorted(directory.glob("*.json"))
+
+    record = json.dumps({"reason": reason, "run_id": run_id, "created_at": time.time()})
+    notified = 0
+    for path in paths:
+        with _local_channels_lock:
+            local = _local_channels.get(path)
+        if local is not None:
+            local.notify(reason)
+            notified += 1
+            continue
+        try:
+            port = int(json.loads(path.read_text(encoding="utf-8"))["port"])
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(record.encode("utf-8"), (_LOOPBACK, port))
+            notified += 1
+        except OSError as e:
+            logger.debug(f"[IMP-PERF-020] Failed to wake loop registered at {path}: {e}")
+    return notified
+
+
+class LoopWakeupChannel:
+    """Blocking wait that returns early when work is announced.
+
+    IMP-PERF-020: Combines an in-process condition variable with an optional
+    loopback socket (see register()) for notifications from other processes.
+    """
+
+    def __init__(
+        self,
+        run_id: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the channel.
+
+        Args:
+            run_id: Run this loop executes; notifications for other runs are ignored
+            clock: Wall-clock time source (shared with other processes)
+        """
+        self.run_id = run_id
+        self.registration_file: Optional[Path] = None
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._pending: List[WakeupEvent] = []
+        self._sock: Optional[socket.socket] = None
+
+        # Metrics
+        self._wakeups = 0
+        self._timeouts = 0
+        self._wakeups_by_reason: Dict[str, int] = {}
+        self._total_latency_s = 0.0
+        self._max_latency_s = 0.0
+        self._last_latency_s: Optional[float] = None
+
+    @property
+    def registered(self) -> bool:
+        """True while the channel can receive notifications from other processes."""
+        return self._sock is not None
+
+    def register(self, registry_dir: Optional[Path] = None) -> bool:
+        """Accept notify_loop_wakeup() calls for this run from any process.
+
+        Args:
+            registry_dir: Registration directory (defaults to default_wakeup_registry_dir())
+
+        Returns:
+            True if the channel is registered
+        """
+        if self._sock is not None:
+            return True
+        path = (registry_dir or default_wakeup_registry_dir()) / _registration_name(self.run_id)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind((_LOOPBACK, 0))
+            sock.setblocking(False)
+            record = {"run_id": self.run_id, "pid": os.getpid(), "port": sock.getsockname()[1]}
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(record), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            sock.close()
+            logger.warning(f"[IMP-PERF-020] Cross-process wakeups unavailable: {e}")
+            return False
+
+        self._sock = sock
+        self.registration_file = path
+        with _local_channels_lock:
+            _local_channels[path] = self
+        return True
+
+    def close(self) -> None:
+        """Remove the registration and release the socket."""
+        path, self.registration_file = self.registration_file, None
+        if path is not None:
+            with _local_channels_lock:
+                if _local_channels.get(path) is self:
+                    del _local_channels[path]
+            try:
+                if json.loads(path.read_text(encoding="utf-8")).get("pid") == os.getpid():
+                    path.unlink()
+            except (OSError, ValueError):
+                pass
+        with self._condition:
+            sock, self._sock = self._sock, None
+        if sock is not None:
+            sock.close()
+
+    def notify(self, reason: str) -> None:
+        """Announce in-process that work may be available.
+
+        Args:
+            reason: Short label for what arrived
+        """
+        with self._condition:
+            self._pending.append(WakeupEvent(reason=reason, created_at=self._clock()))
+            self._condition.notify_all()
+            sock = self._sock
+        if sock is not None:
+            try:
+                sock.sendto(_POKE, sock.getsockname())
+            except OSError:
+                pass
+
+    def wait(self, timeout: float) -> Optional[WakeupEvent]:
+        """Block until work is announced or timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The earliest pending wakeup event, or None on timeout
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            with self._condition:
+                event = self._take_pending()
+                if event is not None:
+                    self._record_wakeup(event)
+                    return event
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    return None
+                sock = self._sock
+                if sock is None:
+                    self._condition.wait(remaining)
+                    continue
+            # Block on the socket outside the lock; notify() pokes it as well
+            self._receive(sock, remaining)
+
+    def _receive(self, sock: socket.socket, timeout: float) -> None:
+        """Wait up to timeout for datagrams and queue the wakeups they carry."""
+        try:
+            readable, _, _ = select.select([sock], [], [], timeout)
+        except (OSError, ValueError):
+            # Socket closed by close() while waiting
+            return
+        if not readable:
+            return
+
+        events: List[WakeupEvent] = []
+        while True:
+            try:
+                data = sock.recv(4096)
+            except OSError:
+                # Drained (BlockingIOError) or closed while reading
+                break
+            if data == _POKE:
+                continue
+            event = self._parse_datagram(data)
+            if event is not None:
+                events.append(event)
+        if events:
+            with self._condition:
+                self._pending.extend(events)
+
+    def _parse_datagram(self, data: bytes) -> Optional[WakeupEvent]:
+        try:
+            record = json.loads(data.decode("utf-8"))
+            run_id = record.get("run_id")
+            created_at = float(record.get("created_at", self._clock()))
+        except (ValueError, AttributeError, TypeError) as e:
+            logger.debug(f"[IMP-PERF-020] Ignoring malformed wakeup datagram: {e}")
+            return None
+        if run_id and self.run_id and run_id != self.run_id:
+            return None
+        return WakeupEvent(
+            reason=str(record.get("reason", "external")),
+            created_at=created_at,
+            run_id=run_id,
+        )
+
+    def _take_pending(self) -> Optional[WakeupEvent]:
+        """Pop all pending events, returning the earliest. Caller holds the lock."""
+        if not self._pending:
+            return None
+        event = min(self._pending, key=lambda e: e.created_at)
+        self._pending.clear()
+        return event
+
+    def _record_wakeup(self, event: WakeupEvent) -> None:
+        """Record pickup latency for a wakeup. Caller holds the lock."""
+        latency = max(0.0, self._clock() - event.created_at)
+        self._wakeups += 1
+        self._wakeups_by_reason[event.reason] = self._wakeups_by_reason.get(event.reason, 0) + 1
+        self._total_latency_s += latency
+        self._max_latency_s = max(self._max_latency_s, latency)
+        self._last_latency_s = latency
+        logger.debug(
+            f"[IMP-PERF-020] Woken by '{event.reason}' (pickup latency {latency * 1000:.1f}ms)"
+        )
+
+    def get_stats(self) -> Dict:
+        """Get wakeup and pickup latency metrics.
+
+        Returns:
+            Dictionary with wakeup/timeout counts, wakeups by reason and
+            pickup latency statistics in milliseconds
+        """
+        with self._condition:
+            return {
+                "wakeups": self._wakeups,
+                "timeouts": self._timeouts,
+                "wakeups_by_reason": dict(self._wakeups_by_reason),
+                "avg_pickup_latency_ms": (
+                    round(self._total_latency_s / self._wakeups * 1000, 2) if self._wakeups else 0.0
+                ),
+                "max_pickup_latency_ms": round(self._max_latency_s * 1000, 2),
+                "last_pickup_latency_ms": (
+                    round(self._last_latency_s * 1000, 2)
+                    if self._last_latency_s is not None
+                    else None
+                ),
+                "registration": str(self.registration_file) if self.registration_file else None,
+            }
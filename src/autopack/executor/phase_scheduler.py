@@ -0,0 +1,336 @@
+"""Streaming work-queue scheduler for parallel phase execution.
+
+IMP-PERF-018: Replaces the batch-and-wait parallel group execution in
+autonomous_loop.py. The previous approach submitted a whole group of
+scope-compatible phases to a ThreadPoolExecutor and waited for every phase
+in the group before selecting more work, so one slow phase left every other
+worker idle. PhaseScheduler keeps a long-lived pool of worker slots and
+refills a slot as soon as any phase finishes, admitting each new phase only
+if it is compatible with the scopes that are currently running.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Callable that executes a phase: (phase, adjustments) -> (success, status)
+PhaseExecuteFn = Callable[[Dict, Dict], Tuple[bool, str]]
+
+# Callable that checks whether phases may run together: phases -> (ok, reason)
+CompatibilityCheckFn = Callable[[List[Dict]], Tuple[bool, Optional[str]]]
+
+
+@dataclass
+class RunningPhase:
+    """A phase currently occupying a worker slot."""
+
+    phase_id: str
+    phase: Dict
+    slot: int
+    future: Future
+    started_at: float
+    queue_wait_seconds: float
+
+
+@dataclass
+class PhaseCompletion:
+    """Result of a phase that finished executing in a worker slot."""
+
+    phase: Dict
+    success: bool
+    status: str
+    slot: int
+    queue_wait_seconds: float
+    run_seconds: float
+
+
+class PhaseScheduler:
+    """Long-lived worker-slot scheduler for scope-isolated phases.
+
+    IMP-PERF-018: Phases are submitted one at a time into free slots. The
+    compatibility check is consulted incrementally against the phases that
+    are running right now, so a new phase can start while unrelated phases
+    are still in flight. Callers block in wait_for_completions() only until
+    the first running phase finishes, then refill the freed slot.
+
+    Attributes:
+        max_slots: Number of worker slots (maximum concurrently running phases)
+    """
+
+    def __init__(
+        self,
+        execute_fn: PhaseExecuteFn,
+        max_slots: int,
+        compatibility_check: Optional[CompatibilityCheckFn] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            execute_fn: Function that executes a single phase
+            max_slots: Maximum number of phases running at once
+            compatibility_check: Function deciding if a set of phases may run
+                together (e.g. ScopeBasedParallelismChecker.can_execute_parallel).
+                None admits any phase while a slot is free.
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_slots = max(1, int(max_slots))
+        self._execute_fn = execute_fn
+        self._compatibility_check = compatibility_check
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._running: Dict[str, RunningPhase] = {}
+        self._pending_since: Dict[str, float] = {}
+
+        # Metrics
+        self._created_at = clock()
+        self._slot_busy_seconds: List[float] = [0.0] * self.max_slots
+        self._slot_phases_completed: List[int] = [0] * self.max_slots
+        self._phases_submitted = 0
+        self._phases_completed = 0
+        self._phases_rejected = 0
+        self._total_queue_wait_seconds = 0.0
+        self._max_queue_wait_seconds = 0.0
+
+    @property
+    def running_phase_ids(self) -> Set[str]:
+        """IDs of phases currently occupying a slot."""
+        with self._lock:
+            return set(self._running)
+
+    @property
+    def has_running(self) -> bool:
+        """Whether any phase is currently executing."""
+        with self._lock:
+            return bool(self._running)
+
+    @property
+    def free_slots(self) -> int:
+        """Number of idle worker slots."""
+        with self._lock:
+            return self.max_slots - len(self._running)
+
+    def note_queued(self, phase_ids: Iterable[str]) -> None:
+        """Record the phases that are currently waiting for a slot.
+
+        The first time a phase is seen waiting is used to compute its queue
+        wait when it is eventually submitted. Phases that are no longer
+        waiting are forgotten.
+
+        Args:
+            phase_ids: IDs of the phases that are queued right now
+        """
+        now = self._clock()
+        with self._lock:
+            current = {pid for pid in phase_ids if pid and pid not in self._running}
+            self._pending_since = {pid: self._pending_since.get(pid, now) for pid in current}
+
+    def can_admit(
+        self, phase: Dict, pending: Optional[List[Dict]] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """Check whether a phase could start now.
+
+        Args:
+            phase: Candidate phase
+            pending: Phases already chosen for submission in this round that
+                are not yet running
+
+        Returns:
+            Tuple of (admissible, reason when not admissible)
+        """
+        pending = pending or []
+        phase_id = phase.get("phase_id", "unknown")
+        with self._lock:
+            if phase_id in self._running:
+                return False, f"Phase {phase_id} is already running"
+            if len(self._running) + len(pending) >= self.max_slots:
+                return False, "No free worker slot"
+            in_flight = [r.phase for r in self._running.values()] + list(pending)
+
+        # A lone phase is always runnable; only co-scheduled phases need checking
+        if not in_flight or self._compatibility_check is None:
+            return True, None
+        return self._compatibility_check(in_flight + [phase])
+
+    def submit(self, phase: Dict, adjustments: Optional[Dict] = None) -> int:
+        """Start a phase in a free worker slot.
+
+        Args:
+            phase: Phase to execute
+            adjustments: Keyword adjustments passed to the execute function
+
+        Returns:
+            Index of the slot the phase was assigned to
+
+        Raises:
+            RuntimeError: If no slot is free or the phase is already running
+        """
+        phase_id = phase.get("phase_id", "unknown")
+        now = self._clock()
+        with self._lock:
+            if phase_id in self._running:
+                raise RuntimeError(f"Phase {phase_id} is already running")
+            used = {r.slot for r in self._running.values()}
+            free = [slot for slot in range(self.max_slots) if slot not in used]
+            if not free:
+                raise RuntimeError("No free worker slot")
+            slot = free[0]
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_slots, thread_name_prefix="phase-slot"
+                )
+
+            queue_wait = max(0.0, now - self._pending_since.pop(phase_id, now))
+            future = self._pool.submit(self._execute_fn, phase, adjustments or {})
+            self._running[phase_id] = RunningPhase(
+                phase_id=phase_id,
+                phase=phase,
+                slot=slot,
+                future=future,
+                started_at=now,
+                queue_wait_seconds=queue_wait,
+            )
+            self._phases_submitted += 1
+            self._total_queue_wait_seconds += queue_wait
+            self._max_queue_wait_seconds = max(self._max_queue_wait_seconds, queue_wait)
+            running_count = len(self._running)
+
+        logger.info(
+            f"[IMP-PERF-018] Dispatched phase {phase_id} to slot {slot} "
+            f"(queue_wait={queue_wait:.2f}s, running={running_count}/{self.max_slots})"
+        )
+        return slot
+
+    def record_rejection(self) -> None:
+        """Count a dispatch round in which no phase could be co-scheduled."""
+        with self._lock:
+            self._phases_rejected += 1
+
+    def wait_for_completions(self, timeout: Optional[float] = None) -> List[PhaseCompletion]:
+        """Block until at least one running phase finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Completions for every phase that has finished (empty on timeout
+            or when nothing is running)
+        """
+        with self._lock:
+            futures = [r.future for r in self._running.values()]
+        if not futures:
+            return []
+        wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        return self._collect_finished()
+
+    def drain(self, timeout: Optional[float] = None) -> List[PhaseCompletion]:
+        """Wait for every running phase to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Completions for all phases that finished
+        """
+        with self._lock:
+            futures = [r.future for r in self._running.values()]
+        if futures:
+            wait(futures, timeout=timeout)
+        return self._collect_finished()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            wait: Whether to wait for running phases to finish
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _collect_finished(self) -> List[PhaseCompletion]:
+        """Remove finished phases from their slots and build completions."""
+        now = self._clock()
+        completions: List[PhaseCompletion] = []
+        with self._lock:
+            for phase_id, running in list(self._running.items()):
+                if not running.future.done():
+                    continue
+                del self._running[phase_id]
+
+                try:
+                    success, status = running.future.result()
+                except Exception as e:
+                    logger.error(f"[IMP-PERF-018] Phase {phase_id} raised in slot: {e}")
+                    success, status = False, f"PARALLEL_EXECUTION_ERROR: {e}"
+
+                run_seconds = max(0.0, now - running.started_at)
+                self._slot_busy_seconds[running.slot] += run_seconds
+                self._slot_phases_completed[running.slot] += 1
+                self._phases_completed += 1
+                completions.append(
+                    PhaseCompletion(
+                        phase=running.phase,
+                        success=success,
+                        status=status,
+                        slot=running.slot,
+                        queue_wait_seconds=running.queue_wait_seconds,
+                        run_seconds=run_seconds,
+                    )
+                )
+
+        for completion in completions:
+            logger.info(
+                f"[IMP-PERF-018] Phase {completion.phase.get('phase_id', 'unknown')} "
+                f"finished in slot {completion.slot} after {completion.run_seconds:.2f}s: "
+                f"success={completion.success}, status={completion.status}"
+            )
+        return completions
+
+    def get_stats(self) -> Dict:
+        """Get scheduler metrics.
+
+        Returns:
+            Dictionary with running/submitted/completed counts, queue-wait
+            statistics, and per-slot busy time and utilization.
+        """
+        now = self._clock()
+        with self._lock:
+            elapsed = max(now - self._created_at, 1e-9)
+            busy = list(self._slot_busy_seconds)
+            # Include time spent by phases that are still running
+            for running in self._running.values():
+                busy[running.slot] += max(0.0, now - running.started_at)
+
+            slots = [
+                {
+                    "slot": slot,
+                    "busy_seconds": round(busy[slot], 3),
+                    "utilization": round(min(1.0, busy[slot] / elapsed), 4),
+                    "phases_completed": self._slot_phases_completed[slot],
+                }
+                for slot in range(self.max_slots)
+            ]
+            submitted = self._phases_submitted
+            return {
+                "max_slots": self.max_slots,
+                "running_phases": sorted(self._running),
+                "phases_submitted": submitted,
+                "phases_completed": self._phases_completed,
+                "dispatch_rejections": self._phases_rejected,
+                "queued_phases": len(self._pending_since),
+                "avg_queue_wait_seconds": (
+                    round(self._total_queue_wait_seconds / submitted, 3) if submitted else 0.0
+                ),
+                "max_queue_wait_seconds": round(self._max_queue_wait_seconds, 3),
+                "utilization": round(min(1.0, sum(busy) / (elapsed * self.max_slots)), 4),
+                "slots": slots,
+            }
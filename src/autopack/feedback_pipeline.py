@@ -2298,6 +2298,10 @@ class FeedbackPipeline:
 
             # Emit to the task queue
             self._append_task_to_queue(followup_task, task_queue_file)
+            # IMP-PERF-020: Wake a waiting executor loop so it picks the task up promptly
+            from autopack.executor.loop_wakeup import notify_loop_wakeup
+
+            notify_loop_wakeup("roadc_tasks")
 
             logger.info(
                 f"[IMP-LOOP-026] Emitted follow-up task to ROADC_TASK_QUEUE: "
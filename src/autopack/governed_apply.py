@@ -8,6 +8,8 @@ Enhanced with self-troubleshoot capabilities:
 - Post-application file validation (syntax check)
 - File integrity checks before/after fallback operations
 - Automatic restoration on corruption detection
+- Staged in-memory apply with atomic commit for exactly-applying patches
+  (IMP-PERF-031), falling back to git apply otherwise
 
 Per GPT_RESPONSE18: Added symbol preservation and structural similarity validation.
 """
@@ -15,6 +17,7 @@ Per GPT_RESPONSE18: Added symbol preservation and structural similarity validati
 import hashlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -24,11 +27,18 @@ from .apply.validation import (
     check_structural_similarity,
     check_symbol_preservation,
     compute_file_hash,
+    validate_file_content,
     validate_python_syntax,
 )
 from .config import settings
 from .exceptions import ValidationError
-from .patching.apply_engine import execute_git_apply, execute_manual_apply
+from .patching.apply_engine import (
+    StagedFile,
+    commit_staged_files,
+    execute_git_apply,
+    execute_manual_apply,
+    stage_patch,
+)
 from .patching.patch_quality import validate_patch_quality
 from .patching.patch_sanitize import fix_empty_file_diffs, repair_hunk_headers, sanitize_patch
 from .patching.policy import PatchPolicy
@@ -461,6 +471,7 @@ class GovernedApplyPath:
         files_modified: List[str],
         backups: Dict[str, Tuple[str, str]],
         validation_config: Optional[Dict] = None,
+        new_contents: Optional[Dict[str, str]] = None,
     ) -> Tuple[bool, List[str]]:
         """
         Validate content changes using symbol preservation and structural similarity.
@@ -473,6 +484,8 @@ class GovernedApplyPath:
             files_modified: List of relative file paths that were modified
             backups: Dict mapping file path to (hash, content) tuple
             validation_config: Optional config dict with thresholds
+            new_contents: Optional new file contents (IMP-PERF-031: staged apply
+                passes them to avoid re-reading files from disk)
 
         Returns:
             Tuple of (all_valid, list of files with issues)
@@ -516,12 +529,15 @@ class GovernedApplyPath:
             _, old_content = backups[rel_path]
 
             # Read new content
-            try:
-                with open(full_path, "r", encoding="utf-8") as f:
-                    new_content = f.read()
-            except Exception as e:
-                logger.warning(f"[Validation] Failed to read {rel_path}: {e}")
-                continue
+            if new_contents is not None and rel_path in new_contents:
+                new_content = new_contents[rel_path]
+            else:
+                try:
+                    with open(full_path, "r", encoding="utf-8") as f:
+                        new_content = f.read()
+                except Exception as e:
+                    logger.warning(f"[Validation] Failed to read {rel_path}: {e}")
+                    continue
 
             old_line_count = old_content.count("\n") + 1
 
@@ -1231,6 +1247,16 @@ class GovernedApplyPath:
                     logger.error(f"[Isolation] {error_msg}")
                     return False, error_msg
 
+            # IMP-PERF-031: Common path - apply, validate and write from memory without
+            # backups, savepoints or git subprocesses. Returns None to fall back to git apply.
+            quality_checked = False
+            if settings.governed_apply_staged_enabled:
+                patch_content = self._check_patch_quality(patch_content, full_file_mode)
+                quality_checked = True
+                staged_result = self._apply_patch_staged(patch_content)
+                if staged_result is not None:
+                    return staged_result
+
             backups = self._backup_files(files_to_modify)
             logger.debug(f"[Integrity] Backed up {len(backups)} existing files before patch")
 
@@ -1245,34 +1271,8 @@ class GovernedApplyPath:
                     )
 
             # Validate patch for common LLM truncation issues
-            validation_errors = self._validate_patch_quality(patch_content)
-            if validation_errors:
-                # Check if any errors are YAML-related - attempt repair
-                yaml_errors = [e for e in validation_errors if "YAML" in e or "yaml" in e]
-                if yaml_errors and full_file_mode:
-                    logger.info(
-                        f"[YamlRepair] Detected {len(yaml_errors)} YAML validation errors, attempting repair..."
-                    )
-                    repaired_patch, repair_method = self._attempt_yaml_repair_in_patch(
-                        patch_content, validation_errors
-                    )
-                    if repaired_patch:
-                        logger.info(f"[YamlRepair] Repair succeeded via {repair_method}")
-                        patch_content = repaired_patch
-                        # Re-validate after repair
-                        validation_errors = self._validate_patch_quality(patch_content)
-                    # Pack schema validation for country packs (after structural validation passes)
-                    if not validation_errors:
-                        validation_errors.extend(self._validate_pack_schema_in_patch(patch_content))
-                        if not validation_errors:
-                            logger.info("[YamlRepair] Repaired patch passed validation")
-
-                if validation_errors:
-                    error_details = "\n".join(f"  - {err}" for err in validation_errors)
-                    error_msg = f"Patch validation failed - LLM generated incomplete/truncated patch:\n{error_details}"
-                    logger.error(error_msg)
-                    logger.error(f"Patch content:\n{patch_content[:500]}...")
-                    raise PatchApplyError(error_msg)
+            if not quality_checked:
+                patch_content = self._check_patch_quality(patch_content, full_file_mode)
 
             # Write patch to a temporary file
             patch_file = self.workspace / "temp_patch.diff"
@@ -1437,6 +1437,145 @@ class GovernedApplyPath:
                 patch_file.unlink()
             return False, error_msg
 
+    def _check_patch_quality(self, patch_content: str, full_file_mode: bool) -> str:
+        """
+        Validate patch quality, repairing YAML content in full-file mode.
+
+        Args:
+            patch_content: Sanitized patch content
+            full_file_mode: Whether YAML repair may rewrite file contents
+
+        Returns:
+            Patch content (repaired if a YAML repair succeeded)
+
+        Raises:
+            PatchApplyError: If the patch is incomplete/truncated
+        """
+        # Validate patch for common LLM truncation issues
+        validation_errors = self._validate_patch_quality(patch_content)
+        if validation_errors:
+            # Check if any errors are YAML-related - attempt repair
+            yaml_errors = [e for e in validation_errors if "YAML" in e or "yaml" in e]
+            if yaml_errors and full_file_mode:
+                logger.info(
+                    f"[YamlRepair] Detected {len(yaml_errors)} YAML validation errors, attempting repair..."
+                )
+                repaired_patch, repair_method = self._attempt_yaml_repair_in_patch(
+                    patch_content, validation_errors
+                )
+                if repaired_patch:
+                    logger.info(f"[YamlRepair] Repair succeeded via {repair_method}")
+                    patch_content = repaired_patch
+                    # Re-validate after repair
+                    validation_errors = self._validate_patch_quality(patch_content)
+                # Pack schema validation for country packs (after structural validation passes)
+                if not validation_errors:
+                    validation_errors.extend(self._validate_pack_schema_in_patch(patch_content))
+                    if not validation_errors:
+                        logger.info("[YamlRepair] Repaired patch passed validation")
+
+            if validation_errors:
+                error_details = "\n".join(f"  - {err}" for err in validation_errors)
+                error_msg = f"Patch validation failed - LLM generated incomplete/truncated patch:\n{error_details}"
+                logger.error(error_msg)
+                logger.error(f"Patch content:\n{patch_content[:500]}...")
+                raise PatchApplyError(error_msg)
+        return patch_content
+
+    def _validate_staged_files(self, staged: Dict[str, StagedFile]) -> Tuple[bool, List[str]]:
+        """
+        Verify staged file contents are syntactically valid before writing them.
+
+        IMP-PERF-031: In-memory counterpart of _validate_applied_files. Files are
+        validated in parallel since syntax checks are independent per file.
+
+        Args:
+            staged: Staged files from stage_patch()
+
+        Returns:
+            Tuple of (all_valid, list_of_corrupted_files)
+        """
+        to_check = [f for f in staged.values() if f.content is not None]
+        if len(to_check) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(to_check), 8)) as executor:
+                results = list(
+                    executor.map(lambda f: validate_file_content(f.path, f.content), to_check)
+                )
+        else:
+            results = [validate_file_content(f.path, f.content) for f in to_check]
+
+        corrupted_files = []
+        for staged_file, (is_valid, error) in zip(to_check, results):
+            if is_valid:
+                logger.debug(f"[Validation] OK: {staged_file.path}")
+            else:
+                logger.error(f"[Validation] CORRUPTED: {staged_file.path} - {error}")
+                corrupted_files.append(staged_file.path)
+
+        if corrupted_files:
+            logger.error(f"[Validation] {len(corrupted_files)} staged files failed validation")
+            return False, corrupted_files
+
+        logger.info(f"[Validation] All {len(to_check)} staged files validated successfully")
+        return True, []
+
+    def _apply_patch_staged(self, patch_content: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """
+        Apply a patch through an in-memory overlay and commit it atomically.
+
+        IMP-PERF-031: Hunks are applied to in-memory copies of the affected files,
+        validated there, and only then written (temp file + rename). A failed
+        validation leaves the workspace untouched, so no backups are needed.
+
+        Args:
+            patch_content: Sanitized, quality-checked patch content
+
+        Returns:
+            (success, error_message) like apply_patch, or None if the patch cannot
+            be applied exactly in memory and should go through git apply
+        """
+        staged, reason = stage_patch(patch_content, self.workspace)
+        if staged is None:
+            logger.info(f"[IMP-PERF-031] Staged apply not possible ({reason}); using git apply")
+            return None
+
+        all_valid, corrupted = self._validate_staged_files(staged)
+        if not all_valid:
+            logger.error(
+                f"[Integrity] Patch would corrupt {len(corrupted)} files - nothing written"
+            )
+            return (
+                False,
+                f"Patch corrupted {len(corrupted)} files (staged apply, workspace unchanged)",
+            )
+
+        commit_result = commit_staged_files(staged, self.workspace)
+        if not commit_result.success:
+            return False, commit_result.message
+
+        files_changed = commit_result.files_modified
+        logger.info(f"Patch applied successfully - {len(files_changed)} files modified")
+        for file_path in files_changed:
+            logger.info(f"  - {file_path}")
+
+        # [GPT_RESPONSE18] Advisory content validation against the in-memory originals
+        backups = {
+            f.path: (hashlib.sha256(f.original.encode()).hexdigest(), f.original)
+            for f in staged.values()
+            if f.original is not None
+        }
+        new_contents = {f.path: f.content for f in staged.values() if f.content is not None}
+        content_valid, problem_files = self._validate_content_changes(
+            files_changed, backups, new_contents=new_contents
+        )
+        if not content_valid:
+            logger.warning(
+                f"[Validation] Content validation issues in {len(problem_files)} files. "
+                "Patch applied but may have unintended changes."
+            )
+
+        return True, None
+
     def _extract_files_from_patch(self, patch_content: str) -> List[str]:
         """
         Extract list of files modified from patch content.
@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ....llm_client import BuilderResult
-from ....ndjson_format import NDJSONApplier, NDJSONParser
+from ....ndjson_format import NDJSONApplier, NDJSONParser, NDJSONStreamPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +51,26 @@ class NDJSONParserWrapper:
     5. Generate synthetic diff markers
     """
 
+    def stream_pipeline(
+        self, file_context: Optional[Dict], phase_spec: Dict
+    ) -> NDJSONStreamPipeline:
+        """Create a streaming pipeline that validates each operation against the manifest.
+
+        IMP-PERF-030: Feed it from the transport stream (``on_text=pipeline.feed``)
+        and pass it back to parse() as ``ndjson_stream``.
+
+        Args:
+            file_context: Repository file context (provides the workspace root)
+            phase_spec: Phase specification (provides the deliverables manifest)
+
+        Returns:
+            NDJSONStreamPipeline that aborts on the first out-of-manifest operation
+        """
+        workspace = Path(file_context.get("workspace", ".")) if file_context else Path(".")
+        return NDJSONStreamPipeline(
+            workspace, validate_op=lambda op: self._validate_manifest(phase_spec, [op])
+        )
+
     def parse(
         self,
         content: str,
@@ -63,6 +83,7 @@ class NDJSONParserWrapper:
         was_truncated: bool = False,
         # Callbacks for fallback to other parsers
         fallback_structured_edit=None,
+        ndjson_stream: Optional[NDJSONStreamPipeline] = None,
     ) -> BuilderResult:
         """Parse NDJSON format response.
 
@@ -78,11 +99,30 @@ class NDJSONParserWrapper:
             stop_reason: Stop reason from API
             was_truncated: Whether output was truncated
             fallback_structured_edit: Callback for structured edit fallback
+            ndjson_stream: Pipeline that consumed the streamed output (IMP-PERF-030);
+                its staged operations are committed instead of re-parsing content
 
         Returns:
             BuilderResult with success/failure status
         """
         try:
+            # IMP-PERF-030: Operations were already parsed, validated and staged while
+            # streaming. Fall through to the one-pass parser only if the stream yielded
+            # nothing line-parseable (fenced/pretty-printed/structured-edit output).
+            if ndjson_stream is not None:
+                stream_result = ndjson_stream.finish()
+                if ndjson_stream.aborted or stream_result.operations:
+                    return self._finish_stream(
+                        ndjson_stream,
+                        stream_result,
+                        content,
+                        response,
+                        model,
+                        phase_spec,
+                        stop_reason,
+                        was_truncated,
+                    )
+
             # Pre-sanitize: strip common markdown fences that break NDJSON line parsing
             raw = content or ""
             lines = []
@@ -212,6 +252,60 @@ class NDJSONParserWrapper:
                 raw_output=content,
             )
 
+    def _finish_stream(
+        self,
+        pipeline: NDJSONStreamPipeline,
+        parse_result,
+        content: str,
+        response: Any,
+        model: str,
+        phase_spec: Dict,
+        stop_reason: Optional[str],
+        was_truncated: bool,
+    ) -> BuilderResult:
+        """Build the result for a streamed response, committing staged files on success."""
+        effective_truncation = self._calculate_effective_truncation(
+            was_truncated, parse_result, phase_spec
+        )
+
+        if pipeline.aborted:
+            return BuilderResult(
+                success=False,
+                patch_content="",
+                builder_messages=pipeline.abort_error["messages"],
+                tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+                prompt_tokens=response.usage.input_tokens,
+                completion_tokens=response.usage.output_tokens,
+                model_used=model,
+                error=pipeline.abort_error["error_code"],
+                stop_reason=stop_reason,
+                was_truncated=effective_truncation,
+                raw_output=content,
+            )
+
+        apply_result = pipeline.commit()
+
+        logger.info(
+            f"[IMP-PERF-030] Committed {len(apply_result['applied'])} streamed operations, "
+            f"{len(apply_result['failed'])} failed, truncated={parse_result.was_truncated}"
+        )
+
+        patch_content = self._generate_synthetic_diff(apply_result)
+        success = len(apply_result["applied"]) > 0 and len(apply_result["failed"]) == 0
+
+        return BuilderResult(
+            success=success,
+            patch_content=patch_content,
+            builder_messages=self._build_messages(parse_result),
+            tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+            prompt_tokens=response.usage.input_tokens,
+            completion_tokens=response.usage.output_tokens,
+            model_used=model,
+            stop_reason=stop_reason,
+            was_truncated=effective_truncation,
+            raw_output=content,
+        )
+
     def _is_structured_edit_format(self, sanitized: str) -> bool:
         """Check if content is structured-edit JSON instead of NDJSON."""
         try:
@@ -495,6 +589,10 @@ class NDJSONParserWrapper:
                 f"Output truncated: completed {completed}/{expected} operations. "
                 f"Continuation recovery can complete remaining {expected - completed} operations."
             )
+        if parse_result.was_truncated and parse_result.truncated_file_path:
+            messages.append(
+                f"Output truncated inside operation for {parse_result.truncated_file_path}."
+            )
         return messages
 
     def _write_debug_sample(
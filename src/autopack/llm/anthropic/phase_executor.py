@@ -13,15 +13,21 @@ import copy
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from ...config import settings
 from ...continuation_recovery import ContinuationRecovery
 from ...llm_client import BuilderResult
 from ...llm_service import estimate_tokens
 from ...token_estimator import TokenEstimator
-from ..providers.anthropic_transport import AnthropicTransport
+from ..providers.anthropic_transport import (
+    MAX_CACHE_BREAKPOINTS,
+    AnthropicTransport,
+    cache_control_blocks,
+)
+from .parsers.ndjson_parser import NDJSONParserWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +101,45 @@ class AnthropicPhaseExecutor:
         self.transport = transport
         self.client = client  # For calling helper methods during transition
 
+    @staticmethod
+    def _prompt_cache_layout(system_prompt: str, user_prompt: str) -> Tuple[Any, List[Dict]]:
+        """Lay out a request with prompt-cache breakpoints on its stable prefix.
+
+        IMP-PERF-029: The system prompt only depends on the output mode and phase
+        complexity, so it is always cacheable. A SegmentedPrompt user prompt adds
+        breakpoints after its shared and phase segments; plain strings are sent as-is.
+
+        Returns:
+            (system, messages) for AnthropicTransport.send_request
+        """
+        if not settings.anthropic_prompt_caching_enabled:
+            return system_prompt, [{"role": "user", "content": user_prompt}]
+
+        segments = getattr(user_prompt, "segments", None)
+        if segments:
+            content = cache_control_blocks(
+                segments[:-1], segments[-1], max_breakpoints=MAX_CACHE_BREAKPOINTS - 1
+            )
+        else:
+            content = user_prompt
+        return cache_control_blocks([system_prompt]), [{"role": "user", "content": content}]
+
+    @staticmethod
+    def _record_prompt_cache_usage(usage: Any, phase_id: str, token_budget_metadata: Dict) -> None:
+        """Log prompt cache reads/writes and store them in the phase token_budget metadata."""
+        cache_read = getattr(usage, "cache_read_input_tokens", 0)
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0)
+        if not isinstance(cache_read, int) or not isinstance(cache_write, int):
+            return
+
+        token_budget_metadata["cache_read_input_tokens"] = cache_read
+        token_budget_metadata["cache_creation_input_tokens"] = cache_write
+        if cache_read or cache_write:
+            logger.info(
+                f"[IMP-PERF-029] Prompt cache: phase={phase_id} read={cache_read} "
+                f"write={cache_write} uncached={usage.input_tokens - cache_read - cache_write}"
+            )
+
     def execute_phase(
         self,
         phase_spec: Dict,
@@ -624,13 +669,25 @@ class AnthropicPhaseExecutor:
             # PR-LLM-1: Call Anthropic API via transport wrapper with streaming for long operations
             # Use Claude's max output capacity (64K) to avoid truncation of large patches
             # Enable streaming to avoid 10-minute timeout for complex generations
+            # IMP-PERF-029: Stable prompt segments carry cache breakpoints
+            request_system, request_messages = self._prompt_cache_layout(system_prompt, user_prompt)
+
+            # IMP-PERF-030: Parse, validate and stage NDJSON operations while the response
+            # streams; the pipeline stops generation on the first bad operation
+            ndjson_stream = None
+            stream_kwargs: Dict[str, Any] = {}
+            if use_ndjson_format and settings.ndjson_streaming_apply_enabled:
+                ndjson_stream = NDJSONParserWrapper().stream_pipeline(file_context, phase_spec)
+                stream_kwargs["on_text"] = ndjson_stream.feed
+
             response = self.transport.send_request(
-                messages=[{"role": "user", "content": user_prompt}],
+                messages=request_messages,
                 model=model,
                 max_tokens=min(max_tokens or 64000, 64000),
-                system=system_prompt,
+                system=request_system,
                 temperature=0.2,
                 stream=True,
+                **stream_kwargs,
             )
 
             # Extract content and metadata from transport response
@@ -662,6 +719,7 @@ class AnthropicPhaseExecutor:
             token_budget_metadata["actual_output_tokens"] = (
                 actual_output_tokens  # For P10 base calculation
             )
+            self._record_prompt_cache_usage(response.usage, phase_id, token_budget_metadata)
 
             if was_truncated:
                 logger.warning("[Builder] Output was truncated (stop_reason=max_tokens)")
@@ -682,8 +740,9 @@ class AnthropicPhaseExecutor:
             }
 
             # Define parsing dispatcher (delegates to client parsing methods)
-            def _parse_once(text: str):
+            def _parse_once(text: str, ndjson_stream=None):
                 if use_ndjson_format:
+                    parse_kwargs = {"ndjson_stream": ndjson_stream} if ndjson_stream else {}
                     return self.client._parse_ndjson_output(
                         text,
                         file_context,
@@ -693,6 +752,7 @@ class AnthropicPhaseExecutor:
                         config=config,
                         stop_reason=stop_reason,
                         was_truncated=was_truncated,
+                        **parse_kwargs,
                     )
                 elif use_structured_edit:
                     return self.client._parse_structured_edit_output(
@@ -718,7 +778,7 @@ class AnthropicPhaseExecutor:
                         was_truncated=was_truncated,
                     )
 
-            result = _parse_once(content)
+            result = _parse_once(content, ndjson_stream=ndjson_stream)
 
             # BUILD-129 Phase 2: Continuation-based recovery for truncated outputs
             # NOTE: Skip continuation for NDJSON mode. NDJSON is already truncation-tolerant and continuation
@@ -758,11 +818,14 @@ class AnthropicPhaseExecutor:
                             f"[BUILD-129] Executing continuation request for {len(continuation_context.remaining_deliverables)} remaining deliverables..."
                         )
                         # PR-LLM-1: Call continuation via transport wrapper
+                        request_system, request_messages = self._prompt_cache_layout(
+                            system_prompt, continuation_prompt
+                        )
                         continuation_response = self.transport.send_request(
-                            messages=[{"role": "user", "content": continuation_prompt}],
+                            messages=request_messages,
                             model=model,
                             max_tokens=min(max_tokens or 64000, 64000),
-                            system=system_prompt,
+                            system=request_system,
                             temperature=0.2,
                             stream=True,
                         )
@@ -1047,11 +1110,14 @@ class AnthropicPhaseExecutor:
 
                     # IMP-003: Use transport wrapper for consistent circuit breaker,
                     # typed error handling, and telemetry during retries
+                    request_system, request_messages = self._prompt_cache_layout(
+                        system_prompt, user_prompt_retry
+                    )
                     retry_response = self.transport.send_request(
-                        messages=[{"role": "user", "content": user_prompt_retry}],
+                        messages=request_messages,
                         model=model,
                         max_tokens=min(max_tokens or 64000, 64000),
-                        system=system_prompt,
+                        system=request_system,
                         temperature=0.2,
                         stream=True,
                     )
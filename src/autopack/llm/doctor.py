@@ -17,6 +17,7 @@ from ..error_recovery import (
     choose_doctor_model,
     should_escalate_doctor_model,
 )
+from ..llm_response_cache import CACHED_ROLE_SUFFIX, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +133,7 @@ def execute_doctor(
     model_to_provider_fn: Optional[callable] = None,
     record_usage_fn: Optional[callable] = None,
     record_usage_total_only_fn: Optional[callable] = None,
+    response_cache: Optional[Any] = None,
 ) -> DoctorResponse:
     """
     Invoke the Autopack Doctor to diagnose a phase failure.
@@ -153,6 +155,7 @@ def execute_doctor(
         model_to_provider_fn: Optional function to map model name to provider
         record_usage_fn: Optional function to record usage with exact token splits
         record_usage_total_only_fn: Optional function to record total-only usage
+        response_cache: Optional LlmResponseCache for identical prompts (IMP-PERF-028)
 
     Returns:
         DoctorResponse with action, confidence, rationale, and optional hints
@@ -182,6 +185,7 @@ def execute_doctor(
         model_to_provider_fn,
         record_usage_fn,
         record_usage_total_only_fn,
+        response_cache,
     )
     escalated = False
 
@@ -198,6 +202,7 @@ def execute_doctor(
             model_to_provider_fn,
             record_usage_fn,
             record_usage_total_only_fn,
+            response_cache,
         )
         # Prefer strong response if its confidence is higher
         if strong_response.confidence >= response.confidence:
@@ -288,6 +293,7 @@ def _call_doctor_llm(
     model_to_provider_fn: Optional[callable] = None,
     record_usage_fn: Optional[callable] = None,
     record_usage_total_only_fn: Optional[callable] = None,
+    response_cache: Optional[Any] = None,
 ) -> DoctorResponse:
     """
     Call LLM for Doctor diagnosis and parse response.
@@ -301,6 +307,8 @@ def _call_doctor_llm(
         model_to_provider_fn: Optional function to map model name to provider
         record_usage_fn: Optional function to record usage with exact token splits
         record_usage_total_only_fn: Optional function to record total-only usage
+        response_cache: Optional LlmResponseCache; identical prompts are served
+            from it and recorded as zero-token "doctor:cached" usage
 
     Returns:
         DoctorResponse parsed from LLM output
@@ -310,10 +318,32 @@ def _call_doctor_llm(
         {"role": "system", "content": DOCTOR_SYSTEM_PROMPT},
         {"role": "user", "content": user_message},
     ]
+    is_openai = hasattr(client, "client") and hasattr(client.client, "chat")
+
+    # IMP-PERF-028: Key on model + normalized system/user prompt + sampling params
+    cache_key = None
+    if response_cache is not None:
+        cache_key = make_cache_key(
+            "doctor", model, messages, max_tokens=1000, temperature=0.3 if is_openai else None
+        )
+        cached = response_cache.get(cache_key, "doctor")
+        if cached is not None:
+            logger.info(f"[IMP-PERF-028] Doctor response served from cache (model={model})")
+            if record_usage_fn:
+                record_usage_fn(
+                    provider=model_to_provider_fn(model) if model_to_provider_fn else "openai",
+                    model=model,
+                    role=f"doctor{CACHED_ROLE_SUFFIX}",
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    run_id=run_id,
+                    phase_id=phase_id,
+                )
+            return _parse_doctor_json(cached["content"])
 
     try:
         # Use the client's underlying API call
-        if hasattr(client, "client") and hasattr(client.client, "chat"):
+        if is_openai:
             # OpenAI client
             completion = client.client.chat.completions.create(
                 model=model,
@@ -355,6 +385,10 @@ def _call_doctor_llm(
 
         # Parse JSON response with robust extraction
         response = _parse_doctor_json(content)
+        if cache_key is not None:
+            response_cache.put(
+                cache_key, {"content": content, "tokens_used": tokens_used}, "doctor", model
+            )
 
         # Record usage with exact token counts (no guessing)
         if tokens_used > 0 and (record_usage_fn or record_usage_total_only_fn):
@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 
 from .anthropic_builder_prompts import (
+    SegmentedPrompt,
     build_minimal_system_prompt,
     build_system_prompt,
     build_user_prompt,
@@ -32,6 +33,7 @@ __all__ = [
     "build_system_prompt",
     "build_minimal_system_prompt",
     "build_user_prompt",
+    "SegmentedPrompt",
     "PromptConfig",
     "PromptParts",
     "PromptBuilder",
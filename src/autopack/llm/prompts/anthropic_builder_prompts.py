@@ -12,15 +12,35 @@ Each prompt mode includes required "output contract" markers that are verified b
 
 Deliverables manifest preview limit: When a manifest is present, it shows up to 60 entries
 to keep the prompt compact while ensuring path correctness.
+
+IMP-PERF-029: The user prompt is laid out stable -> volatile (see SegmentedPrompt) so
+retries and sibling phases share a prefix the provider can serve from its prompt cache.
 """
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+class SegmentedPrompt(str):
+    """Prompt text that remembers its stable -> volatile segment boundaries.
+
+    IMP-PERF-029: Behaves exactly like the joined prompt string, so callers that
+    measure, log or concatenate it are unaffected. ``segments`` is ordered from
+    most to least reusable; every segment but the last may be cached by the
+    provider (see llm.providers.anthropic_transport.cache_control_blocks).
+    """
+
+    segments: Tuple[str, ...]
+
+    def __new__(cls, segments: Sequence[str]) -> "SegmentedPrompt":
+        prompt = super().__new__(cls, "\n".join(segment for segment in segments if segment))
+        prompt.segments = tuple(segments)
+        return prompt
+
+
 def build_system_prompt(
     use_full_file_mode: bool = True,
     use_structured_edit: bool = False,
@@ -445,9 +465,16 @@ def build_user_prompt(
     context_budget_tokens: Optional[
         int
     ] = None,  # NEW: Hard cap for file_context inclusion (approx tokens)
-) -> str:
+) -> SegmentedPrompt:
     """Build user prompt with phase details
 
+    IMP-PERF-029: Sections are emitted in three segments, most reusable first:
+    1. shared  - output format contract, learned rules and file context
+                 (identical across retries and sibling phases with the same scope)
+    2. phase   - phase specification, scope and deliverables contract, intention anchor
+                 (identical across retries of this phase)
+    3. attempt - retrieved memory context and run hints (may change every attempt)
+
     Args:
         phase_spec: Phase specification
         file_context: Repository file context
@@ -456,6 +483,9 @@ def build_user_prompt(
         use_full_file_mode: If True, include FULL file content for accurate editing
         config: BuilderOutputConfig instance (per IMPLEMENTATION_PLAN2.md)
         retrieved_context: Retrieved context from vector memory (formatted string)
+
+    Returns:
+        SegmentedPrompt (a str) with shared, phase and attempt segments
     """
     # Load config if not provided
     if config is None:
@@ -528,13 +558,13 @@ def build_user_prompt(
         )
 
     # Explicit format contract (applies to all modes)
-    prompt_parts.append("\n# Output Format (strict)")
-    prompt_parts.append("- Output JSON ONLY with a top-level `files` array.")
-    prompt_parts.append(
-        "- Each entry MUST include: path, mode (replace|create|modify), new_content."
-    )
-    prompt_parts.append("- Do NOT output git diff, markdown fences, or prose.")
-    prompt_parts.append("- No code fences, no surrounding text. Return only JSON.")
+    shared_parts = [
+        "# Output Format (strict)",
+        "- Output JSON ONLY with a top-level `files` array.",
+        "- Each entry MUST include: path, mode (replace|create|modify), new_content.",
+        "- Do NOT output git diff, markdown fences, or prose.",
+        "- No code fences, no surrounding text. Return only JSON.",
+    ]
 
     # Inject scope constraints if provided
     if scope_paths:
@@ -581,7 +611,7 @@ def build_user_prompt(
         )
 
     if project_rules:
-        prompt_parts.append("\n# Learned Rules (must follow):")
+        shared_parts.append("\n# Learned Rules (must follow):")
         for rule in project_rules[:10]:  # Top 10 rules
             # Support both dict-based rules and LearnedRule dataclasses
             if isinstance(rule, dict):
@@ -589,10 +619,11 @@ def build_user_prompt(
             else:
                 text = getattr(rule, "constraint", str(rule))
             if text:
-                prompt_parts.append(f"- {text}")
+                shared_parts.append(f"- {text}")
 
+    attempt_parts: List[str] = []
     if run_hints:
-        prompt_parts.append("\n# Hints from earlier phases:")
+        attempt_parts.append("\n# Hints from earlier phases:")
         for hint in run_hints[:5]:  # Recent hints
             # Support both dict-based hints and RunRuleHint dataclasses
             if isinstance(hint, dict):
@@ -600,7 +631,7 @@ def build_user_prompt(
             else:
                 text = getattr(hint, "hint_text", str(hint))
             if text:
-                prompt_parts.append(f"- {hint}")
+                attempt_parts.append(f"- {hint}")
 
     # Milestone 2: Inject intention anchor (canonical project goal)
     if run_id := phase_spec.get("run_id"):
@@ -617,9 +648,10 @@ def build_user_prompt(
 
     # NEW: Include retrieved context from vector memory (per IMPLEMENTATION_PLAN_MEMORY_AND_CONTEXT.md)
     if retrieved_context:
-        prompt_parts.append("\n# Retrieved Context (from previous runs/phases):")
-        prompt_parts.append(retrieved_context)
+        attempt_parts.append("\n# Retrieved Context (from previous runs/phases):")
+        attempt_parts.append(retrieved_context)
 
+    file_parts: List[str] = []
     if file_context:
         # Extract existing_files dict (autonomous_executor returns {"existing_files": {path: content}})
         files = file_context.get("existing_files", file_context)
@@ -675,17 +707,17 @@ def build_user_prompt(
                 )
 
                 if selection.omitted:
-                    prompt_parts.append("\n# Context Budgeting (Autopack)")
-                    prompt_parts.append(
+                    file_parts.append("\n# Context Budgeting (Autopack)")
+                    file_parts.append(
                         f"Autopack kept {len(selection.kept)} files (mode={selection.mode}) "
                         f"and omitted {len(selection.omitted)} files to stay within budget."
                     )
-                    prompt_parts.append(
+                    file_parts.append(
                         "If you need a missing file, proceed with best effort; do NOT invent its contents."
                     )
-                    prompt_parts.append("Omitted files (sample):")
+                    file_parts.append("Omitted files (sample):")
                     for fp in selection.omitted[:40]:
-                        prompt_parts.append(f"- {fp}")
+                        file_parts.append(f"- {fp}")
 
                 files = selection.kept
             except Exception as exc:
@@ -714,25 +746,25 @@ def build_user_prompt(
                                 break
 
         if missing_scope_files:
-            prompt_parts.append("\n# Missing Scoped Files")
-            prompt_parts.append(
+            file_parts.append("\n# Missing Scoped Files")
+            file_parts.append(
                 "The following scoped files are within scope but do not exist yet. You may create them:"
             )
             for missing_path in missing_scope_files:
-                prompt_parts.append(f"- {missing_path}")
+                file_parts.append(f"- {missing_path}")
 
         if use_structured_edit_mode:
             # NEW: Structured edit mode - show files with line numbers (per IMPLEMENTATION_PLAN3.md Phase 5)
-            prompt_parts.append("\n# Files in Context (for structured edits):")
-            prompt_parts.append("Use line numbers to specify where to make changes.")
-            prompt_parts.append("Line numbers are 1-indexed (first line is line 1).\n")
+            file_parts.append("\n# Files in Context (for structured edits):")
+            file_parts.append("Use line numbers to specify where to make changes.")
+            file_parts.append("Line numbers are 1-indexed (first line is line 1).\n")
 
             for file_path, content in files.items():
                 if not isinstance(content, str):
                     continue
 
                 line_count = content.count("\n") + 1
-                prompt_parts.append(f"\n## {file_path} ({line_count} lines)")
+                file_parts.append(f"\n## {file_path} ({line_count} lines)")
 
                 # Show file with line numbers
                 lines = content.split("\n")
@@ -741,17 +773,17 @@ def build_user_prompt(
                 if line_count > 300:
                     # First 100 lines
                     for i, line in enumerate(lines[:100], 1):
-                        prompt_parts.append(f"{i:4d} | {line}")
+                        file_parts.append(f"{i:4d} | {line}")
 
-                    prompt_parts.append(f"\n... [{line_count - 200} lines omitted] ...\n")
+                    file_parts.append(f"\n... [{line_count - 200} lines omitted] ...\n")
 
                     # Last 100 lines
                     for i, line in enumerate(lines[-100:], line_count - 99):
-                        prompt_parts.append(f"{i:4d} | {line}")
+                        file_parts.append(f"{i:4d} | {line}")
                 else:
                     # Show all lines with numbers
                     for i, line in enumerate(lines, 1):
-                        prompt_parts.append(f"{i:4d} | {line}")
+                        file_parts.append(f"{i:4d} | {line}")
 
         elif use_full_file_mode:
             # NEW: Separate files into modifiable vs read-only using scope metadata
@@ -778,46 +810,44 @@ def build_user_prompt(
 
             # Add explicit contract (per GPT_RESPONSE14 Q1)
             if modifiable_files or readonly_files:
-                prompt_parts.append("\n# File Modification Rules")
-                prompt_parts.append(
+                file_parts.append("\n# File Modification Rules")
+                file_parts.append(
                     "You are only allowed to modify files that are fully shown below."
                 )
-                prompt_parts.append(
+                file_parts.append(
                     "Any file marked as READ-ONLY CONTEXT must NOT appear in the `files` list in your JSON output."
                 )
-                prompt_parts.append(
+                file_parts.append(
                     "For each file you modify, return the COMPLETE new file content in `new_content`."
                 )
-                prompt_parts.append(
-                    "Do NOT use ellipses (...) or omit any code that should remain."
-                )
+                file_parts.append("Do NOT use ellipses (...) or omit any code that should remain.")
 
             # Show modifiable files with full content (Bucket A: ≤500 lines)
             if modifiable_files:
-                prompt_parts.append("\n# Files You May Modify (COMPLETE CONTENT):")
+                file_parts.append("\n# Files You May Modify (COMPLETE CONTENT):")
                 for file_path, content, line_count, meta in modifiable_files:
                     missing_note = (
                         " — file does not exist yet, create it." if meta.get("missing") else ""
                     )
-                    prompt_parts.append(f"\n## {file_path} ({line_count} lines){missing_note}")
+                    file_parts.append(f"\n## {file_path} ({line_count} lines){missing_note}")
                     if meta.get("missing"):
-                        prompt_parts.append(
+                        file_parts.append(
                             "This file is currently missing. Provide the complete new content below."
                         )
-                    prompt_parts.append(f"```\n{content}\n```")
+                    file_parts.append(f"```\n{content}\n```")
 
             # Show read-only files with truncated content (Bucket B+C: >500 lines)
             readonly_combined = readonly_files + [
                 (path, content, line_count, {}) for path, content, line_count in fallback_readonly
             ]
             if readonly_combined:
-                prompt_parts.append("\n# Read-Only Context Files (DO NOT MODIFY):")
+                file_parts.append("\n# Read-Only Context Files (DO NOT MODIFY):")
                 for file_path, content, line_count, meta in readonly_combined:
-                    prompt_parts.append(f"\n## {file_path} (READ-ONLY CONTEXT — DO NOT MODIFY)")
-                    prompt_parts.append(
+                    file_parts.append(f"\n## {file_path} (READ-ONLY CONTEXT — DO NOT MODIFY)")
+                    file_parts.append(
                         f"This file has {line_count} lines (too large for full-file replacement)."
                     )
-                    prompt_parts.append(
+                    file_parts.append(
                         "You may read this snippet as context, but you must NOT include it in your JSON output."
                     )
 
@@ -825,18 +855,24 @@ def build_user_prompt(
                     lines = content.split("\n")
                     first_part = "\n".join(lines[:200])
                     last_part = "\n".join(lines[-50:])
-                    prompt_parts.append(
+                    file_parts.append(
                         f"```\n{first_part}\n\n... [{line_count - 250} lines omitted] ...\n\n{last_part}\n```"
                     )
         else:
             # Legacy diff mode: show truncated content
-            prompt_parts.append("\n# Repository Context:")
+            file_parts.append("\n# Repository Context:")
             for file_path, content in list(files.items())[:5]:
-                prompt_parts.append(f"\n## {file_path}")
+                file_parts.append(f"\n## {file_path}")
                 # Show first 500 chars without literal "..." to avoid teaching model bad habits
                 if isinstance(content, str):
-                    prompt_parts.append(f"```\n{content[:500]}\n```")
+                    file_parts.append(f"```\n{content[:500]}\n```")
                 else:
-                    prompt_parts.append(f"```\n{str(content)[:500]}\n```")
-
-    return "\n".join(prompt_parts)
+                    file_parts.append(f"```\n{str(content)[:500]}\n```")
+
+    return SegmentedPrompt(
+        [
+            "\n".join(shared_parts + file_parts),
+            "\n".join(prompt_parts),
+            "\n".join(attempt_parts),
+        ]
+    )
@@ -8,6 +8,8 @@ from .anthropic_transport import (
     AnthropicTransportTimeout,
     TransportResponse,
     TransportUsage,
+    cache_control_blocks,
+    extract_usage,
 )
 
 __all__ = [
@@ -18,4 +20,6 @@ __all__ = [
     "AnthropicTransportApiError",
     "TransportResponse",
     "TransportUsage",
+    "cache_control_blocks",
+    "extract_usage",
 ]
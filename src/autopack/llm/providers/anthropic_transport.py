@@ -9,7 +9,7 @@ Extracted from anthropic_clients.py as part of PR-LLM-1 (Item 1.1: god file refa
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
 try:
     from anthropic import Anthropic
@@ -63,15 +63,28 @@ class AnthropicTransportApiError(AnthropicTransportError):
 
 @dataclass
 class TransportUsage:
-    """Token usage information from API response"""
+    """Token usage information from API response
+
+    IMP-PERF-029: input_tokens counts the whole prompt, including tokens
+    written to or read from the provider prompt cache, so budgets and
+    estimator telemetry keep their meaning. The cache split is reported
+    separately.
+    """
 
     input_tokens: int
     output_tokens: int
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
     @property
     def total_tokens(self) -> int:
         return self.input_tokens + self.output_tokens
 
+    @property
+    def uncached_input_tokens(self) -> int:
+        """Prompt tokens processed without touching the prompt cache."""
+        return self.input_tokens - self.cache_creation_input_tokens - self.cache_read_input_tokens
+
 
 @dataclass
 class TransportResponse:
@@ -83,6 +96,63 @@ class TransportResponse:
     model: str
 
 
+# ============================================================================
+# Prompt Caching
+# ============================================================================
+
+# IMP-PERF-029: Anthropic allows at most 4 cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def cache_control_blocks(
+    stable: Sequence[str], volatile: str = "", max_breakpoints: int = MAX_CACHE_BREAKPOINTS
+) -> List[Dict[str, Any]]:
+    """Build text content blocks with a cache breakpoint after each stable segment.
+
+    Segments must be ordered from most to least reusable. Block texts join
+    back to the same "\\n"-separated prompt the segments were built from.
+    Only the last ``max_breakpoints`` stable segments get a breakpoint; a
+    breakpoint caches everything before it, so earlier ones are redundant.
+
+    Args:
+        stable: Cacheable segments (e.g. shared instructions, file context)
+        volatile: Trailing segment that changes per attempt (never cached)
+        max_breakpoints: Breakpoints available to this list of blocks
+
+    Returns:
+        List of {"type": "text", ...} blocks for a system prompt or message content
+    """
+    texts = [text for text in stable if text]
+    blocks: List[Dict[str, Any]] = []
+    for index, text in enumerate(texts):
+        is_last = index == len(texts) - 1 and not volatile
+        block: Dict[str, Any] = {"type": "text", "text": text if is_last else text + "\n"}
+        if index >= len(texts) - max_breakpoints:
+            block["cache_control"] = dict(EPHEMERAL_CACHE_CONTROL)
+        blocks.append(block)
+    if volatile:
+        blocks.append({"type": "text", "text": volatile})
+    return blocks
+
+
+def _usage_count(usage: Any, name: str) -> int:
+    value = getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def extract_usage(usage: Any) -> TransportUsage:
+    """Normalize an Anthropic usage object, folding cache tokens into input_tokens."""
+    cache_creation = _usage_count(usage, "cache_creation_input_tokens")
+    cache_read = _usage_count(usage, "cache_read_input_tokens")
+    return TransportUsage(
+        input_tokens=usage.input_tokens + cache_creation + cache_read,
+        output_tokens=usage.output_tokens,
+        cache_creation_input_tokens=cache_creation,
+        cache_read_input_tokens=cache_read,
+    )
+
+
 # ============================================================================
 # Transport Wrapper
 # ============================================================================
@@ -150,19 +220,25 @@ class AnthropicTransport:
         messages: list,
         model: str,
         max_tokens: int,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         temperature: float = 1.0,
         stream: bool = False,
+        on_text: Optional[Callable[[str], Optional[bool]]] = None,
     ) -> TransportResponse:
         """Send request to Anthropic API (non-streaming)
 
         Args:
-            messages: List of message dicts [{"role": "user", "content": "..."}]
+            messages: List of message dicts [{"role": "user", "content": "..."}];
+                content may be a list of text blocks (see cache_control_blocks)
             model: Model identifier (e.g., "claude-sonnet-4-5")
             max_tokens: Maximum tokens to generate
-            system: Optional system prompt
+            system: Optional system prompt, as a string or list of text blocks
             temperature: Sampling temperature (default: 1.0)
             stream: If True, use streaming mode (default: False)
+            on_text: Optional callback invoked with each streamed text delta
+                (IMP-PERF-030). Returning False stops generation early; the
+                response then carries the text received so far and
+                stop_reason "aborted". Forces streaming mode.
 
         Returns:
             TransportResponse with content, usage, and stop_reason
@@ -174,7 +250,7 @@ class AnthropicTransport:
             CircuitBreakerOpenError: If circuit breaker is open
         """
         try:
-            if stream:
+            if stream or on_text is not None:
                 return self.circuit_breaker.call(
                     self._send_streaming_request,
                     messages=messages,
@@ -182,6 +258,7 @@ class AnthropicTransport:
                     max_tokens=max_tokens,
                     system=system,
                     temperature=temperature,
+                    on_text=on_text,
                 )
             else:
                 return self.circuit_breaker.call(
@@ -204,7 +281,7 @@ class AnthropicTransport:
         messages: list,
         model: str,
         max_tokens: int,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         temperature: float = 1.0,
     ) -> TransportResponse:
         """Send non-streaming request to Anthropic API"""
@@ -223,11 +300,8 @@ class AnthropicTransport:
             # Extract content from first content block
             content = response.content[0].text if response.content else ""
 
-            # Extract usage
-            usage = TransportUsage(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
+            # Extract usage (IMP-PERF-029: including prompt cache reads/writes)
+            usage = extract_usage(response.usage)
 
             # Extract stop reason
             stop_reason = getattr(response, "stop_reason", None)
@@ -247,8 +321,9 @@ class AnthropicTransport:
         messages: list,
         model: str,
         max_tokens: int,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         temperature: float = 1.0,
+        on_text: Optional[Callable[[str], Optional[bool]]] = None,
     ) -> TransportResponse:
         """Send streaming request to Anthropic API"""
         try:
@@ -264,18 +339,40 @@ class AnthropicTransport:
             # Use streaming context manager
             with self.client.messages.stream(**kwargs) as stream:
                 # Collect streaming text
-                content = ""
+                chunks: List[str] = []
+                aborted = False
                 for text in stream.text_stream:
-                    content += text
-
-                # Get final message for usage metadata
-                response = stream.get_final_message()
+                    chunks.append(text)
+                    # IMP-PERF-030: let the consumer process deltas and stop early
+                    if on_text is not None and on_text(text) is False:
+                        aborted = True
+                        break
+
+                if aborted:
+                    # Leaving the context manager closes the connection; usage so far
+                    # comes from the accumulated snapshot
+                    response = getattr(stream, "current_message_snapshot", None)
+                else:
+                    # Get final message for usage metadata
+                    response = stream.get_final_message()
+
+            content = "".join(chunks)
+            if aborted:
+                logger.info(f"[IMP-PERF-030] Stream aborted by consumer after {len(content)} chars")
+                partial_usage = getattr(response, "usage", None)
+                return TransportResponse(
+                    content=content,
+                    usage=(
+                        extract_usage(partial_usage)
+                        if partial_usage is not None
+                        else TransportUsage(input_tokens=0, output_tokens=0)
+                    ),
+                    stop_reason="aborted",
+                    model=getattr(response, "model", None) or model,
+                )
 
-            # Extract usage
-            usage = TransportUsage(
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-            )
+            # Extract usage (IMP-PERF-029: including prompt cache reads/writes)
+            usage = extract_usage(response.usage)
 
             # Extract stop reason
             stop_reason = getattr(response, "stop_reason", None)
@@ -5,16 +5,21 @@ Provides:
 - Streaming message handling
 - Token usage tracking
 - Stop reason detection
+- StubTransport: offline stand-in for providers.AnthropicTransport that
+  emulates provider prompt caching (IMP-PERF-029)
 
 This module extracts the transport layer from anthropic_clients.py.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 from dataclasses import dataclass
-from typing import Any, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from .providers.anthropic_transport import TransportResponse, TransportUsage
 
 logger = logging.getLogger(__name__)
 
@@ -252,3 +257,117 @@ class AnthropicTransport:
             True if utilization >= threshold
         """
         return AnthropicTransport.calculate_utilization(output_tokens, max_tokens) >= threshold
+
+
+class StubTransport:
+    """Local stand-in for providers.AnthropicTransport with prompt-cache emulation.
+
+    IMP-PERF-029: Serves canned responses without network access and models how
+    Anthropic prompt caching bills a request, so prompt layout changes can be
+    measured offline:
+    - each block with ``cache_control`` caches the prompt prefix ending at it
+      (system blocks first, then message content, in order)
+    - a request reads the longest prefix cached by an earlier request and
+      writes every longer breakpoint prefix
+    - tokens are approximated as 4 characters per token
+
+    IMP-PERF-030: When ``on_text`` is given, the response is delivered in
+    ``chunk_size`` character deltas like a real stream, and the callback can
+    stop generation early by returning False.
+
+    Example:
+        transport = StubTransport(responses=['{"files": []}'])
+        executor = AnthropicPhaseExecutor(transport, client)
+        executor.execute_phase(...)
+        print(transport.requests[-1]["usage"].cache_read_input_tokens)
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Sequence[str]] = None,
+        min_cacheable_tokens: int = 0,
+        chunk_size: int = 64,
+    ):
+        """Initialize stub transport.
+
+        Args:
+            responses: Response texts returned in order (the last one repeats)
+            min_cacheable_tokens: Breakpoint prefixes shorter than this are not
+                cached (Anthropic requires 1024+ tokens on most models)
+            chunk_size: Characters per streamed text delta
+        """
+        self.responses = list(responses or ["{}"])
+        self.min_cacheable_tokens = min_cacheable_tokens
+        self.chunk_size = chunk_size
+        self.requests: List[Dict[str, Any]] = []
+        self._cached_prefixes: Set[str] = set()
+
+    @staticmethod
+    def _blocks(content: Union[str, List[Dict[str, Any]], None]) -> List[Dict[str, Any]]:
+        if not content:
+            return []
+        if isinstance(content, str):
+            return [{"type": "text", "text": content}]
+        return list(content)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Approximate token count (4 characters per token)."""
+        return (len(text) + 3) // 4
+
+    def send_request(
+        self,
+        messages: list,
+        model: str,
+        max_tokens: int,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        temperature: float = 1.0,
+        stream: bool = False,
+        on_text: Optional[Callable[[str], Optional[bool]]] = None,
+    ) -> TransportResponse:
+        """Return the next canned response with emulated prompt-cache usage."""
+        blocks = self._blocks(system)
+        for message in messages:
+            blocks.extend(self._blocks(message.get("content")))
+
+        prefix_hash = hashlib.sha256(model.encode("utf-8"))
+        prompt_tokens = 0
+        breakpoints = []
+        for block in blocks:
+            text = block.get("text", "")
+            prefix_hash.update(text.encode("utf-8"))
+            prompt_tokens += self.estimate_tokens(text)
+            if block.get("cache_control") and prompt_tokens >= self.min_cacheable_tokens:
+                breakpoints.append((prefix_hash.hexdigest(), prompt_tokens))
+
+        cache_read = max(
+            (tokens for key, tokens in breakpoints if key in self._cached_prefixes), default=0
+        )
+        cache_write = max((tokens for _, tokens in breakpoints), default=0) - cache_read
+        self._cached_prefixes.update(key for key, _ in breakpoints)
+
+        content = self.responses[min(len(self.requests), len(self.responses) - 1)]
+        stop_reason = "end_turn"
+        if on_text is not None:
+            for start in range(0, len(content), self.chunk_size):
+                if on_text(content[start : start + self.chunk_size]) is False:
+                    content = content[: start + self.chunk_size]
+                    stop_reason = "aborted"
+                    break
+        usage = TransportUsage(
+            input_tokens=prompt_tokens,
+            output_tokens=self.estimate_tokens(content),
+            cache_creation_input_tokens=max(cache_write, 0),
+            cache_read_input_tokens=cache_read,
+        )
+        self.requests.append(
+            {
+                "messages": messages,
+                "system": system,
+                "model": model,
+                "max_tokens": max_tokens,
+                "usage": usage,
+                "stop_reason": stop_reason,
+            }
+        )
+        return TransportResponse(content=content, usage=usage, stop_reason=stop_reason, model=model)
@@ -11,9 +11,10 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
-from sqlalchemy import func
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
+from ..llm_response_cache import CACHED_ROLE_SUFFIX
 from ..usage_recorder import LlmUsageEvent
 
 logger = logging.getLogger(__name__)
@@ -183,12 +184,17 @@ def aggregate_usage_by_run(db: Session, run_id: str) -> Dict:
         Dict with aggregated usage statistics including:
         - total_tokens: Total tokens used across all calls
         - total_calls: Number of LLM calls made
+        - cached_calls: Calls served from the LLM response cache (IMP-PERF-028),
+          included in total_calls with zero tokens
         - total_cost_estimate: Estimated cost (placeholder)
     """
     result = (
         db.query(
             func.sum(LlmUsageEvent.total_tokens).label("total_tokens"),
             func.count(LlmUsageEvent.id).label("total_calls"),
+            func.sum(case((LlmUsageEvent.role.like(f"%{CACHED_ROLE_SUFFIX}"), 1), else_=0)).label(
+                "cached_calls"
+            ),
         )
         .filter(LlmUsageEvent.run_id == run_id)
         .first()
@@ -201,6 +207,7 @@ def aggregate_usage_by_run(db: Session, run_id: str) -> Dict:
         "run_id": run_id,
         "total_tokens": total_tokens,
         "total_calls": total_calls,
+        "cached_calls": result.cached_calls or 0,
         "total_cost_estimate": 0.0,  # Placeholder for cost calculation
     }
 
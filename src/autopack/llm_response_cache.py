@@ -0,0 +1,278 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+IMP-PERF-028: Retries, resumed runs and dry-run replays re-send identical
+prompts through LlmService (builder, auditor, doctor), paying full latency
+and cost each time. LlmResponseCache stores the parsed response of a call
+under a SHA-256 of its inputs - role, model, the normalized prompt content,
+max_tokens and temperature - so an identical call is served from disk.
+
+Entries are JSON files sharded by the first two hex digits of the key.
+Each entry expires after ``ttl_seconds``; once the cache exceeds
+``max_bytes`` the least recently used entries (by mtime, refreshed on hit)
+are evicted. Only successful responses should be stored.
+
+Cache hits are recorded as zero-token usage events with a ``<role>:cached``
+role so they show up in cost reports next to the real calls
+(see usage_recorder.get_llm_response_cache_stats).
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = ".llm_response_cache"
+CACHED_ROLE_SUFFIX = ":cached"
+DEFAULT_TTL_SECONDS = 86400
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Get the response cache directory under the autonomous runs directory."""
+    from autopack.config import settings
+
+    return Path(settings.autonomous_runs_dir) / CACHE_DIRNAME
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize prompt text so formatting-only differences share a cache entry.
+
+    Unifies line endings and strips trailing whitespace on each line and
+    around the whole text.
+    """
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert call inputs into a JSON-stable structure with normalized strings."""
+    if isinstance(value, str):
+        return normalize_prompt(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _canonical(dataclasses.asdict(value))
+    if hasattr(value, "to_dict"):
+        return _canonical(value.to_dict())
+    if hasattr(value, "__dict__"):
+        return _canonical({k: v for k, v in vars(value).items() if not k.startswith("_")})
+    return str(value)
+
+
+def make_cache_key(
+    role: str,
+    model: str,
+    prompt: Any,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+) -> str:
+    """Build the content address for an LLM call.
+
+    Args:
+        role: Caller role (builder, auditor, doctor)
+        model: Resolved model name
+        prompt: Prompt text, or the structured inputs the prompt is built from
+        max_tokens: Output token limit
+        temperature: Sampling temperature (None if provider default)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        {
+            "role": role,
+            "model": model,
+            "prompt": _canonical(prompt),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """On-disk LLM response cache with TTL and size-based LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str, role: str = "unknown") -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None on miss/expiry."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count(self.misses, role)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[IMP-PERF-028] Dropping unreadable cache entry {path.name}: {e}")
+            self._remove(path)
+            self._count(self.misses, role)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            self._count(self.misses, role)
+            return None
+
+        try:
+            # Refresh recency for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(self.hits, role)
+        return entry.get("response")
+
+    def put(
+        self, key: str, response: Dict[str, Any], role: str = "unknown", model: str = ""
+    ) -> None:
+        """Store a response under key, evicting old entries if over max_bytes."""
+        path = self._path(key)
+        data = json.dumps(
+            {"role": role, "model": model, "created_at": time.time(), "response": response},
+            default=str,
+        ).encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"[IMP-PERF-028] Failed to write response cache entry: {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return in-process hit/miss counters per role."""
+        with self._lock:
+            roles = set(self.hits) | set(self.misses)
+            return {
+                "hits": sum(self.hits.values()),
+                "misses": sum(self.misses.values()),
+                "evictions": self.evictions,
+                "by_role": {
+                    role: {"hits": self.hits[role], "misses": self.misses[role]}
+                    for role in sorted(roles)
+                },
+            }
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.json"):
+                self._remove(path)
+            self._total_bytes = 0
+
+    def _count(self, counter: Counter, role: str) -> None:
+        with self._lock:
+            counter[role] += 1
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*/*.json") if p.is_file())
+
+    def _evict(self) -> None:
+        """Delete expired entries, then least recently used ones down to 90% of max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        cutoff = time.time() - self.ttl_seconds
+        for mtime, size, path in entries:
+            if total <= target and mtime >= cutoff:
+                break
+            if self._remove(path):
+                total -= size
+                self.evictions += 1
+        self._total_bytes = total
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+_cache: Optional[LlmResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache(role: str) -> Optional[LlmResponseCache]:
+    """Get the process-wide response cache if caching is enabled for role.
+
+    Args:
+        role: builder, auditor or doctor
+
+    Returns:
+        The shared LlmResponseCache, or None when disabled globally or for role
+    """
+    global _cache
+    from .config import settings
+
+    if not getattr(settings, "llm_response_cache_enabled", False):
+        return None
+    if not getattr(settings, f"llm_response_cache_{role}", False):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LlmResponseCache(
+                ttl_seconds=settings.llm_response_cache_ttl_seconds,
+                max_bytes=settings.llm_response_cache_max_mb * 1024 * 1024,
+            )
+        return _cache
+
+
+def reset_llm_response_cache() -> None:
+    """Forget the process-wide cache instance (entries on disk are kept)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -7,9 +7,13 @@ This service wraps the OpenAI clients and provides:
 - Quality gate enforcement for high-risk categories
 """
 
+import dataclasses
 import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -37,15 +41,22 @@ def estimate_tokens(text: str, *, chars_per_token: float = 4.0) -> int:
     return max(1, int(len(text) / chars_per_token))
 
 
+from .apply.engine import is_ndjson_synthetic_patch
 from .dual_auditor import DualAuditor
 from .error_recovery import DoctorContextSummary, DoctorRequest, DoctorResponse, choose_doctor_model
 from .exceptions import ScopeReductionError
 from .llm import doctor
 from .llm.client_resolution import resolve_client_and_model
 from .llm_client import AuditorResult, BuilderResult
+from .llm_response_cache import (
+    CACHED_ROLE_SUFFIX,
+    LlmResponseCache,
+    get_llm_response_cache,
+    make_cache_key,
+)
 from .model_router import ModelRouter
 from .quality_gate import QualityGate, integrate_with_auditor
-from .usage_recorder import LlmUsageEvent
+from .usage_recorder import LlmUsageEvent, UsageEventData, record_usage
 
 # Import OpenAI clients with graceful fallback
 try:
@@ -513,18 +524,50 @@ class LlmService:
         # Resolve client and model (handling fallbacks)
         builder_client, resolved_model = self._resolve_client_and_model("builder", model)
 
-        # Execute builder with selected model
-        result = builder_client.execute_phase(
-            phase_spec=phase_spec,
-            file_context=file_context,
-            max_tokens=max_tokens,
-            model=resolved_model,
-            project_rules=project_rules,
-            run_hints=run_hints,
-            use_full_file_mode=use_full_file_mode,  # NEW: Pass mode from pre-flight
-            config=config,  # NEW: Pass BuilderOutputConfig
-            retrieved_context=retrieved_context,  # NEW: Vector memory context
+        # IMP-PERF-028: Serve identical builder calls from the response cache. The
+        # attempt index is part of the key so a retry after a rejected or failed
+        # patch reaches the model instead of replaying the same patch
+        response_cache, cache_key, cached = self._response_cache_lookup(
+            "builder",
+            resolved_model,
+            {
+                "attempt_index": attempt_index,
+                "phase_spec": phase_spec,
+                "file_context": file_context,
+                "project_rules": project_rules,
+                "run_hints": run_hints,
+                "use_full_file_mode": use_full_file_mode,
+                "config": config,
+                "retrieved_context": retrieved_context,
+            },
+            max_tokens,
         )
+        if cached is not None:
+            result = self._result_from_cache(BuilderResult, cached)
+        else:
+            # Execute builder with selected model
+            result = builder_client.execute_phase(
+                phase_spec=phase_spec,
+                file_context=file_context,
+                max_tokens=max_tokens,
+                model=resolved_model,
+                project_rules=project_rules,
+                run_hints=run_hints,
+                use_full_file_mode=use_full_file_mode,  # NEW: Pass mode from pre-flight
+                config=config,  # NEW: Pass BuilderOutputConfig
+                retrieved_context=retrieved_context,  # NEW: Vector memory context
+            )
+            # Structured edit plans, truncated output and NDJSON results (applied to
+            # disk by the client; the patch is only a synthetic header) are not
+            # replayable from cache
+            if (
+                response_cache is not None
+                and result.success
+                and result.edit_plan is None
+                and not result.was_truncated
+                and not is_ndjson_synthetic_patch(result.patch_content or "")
+            ):
+                response_cache.put(cache_key, dataclasses.asdict(result), "builder", resolved_model)
 
         # Classify outcome for escalation tracking / provider health
         if phase_id:
@@ -553,7 +596,9 @@ class LlmService:
                 )
 
         # Record usage in database
-        if result.success and result.tokens_used > 0:
+        if cached is not None:
+            self._record_cache_hit("builder", resolved_model, run_id, phase_id)
+        elif result.success and result.tokens_used > 0:
             # BUILD-144 P0: No heuristic token splits - require exact counts or record total-only
             if result.prompt_tokens is not None and result.completion_tokens is not None:
                 # Exact counts available - use them
@@ -677,8 +722,10 @@ class LlmService:
             pass
 
         # Run dual audit only if enabled and configured for this category
+        cached = None
         if settings.dual_audit_enabled and self._should_use_dual_audit(task_category):
             # Run dual audit (may early-exit if primary has high confidence)
+            dual_audit_timing: Dict = {}
             primary_result, secondary_result = self._run_dual_audit(
                 patch_content=patch_content,
                 phase_spec=phase_spec,
@@ -689,6 +736,7 @@ class LlmService:
                 run_hints=run_hints,
                 run_id=run_id,
                 phase_id=phase_id,
+                timing=dual_audit_timing,
             )
 
             # IMP-PERF-002: Handle early-exit case (secondary_result is None)
@@ -700,6 +748,20 @@ class LlmService:
                     f"[DUAL-AUDIT] Early exit applied - using primary result only "
                     f"(confidence={primary_result.confidence:.2f})"
                 )
+                # IMP-PERF-027: Record early exits too, so hedged secondaries that were
+                # launched and then discarded show up in the telemetry
+                self._log_dual_audit_telemetry(
+                    phase_id=phase_id or "unknown",
+                    task_category=task_category,
+                    primary_model=model,
+                    secondary_model=secondary_model,
+                    primary_result=primary_result,
+                    secondary_result=None,
+                    disagreement=None,
+                    judge_result=None,
+                    final_result=result,
+                    timing=dual_audit_timing,
+                )
             else:
                 # Full dual audit - detect disagreement and merge
                 # Detect disagreement
@@ -740,21 +802,41 @@ class LlmService:
                     disagreement=disagreement,
                     judge_result=judge_result,
                     final_result=result,
+                    timing=dual_audit_timing,
                 )
         else:
             # Standard single-auditor path
             # Resolve client and model (handling fallbacks)
             auditor_client, resolved_model = self._resolve_client_and_model("auditor", model)
 
-            # Execute auditor with selected model
-            result = auditor_client.review_patch(
-                patch_content=patch_content,
-                phase_spec=phase_spec,
-                max_tokens=max_tokens,
-                model=resolved_model,
-                project_rules=project_rules,
-                run_hints=run_hints,
+            # IMP-PERF-028: Serve identical reviews from the response cache
+            response_cache, cache_key, cached = self._response_cache_lookup(
+                "auditor",
+                resolved_model,
+                {
+                    "patch_content": patch_content,
+                    "phase_spec": phase_spec,
+                    "project_rules": project_rules,
+                    "run_hints": run_hints,
+                },
+                max_tokens,
             )
+            if cached is not None:
+                result = self._result_from_cache(AuditorResult, cached)
+            else:
+                # Execute auditor with selected model
+                result = auditor_client.review_patch(
+                    patch_content=patch_content,
+                    phase_spec=phase_spec,
+                    max_tokens=max_tokens,
+                    model=resolved_model,
+                    project_rules=project_rules,
+                    run_hints=run_hints,
+                )
+                if response_cache is not None and not result.error:
+                    response_cache.put(
+                        cache_key, dataclasses.asdict(result), "auditor", resolved_model
+                    )
 
         # Classify outcome for escalation tracking
         if phase_id:
@@ -774,7 +856,9 @@ class LlmService:
                 )
 
         # Record usage in database (skip if dual audit - usage already recorded)
-        if not self._should_use_dual_audit(task_category) and result.tokens_used > 0:
+        if cached is not None:
+            self._record_cache_hit("auditor", resolved_model, run_id, phase_id)
+        elif not self._should_use_dual_audit(task_category) and result.tokens_used > 0:
             # BUILD-144 P0: No heuristic token splits - require exact counts or record total-only
             if result.prompt_tokens is not None and result.completion_tokens is not None:
                 # Exact counts available - use them
@@ -847,6 +931,19 @@ class LlmService:
             run_id: Optional run identifier
             phase_id: Optional phase identifier
         """
+        if self._submit_buffered_usage(
+            UsageEventData(
+                provider=provider,
+                model=model,
+                run_id=run_id,
+                phase_id=phase_id,
+                role=role,
+                total_tokens=prompt_tokens + completion_tokens,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+            )
+        ):
+            return
         try:
             usage_event = LlmUsageEvent(
                 provider=provider,
@@ -890,6 +987,19 @@ class LlmService:
             run_id: Optional run identifier
             phase_id: Optional phase identifier
         """
+        if self._submit_buffered_usage(
+            UsageEventData(
+                provider=provider,
+                model=model,
+                run_id=run_id,
+                phase_id=phase_id,
+                role=role,
+                total_tokens=total_tokens,
+                prompt_tokens=None,
+                completion_tokens=None,
+            )
+        ):
+            return
         try:
             # Record with total_tokens populated and prompt/completion as None
             usage_event = LlmUsageEvent(
@@ -914,6 +1024,71 @@ class LlmService:
             print(f"Warning: Failed to record total-only usage: {e}")
             self.db.rollback()
 
+    def _response_cache_lookup(
+        self, role: str, model: str, prompt: Dict, max_tokens: Optional[int]
+    ) -> Tuple[Optional[LlmResponseCache], Optional[str], Optional[Dict]]:
+        """Look up a call in the LLM response cache.
+
+        IMP-PERF-028: The builder and auditor prompts are rendered inside the
+        provider clients, so the key is built from the inputs they render
+        (plus role, resolved model and max_tokens).
+
+        Returns:
+            (cache, key, cached response) - cache and key are None when caching
+            is disabled for role; the response is None on a miss
+        """
+        response_cache = get_llm_response_cache(role)
+        if response_cache is None:
+            return None, None, None
+        key = make_cache_key(role, model, prompt, max_tokens=max_tokens)
+        cached = response_cache.get(key, role)
+        if cached is not None:
+            logger.info(
+                f"[IMP-PERF-028] {role} response served from cache "
+                f"(model={model}, saved {cached.get('tokens_used', 0)} tokens)"
+            )
+        return response_cache, key, cached
+
+    @staticmethod
+    def _result_from_cache(result_cls, cached: Dict):
+        """Rebuild a BuilderResult/AuditorResult from its cached dict."""
+        names = {field.name for field in dataclasses.fields(result_cls)}
+        return result_cls(**{k: v for k, v in cached.items() if k in names})
+
+    def _record_cache_hit(
+        self, role: str, model: str, run_id: Optional[str], phase_id: Optional[str]
+    ) -> None:
+        """Record a cache hit as a zero-token usage event (role "<role>:cached")."""
+        self._record_usage(
+            provider=self._model_to_provider(model),
+            model=model,
+            role=f"{role}{CACHED_ROLE_SUFFIX}",
+            prompt_tokens=0,
+            completion_tokens=0,
+            run_id=run_id,
+            phase_id=phase_id,
+        )
+
+    def _submit_buffered_usage(self, event: UsageEventData) -> bool:
+        """Queue a usage event on the buffered recorder when it is enabled.
+
+        IMP-PERF-022: Keeps the usage INSERT/COMMIT off the LLM call path.
+
+        Returns:
+            True if the event was handed to the buffered recorder
+        """
+        from .config import settings
+
+        if not getattr(settings, "usage_buffer_enabled", False):
+            return False
+        try:
+            from .usage_buffer import get_usage_buffer
+
+            return get_usage_buffer().submit(event)
+        except Exception as e:
+            logger.warning(f"[IMP-PERF-022] Buffered usage recording unavailable: {e}")
+            return False
+
     def _model_to_provider(self, model: str) -> str:
         """
         Map model name to provider.
@@ -1140,6 +1315,7 @@ class LlmService:
                 model_to_provider_fn=self._model_to_provider,
                 record_usage_fn=self._record_usage,
                 record_usage_total_only_fn=self._record_usage_total_only,
+                response_cache=get_llm_response_cache("doctor"),
             ),
         )
 
@@ -1258,6 +1434,9 @@ class LlmService:
         run_id: Optional[str],
         phase_id: Optional[str],
         early_exit_threshold: float = 0.9,
+        concurrent: Optional[bool] = None,
+        hedge_delay_seconds: Optional[float] = None,
+        timing: Optional[Dict] = None,
     ) -> Tuple[AuditorResult, Optional[AuditorResult]]:
         """Run primary auditor, and optionally secondary with early-exit optimization.
 
@@ -1265,6 +1444,12 @@ class LlmService:
         If primary auditor approves with high confidence (>0.9), skip secondary
         to reduce LLM costs.
 
+        IMP-PERF-027: In concurrent mode the secondary is launched alongside the
+        primary (optionally after a hedge delay) instead of after it, so a
+        low-confidence primary no longer costs two sequential LLM latencies.
+        If the primary clears the early-exit threshold the secondary is
+        cancelled, or its result discarded if it is already in flight.
+
         Args:
             patch_content: Git diff/patch to review
             phase_spec: Phase specification
@@ -1276,24 +1461,85 @@ class LlmService:
             run_id: Run identifier
             phase_id: Phase identifier
             early_exit_threshold: Confidence threshold for skipping secondary (default 0.9)
+            concurrent: Run auditors concurrently (default: settings.dual_audit_concurrent)
+            hedge_delay_seconds: Delay before launching the concurrent secondary
+                (default: settings.dual_audit_hedge_delay_seconds)
+            timing: Optional dict filled with wall-clock and token stats for telemetry
 
         Returns:
             Tuple of (primary_result, secondary_result or None if early-exit)
         """
+        from .config import settings
+
+        if concurrent is None:
+            concurrent = settings.dual_audit_concurrent
+        if hedge_delay_seconds is None:
+            hedge_delay_seconds = settings.dual_audit_hedge_delay_seconds
+
         logger.info(
             f"[DUAL-AUDIT] Running dual audit: primary={primary_model}, secondary={secondary_model}"
+            + (f" (concurrent, hedge_delay={hedge_delay_seconds}s)" if concurrent else "")
         )
 
-        # Run primary auditor
-        primary_client, resolved_primary = self._resolve_client_and_model("auditor", primary_model)
-        primary_result = primary_client.review_patch(
+        review_kwargs = dict(
             patch_content=patch_content,
             phase_spec=phase_spec,
-            max_tokens=max_tokens,
-            model=resolved_primary,
             project_rules=project_rules,
             run_hints=run_hints,
         )
+        secondary_max_tokens = max_tokens // 2 if max_tokens else None
+        stats = timing if timing is not None else {}
+        stats.update(
+            {
+                "mode": "concurrent" if concurrent else "sequential",
+                "hedge_delay_seconds": hedge_delay_seconds if concurrent else None,
+                "secondary_launched": False,
+                "secondary_seconds": None,
+                "secondary_tokens": None,
+            }
+        )
+        started = time.perf_counter()
+
+        primary_client, resolved_primary = self._resolve_client_and_model("auditor", primary_model)
+        secondary_future = None
+        if concurrent:
+            secondary_client, resolved_secondary = self._resolve_client_and_model(
+                "auditor", secondary_model
+            )
+            primary_done = threading.Event()
+            skip_secondary = threading.Event()
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dual-audit")
+
+            def run_secondary():
+                # Hedge: give the primary a head start, then launch unless it cleared
+                primary_done.wait(hedge_delay_seconds)
+                if skip_secondary.is_set():
+                    return None
+                stats["secondary_launched"] = True
+                secondary_started = time.perf_counter()
+                result = secondary_client.review_patch(
+                    max_tokens=secondary_max_tokens, model=resolved_secondary, **review_kwargs
+                )
+                stats["secondary_seconds"] = time.perf_counter() - secondary_started
+                return result
+
+            secondary_future = executor.submit(run_secondary)
+            executor.shutdown(wait=False)
+
+        # Run primary auditor
+        try:
+            primary_result = primary_client.review_patch(
+                max_tokens=max_tokens, model=resolved_primary, **review_kwargs
+            )
+        except Exception:
+            if secondary_future is not None:
+                skip_secondary.set()
+                primary_done.set()
+                self._abandon_secondary_audit(
+                    secondary_future, resolved_secondary, run_id, phase_id
+                )
+            raise
+        stats["primary_seconds"] = time.perf_counter() - started
 
         # IMP-PERF-002: Calculate confidence and check for early exit
         primary_confidence = self._calculate_auditor_confidence(primary_result)
@@ -1304,30 +1550,18 @@ class LlmService:
                 f"[DUAL-AUDIT] Early exit: primary approved with confidence {primary_confidence:.2f} "
                 f"> threshold {early_exit_threshold}. Skipping secondary auditor."
             )
+            if secondary_future is not None:
+                skip_secondary.set()
+                primary_done.set()
+                self._abandon_secondary_audit(
+                    secondary_future, resolved_secondary, run_id, phase_id
+                )
             # Record usage for primary only
-            if primary_result.tokens_used > 0:
-                if (
-                    primary_result.prompt_tokens is not None
-                    and primary_result.completion_tokens is not None
-                ):
-                    self._record_usage(
-                        provider=self._model_to_provider(resolved_primary),
-                        model=resolved_primary,
-                        role="auditor:primary",
-                        prompt_tokens=primary_result.prompt_tokens,
-                        completion_tokens=primary_result.completion_tokens,
-                        run_id=run_id,
-                        phase_id=phase_id,
-                    )
-                else:
-                    self._record_usage_total_only(
-                        provider=self._model_to_provider(resolved_primary),
-                        model=resolved_primary,
-                        role="auditor:primary",
-                        total_tokens=primary_result.tokens_used,
-                        run_id=run_id,
-                        phase_id=phase_id,
-                    )
+            self._record_auditor_usage(
+                primary_result, resolved_primary, "primary", run_id, phase_id
+            )
+            stats["wall_clock_seconds"] = time.perf_counter() - started
+            stats["wall_clock_saved_seconds"] = 0.0
             return primary_result, None
 
         logger.info(
@@ -1335,48 +1569,125 @@ class LlmService:
             f"approved={primary_result.approved}"
         )
 
-        # Run secondary auditor
-        secondary_client, resolved_secondary = self._resolve_client_and_model(
-            "auditor", secondary_model
-        )
-        secondary_result = secondary_client.review_patch(
-            patch_content=patch_content,
-            phase_spec=phase_spec,
-            max_tokens=max_tokens // 2 if max_tokens else None,
-            model=resolved_secondary,
-            project_rules=project_rules,
-            run_hints=run_hints,
-        )
+        if secondary_future is not None:
+            # Already running, or launched now if still inside the hedge delay
+            primary_done.set()
+            secondary_result = secondary_future.result()
+        else:
+            # Run secondary auditor
+            secondary_client, resolved_secondary = self._resolve_client_and_model(
+                "auditor", secondary_model
+            )
+            secondary_started = time.perf_counter()
+            secondary_result = secondary_client.review_patch(
+                max_tokens=secondary_max_tokens, model=resolved_secondary, **review_kwargs
+            )
+            stats["secondary_launched"] = True
+            stats["secondary_seconds"] = time.perf_counter() - secondary_started
         secondary_result.confidence = self._calculate_auditor_confidence(secondary_result)
 
         # Record usage for both
-        for result, model, role_suffix in [
-            (primary_result, resolved_primary, "primary"),
-            (secondary_result, resolved_secondary, "secondary"),
-        ]:
-            if result.tokens_used > 0:
-                if result.prompt_tokens is not None and result.completion_tokens is not None:
-                    self._record_usage(
-                        provider=self._model_to_provider(model),
-                        model=model,
-                        role=f"auditor:{role_suffix}",
-                        prompt_tokens=result.prompt_tokens,
-                        completion_tokens=result.completion_tokens,
-                        run_id=run_id,
-                        phase_id=phase_id,
-                    )
-                else:
-                    self._record_usage_total_only(
-                        provider=self._model_to_provider(model),
-                        model=model,
-                        role=f"auditor:{role_suffix}",
-                        total_tokens=result.tokens_used,
-                        run_id=run_id,
-                        phase_id=phase_id,
-                    )
+        self._record_auditor_usage(primary_result, resolved_primary, "primary", run_id, phase_id)
+        self._record_auditor_usage(
+            secondary_result, resolved_secondary, "secondary", run_id, phase_id
+        )
 
+        wall_clock = time.perf_counter() - started
+        stats["wall_clock_seconds"] = wall_clock
+        stats["wall_clock_saved_seconds"] = max(
+            0.0, stats["primary_seconds"] + stats["secondary_seconds"] - wall_clock
+        )
+        stats["secondary_tokens"] = secondary_result.tokens_used
         return primary_result, secondary_result
 
+    def _abandon_secondary_audit(
+        self,
+        future: Future,
+        model: str,
+        run_id: Optional[str],
+        phase_id: Optional[str],
+    ) -> None:
+        """Cancel a concurrent secondary audit that is no longer needed.
+
+        IMP-PERF-027: The caller has already told the worker to stop, so a
+        secondary that has not reached the LLM yet is skipped. One already in
+        flight cannot be interrupted; its result is discarded when it completes
+        and only its token cost is accounted for.
+        """
+        if future.cancel():
+            return
+
+        def on_done(done: Future) -> None:
+            if done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            if result is None or result.tokens_used <= 0:
+                return
+            logger.info(
+                f"[IMP-PERF-027] Discarded in-flight secondary audit spent "
+                f"{result.tokens_used} tokens (phase={phase_id})"
+            )
+            event = UsageEventData(
+                provider=self._model_to_provider(model),
+                model=model,
+                run_id=run_id,
+                phase_id=phase_id,
+                role="auditor:secondary_discarded",
+                total_tokens=result.tokens_used,
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+            )
+            # Runs on the worker thread, so self.db (owned by the caller) is not used
+            if not self._submit_buffered_usage(event):
+                self._record_usage_on_own_session(event)
+
+        future.add_done_callback(on_done)
+
+    def _record_usage_on_own_session(self, event: UsageEventData) -> None:
+        """Record a usage event on a new DB session (safe off the calling thread)."""
+        from .database import SessionLocal
+
+        session = SessionLocal()
+        try:
+            record_usage(session, event)
+        except Exception as e:
+            # Don't fail the worker if usage recording fails
+            logger.warning(f"Failed to record {event.role} usage: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _record_auditor_usage(
+        self,
+        result: AuditorResult,
+        model: str,
+        role_suffix: str,
+        run_id: Optional[str],
+        phase_id: Optional[str],
+    ) -> None:
+        """Record usage for one dual-audit auditor call (skipped if no tokens)."""
+        if result.tokens_used <= 0:
+            return
+        if result.prompt_tokens is not None and result.completion_tokens is not None:
+            self._record_usage(
+                provider=self._model_to_provider(model),
+                model=model,
+                role=f"auditor:{role_suffix}",
+                prompt_tokens=result.prompt_tokens,
+                completion_tokens=result.completion_tokens,
+                run_id=run_id,
+                phase_id=phase_id,
+            )
+        else:
+            self._record_usage_total_only(
+                provider=self._model_to_provider(model),
+                model=model,
+                role=f"auditor:{role_suffix}",
+                total_tokens=result.tokens_used,
+                run_id=run_id,
+                phase_id=phase_id,
+            )
+
     def _detect_dual_audit_disagreement(
         self, primary: AuditorResult, secondary: AuditorResult
     ) -> Dict:
@@ -1631,10 +1942,11 @@ class LlmService:
         primary_model: str,
         secondary_model: str,
         primary_result: AuditorResult,
-        secondary_result: AuditorResult,
-        disagreement: Dict,
+        secondary_result: Optional[AuditorResult],
+        disagreement: Optional[Dict],
         judge_result: Optional[AuditorResult],
         final_result: AuditorResult,
+        timing: Optional[Dict] = None,
     ):
         """Log dual audit telemetry to JSONL file for analysis.
 
@@ -1644,10 +1956,11 @@ class LlmService:
             primary_model: Primary auditor model
             secondary_model: Secondary auditor model
             primary_result: Primary auditor result
-            secondary_result: Secondary auditor result
-            disagreement: Disagreement info
+            secondary_result: Secondary auditor result, or None on early exit
+            disagreement: Disagreement info, or None on early exit
             judge_result: Optional judge result
             final_result: Final merged result
+            timing: Optional wall-clock/token stats from _run_dual_audit (IMP-PERF-027)
         """
         telemetry_dir = Path("logs/telemetry")
         telemetry_dir.mkdir(parents=True, exist_ok=True)
@@ -1663,16 +1976,34 @@ class LlmService:
             "secondary_model": secondary_model,
             "primary_approved": primary_result.approved,
             "primary_issues_count": len(primary_result.issues_found),
-            "secondary_approved": secondary_result.approved,
-            "secondary_issues_count": len(secondary_result.issues_found),
-            "has_disagreement": disagreement["has_disagreement"],
-            "disagreement_type": disagreement.get("type"),
+            "early_exit": secondary_result is None,
+            "secondary_approved": secondary_result.approved if secondary_result else None,
+            "secondary_issues_count": (
+                len(secondary_result.issues_found) if secondary_result else None
+            ),
+            "has_disagreement": bool(disagreement and disagreement["has_disagreement"]),
+            "disagreement_type": disagreement.get("type") if disagreement else None,
             "judge_invoked": judge_result is not None,
             "judge_approved": judge_result.approved if judge_result else None,
             "final_approved": final_result.approved,
             "final_issues_count": len(final_result.issues_found),
             "total_tokens": final_result.tokens_used,
         }
+        if timing:
+            # IMP-PERF-027: Wall-clock saved by running the secondary concurrently
+            # versus the tokens it spent
+            record.update(
+                {
+                    "audit_mode": timing.get("mode"),
+                    "hedge_delay_seconds": timing.get("hedge_delay_seconds"),
+                    "secondary_launched": timing.get("secondary_launched"),
+                    "primary_seconds": timing.get("primary_seconds"),
+                    "secondary_seconds": timing.get("secondary_seconds"),
+                    "wall_clock_seconds": timing.get("wall_clock_seconds"),
+                    "wall_clock_saved_seconds": timing.get("wall_clock_saved_seconds"),
+                    "secondary_tokens": timing.get("secondary_tokens"),
+                }
+            )
 
         try:
             with open(telemetry_file, "a") as f:
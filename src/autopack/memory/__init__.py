@@ -7,18 +7,25 @@
 # - maintenance.py: TTL prune + optional compression
 # - goal_drift.py: Goal drift detection for pre-apply gating
 # - learning_db.py: Historical learning database for cross-cycle memory
+# - learning_db_sqlite.py: SQLite-backed learning database (IMP-PERF-016)
 
 from .embeddings import (
     EMBEDDING_SIZE,
     MAX_EMBEDDING_CHARS,
     async_embed_text,
     clear_embedding_cache,
+    configure_embedding_cache,
     get_embedding_cache_stats,
     sync_embed_text,
 )
 from .faiss_store import FaissStore
 from .goal_drift import check_goal_drift, extract_goal_from_description, should_block_on_drift
 from .learning_db import LearningDatabase
+from .learning_db_sqlite import (
+    SqliteLearningDatabase,
+    migrate_json_learning_db,
+    open_learning_database,
+)
 from .memory_patterns import ProjectNamespaceError
 from .memory_service import MemoryService
 from .qdrant_store import QDRANT_AVAILABLE, QdrantStore
@@ -30,6 +37,7 @@ __all__ = [
     "EMBEDDING_SIZE",
     "MAX_EMBEDDING_CHARS",
     "clear_embedding_cache",
+    "configure_embedding_cache",
     "get_embedding_cache_stats",
     "FaissStore",
     "QdrantStore",
@@ -40,6 +48,10 @@ __all__ = [
     "should_block_on_drift",
     "extract_goal_from_description",
     "LearningDatabase",
+    # IMP-PERF-016: SQLite-backed learning database
+    "SqliteLearningDatabase",
+    "migrate_json_learning_db",
+    "open_learning_database",
     # IMP-LOOP-032: Memory-to-Task Promoter
     "MemoryTaskPromoter",
     "PromotableInsight",
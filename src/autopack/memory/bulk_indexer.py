@@ -0,0 +1,254 @@
+# autopack/memory/bulk_indexer.py
+"""
+Streaming bulk embed-and-upsert pipeline for vector memory.
+
+IMP-PERF-014: Bulk indexing (SOT docs, workspace files) used to embed one chunk
+and upsert one small batch at a time, paying a provider round-trip per chunk.
+
+BulkIndexer instead:
+- Buffers chunks into batches of the provider's maximum batch size
+- Embeds a bounded number of batches concurrently, optionally capped by an
+  estimated tokens-per-minute budget
+- Skips the provider for texts already in the embedding cache
+- Upserts finished points to the vector store in large batches
+- Reports throughput (chunks/s, tokens/s) when closed
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .embeddings import MAX_EMBEDDING_BATCH_SIZE, sync_embed_texts_cached
+
+logger = logging.getLogger(__name__)
+
+# Type for store (could be NullStore, FaissStore, or QdrantStore)
+StoreType = Any
+
+# Rough token estimate used for throughput and rate limiting
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class BulkIndexStats:
+    """Throughput statistics for a bulk indexing run.
+
+    Attributes:
+        chunks: Chunks submitted for indexing
+        upserted: Points written to the vector store
+        failed: Chunks that could not be embedded or upserted
+        embed_batches: Embedding batches dispatched
+        upsert_batches: Upsert calls made to the store
+        tokens: Estimated tokens embedded (chars / 4)
+        elapsed_s: Wall-clock seconds from first chunk to close
+    """
+
+    chunks: int = 0
+    upserted: int = 0
+    failed: int = 0
+    embed_batches: int = 0
+    upsert_batches: int = 0
+    tokens: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def chunks_per_s(self) -> float:
+        """Chunks indexed per second."""
+        return self.chunks / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def tokens_per_s(self) -> float:
+        """Estimated tokens embedded per second."""
+        return self.tokens / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "chunks": self.chunks,
+            "upserted": self.upserted,
+            "failed": self.failed,
+            "embed_batches": self.embed_batches,
+            "upsert_batches": self.upsert_batches,
+            "tokens": self.tokens,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "chunks_per_s": round(self.chunks_per_s, 2),
+            "tokens_per_s": round(self.tokens_per_s, 2),
+        }
+
+
+class BulkIndexer:
+    """Streaming, batched embedding pipeline that upserts into one collection.
+
+    Usage:
+        with BulkIndexer(store, "sot_docs") as indexer:
+            for doc in docs:
+                indexer.add(doc["id"], doc["content"], doc["metadata"])
+        stats = indexer.stats
+
+    ``add`` blocks once ``max_concurrent_batches`` embedding batches are in
+    flight, so memory use stays bounded however many chunks are streamed in.
+    """
+
+    def __init__(
+        self,
+        store: StoreType,
+        collection: str,
+        embed_batch_size: int = MAX_EMBEDDING_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        upsert_batch_size: int = 1000,
+        max_tokens_per_minute: Optional[int] = None,
+        model: str = "text-embedding-3-small",
+    ):
+        """Initialize BulkIndexer.
+
+        Args:
+            store: Vector store to upsert into
+            collection: Target collection name
+            embed_batch_size: Chunks per embedding request
+            max_concurrent_batches: Embedding batches allowed in flight at once
+            upsert_batch_size: Points accumulated before each store upsert
+            max_tokens_per_minute: Optional cap on estimated tokens submitted per minute
+            model: Embedding model name
+        """
+        self.store = store
+        self.collection = collection
+        self.embed_batch_size = max(1, embed_batch_size)
+        self.upsert_batch_size = max(1, upsert_batch_size)
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.model = model
+        self.stats = BulkIndexStats()
+
+        self._pending: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._ready: List[Dict[str, Any]] = []
+        self._ready_lock = threading.Lock()
+        self._upsert_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent_batches))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent_batches), thread_name_prefix="bulk-embed"
+        )
+        self._futures: List[Future] = []
+        self._token_window: Deque[Tuple[float, int]] = deque()
+        self._started: Optional[float] = None
+        self._closed = False
+
+    def __enter__(self) -> "BulkIndexer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def add(self, point_id: str, text: str, payload: Dict[str, Any]) -> None:
+        """Queue a chunk for embedding and upsert.
+
+        Args:
+            point_id: Vector store point ID
+            text: Text to embed
+            payload: Payload stored with the point
+        """
+        if self._closed:
+            raise RuntimeError("BulkIndexer is closed")
+        if self._started is None:
+            self._started = time.perf_counter()
+        self._pending.append((point_id, text, payload))
+        self.stats.chunks += 1
+        if len(self._pending) >= self.embed_batch_size:
+            self._dispatch()
+
+    def close(self) -> BulkIndexStats:
+        """Embed and upsert everything queued, then return the final stats."""
+        if self._closed:
+            return self.stats
+        self._closed = True
+        try:
+            if self._pending:
+                self._dispatch()
+            for future in self._futures:
+                future.result()
+        finally:
+            self._executor.shutdown(wait=True)
+        self._flush_ready(force=True)
+
+        if self._started is not None:
+            self.stats.elapsed_s = time.perf_counter() - self._started
+        logger.info(
+            f"[IMP-PERF-014] Bulk indexed {self.stats.upserted}/{self.stats.chunks} chunks "
+            f"into '{self.collection}' in {self.stats.elapsed_s:.2f}s "
+            f"({self.stats.chunks_per_s:.1f} chunks/s, {self.stats.tokens_per_s:.0f} tokens/s)"
+        )
+        return self.stats
+
+    def _dispatch(self) -> None:
+        """Hand the pending chunks to a worker, waiting for a free slot."""
+        batch, self._pending = self._pending, []
+        tokens = sum(len(text) for _, text, _ in batch) // _CHARS_PER_TOKEN
+        self._wait_for_token_budget(tokens)
+        self._slots.acquire()
+        self.stats.embed_batches += 1
+        self._futures.append(self._executor.submit(self._embed_batch, batch, tokens))
+
+    def _wait_for_token_budget(self, tokens: int) -> None:
+        """Sleep until submitting ``tokens`` keeps the last minute under budget."""
+        if not self.max_tokens_per_minute:
+            return
+        while True:
+            now = time.monotonic()
+            while self._token_window and now - self._token_window[0][0] >= 60.0:
+                self._token_window.popleft()
+            used = sum(count for _, count in self._token_window)
+            if not self._token_window or used + tokens <= self.max_tokens_per_minute:
+                self._token_window.append((now, tokens))
+                return
+            time.sleep(60.0 - (now - self._token_window[0][0]))
+
+    def _embed_batch(self, batch: List[Tuple[str, str, Dict[str, Any]]], tokens: int) -> None:
+        """Worker: embed one batch and queue the resulting points."""
+        try:
+            vectors = sync_embed_texts_cached(
+                [text for _, text, _ in batch],
+                model=self.model,
+                batch_size=self.embed_batch_size,
+            )
+        except Exception as e:
+            logger.warning(f"[IMP-PERF-014] Failed to embed batch of {len(batch)} chunks: {e}")
+            with self._stats_lock:
+                self.stats.failed += len(batch)
+            return
+        finally:
+            self._slots.release()
+
+        with self._stats_lock:
+            self.stats.tokens += tokens
+        with self._ready_lock:
+            self._ready.extend(
+                {"id": point_id, "vector": vector, "payload": payload}
+                for (point_id, _, payload), vector in zip(batch, vectors)
+            )
+        self._flush_ready()
+
+    def _flush_ready(self, force: bool = False) -> None:
+        """Upsert queued points once a full upsert batch is ready (or when forced)."""
+        with self._upsert_lock:
+            while True:
+                with self._ready_lock:
+                    if not self._ready or (not force and len(self._ready) < self.upsert_batch_size):
+                        return
+                    points = self._ready[: self.upsert_batch_size]
+                    del self._ready[: self.upsert_batch_size]
+                try:
+                    self.store.upsert(self.collection, points)
+                    upserted, failed = len(points), 0
+                except Exception as e:
+                    logger.warning(
+                        f"[IMP-PERF-014] Failed to upsert {len(points)} points "
+                        f"into '{self.collection}': {e}"
+                    )
+                    upserted, failed = 0, len(points)
+                with self._stats_lock:
+                    self.stats.upserted += upserted
+                    self.stats.failed += failed
+                    self.stats.upsert_batches += 1
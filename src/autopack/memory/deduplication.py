@@ -15,9 +15,9 @@ import hashlib
 import logging
 import threading
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from .embeddings import sync_embed_text
+from .embeddings import sync_embed_text, sync_embed_texts_cached
 
 if TYPE_CHECKING:
     pass
@@ -84,6 +84,18 @@ class ContentDeduplicator:
             self._content_hashes.add(content_hash)
             return True
 
+    def untrack_hashes(self, content_hashes: Iterable[str]) -> None:
+        """Forget content hashes whose insights were not stored.
+
+        Lets a retried write persist insights that check_and_track_hash
+        reserved before the write failed.
+
+        Args:
+            content_hashes: Content hashes to stop tracking
+        """
+        with self._write_lock:
+            self._content_hashes.difference_update(content_hashes)
+
     def clear_hashes(self) -> None:
         """Clear tracked content hashes.
 
@@ -128,11 +140,9 @@ class ContentDeduplicator:
             return []
 
         insight_type = insight.get("insight_type", "unknown")
-        description = insight.get("description", "")
-        content = insight.get("content", description)
 
         # Build search text same as used for storage
-        search_text = f"{insight_type}:{content}"
+        search_text = self.search_text_for_insight(insight)
         if not search_text.strip(":"):
             return []
 
@@ -141,13 +151,12 @@ class ContentDeduplicator:
             query_vector = sync_embed_text(search_text)
 
             # Determine which collection to search based on insight type
-            if insight_type == "failure_mode":
-                collection = collection_errors_ci
-            elif insight_type == "retry_cause":
-                collection = collection_doctor_hints
-            else:
-                # cost_sink and generic insights go to run_summaries
-                collection = collection_run_summaries
+            collection = self.collection_for_insight_type(
+                insight_type,
+                collection_errors_ci,
+                collection_doctor_hints,
+                collection_run_summaries,
+            )
 
             # Search for similar insights with telemetry_insight task_type
             results = safe_store_call(
@@ -161,22 +170,7 @@ class ContentDeduplicator:
                 [],
             )
 
-            # Filter by similarity threshold and return with metadata
-            similar = []
-            for result in results:
-                score = result.get("score", 0)
-                if score >= threshold:
-                    similar.append(
-                        {
-                            "id": result.get("id"),
-                            "payload": result.get("payload", {}),
-                            "score": score,
-                            "collection": collection,
-                        }
-                    )
-
-            # Sort by score descending (highest similarity first)
-            similar.sort(key=lambda x: x.get("score", 0), reverse=True)
+            similar = self._similar_above_threshold(results, collection, threshold)
 
             if similar:
                 logger.debug(
@@ -190,6 +184,147 @@ class ContentDeduplicator:
             logger.warning(f"[IMP-MEM-006] Error finding similar insights: {e}")
             return []
 
+    @staticmethod
+    def search_text_for_insight(insight: Dict[str, Any]) -> str:
+        """Return the text an insight is embedded as for similarity search."""
+        insight_type = insight.get("insight_type", "unknown")
+        content = insight.get("content", insight.get("description", ""))
+        return f"{insight_type}:{content}"
+
+    @staticmethod
+    def collection_for_insight_type(
+        insight_type: str,
+        collection_errors_ci: str,
+        collection_doctor_hints: str,
+        collection_run_summaries: str,
+    ) -> str:
+        """Return the collection an insight type is stored in (and deduplicated against)."""
+        if insight_type == "failure_mode":
+            return collection_errors_ci
+        if insight_type == "retry_cause":
+            return collection_doctor_hints
+        # cost_sink and generic insights go to run_summaries
+        return collection_run_summaries
+
+    @staticmethod
+    def _similar_above_threshold(
+        results: List[Dict[str, Any]], collection: str, threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Keep search hits at or above threshold, highest similarity first."""
+        similar = []
+        for result in results:
+            score = result.get("score", 0)
+            if score >= threshold:
+                similar.append(
+                    {
+                        "id": result.get("id"),
+                        "payload": result.get("payload", {}),
+                        "score": score,
+                        "collection": collection,
+                    }
+                )
+
+        # Sort by score descending (highest similarity first)
+        similar.sort(key=lambda x: x.get("score", 0), reverse=True)
+        return similar
+
+    def find_similar_insights_batch(
+        self,
+        insights: List[Dict[str, Any]],
+        enabled: bool,
+        store: Any,
+        safe_store_call: Callable[[str, Callable, Any], Any],
+        collection_errors_ci: str,
+        collection_doctor_hints: str,
+        collection_run_summaries: str,
+        threshold: float = 0.9,
+    ) -> Tuple[List[List[Dict[str, Any]]], List[Optional[List[float]]]]:
+        """Find similar stored insights for many insights at once.
+
+        IMP-PERF-026: Batch form of find_similar_insights. All search texts are
+        embedded in one call and each collection is searched once with every
+        query vector (``store.search_batch`` when the store provides it),
+        instead of one embed and one search per insight.
+
+        Args:
+            insights: Insight dicts to match.
+            enabled: Whether memory is enabled.
+            store: The vector store instance.
+            safe_store_call: Function for safe store operations.
+            collection_errors_ci: Name of errors/CI collection.
+            collection_doctor_hints: Name of doctor hints collection.
+            collection_run_summaries: Name of run summaries collection.
+            threshold: Minimum similarity score (0-1) to consider as duplicate.
+
+        Returns:
+            Tuple of (similar insights per input, search vector per input). Each
+            similar list has the same shape as find_similar_insights returns;
+            vectors are None for insights without searchable content.
+        """
+        similar: List[List[Dict[str, Any]]] = [[] for _ in insights]
+        vectors: List[Optional[List[float]]] = [None] * len(insights)
+        if not enabled or not insights:
+            return similar, vectors
+
+        searchable = [
+            i
+            for i, insight in enumerate(insights)
+            if self.search_text_for_insight(insight).strip(":")
+        ]
+        if not searchable:
+            return similar, vectors
+
+        try:
+            embedded = sync_embed_texts_cached(
+                [self.search_text_for_insight(insights[i]) for i in searchable]
+            )
+        except Exception as e:
+            logger.warning(f"[IMP-PERF-026] Error embedding insights for deduplication: {e}")
+            return similar, vectors
+
+        by_collection: Dict[str, List[int]] = {}
+        for i, vector in zip(searchable, embedded):
+            vectors[i] = vector
+            collection = self.collection_for_insight_type(
+                insights[i].get("insight_type", "unknown"),
+                collection_errors_ci,
+                collection_doctor_hints,
+                collection_run_summaries,
+            )
+            by_collection.setdefault(collection, []).append(i)
+
+        search_filter = {"task_type": "telemetry_insight"}
+        for collection, indices in by_collection.items():
+            query_vectors = [vectors[i] for i in indices]
+            search_batch = getattr(store, "search_batch", None)
+            if callable(search_batch):
+                results = safe_store_call(
+                    f"_find_similar_insights_batch/{collection}",
+                    lambda: search_batch(collection, query_vectors, filter=search_filter, limit=5),
+                    [],
+                )
+            else:
+                results = [
+                    safe_store_call(
+                        f"_find_similar_insights/{collection}",
+                        lambda v=vector: store.search(collection, v, filter=search_filter, limit=5),
+                        [],
+                    )
+                    for vector in query_vectors
+                ]
+            if len(results) != len(indices):
+                results = [[] for _ in indices]
+            for i, hits in zip(indices, results):
+                similar[i] = self._similar_above_threshold(hits, collection, threshold)
+
+        matched = sum(1 for hits in similar if hits)
+        if matched:
+            logger.debug(
+                f"[IMP-PERF-026] Found similar insights for {matched}/{len(insights)} "
+                f"insights in {len(by_collection)} batched search(es)"
+            )
+        return similar, vectors
+
     def merge_insights(
         self,
         existing: Dict[str, Any],
@@ -214,6 +349,38 @@ class ContentDeduplicator:
             safe_store_call: Function for safe store operations.
             collection_run_summaries: Default collection name for fallback.
 
+        Returns:
+            The existing insight's ID (now updated with merged data), or empty
+            string if merge failed.
+        """
+        return self.merge_insight_group(
+            existing, [new_insight], enabled, store, safe_store_call, collection_run_summaries
+        )
+
+    def merge_insight_group(
+        self,
+        existing: Dict[str, Any],
+        new_insights: List[Dict[str, Any]],
+        enabled: bool,
+        store: Any,
+        safe_store_call: Callable[[str, Callable, Any], Any],
+        collection_run_summaries: str,
+    ) -> str:
+        """Merge several new insights into the same existing insight with one update.
+
+        IMP-PERF-026: Used by batched writes when more than one insight in a
+        batch matches the same stored insight; merge_insights is the
+        single-insight case.
+
+        Args:
+            existing: Dict containing 'id', 'payload', and 'collection' of
+                      the existing similar insight.
+            new_insights: The new insight dicts that would have been stored.
+            enabled: Whether memory is enabled.
+            store: The vector store instance.
+            safe_store_call: Function for safe store operations.
+            collection_run_summaries: Default collection name for fallback.
+
         Returns:
             The existing insight's ID (now updated with merged data), or empty
             string if merge failed.
@@ -230,38 +397,9 @@ class ContentDeduplicator:
             return ""
 
         try:
-            # Update occurrence count
-            current_occurrences = payload.get("occurrence_count", 1)
-            new_occurrences = current_occurrences + 1
-
-            # Update timestamp to latest
-            new_timestamp = datetime.now(timezone.utc).isoformat()
-
-            # Merge metadata - keep highest confidence
-            existing_confidence = payload.get("confidence", 0.5)
-            new_confidence = new_insight.get("confidence", 0.5)
-            merged_confidence = max(existing_confidence, new_confidence)
-
-            # Prepare updated payload
-            updated_payload = {
-                "occurrence_count": new_occurrences,
-                "last_occurrence": new_timestamp,
-                "confidence": merged_confidence,
-                # Track merge history
-                "merge_count": payload.get("merge_count", 0) + 1,
-                "last_merged_at": new_timestamp,
-            }
-
-            # Preserve suggested_action if new one is provided
-            new_action = new_insight.get("suggested_action")
-            if new_action and new_action != payload.get("suggested_action"):
-                # Append to existing actions or set new one
-                existing_actions = payload.get("suggested_actions", [])
-                if payload.get("suggested_action"):
-                    existing_actions = [payload["suggested_action"]] + existing_actions
-                if new_action not in existing_actions:
-                    existing_actions.append(new_action)
-                updated_payload["suggested_actions"] = existing_actions[:5]  # Keep max 5
+            updated_payload = self.merged_payload_fields(payload, new_insights)
+            new_occurrences = updated_payload["occurrence_count"]
+            merged_confidence = updated_payload["confidence"]
 
             # Update the existing record
             success = safe_store_call(
@@ -286,3 +424,56 @@ class ContentDeduplicator:
         except Exception as e:
             logger.warning(f"[IMP-MEM-006] Error merging insights: {e}")
             return ""
+
+    @staticmethod
+    def merged_payload_fields(
+        payload: Dict[str, Any], new_insights: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Compute the payload fields that record new insights merged into an existing one.
+
+        IMP-MEM-006: Increments the occurrence and merge counts once per merged
+        insight, updates timestamps, keeps the highest confidence, and collects
+        up to five distinct suggested actions.
+
+        Args:
+            payload: Payload of the existing insight.
+            new_insights: Insights being merged into it.
+
+        Returns:
+            Fields to apply to the existing payload.
+        """
+        # Update timestamp to latest
+        new_timestamp = datetime.now(timezone.utc).isoformat()
+
+        # Merge metadata - keep highest confidence
+        merged_confidence = payload.get("confidence", 0.5)
+        for new_insight in new_insights:
+            merged_confidence = max(merged_confidence, new_insight.get("confidence", 0.5))
+
+        updated_payload = {
+            # Update occurrence count
+            "occurrence_count": payload.get("occurrence_count", 1) + len(new_insights),
+            "last_occurrence": new_timestamp,
+            "confidence": merged_confidence,
+            # Track merge history
+            "merge_count": payload.get("merge_count", 0) + len(new_insights),
+            "last_merged_at": new_timestamp,
+        }
+
+        # Preserve suggested_action if new one is provided
+        existing_actions: Optional[List[str]] = None
+        for new_insight in new_insights:
+            new_action = new_insight.get("suggested_action")
+            if not new_action or new_action == payload.get("suggested_action"):
+                continue
+            if existing_actions is None:
+                # Append to existing actions or set new one
+                existing_actions = payload.get("suggested_actions", [])
+                if payload.get("suggested_action"):
+                    existing_actions = [payload["suggested_action"]] + existing_actions
+            if new_action not in existing_actions:
+                existing_actions.append(new_action)
+        if existing_actions is not None:
+            updated_payload["suggested_actions"] = existing_actions[:5]  # Keep max 5
+
+        return updated_payload
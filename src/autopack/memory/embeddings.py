@@ -9,14 +9,23 @@ Provides:
 - Local deterministic embedding (SHA256-based) when OpenAI unavailable
 
 IMP-PERF-005: Caching added to prevent redundant embedding API calls.
+IMP-PERF-013: The cache is a byte-bounded LRU of packed arrays with an optional
+SQLite tier (AUTOPACK_EMBEDDING_CACHE_PATH) that survives process restarts.
+Local hash embeddings are cached under a separate "local/" model key, and a
+local vector produced because an OpenAI call failed is never cached.
 """
 
 import asyncio
 import hashlib
 import logging
 import os
+import sqlite3
 import threading
-from typing import List, Optional, Tuple
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
 from sqlalchemy.orm import Session
 
@@ -27,13 +36,40 @@ logger = logging.getLogger(__name__)
 MAX_EMBEDDING_CHARS = 30000
 EMBEDDING_SIZE = 1536
 
+# IMP-PERF-014: Maximum number of inputs OpenAI accepts in one embeddings request
+MAX_EMBEDDING_BATCH_SIZE = 2048
+
 # IMP-PERF-005: Embedding cache to prevent redundant API calls
 # Cache stores (text_hash, model) -> embedding_result
+# IMP-PERF-013: True LRU bounded by entry count and bytes; embeddings are kept as
+# packed double arrays (8 bytes/dim, bit-exact with the computed vector) and
+# optionally backed by an on-disk SQLite tier
 _EMBEDDING_CACHE_MAXSIZE = 1000
-_embedding_cache: dict[str, Tuple[float, ...]] = {}
+_EMBEDDING_CACHE_MAX_BYTES = int(
+    os.getenv("AUTOPACK_EMBEDDING_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+_embedding_cache: "OrderedDict[str, array]" = OrderedDict()
+_embedding_cache_bytes = 0
 _embedding_cache_lock = threading.Lock()
 _embedding_cache_hits = 0
 _embedding_cache_misses = 0
+_embedding_cache_disk_hits = 0
+
+# IMP-PERF-013: Optional persistent tier (disabled unless a path is configured)
+_disk_cache_path: Optional[Path] = (
+    Path(os.environ["AUTOPACK_EMBEDDING_CACHE_PATH"])
+    if os.getenv("AUTOPACK_EMBEDDING_CACHE_PATH")
+    else None
+)
+_disk_cache_conn: Optional[sqlite3.Connection] = None
+_disk_cache_lock = threading.Lock()
+# Row bound for the disk tier; least recently used rows are evicted past it
+_EMBEDDING_DISK_CACHE_MAX_ROWS = int(os.getenv("AUTOPACK_EMBEDDING_DISK_CACHE_MAX_ROWS", "20000"))
+_disk_cache_rows = 0
+
+# Model-key prefix for deterministic local embeddings, so they never share a
+# cache entry with (or get served in place of) provider embeddings
+_LOCAL_MODEL_PREFIX = "local/"
 
 # Check for OpenAI availability
 _USE_OPENAI = False
@@ -71,51 +107,229 @@ def _get_cache_key(text: str, model: str) -> str:
     return f"{model}:{text_hash}"
 
 
-def _get_cached_embedding(cache_key: str) -> Optional[Tuple[float, ...]]:
+def _cache_model(model: str) -> str:
+    """Model name used in cache keys for the active embedding backend."""
+    return model if semantic_embeddings_enabled() else f"{_LOCAL_MODEL_PREFIX}{model}"
+
+
+def _get_cached_embedding(cache_key: str) -> Optional[array]:
     """Get embedding from cache if it exists.
 
     IMP-PERF-005: Thread-safe cache lookup.
+    IMP-PERF-013: A hit marks the entry most recently used. Memory misses fall
+    through to the disk tier, and disk hits are promoted into memory.
     """
-    global _embedding_cache_hits
+    global _embedding_cache_hits, _embedding_cache_disk_hits
     with _embedding_cache_lock:
-        if cache_key in _embedding_cache:
+        cached = _embedding_cache.get(cache_key)
+        if cached is not None:
+            _embedding_cache.move_to_end(cache_key)
             _embedding_cache_hits += 1
-            return _embedding_cache[cache_key]
-    return None
+            return cached
 
+    cached = _disk_cache_get(cache_key)
+    if cached is None:
+        return None
+    with _embedding_cache_lock:
+        _embedding_cache_hits += 1
+        _embedding_cache_disk_hits += 1
+        _store_in_memory(cache_key, cached)
+    return cached
 
-def _put_cached_embedding(cache_key: str, embedding: List[float]) -> None:
-    """Store embedding in cache with LRU-like eviction.
+
+def _put_cached_embedding(cache_key: str, embedding: List[float]) -> array:
+    """Store embedding in cache with LRU eviction.
 
     IMP-PERF-005: Thread-safe cache storage with size limit.
-    When cache is full, removes oldest entries (FIFO eviction).
+    IMP-PERF-013: Least recently used entries are evicted until both
+    _EMBEDDING_CACHE_MAXSIZE and _EMBEDDING_CACHE_MAX_BYTES hold. The embedding
+    is also written to the disk tier when one is configured.
+
+    Returns:
+        The stored packed array
     """
     global _embedding_cache_misses
+    packed = array("d", embedding)
     with _embedding_cache_lock:
         _embedding_cache_misses += 1
+        _store_in_memory(cache_key, packed)
+    _disk_cache_put(cache_key, packed)
+    return packed
+
+
+def _store_in_memory(cache_key: str, packed: array) -> None:
+    """Insert into the in-memory LRU and evict. Caller holds _embedding_cache_lock."""
+    global _embedding_cache_bytes
+    previous = _embedding_cache.pop(cache_key, None)
+    if previous is not None:
+        _embedding_cache_bytes -= _entry_bytes(previous)
+    _embedding_cache[cache_key] = packed
+    _embedding_cache_bytes += _entry_bytes(packed)
+    _evict_over_bounds()
+
+
+def _evict_over_bounds() -> None:
+    """Drop least recently used entries until both bounds hold. Caller holds the lock."""
+    global _embedding_cache_bytes
+    while _embedding_cache and (
+        len(_embedding_cache) > _EMBEDDING_CACHE_MAXSIZE
+        or _embedding_cache_bytes > _EMBEDDING_CACHE_MAX_BYTES
+    ):
+        _, evicted = _embedding_cache.popitem(last=False)
+        _embedding_cache_bytes -= _entry_bytes(evicted)
+
+
+def _entry_bytes(packed: array) -> int:
+    """Bytes held by a cached embedding's packed payload."""
+    return packed.itemsize * len(packed)
+
+
+def configure_embedding_cache(
+    disk_path: Optional[Union[str, Path]] = None,
+    max_bytes: Optional[int] = None,
+    max_disk_rows: Optional[int] = None,
+) -> None:
+    """Configure the embedding cache bounds and persistent tier.
+
+    IMP-PERF-013: The disk tier is a single SQLite file keyed by model+sha256,
+    so re-embedding the same text after a restart is served from disk.
+
+    Args:
+        disk_path: SQLite file for the persistent tier; None disables it
+        max_bytes: New byte bound for the in-memory tier (unchanged if None)
+        max_disk_rows: New row bound for the disk tier (unchanged if None)
+    """
+    global _EMBEDDING_CACHE_MAX_BYTES, _EMBEDDING_DISK_CACHE_MAX_ROWS
+    global _disk_cache_path, _disk_cache_conn
+    if max_bytes is not None:
+        with _embedding_cache_lock:
+            _EMBEDDING_CACHE_MAX_BYTES = max_bytes
+            _evict_over_bounds()
+
+    with _disk_cache_lock:
+        if max_disk_rows is not None:
+            _EMBEDDING_DISK_CACHE_MAX_ROWS = max_disk_rows
+        if _disk_cache_conn is not None:
+            _disk_cache_conn.close()
+            _disk_cache_conn = None
+        _disk_cache_path = Path(disk_path) if disk_path else None
+
+
+def _disk_cache_connection() -> Optional[sqlite3.Connection]:
+    """Open the disk tier lazily. Caller holds _disk_cache_lock."""
+    global _disk_cache_conn, _disk_cache_path, _disk_cache_rows
+    if _disk_cache_conn is not None or _disk_cache_path is None:
+        return _disk_cache_conn
+    try:
+        _disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(_disk_cache_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+        if "accessed" not in columns:
+            conn.execute("ALTER TABLE embeddings ADD COLUMN accessed REAL NOT NULL DEFAULT 0")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings (accessed)"
+        )
+        conn.commit()
+        _disk_cache_rows = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        _disk_cache_conn = conn
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding disk cache unavailable at {_disk_cache_path}: {e}")
+        _disk_cache_path = None
+    return _disk_cache_conn
+
+
+def _disk_cache_get(cache_key: str) -> Optional[array]:
+    """Look up an embedding in the disk tier."""
+    with _disk_cache_lock:
+        conn = _disk_cache_connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (cache_key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE embeddings SET accessed = ? WHERE key = ?", (time.time(), cache_key)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding disk cache read failed: {e}")
+            return None
+    if row is None:
+        return None
+    packed = array("d")
+    packed.frombytes(row[0])
+    return packed
+
+
+def _disk_cache_put(cache_key: str, packed: array) -> None:
+    """Write an embedding to the disk tier, evicting past the row bound."""
+    global _disk_cache_rows
+    with _disk_cache_lock:
+        conn = _disk_cache_connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, accessed) VALUES (?, ?, ?)",
+                (cache_key, packed.tobytes(), time.time()),
+            )
+            _disk_cache_rows += 1
+            if _disk_cache_rows > _EMBEDDING_DISK_CACHE_MAX_ROWS:
+                _evict_disk_rows(conn)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding disk cache write failed: {e}")
 
-        # Evict oldest entries if cache is full
-        if len(_embedding_cache) >= _EMBEDDING_CACHE_MAXSIZE:
-            # Remove oldest 10% of entries
-            to_remove = max(1, _EMBEDDING_CACHE_MAXSIZE // 10)
-            keys_to_remove = list(_embedding_cache.keys())[:to_remove]
-            for key in keys_to_remove:
-                del _embedding_cache[key]
 
-        # Store as tuple for immutability
-        _embedding_cache[cache_key] = tuple(embedding)
+def _evict_disk_rows(conn: sqlite3.Connection) -> None:
+    """Trim the disk tier to 90% of its row bound, least recently used first.
+
+    Caller holds _disk_cache_lock. Trimming below the bound keeps eviction off
+    the path of every subsequent write.
+    """
+    global _disk_cache_rows
+    rows = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    target = int(_EMBEDDING_DISK_CACHE_MAX_ROWS * 0.9)
+    if rows > _EMBEDDING_DISK_CACHE_MAX_ROWS:
+        conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY accessed ASC LIMIT ?)",
+            (rows - target,),
+        )
+        rows = target
+    _disk_cache_rows = rows
 
 
-def clear_embedding_cache() -> None:
+def clear_embedding_cache(disk: bool = False) -> None:
     """Clear the embedding cache.
 
     IMP-PERF-005: Useful for testing and memory management.
+
+    Args:
+        disk: Also delete every entry from the persistent tier (IMP-PERF-013)
     """
     global _embedding_cache_hits, _embedding_cache_misses
+    global _embedding_cache_disk_hits, _embedding_cache_bytes, _disk_cache_rows
     with _embedding_cache_lock:
         _embedding_cache.clear()
+        _embedding_cache_bytes = 0
         _embedding_cache_hits = 0
         _embedding_cache_misses = 0
+        _embedding_cache_disk_hits = 0
+    if disk:
+        with _disk_cache_lock:
+            conn = _disk_cache_connection()
+            if conn is not None:
+                conn.execute("DELETE FROM embeddings")
+                conn.commit()
+                _disk_cache_rows = 0
 
 
 def get_embedding_cache_stats() -> dict:
@@ -129,9 +343,14 @@ def get_embedding_cache_stats() -> dict:
         return {
             "size": len(_embedding_cache),
             "maxsize": _EMBEDDING_CACHE_MAXSIZE,
+            "bytes": _embedding_cache_bytes,
+            "max_bytes": _EMBEDDING_CACHE_MAX_BYTES,
             "hits": _embedding_cache_hits,
+            "disk_hits": _embedding_cache_disk_hits,
             "misses": _embedding_cache_misses,
             "hit_rate": hit_rate,
+            "disk_path": str(_disk_cache_path) if _disk_cache_path else None,
+            "disk_max_rows": _EMBEDDING_DISK_CACHE_MAX_ROWS,
         }
 
 
@@ -218,7 +437,8 @@ def sync_embed_text(
 
     IMP-PERF-005: Results are cached to prevent redundant embedding API calls.
     Cache lookup is based on (text, model). Usage recording only occurs on
-    cache misses when an actual API call is made.
+    cache misses when an actual API call is made. A local vector returned
+    because the OpenAI call failed is not cached, so the next call retries.
 
     Args:
         text: Text to embed
@@ -237,7 +457,7 @@ def sync_embed_text(
         text = text[:MAX_EMBEDDING_CHARS]
 
     # IMP-PERF-005: Check cache first
-    cache_key = _get_cache_key(text, model)
+    cache_key = _get_cache_key(text, _cache_model(model))
     cached_result = _get_cached_embedding(cache_key)
     if cached_result is not None:
         logger.debug(f"Embedding cache hit for key {cache_key[:20]}...")
@@ -259,7 +479,7 @@ def sync_embed_text(
             result = list(response.data[0].embedding)
         except Exception as e:
             logger.warning(f"OpenAI embedding failed ({e}); falling back to local embedding.")
-            result = _local_embed(text)
+            return _local_embed(text)
     else:
         logger.debug(f"Using local offline embedding for preview: '{preview}...'")
         result = _local_embed(text)
@@ -299,18 +519,96 @@ def sync_embed_texts(
             t = t[:MAX_EMBEDDING_CHARS]
         cleaned.append(t)
 
+    vectors, _ = _embed_batch(cleaned, model, db, run_id, phase_id)
+    return vectors
+
+
+def _embed_batch(
+    texts: List[str],
+    model: str,
+    db: Optional[Session],
+    run_id: Optional[str],
+    phase_id: Optional[str],
+) -> Tuple[List[List[float]], bool]:
+    """Embed already-truncated texts in one request.
+
+    Returns:
+        (vectors, fell_back) where fell_back is True when the OpenAI request
+        failed and the vectors are local stand-ins that must not be cached
+    """
     if _USE_OPENAI and _openai_client:
         try:
-            resp = _openai_client.embeddings.create(input=cleaned, model=model)
+            resp = _openai_client.embeddings.create(input=texts, model=model)
             # Record embedding usage if db session provided
             _record_embedding_usage(resp, model, db, run_id, phase_id)
-            return [list(item.embedding) for item in resp.data]
+            return [list(item.embedding) for item in resp.data], False
         except Exception as e:
             logger.warning(
                 f"OpenAI batch embedding failed ({e}); falling back to local embeddings."
             )
+            return [_local_embed(t) for t in texts], True
+
+    return [_local_embed(t) for t in texts], False
+
+
+def sync_embed_texts_cached(
+    texts: List[str],
+    model: str = "text-embedding-3-small",
+    db: Optional[Session] = None,
+    run_id: Optional[str] = None,
+    phase_id: Optional[str] = None,
+    batch_size: int = MAX_EMBEDDING_BATCH_SIZE,
+) -> List[List[float]]:
+    """
+    Batch embedding that consults the embedding cache first.
+
+    IMP-PERF-014: Texts already in the cache (or repeated within ``texts``) are
+    not sent to the provider; the remaining texts are embedded in requests of
+    at most ``batch_size`` inputs and cached. A batch that fell back to local
+    embeddings after an OpenAI failure is returned but not cached.
+
+    Args:
+        texts: List of texts to embed
+        model: OpenAI embedding model (default: text-embedding-3-small)
+        db: Optional database session for usage recording
+        run_id: Optional run identifier for usage tracking
+        phase_id: Optional phase identifier for usage tracking
+        batch_size: Maximum inputs per provider request
+
+    Returns:
+        List of embedding vectors, aligned with ``texts``
+    """
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    pending: "OrderedDict[str, List[int]]" = OrderedDict()
+    pending_texts: List[str] = []
+    cache_model = _cache_model(model)
+
+    for i, text in enumerate(texts):
+        text = (text or "")[:MAX_EMBEDDING_CHARS]
+        cache_key = _get_cache_key(text, cache_model)
+        if cache_key in pending:
+            pending[cache_key].append(i)
+            continue
+        cached = _get_cached_embedding(cache_key)
+        if cached is not None:
+            results[i] = list(cached)
+            continue
+        pending[cache_key] = [i]
+        pending_texts.append(text)
+
+    keys = list(pending)
+    for start in range(0, len(keys), batch_size):
+        batch_keys = keys[start : start + batch_size]
+        vectors, fell_back = _embed_batch(
+            pending_texts[start : start + batch_size], model, db, run_id, phase_id
+        )
+        for cache_key, vector in zip(batch_keys, vectors):
+            if not fell_back:
+                _put_cached_embedding(cache_key, vector)
+            for i in pending[cache_key]:
+                results[i] = list(vector)
 
-    return [_local_embed(t) for t in cleaned]
+    return results  # type: ignore[return-value]
 
 
 async def async_embed_text(
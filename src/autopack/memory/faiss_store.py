@@ -7,6 +7,17 @@ Design:
 - FAISS index stored on disk (no external infra)
 - Collections map to separate index files
 - Payload stored in companion JSON sidecar
+- Writes go to an append-only journal; the snapshot (index + sidecars) is
+  rewritten only on compaction (IMP-PERF-007)
+- Vectors live in an ID-mapped index; deleted/replaced vectors are removed by a
+  background compaction once the dead-vector ratio crosses a threshold
+  (IMP-PERF-008)
+- A list-backed reverse map (faiss_id -> point_id) is kept in step with id_map
+  so search never rebuilds it (IMP-PERF-009)
+- Payload field indexes (project_id, task_type, status) restrict filtered
+  searches to the matching subset before the vector scan (IMP-PERF-010)
+- Without faiss, the fallback search scores a pre-normalized float32 matrix in
+  one matrix-vector product when NumPy is available (IMP-PERF-011)
 
 Collections (per plan):
 - code_docs: embeddings of workspace files
@@ -17,26 +28,39 @@ Collections (per plan):
 
 import json
 import logging
+import os
 import threading
 import uuid
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from autopack.memory.write_generation import bump_memory_write_generation, note_memory_read
 
 logger = logging.getLogger(__name__)
 
+# NumPy backs the FAISS path and the vectorized fallback search (optional dependency)
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
 # Try importing faiss (optional dependency)
 try:
     import faiss
-    import numpy as np
 
     FAISS_AVAILABLE = True
 except ImportError:
     faiss = None  # type: ignore
-    np = None  # type: ignore
     FAISS_AVAILABLE = False
     logger.warning("faiss library not installed; FaissStore will use in-memory fallback")
 
+# Payload statuses that are never returned by search
+_EXCLUDED_STATUSES = ("tombstoned", "superseded", "archived")
+
 
 class FaissStore:
     """
@@ -53,20 +77,42 @@ class FaissStore:
     # Maximum payload entries per collection before LRU eviction kicks in
     MAX_PAYLOAD_ENTRIES = 10000
 
-    def __init__(self, index_dir: str = ".autonomous_runs/file-organizer-app-v1/.faiss"):
+    # IMP-PERF-007: Journal entries accumulated before the snapshot is rewritten
+    JOURNAL_COMPACT_THRESHOLD = 1000
+
+    # IMP-PERF-008: Dead (deleted/replaced) vectors are physically removed once they
+    # make up COMPACT_DEAD_RATIO of the index and number at least COMPACT_MIN_DEAD
+    COMPACT_DEAD_RATIO = 0.25
+    COMPACT_MIN_DEAD = 100
+
+    # IMP-PERF-010: Payload fields indexed for pre-filtered search
+    INDEXED_PAYLOAD_FIELDS = ("project_id", "task_type", "status")
+
+    def __init__(
+        self,
+        index_dir: str = ".autonomous_runs/file-organizer-app-v1/.faiss",
+        journal: bool = True,
+    ):
         """
         Initialize FAISS store.
 
         Args:
             index_dir: Directory to store index files
+            journal: Append writes to a per-collection journal and only rewrite the
+                full snapshot on compaction. When False, every write rewrites the
+                snapshot (legacy behaviour).
         """
         self.index_dir = Path(index_dir)
         self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._journal_enabled = journal
 
         # In-memory caches: {collection_name: {"index": faiss.Index, "payloads": {id: payload}}}
         self._collections: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
 
+        # Background index compactions in flight: {collection_name: Thread}
+        self._compaction_threads: Dict[str, threading.Thread] = {}
+
         # Default dimension
         self._default_dim = 1536
 
@@ -79,6 +125,15 @@ class FaissStore:
     def _id_map_path(self, name: str) -> Path:
         return self.index_dir / f"{name}.idmap.json"
 
+    def _journal_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.journal.jsonl"
+
+    def _meta_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.meta.json"
+
+    def _rev_ids_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.revids.json"
+
     def ensure_collection(self, name: str, size: int = 1536) -> None:
         """
         Ensure a collection exists (create if not).
@@ -95,55 +150,521 @@ class FaissStore:
             payload_path = self._payload_path(name)
             id_map_path = self._id_map_path(name)
 
+            try:
+                # Roll forward a snapshot that was committed but not fully renamed
+                self._finish_snapshot(name)
+            except Exception as e:
+                logger.warning(f"[FAISS] Failed to finish pending snapshot for '{name}': {e}")
+
             if FAISS_AVAILABLE and index_path.exists():
                 # Load existing index
                 try:
-                    index = faiss.read_index(str(index_path))
+                    index = self._as_id_map_index(faiss.read_index(str(index_path)))
                     with open(payload_path, "r", encoding="utf-8") as f:
                         payloads = OrderedDict(json.load(f))
                     with open(id_map_path, "r", encoding="utf-8") as f:
                         id_map = json.load(f)
-                    self._collections[name] = {
+                    col = {
                         "index": index,
                         "payloads": payloads,
-                        "id_map": id_map,  # {str_id: faiss_idx}
+                        "id_map": id_map,  # {str_id: faiss_id}
+                        "rev_ids": self._load_rev_ids(name, index, id_map),
+                        "field_index": self._build_field_index(payloads),
                         "dim": size,
+                        "seq": self._read_snapshot_seq(name),
+                        "journal_ops": 0,
+                        "snapshotted": True,
                     }
-                    logger.info(f"[FAISS] Loaded collection '{name}' with {index.ntotal} vectors")
+                    self._collections[name] = col
+                    replayed = self._replay_journal(name, col)
+                    logger.info(
+                        f"[FAISS] Loaded collection '{name}' with {index.ntotal} vectors "
+                        f"({replayed} journal entries replayed)"
+                    )
+                    self._maybe_schedule_compaction(name)
                     return
                 except Exception as e:
                     logger.warning(f"[FAISS] Failed to load index '{name}': {e}, creating new")
 
             # Create new collection
             if FAISS_AVAILABLE:
-                index = faiss.IndexFlatIP(size)  # Inner product (cosine after normalization)
+                # Inner product (cosine after normalization), addressed by explicit int64 ids
+                index = faiss.IndexIDMap2(faiss.IndexFlatIP(size))
             else:
                 index = None  # Fallback to in-memory list
-            self._collections[name] = {
+            col = {
                 "index": index,
                 "payloads": OrderedDict(),  # Use OrderedDict for LRU eviction
                 "id_map": {},
+                "rev_ids": [],  # faiss_id (or fallback position) -> point_id, None if dead
+                "field_index": {field: {} for field in self.INDEXED_PAYLOAD_FIELDS},
                 "dim": size,
                 "vectors": [] if not FAISS_AVAILABLE else None,  # Fallback storage
+                "matrix": None,  # Fallback: pre-normalized float32 rows mirroring "vectors"
+                "matrix_rows": 0,
+                "seq": 0,  # Last journal sequence number applied
+                "journal_ops": 0,  # Journal entries written since the last snapshot
+                "snapshotted": False,
             }
+            self._collections[name] = col
+            if FAISS_AVAILABLE:
+                # Recover writes journaled before the first snapshot was taken
+                self._replay_journal(name, col)
             logger.info(f"[FAISS] Created collection '{name}' with dim={size}")
 
+    @staticmethod
+    def _as_id_map_index(index: Any) -> Any:
+        """Wrap a legacy positional IndexFlatIP in an IndexIDMap2.
+
+        Older snapshots stored a bare flat index whose id_map values were vector
+        positions, so positions become the explicit ids.
+        """
+        if hasattr(index, "id_map"):
+            return index
+        wrapped = faiss.IndexIDMap2(faiss.IndexFlatIP(index.d))
+        if index.ntotal:
+            vectors = index.reconstruct_n(0, index.ntotal)
+            wrapped.add_with_ids(vectors, np.arange(index.ntotal, dtype=np.int64))
+        return wrapped
+
+    def _load_rev_ids(self, name: str, index: Any, id_map: Dict[str, int]) -> List[Optional[str]]:
+        """Load the persisted reverse map, rebuilding it from id_map if stale."""
+        size = int(faiss.vector_to_array(index.id_map).max()) + 1 if index.ntotal else 0
+        size = max([size] + [faiss_id + 1 for faiss_id in id_map.values()])
+
+        rev_ids_path = self._rev_ids_path(name)
+        if rev_ids_path.exists():
+            try:
+                with open(rev_ids_path, "r", encoding="utf-8") as f:
+                    rev_ids = json.load(f)
+                if len(rev_ids) == size and all(
+                    rev_ids[faiss_id] == point_id for point_id, faiss_id in id_map.items()
+                ):
+                    return rev_ids
+            except Exception as e:
+                logger.warning(f"[FAISS] Unreadable reverse id map for '{name}': {e}")
+
+        rev_ids: List[Optional[str]] = [None] * size
+        for point_id, faiss_id in id_map.items():
+            rev_ids[faiss_id] = point_id
+        return rev_ids
+
+    def _build_field_index(self, payloads: Dict[str, Dict[str, Any]]) -> Dict[str, Dict]:
+        """Build {field: {value: {point_id}}} for INDEXED_PAYLOAD_FIELDS."""
+        field_index: Dict[str, Dict] = {field: {} for field in self.INDEXED_PAYLOAD_FIELDS}
+        for point_id, payload in payloads.items():
+            self._index_payload(field_index, point_id, payload)
+        return field_index
+
+    @staticmethod
+    def _index_payload(field_index: Dict[str, Dict], point_id: str, payload: Dict) -> None:
+        """Add a point's indexed payload values to the field index."""
+        for field, values in field_index.items():
+            value = payload.get(field)
+            if value is None:
+                continue
+            try:
+                values.setdefault(value, set()).add(point_id)
+            except TypeError:
+                # Unhashable values are only reachable through the unindexed path
+                continue
+
+    @staticmethod
+    def _unindex_payload(field_index: Dict[str, Dict], point_id: str, payload: Dict) -> None:
+        """Remove a point's indexed payload values from the field index."""
+        for field, values in field_index.items():
+            value = payload.get(field)
+            if value is None:
+                continue
+            try:
+                point_ids = values.get(value)
+            except TypeError:
+                continue
+            if point_ids is not None:
+                point_ids.discard(point_id)
+                if not point_ids:
+                    del values[value]
+
+    def _set_payload(self, col: Dict[str, Any], point_id: str, payload: Dict[str, Any]) -> None:
+        """Store a payload, keeping the field index in sync."""
+        field_index = col.get("field_index")
+        if field_index is not None:
+            previous = col["payloads"].get(point_id)
+            if previous is not None:
+                self._unindex_payload(field_index, point_id, previous)
+            self._index_payload(field_index, point_id, payload)
+        col["payloads"][point_id] = payload
+
+    def _candidate_ids(
+        self, col: Dict[str, Any], filter: Optional[Dict[str, Any]]
+    ) -> Optional[set]:
+        """Resolve a filter to matching point IDs via the payload field index.
+
+        Only indexed fields are resolved here; callers still apply the full filter.
+        Points with an excluded status are removed from the candidates.
+
+        Returns:
+            Set of candidate point IDs, or None if the filter has no indexed field
+        """
+        field_index = col.get("field_index")
+        if not filter or not field_index:
+            return None
+
+        matches = []
+        for key, value in filter.items():
+            if key not in field_index:
+                continue
+            try:
+                matches.append(field_index[key].get(value, set()))
+            except TypeError:
+                return None
+        if not matches:
+            return None
+
+        matches.sort(key=len)
+        candidates = set(matches[0]).intersection(*matches[1:])
+        status_index = field_index.get("status", {})
+        for status in _EXCLUDED_STATUSES:
+            candidates -= status_index.get(status, set())
+        return candidates
+
+    def _vector_total(self, col: Dict[str, Any]) -> int:
+        """Number of stored vectors, including dead ones awaiting compaction."""
+        if col.get("index") is not None:
+            return int(col["index"].ntotal)
+        return len(col.get("vectors") or [])
+
+    def _dead_count(self, col: Dict[str, Any]) -> int:
+        """Number of stored vectors no longer referenced by id_map."""
+        return max(self._vector_total(col) - len(col["id_map"]), 0)
+
+    def _maybe_schedule_compaction(self, name: str) -> bool:
+        """Start a background index compaction if the dead ratio warrants it.
+
+        Must be called with ``self._lock`` held.
+
+        Returns:
+            True if a compaction thread was started
+        """
+        col = self._collections[name]
+        total = self._vector_total(col)
+        dead = self._dead_count(col)
+        if dead < self.COMPACT_MIN_DEAD or dead < total * self.COMPACT_DEAD_RATIO:
+            return False
+        running = self._compaction_threads.get(name)
+        if running is not None and running.is_alive():
+            return False
+
+        thread = threading.Thread(
+            target=self.compact,
+            args=(name,),
+            name=f"faiss-compact-{name}",
+            daemon=True,
+        )
+        self._compaction_threads[name] = thread
+        thread.start()
+        return True
+
+    def compact(self, collection: str) -> int:
+        """Physically remove dead vectors from a collection's index.
+
+        Runs automatically in the background once the dead-vector ratio crosses
+        COMPACT_DEAD_RATIO; may also be called directly.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Number of dead vectors removed
+        """
+        with self._lock:
+            col = self._collections.get(collection)
+            if col is None:
+                return 0
+            dead = self._dead_count(col)
+            if dead == 0:
+                return 0
+
+            # Rebuild with dense ids (0..live-1) so rev_ids stays compact
+            point_ids = list(col["id_map"])
+            old_ids = [col["id_map"][point_id] for point_id in point_ids]
+            if col.get("index") is not None:
+                current = col["index"]
+                index = faiss.IndexIDMap2(faiss.IndexFlatIP(current.d))
+                if old_ids:
+                    # Locate live ids in the flat storage (stored in id_map order)
+                    stored_ids = faiss.vector_to_array(current.id_map)
+                    order = np.argsort(stored_ids)
+                    wanted = np.array(old_ids, dtype=np.int64)
+                    positions = order[np.searchsorted(stored_ids, wanted, sorter=order)]
+                    flat = faiss.downcast_index(current.index)
+                    vectors = flat.reconstruct_n(0, current.ntotal)[positions]
+                    index.add_with_ids(vectors, np.arange(len(old_ids), dtype=np.int64))
+                col["index"] = index
+            else:
+                if NUMPY_AVAILABLE and col["vectors"]:
+                    matrix = self._fallback_matrix(col)
+                    col["matrix"] = matrix[np.array(old_ids, dtype=np.int64)]
+                    col["matrix_rows"] = len(old_ids)
+                col["vectors"] = [col["vectors"][position] for position in old_ids]
+            removed = dead
+            col["id_map"] = {point_id: i for i, point_id in enumerate(point_ids)}
+            col["rev_ids"] = point_ids
+
+            logger.info(f"[FAISS] Compacted '{collection}': removed {removed} dead vectors")
+            # Snapshot so the on-disk index shrinks too
+            self._save_collection(collection)
+            return removed
+
+    def get_collection_stats(self, collection: str) -> Dict[str, Any]:
+        """Return live/dead vector counts and persistence state for a collection."""
+        self.ensure_collection(collection)
+        with self._lock:
+            col = self._collections[collection]
+            total = self._vector_total(col)
+            dead = self._dead_count(col)
+            running = self._compaction_threads.get(collection)
+            return {
+                "live": len(col["id_map"]),
+                "dead": dead,
+                "total_vectors": total,
+                "dead_ratio": dead / total if total else 0.0,
+                "payloads": len(col["payloads"]),
+                "journal_ops": col.get("journal_ops", 0),
+                "compacting": running is not None and running.is_alive(),
+            }
+
     def _save_collection(self, name: str) -> None:
-        """Persist collection to disk."""
+        """Persist a full snapshot of the collection and truncate its journal.
+
+        The snapshot files (index, id map, reverse ids, payloads) must change
+        together: compaction renumbers every vector, so a new index next to an
+        old id map would point ids at the wrong vectors. Each file is first
+        written to a staging path; writing the meta file (journal sequence plus
+        the staged renames) is the commit point, after which the renames are
+        applied. A crash before the commit keeps the previous snapshot and
+        replays the journal; a crash after it is rolled forward on the next
+        load by _finish_snapshot.
+        """
         if name not in self._collections:
             return
         col = self._collections[name]
         try:
+            staged: List[Tuple[Path, Path]] = []
             if FAISS_AVAILABLE and col["index"] is not None:
-                faiss.write_index(col["index"], str(self._index_path(name)))
-            with open(self._payload_path(name), "w", encoding="utf-8") as f:
-                json.dump(dict(col["payloads"]), f)
-            with open(self._id_map_path(name), "w", encoding="utf-8") as f:
-                json.dump(col["id_map"], f)
+                index_path = self._index_path(name)
+                index_tmp = self._staging_path(index_path)
+                faiss.write_index(col["index"], str(index_tmp))
+                staged.append((index_tmp, index_path))
+            files = [(self._id_map_path(name), col["id_map"])]
+            if "rev_ids" in col:
+                files.append((self._rev_ids_path(name), col["rev_ids"]))
+            files.append((self._payload_path(name), dict(col["payloads"])))
+            for path, data in files:
+                tmp_path = self._staging_path(path)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                staged.append((tmp_path, path))
+
+            self._write_json_atomic(
+                self._meta_path(name),
+                {
+                    "seq": col.get("seq", 0),
+                    "pending": [[tmp.name, path.name] for tmp, path in staged],
+                },
+            )
+            self._finish_snapshot(name)
+            journal_path = self._journal_path(name)
+            if journal_path.exists():
+                journal_path.unlink()
+            col["journal_ops"] = 0
+            col["snapshotted"] = True
         except Exception as e:
             logger.error(f"[FAISS] Failed to save collection '{name}': {e}")
 
-    def _evict_if_needed(self, collection_name: str) -> int:
+    @staticmethod
+    def _staging_path(path: Path) -> Path:
+        return path.with_name(path.name + ".staged")
+
+    def _finish_snapshot(self, name: str) -> None:
+        """Apply the staged renames of a committed snapshot, if any are pending.
+
+        Idempotent: files already moved into place are skipped, so this also
+        completes a snapshot interrupted by a crash after its commit point.
+        """
+        meta_path = self._meta_path(name)
+        if not meta_path.exists():
+            return
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        pending = meta.pop("pending", None)
+        if not pending:
+            return
+        for tmp_name, final_name in pending:
+            tmp_path = self.index_dir / tmp_name
+            if tmp_path.exists():
+                os.replace(tmp_path, self.index_dir / final_name)
+        self._write_json_atomic(meta_path, meta)
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any) -> None:
+        """Write JSON to a temp file and atomically rename it over ``path``."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def _read_snapshot_seq(self, name: str) -> int:
+        """Return the journal sequence number covered by the on-disk snapshot."""
+        meta_path = self._meta_path(name)
+        if not meta_path.exists():
+            return 0
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return int(json.load(f).get("seq", 0))
+        except Exception as e:
+            logger.warning(f"[FAISS] Unreadable snapshot meta for '{name}': {e}")
+            return 0
+
+    def _persist(self, name: str, ops: List[Dict[str, Any]]) -> None:
+        """Durably record mutations applied to a collection.
+
+        IMP-PERF-007: In journal mode the operations are appended to the
+        collection's journal, so the cost is proportional to the write. The full
+        snapshot is only rewritten when the journal reaches
+        JOURNAL_COMPACT_THRESHOLD entries (or the collection has never been
+        snapshotted).
+
+        Args:
+            name: Collection name
+            ops: Journal operations ({"op": "upsert"|"payload"|"delete", ...})
+        """
+        col = self._collections[name]
+        if not self._journal_enabled:
+            self._save_collection(name)
+            return
+        if not ops:
+            return
+
+        if col.get("index") is None:
+            # Fallback mode: vectors live only in memory and collections are never
+            # reloaded, so a journal would never be replayed. Only refresh the
+            # payload sidecars on the same snapshot cadence.
+            col["journal_ops"] += len(ops)
+            if not col["snapshotted"] or col["journal_ops"] >= self.JOURNAL_COMPACT_THRESHOLD:
+                self._save_collection(name)
+            return
+
+        try:
+            with open(self._journal_path(name), "a", encoding="utf-8") as f:
+                for op in ops:
+                    col["seq"] += 1
+                    f.write(json.dumps({"seq": col["seq"], **op}) + "\n")
+        except Exception as e:
+            logger.error(f"[FAISS] Failed to append journal for '{name}': {e}")
+            self._save_collection(name)
+            return
+
+        col["journal_ops"] += len(ops)
+        if not col["snapshotted"] or col["journal_ops"] >= self.JOURNAL_COMPACT_THRESHOLD:
+            self._save_collection(name)
+
+    def _replay_journal(self, name: str, col: Dict[str, Any]) -> int:
+        """Apply journal entries newer than the loaded snapshot.
+
+        A torn trailing line (crash during append) stops the replay; the
+        collection is then re-snapshotted so later appends start on a clean file.
+
+        Returns:
+            Number of journal entries applied
+        """
+        journal_path = self._journal_path(name)
+        if not journal_path.exists():
+            return 0
+
+        applied = 0
+        lines = 0
+        torn = False
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"[FAISS] Truncated journal entry in '{name}'; stopping replay")
+                    torn = True
+                    break
+                lines += 1
+                seq = int(entry.get("seq", 0))
+                if seq <= col["seq"]:
+                    continue
+                self._apply_op(col, entry)
+                col["seq"] = seq
+                applied += 1
+
+        col["journal_ops"] = lines
+        if torn:
+            self._save_collection(name)
+        return applied
+
+    def _apply_op(self, col: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        """Apply a single journal operation to an in-memory collection."""
+        op = entry.get("op")
+        if op == "upsert":
+            self._add_point(col, entry["id"], entry.get("vector", []), entry.get("payload", {}))
+        elif op == "payload":
+            if entry["id"] in col["payloads"]:
+                self._set_payload(col, entry["id"], entry.get("payload", {}))
+        elif op == "delete":
+            for point_id in entry.get("ids", []):
+                self._remove_point(col, point_id)
+        else:
+            logger.warning(f"[FAISS] Unknown journal op '{op}' ignored")
+
+    def _add_point(
+        self, col: Dict[str, Any], point_id: str, vector: List[float], payload: Dict[str, Any]
+    ) -> None:
+        """Insert or replace a point in the in-memory collection.
+
+        Re-upserting an existing ID remaps it to the new vector; the previous
+        vector becomes dead and is dropped by the next compaction.
+        """
+        # Normalize vector for cosine similarity
+        if FAISS_AVAILABLE:
+            vec_np = np.array(vector, dtype=np.float32).reshape(1, -1)
+            faiss.normalize_L2(vec_np)
+
+            faiss_id = len(col["rev_ids"])
+            col["index"].add_with_ids(vec_np, np.array([faiss_id], dtype=np.int64))
+        else:
+            # Fallback: store in list
+            col["vectors"].append({"id": point_id, "vector": vector})
+            faiss_id = len(col["vectors"]) - 1
+
+        previous = col["id_map"].get(point_id)
+        if previous is not None:
+            col["rev_ids"][previous] = None
+        col["id_map"][point_id] = faiss_id
+        col["rev_ids"].append(point_id)
+
+        self._set_payload(col, point_id, payload)
+
+    def _remove_point(self, col: Dict[str, Any], point_id: str) -> bool:
+        """Drop a point's payload and id mapping. Returns True if it existed."""
+        if point_id not in col["payloads"]:
+            return False
+        payload = col["payloads"].pop(point_id)
+        if col.get("field_index") is not None:
+            self._unindex_payload(col["field_index"], point_id, payload)
+        faiss_id = col["id_map"].pop(point_id, None)
+        if faiss_id is not None:
+            col["rev_ids"][faiss_id] = None
+        return True
+
+    def _evict_if_needed(
+        self, collection_name: str, evicted_ids: Optional[List[str]] = None
+    ) -> int:
         """
         Evict oldest entries from payload cache if over MAX_PAYLOAD_ENTRIES.
 
@@ -151,6 +672,8 @@ class FaissStore:
 
         Args:
             collection_name: Name of the collection to evict from
+            evicted_ids: Optional list that receives the evicted point IDs (used to
+                journal evictions, since LRU order is not reproducible on replay)
 
         Returns:
             Number of entries evicted
@@ -163,12 +686,11 @@ class FaissStore:
         evicted = 0
 
         while len(payloads) > self.MAX_PAYLOAD_ENTRIES:
-            # Remove oldest entry (first item in OrderedDict)
+            # Remove oldest entry (first item in OrderedDict); its vector becomes dead
             oldest_key = next(iter(payloads))
-            del payloads[oldest_key]
-            # Also remove from id_map to keep them in sync
-            if oldest_key in col["id_map"]:
-                del col["id_map"][oldest_key]
+            self._remove_point(col, oldest_key)
+            if evicted_ids is not None:
+                evicted_ids.append(oldest_key)
             evicted += 1
 
         if evicted > 0:
@@ -200,34 +722,38 @@ class FaissStore:
             col = self._collections[collection]
             count = 0
 
+            ops: List[Dict[str, Any]] = []
+
+            project_ids: Set[Optional[str]] = set()
+
             for point in points:
                 point_id = str(point.get("id") or uuid.uuid4().hex)
                 vector = point.get("vector", [])
                 payload = point.get("payload", {})
-
-                # Normalize vector for cosine similarity
-                if FAISS_AVAILABLE:
-                    vec_np = np.array(vector, dtype=np.float32).reshape(1, -1)
-                    faiss.normalize_L2(vec_np)
-
-                    # If point exists, we can't update in place with IndexFlatIP
-                    # For simplicity, we just add (duplicates handled by ID dedup at search time)
-                    # A production system would use IndexIDMap
-                    col["index"].add(vec_np)
-                    faiss_idx = col["index"].ntotal - 1
-                    col["id_map"][point_id] = faiss_idx
-                else:
-                    # Fallback: store in list
-                    col["vectors"].append({"id": point_id, "vector": vector})
-                    col["id_map"][point_id] = len(col["vectors"]) - 1
-
-                col["payloads"][point_id] = payload
+                project_ids.add(payload.get("project_id"))
+
+                self._add_point(col, point_id, vector, payload)
+                ops.append(
+                    {
+                        "op": "upsert",
+                        "id": point_id,
+                        "vector": [float(x) for x in vector],
+                        "payload": payload,
+                    }
+                )
                 count += 1
 
             # Evict oldest entries if over limit
-            self._evict_if_needed(collection)
-
-            self._save_collection(collection)
+            evicted_ids: List[str] = []
+            self._evict_if_needed(collection, evicted_ids)
+            if evicted_ids:
+                ops.append({"op": "delete", "ids": evicted_ids})
+                project_ids.add(None)
+
+            self._persist(collection, ops)
+            self._maybe_schedule_compaction(collection)
+            # IMP-PERF-019: Invalidate memory context built before this write
+            bump_memory_write_generation(collection, project_ids)
             return count
 
     def search(
@@ -250,6 +776,7 @@ class FaissStore:
             List of {"id": str, "score": float, "payload": Dict}
         """
         self.ensure_collection(collection)
+        note_memory_read(collection, filter)
 
         with self._lock:
             col = self._collections[collection]
@@ -262,48 +789,196 @@ class FaissStore:
                 query_np = np.array(query_vector, dtype=np.float32).reshape(1, -1)
                 faiss.normalize_L2(query_np)
 
-                # Search more than limit to allow for filtering
-                k = min(limit * 3, col["index"].ntotal)
-                scores, indices = col["index"].search(query_np, k)
+                plan = self._faiss_search_plan(col, filter, limit)
+                if plan is None:
+                    return []
+                params, ntotal, k = plan
+                return self._faiss_search_widening(col, query_np, params, ntotal, k, filter, limit)
+            else:
+                # Fallback: brute-force cosine similarity
+                return self._fallback_search(col, query_vector, filter, limit)
+
+    def search_batch(
+        self,
+        collection: str,
+        query_vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors at once.
+
+        IMP-PERF-026: Takes the lock and resolves the filter once, then scores
+        all queries together (one FAISS search or one matrix product).
 
-                # Reverse map faiss_idx -> point_id
-                idx_to_id = {v: k for k, v in col["id_map"].items()}
+        Args:
+            collection: Collection name
+            query_vectors: Query embeddings
+            filter: Optional payload filter applied to every query
+            limit: Max results per query
+
+        Returns:
+            One list of {"id": str, "score": float, "payload": Dict} per query,
+            in the same order as query_vectors
+        """
+        if not query_vectors:
+            return []
+        self.ensure_collection(collection)
+        note_memory_read(collection, filter)
+
+        with self._lock:
+            col = self._collections[collection]
+
+            if FAISS_AVAILABLE and col["index"] is not None:
+                if col["index"].ntotal == 0:
+                    return [[] for _ in query_vectors]
+
+                queries = np.array(query_vectors, dtype=np.float32)
+                faiss.normalize_L2(queries)
+
+                plan = self._faiss_search_plan(col, filter, limit)
+                if plan is None:
+                    return [[] for _ in query_vectors]
+                params, ntotal, k = plan
+                scores, labels = col["index"].search(queries, k, params=params)
 
                 results = []
-                for i, (score, faiss_idx) in enumerate(zip(scores[0], indices[0])):
-                    if faiss_idx < 0:
-                        continue
-                    point_id = idx_to_id.get(faiss_idx)
-                    if not point_id:
-                        continue
-                    payload = col["payloads"].get(point_id, {})
-
-                    status = payload.get("status")
-                    if status in ("tombstoned", "superseded", "archived"):
-                        continue
-
-                    # Apply filter
-                    if filter and not self._matches_filter(payload, filter):
-                        continue
-
-                    # Mark as recently used for LRU eviction
-                    if point_id in col["payloads"]:
-                        col["payloads"].move_to_end(point_id)
-
-                    results.append(
-                        {
-                            "id": point_id,
-                            "score": float(score),
-                            "payload": payload,
-                        }
-                    )
-                    if len(results) >= limit:
-                        break
+                for i in range(len(query_vectors)):
+                    hits = self._collect_hits(col, scores[i], labels[i], filter, limit)
+                    if len(hits) < limit and k < ntotal:
+                        # Too many dead/filtered hits for this query: widen it alone
+                        hits = self._faiss_search_widening(
+                            col,
+                            queries[i : i + 1],
+                            params,
+                            ntotal,
+                            min(k * 2, ntotal),
+                            filter,
+                            limit,
+                        )
+                    results.append(hits)
+                return results
+
+            if NUMPY_AVAILABLE and col.get("vectors"):
+                return self._fallback_search_batch(col, query_vectors, filter, limit)
+            return [self._fallback_search(col, q, filter, limit) for q in query_vectors]
+
+    def _faiss_search_plan(
+        self, col: Dict[str, Any], filter: Optional[Dict[str, Any]], limit: int
+    ) -> Optional[Tuple[Any, int, int]]:
+        """Return (search params, scannable total, initial k), or None if nothing matches."""
+        candidates = self._candidate_ids(col, filter)
+        if candidates is not None:
+            # Pre-filter: scan only vectors of points matching the indexed fields
+            candidate_ids = np.fromiter(
+                (col["id_map"][pid] for pid in candidates if pid in col["id_map"]),
+                dtype=np.int64,
+            )
+            if candidate_ids.size == 0:
+                return None
+            params = faiss.SearchParameters(sel=faiss.IDSelectorBatch(candidate_ids))
+            ntotal = int(candidate_ids.size)
+            return params, ntotal, min(limit * 3, ntotal)
+
+        ntotal = col["index"].ntotal
+        return None, ntotal, min(limit * 3 + self._dead_count(col), ntotal)
 
+    def _faiss_search_widening(
+        self,
+        col: Dict[str, Any],
+        query_np: Any,
+        params: Any,
+        ntotal: int,
+        k: int,
+        filter: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Search one query, over-fetching to cover dead vectors and filtering.
+
+        The scan widens until enough results survive or the whole index was visited.
+        """
+        while True:
+            scores, labels = col["index"].search(query_np, k, params=params)
+            results = self._collect_hits(col, scores[0], labels[0], filter, limit)
+            if len(results) >= limit or k >= ntotal:
                 return results
-            else:
-                # Fallback: brute-force cosine similarity
-                return self._fallback_search(col, query_vector, filter, limit)
+            k = min(k * 2, ntotal)
+
+    def _collect_hits(
+        self,
+        col: Dict[str, Any],
+        scores: Any,
+        labels: Any,
+        filter: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Turn raw index hits into filtered search results."""
+        rev_ids = col["rev_ids"]
+        results = []
+        for score, faiss_id in zip(scores, labels):
+            if faiss_id < 0 or faiss_id >= len(rev_ids):
+                continue
+            point_id = rev_ids[faiss_id]
+            if not point_id:
+                continue
+            payload = col["payloads"].get(point_id, {})
+
+            status = payload.get("status")
+            if status in _EXCLUDED_STATUSES:
+                continue
+
+            # Apply filter
+            if filter and not self._matches_filter(payload, filter):
+                continue
+
+            # Mark as recently used for LRU eviction
+            if point_id in col["payloads"]:
+                col["payloads"].move_to_end(point_id)
+
+            results.append(
+                {
+                    "id": point_id,
+                    "score": float(score),
+                    "payload": payload,
+                }
+            )
+            if len(results) >= limit:
+                break
+        return results
+
+    def _fallback_matrix(self, col: Dict[str, Any]) -> Any:
+        """Return the pre-normalized float32 matrix mirroring ``col["vectors"]``.
+
+        Rows are normalized once, appended lazily for vectors added since the last
+        search, and the backing array grows by doubling so appends stay amortized.
+        The matrix width is taken from the first vector; other lengths are
+        truncated or zero-padded to it.
+        """
+        vectors = col["vectors"]
+        matrix = col.get("matrix")
+        rows = col.get("matrix_rows", 0) if matrix is not None else 0
+        total = len(vectors)
+        if matrix is not None and rows >= total:
+            return matrix[:total]
+
+        dim = matrix.shape[1] if matrix is not None else len(vectors[0]["vector"])
+        new_rows = np.zeros((total - rows, dim), dtype=np.float32)
+        for i, item in enumerate(vectors[rows:]):
+            vector = item["vector"][:dim]
+            new_rows[i, : len(vector)] = vector
+        norms = np.linalg.norm(new_rows, axis=1, keepdims=True)
+        np.divide(new_rows, norms, out=new_rows, where=norms > 0)
+
+        if matrix is None or matrix.shape[0] < total:
+            capacity = max(total, 2 * (matrix.shape[0] if matrix is not None else 0))
+            grown = np.empty((capacity, dim), dtype=np.float32)
+            if rows:
+                grown[:rows] = matrix[:rows]
+            matrix = grown
+        matrix[rows:total] = new_rows
+        col["matrix"] = matrix
+        col["matrix_rows"] = total
+        return matrix[:total]
 
     def _fallback_search(
         self,
@@ -312,26 +987,163 @@ class FaissStore:
         filter: Optional[Dict],
         limit: int,
     ) -> List[Dict[str, Any]]:
-        """Brute-force search without FAISS."""
+        """Brute-force search without FAISS.
+
+        IMP-PERF-011: With NumPy, scores come from a single product against the
+        pre-normalized matrix and the top hits are picked with ``argpartition``,
+        over-fetching (and widening) to cover dead and filtered-out vectors.
+        """
         if not col.get("vectors"):
             return []
+        if not NUMPY_AVAILABLE:
+            return self._python_fallback_search(col, query_vector, filter, limit)
+
+        matrix = self._fallback_matrix(col)
+        positions = self._fallback_positions(col, filter)
+        if positions is not None and positions.size == 0:
+            return []
+        query = self._normalized_query(query_vector, matrix.shape[1])
+        scores = (matrix if positions is None else matrix[positions]) @ query
+        return self._rank_fallback_hits(col, scores, positions, filter, limit)
+
+    def _fallback_search_batch(
+        self,
+        col: Dict,
+        query_vectors: List[List[float]],
+        filter: Optional[Dict],
+        limit: int,
+    ) -> List[List[Dict[str, Any]]]:
+        """Brute-force search for several queries with a single matrix product."""
+        matrix = self._fallback_matrix(col)
+        positions = self._fallback_positions(col, filter)
+        if positions is not None and positions.size == 0:
+            return [[] for _ in query_vectors]
+        dim = matrix.shape[1]
+        queries = np.stack([self._normalized_query(q, dim) for q in query_vectors], axis=1)
+        scores = (matrix if positions is None else matrix[positions]) @ queries
+        return [
+            self._rank_fallback_hits(col, scores[:, i], positions, filter, limit)
+            for i in range(len(query_vectors))
+        ]
+
+    @staticmethod
+    def _normalized_query(query_vector: List[float], dim: int) -> Any:
+        """Return the query as a unit float32 vector truncated or zero-padded to dim."""
+        query = np.zeros(dim, dtype=np.float32)
+        query_values = list(query_vector)[:dim]
+        query[: len(query_values)] = query_values
+        query_norm = np.linalg.norm(query)
+        if query_norm > 0:
+            query /= query_norm
+        return query
+
+    def _fallback_positions(self, col: Dict[str, Any], filter: Optional[Dict]) -> Any:
+        """Matrix rows of the points matching the indexed filter fields (None = all rows)."""
+        candidates = self._candidate_ids(col, filter)
+        if candidates is None:
+            return None
+        return np.array(
+            sorted(col["id_map"][point_id] for point_id in candidates if point_id in col["id_map"]),
+            dtype=np.int64,
+        )
+
+    def _rank_fallback_hits(
+        self,
+        col: Dict[str, Any],
+        scores: Any,
+        positions: Any,
+        filter: Optional[Dict],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Pick the top hits from fallback scores, widening past dead/filtered entries."""
+        ntotal = int(scores.size)
+        k = min(limit * 3 + self._dead_count(col), ntotal)
+        while True:
+            if k < ntotal:
+                top = np.argpartition(-scores, k - 1)[:k]
+                # Position order first so equal scores keep insertion order
+                top.sort()
+            else:
+                top = np.arange(ntotal)
+            top = top[np.argsort(-scores[top], kind="stable")]
+            hits = top if positions is None else positions[top]
+            results = self._collect_fallback_hits(col, hits, scores[top], filter, limit)
+            if len(results) >= limit or k >= ntotal:
+                return results
+            k = min(k * 2, ntotal)
+
+    def _collect_fallback_hits(
+        self,
+        col: Dict[str, Any],
+        positions: Any,
+        scores: Any,
+        filter: Optional[Dict[str, Any]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Turn ranked fallback positions into filtered search results."""
+        results = []
+        for position, score in zip(positions.tolist(), scores.tolist()):
+            point_id = col["vectors"][position]["id"]
+
+            # Skip dead entries (deleted or replaced by a later upsert)
+            if col["id_map"].get(point_id) != position:
+                continue
+            payload = col["payloads"].get(point_id, {})
+
+            status = payload.get("status")
+            if status in _EXCLUDED_STATUSES:
+                continue
+
+            if filter and not self._matches_filter(payload, filter):
+                continue
+
+            # Mark as recently used for LRU eviction
+            if point_id in col["payloads"]:
+                col["payloads"].move_to_end(point_id)
+
+            results.append({"id": point_id, "score": float(score), "payload": payload})
+            if len(results) >= limit:
+                break
+        return results
+
+    def _python_fallback_search(
+        self,
+        col: Dict,
+        query_vector: List[float],
+        filter: Optional[Dict],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Pure-Python brute-force search, used when NumPy is not installed."""
+        query_norm = sum(x * x for x in query_vector) ** 0.5
 
         def cosine_sim(a: List[float], b: List[float]) -> float:
             dot = sum(x * y for x, y in zip(a, b))
-            norm_a = sum(x * x for x in a) ** 0.5
             norm_b = sum(x * x for x in b) ** 0.5
-            if norm_a == 0 or norm_b == 0:
+            if query_norm == 0 or norm_b == 0:
                 return 0.0
-            return dot / (norm_a * norm_b)
+            return dot / (query_norm * norm_b)
+
+        candidates = self._candidate_ids(col, filter)
+        if candidates is not None:
+            positions = sorted(
+                col["id_map"][point_id] for point_id in candidates if point_id in col["id_map"]
+            )
+        else:
+            positions = range(len(col["vectors"]))
 
         scored = []
-        for item in col["vectors"]:
+        for position in positions:
+            item = col["vectors"][position]
             point_id = item["id"]
             vector = item["vector"]
+
+            # Skip dead entries (deleted or replaced by a later upsert)
+            if col["id_map"].get(point_id) != position:
+                continue
             payload = col["payloads"].get(point_id, {})
 
             status = payload.get("status")
-            if status in ("tombstoned", "superseded", "archived"):
+            if status in _EXCLUDED_STATUSES:
                 continue
 
             if filter and not self._matches_filter(payload, filter):
@@ -372,6 +1184,7 @@ class FaissStore:
             List of {"id": str, "payload": Dict}
         """
         self.ensure_collection(collection)
+        note_memory_read(collection, filter)
 
         with self._lock:
             col = self._collections[collection]
@@ -404,18 +1217,20 @@ class FaissStore:
             col = self._collections[collection]
             if point_id not in col["payloads"]:
                 return False
-            col["payloads"][point_id] = payload
+            previous_project = col["payloads"][point_id].get("project_id")
+            self._set_payload(col, point_id, payload)
             # Mark as recently used for LRU eviction
             col["payloads"].move_to_end(point_id)
-            self._save_collection(collection)
+            self._persist(collection, [{"op": "payload", "id": point_id, "payload": payload}])
+            bump_memory_write_generation(collection, {previous_project, payload.get("project_id")})
             return True
 
     def delete(self, collection: str, ids: List[str]) -> int:
         """
         Delete points by ID.
 
-        Note: With IndexFlatIP, we can't truly delete. We mark payloads as deleted
-        and filter them out in search. A production system would rebuild the index.
+        The payload and id mapping are dropped immediately; the vector stays in the
+        index as dead until a compaction removes it (IMP-PERF-008).
 
         Args:
             collection: Collection name
@@ -428,17 +1243,18 @@ class FaissStore:
 
         with self._lock:
             col = self._collections[collection]
-            count = 0
-
-            for point_id in ids:
-                if point_id in col["payloads"]:
-                    del col["payloads"][point_id]
-                    if point_id in col["id_map"]:
-                        del col["id_map"][point_id]
-                    count += 1
+            project_ids = {
+                col["payloads"][point_id].get("project_id")
+                for point_id in ids
+                if point_id in col["payloads"]
+            }
+            deleted = [point_id for point_id in ids if self._remove_point(col, point_id)]
 
-            self._save_collection(collection)
-            return count
+            if deleted:
+                self._persist(collection, [{"op": "delete", "ids": deleted}])
+                self._maybe_schedule_compaction(collection)
+                bump_memory_write_generation(collection, project_ids)
+            return len(deleted)
 
     def count(self, collection: str, filter: Optional[Dict[str, Any]] = None) -> int:
         """Count documents in collection, optionally filtered."""
@@ -38,6 +38,9 @@ VALID_OUTCOMES = frozenset(
 # Valid priority levels
 VALID_PRIORITIES = frozenset({"critical", "high", "medium", "low"})
 
+# Pattern confidence levels, lowest to highest
+CONFIDENCE_ORDER = {"experimental": 0, "low": 1, "medium": 2, "high": 3}
+
 
 class LearningDatabase:
     """Persistent database for cross-cycle learnings.
@@ -247,22 +250,7 @@ class LearningDatabase:
             logger.warning("Cannot record cycle outcome: empty cycle_id")
             return False
 
-        timestamp = datetime.now().isoformat()
-
-        cycle_record = {
-            "cycle_id": cycle_id,
-            "recorded_at": timestamp,
-            "metrics": {
-                "phases_completed": metrics.get("phases_completed", 0),
-                "phases_blocked": metrics.get("phases_blocked", 0),
-                "total_nudges": metrics.get("total_nudges", 0),
-                "total_escalations": metrics.get("total_escalations", 0),
-                "duration_hours": metrics.get("duration_hours", 0.0),
-                "completion_rate": metrics.get("completion_rate", 0.0),
-            },
-            "blocking_reasons": metrics.get("blocking_reasons", []),
-            "improvements_attempted": metrics.get("improvements_attempted", []),
-        }
+        cycle_record = self._build_cycle_record(cycle_id, metrics)
 
         self._data["cycles"][cycle_id] = cycle_record
 
@@ -277,6 +265,24 @@ class LearningDatabase:
 
         return self._save()
 
+    @staticmethod
+    def _build_cycle_record(cycle_id: str, metrics: dict[str, Any]) -> dict[str, Any]:
+        """Build the stored record for a cycle outcome."""
+        return {
+            "cycle_id": cycle_id,
+            "recorded_at": datetime.now().isoformat(),
+            "metrics": {
+                "phases_completed": metrics.get("phases_completed", 0),
+                "phases_blocked": metrics.get("phases_blocked", 0),
+                "total_nudges": metrics.get("total_nudges", 0),
+                "total_escalations": metrics.get("total_escalations", 0),
+                "duration_hours": metrics.get("duration_hours", 0.0),
+                "completion_rate": metrics.get("completion_rate", 0.0),
+            },
+            "blocking_reasons": metrics.get("blocking_reasons", []),
+            "improvements_attempted": metrics.get("improvements_attempted", []),
+        }
+
     def record_improvement_outcome(
         self,
         imp_id: str,
@@ -300,9 +306,39 @@ class LearningDatabase:
         Returns:
             True if recording was successful, False otherwise.
         """
+        outcome_lower = self._normalize_outcome(imp_id, outcome)
+        if outcome_lower is None:
+            return False
+
+        self._data["improvements"][imp_id] = self._apply_improvement_outcome(
+            self._data["improvements"].get(imp_id),
+            imp_id,
+            outcome_lower,
+            notes,
+            category,
+            priority,
+            cycle_id,
+        )
+
+        # Update category success rates
+        if category:
+            self._update_category_success_rate(category, outcome_lower)
+
+        logger.info(
+            "Recorded improvement outcome: %s -> %s (category=%s)",
+            imp_id,
+            outcome_lower,
+            category or "unknown",
+        )
+
+        return self._save()
+
+    @staticmethod
+    def _normalize_outcome(imp_id: str, outcome: str) -> str | None:
+        """Validate an improvement outcome, returning it lower-cased or None if invalid."""
         if not imp_id:
             logger.warning("Cannot record improvement outcome: empty imp_id")
-            return False
+            return None
 
         outcome_lower = outcome.lower()
         if outcome_lower not in VALID_OUTCOMES:
@@ -312,13 +348,25 @@ class LearningDatabase:
                 imp_id,
                 VALID_OUTCOMES,
             )
-            return False
+            return None
+        return outcome_lower
 
+    @staticmethod
+    def _apply_improvement_outcome(
+        imp_record: dict[str, Any] | None,
+        imp_id: str,
+        outcome: str,
+        notes: str,
+        category: str | None,
+        priority: str | None,
+        cycle_id: str | None,
+    ) -> dict[str, Any]:
+        """Append an outcome to an improvement record, creating the record if needed."""
         timestamp = datetime.now().isoformat()
 
         # Get or create improvement record
-        if imp_id not in self._data["improvements"]:
-            self._data["improvements"][imp_id] = {
+        if imp_record is None:
+            imp_record = {
                 "imp_id": imp_id,
                 "category": category,
                 "priority": priority,
@@ -326,8 +374,6 @@ class LearningDatabase:
                 "outcome_history": [],
             }
 
-        imp_record = self._data["improvements"][imp_id]
-
         # Update category/priority if provided
         if category:
             imp_record["category"] = category
@@ -336,7 +382,7 @@ class LearningDatabase:
 
         # Add outcome to history
         outcome_entry = {
-            "outcome": outcome_lower,
+            "outcome": outcome,
             "recorded_at": timestamp,
             "notes": notes,
             "cycle_id": cycle_id,
@@ -344,21 +390,9 @@ class LearningDatabase:
         imp_record["outcome_history"].append(outcome_entry)
 
         # Update current outcome
-        imp_record["current_outcome"] = outcome_lower
+        imp_record["current_outcome"] = outcome
         imp_record["last_updated"] = timestamp
-
-        # Update category success rates
-        if category:
-            self._update_category_success_rate(category, outcome_lower)
-
-        logger.info(
-            "Recorded improvement outcome: %s -> %s (category=%s)",
-            imp_id,
-            outcome_lower,
-            category or "unknown",
-        )
-
-        return self._save()
+        return imp_record
 
     def _update_pattern_correlations(self, cycle_record: dict[str, Any]) -> None:
         """Update pattern correlation data from a cycle record."""
@@ -720,13 +754,12 @@ class LearningDatabase:
         Returns:
             List of top patterns sorted by success rate.
         """
-        confidence_order = {"experimental": 0, "low": 1, "medium": 2, "high": 3}
-        min_conf_value = confidence_order.get(min_confidence.lower(), 1)
+        min_conf_value = CONFIDENCE_ORDER.get(min_confidence.lower(), 1)
 
         patterns = [
             p
             for p in self._data.get("successful_patterns", {}).values()
-            if confidence_order.get(p.get("confidence", "low"), 0) >= min_conf_value
+            if CONFIDENCE_ORDER.get(p.get("confidence", "low"), 0) >= min_conf_value
         ]
 
         # Sort by success rate descending, then by occurrence count
@@ -805,36 +838,43 @@ class LearningDatabase:
             return False
 
         if new_occurrence:
-            old_count = pattern.get("occurrence_count", 0)
-            old_success_rate = pattern.get("success_rate", 0)
-
-            # Calculate new success rate
-            old_successes = old_count * old_success_rate
-            new_successes = old_successes + (1 if was_successful else 0)
-            new_count = old_count + 1
-
-            pattern["occurrence_count"] = new_count
-            pattern["success_rate"] = round(new_successes / new_count, 3)
-            pattern["updated_at"] = datetime.now().isoformat()
-            pattern["last_seen"] = datetime.now().isoformat()
-
-            # Update confidence based on new count
-            if new_count >= 5:
-                pattern["confidence"] = "high"
-            elif new_count >= 3:
-                pattern["confidence"] = "medium"
-            else:
-                pattern["confidence"] = "low"
-
-            logger.info(
-                "Updated pattern metrics: %s (count=%d, success_rate=%.1f%%)",
-                pattern_id,
-                new_count,
-                pattern["success_rate"] * 100,
-            )
+            self._apply_pattern_occurrence(pattern_id, pattern, was_successful)
 
         return self._save()
 
+    @staticmethod
+    def _apply_pattern_occurrence(
+        pattern_id: str, pattern: dict[str, Any], was_successful: bool
+    ) -> None:
+        """Fold one new occurrence into a pattern's count, success rate and confidence."""
+        old_count = pattern.get("occurrence_count", 0)
+        old_success_rate = pattern.get("success_rate", 0)
+
+        # Calculate new success rate
+        old_successes = old_count * old_success_rate
+        new_successes = old_successes + (1 if was_successful else 0)
+        new_count = old_count + 1
+
+        pattern["occurrence_count"] = new_count
+        pattern["success_rate"] = round(new_successes / new_count, 3)
+        pattern["updated_at"] = datetime.now().isoformat()
+        pattern["last_seen"] = datetime.now().isoformat()
+
+        # Update confidence based on new count
+        if new_count >= 5:
+            pattern["confidence"] = "high"
+        elif new_count >= 3:
+            pattern["confidence"] = "medium"
+        else:
+            pattern["confidence"] = "low"
+
+        logger.info(
+            "Updated pattern metrics: %s (count=%d, success_rate=%.1f%%)",
+            pattern_id,
+            new_count,
+            pattern["success_rate"] * 100,
+        )
+
     def store_project_history(
         self,
         project_id: str,
@@ -0,0 +1,999 @@
+"""SQLite-backed Historical Learning Database.
+
+IMP-PERF-016: LearningDatabase keeps every record in one JSON document and
+rewrites the whole (pretty-printed) file under an exclusive file lock on every
+write. As history accumulates across projects that dump becomes the slowest
+write path in the loop.
+
+SqliteLearningDatabase exposes the same API but stores each improvement,
+cycle, pattern and project as its own row in a WAL-mode SQLite database:
+- Writes touch only the affected rows inside a short IMMEDIATE transaction
+- Pattern and cycle queries use indexes instead of sorting the whole history
+- Readers never block on writers (WAL), across threads and processes
+
+An existing JSON database is imported once via migrate_json_learning_db(), or
+automatically by open_learning_database() when given the legacy JSON path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .learning_db import CONFIDENCE_ORDER, LearningDatabase
+
+logger = logging.getLogger(__name__)
+
+# File suffixes treated as SQLite databases by open_learning_database()
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+# Seconds a writer waits for another process's transaction before failing
+SQLITE_BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS improvements (
+    imp_id TEXT PRIMARY KEY,
+    category TEXT,
+    current_outcome TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_improvements_category_outcome
+    ON improvements (category, current_outcome);
+CREATE INDEX IF NOT EXISTS idx_improvements_outcome ON improvements (current_outcome);
+
+CREATE TABLE IF NOT EXISTS cycles (
+    cycle_id TEXT PRIMARY KEY,
+    recorded_at TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cycles_recorded_at ON cycles (recorded_at DESC);
+
+CREATE TABLE IF NOT EXISTS blocking_reasons (
+    reason TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    cycles TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_blocking_reasons_count ON blocking_reasons (count DESC);
+
+CREATE TABLE IF NOT EXISTS category_success_rates (
+    category TEXT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    implemented INTEGER NOT NULL DEFAULT 0,
+    blocked INTEGER NOT NULL DEFAULT 0,
+    abandoned INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS patterns (
+    pattern_id TEXT PRIMARY KEY,
+    pattern_type TEXT,
+    confidence_rank INTEGER NOT NULL DEFAULT 0,
+    success_rate REAL NOT NULL DEFAULT 0,
+    occurrence_count INTEGER NOT NULL DEFAULT 0,
+    has_project_types INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_patterns_rank
+    ON patterns (confidence_rank, success_rate DESC, occurrence_count DESC);
+CREATE INDEX IF NOT EXISTS idx_patterns_type ON patterns (pattern_type);
+
+-- Lower-cased recommended_for / avoid_for / associated_project_types entries
+CREATE TABLE IF NOT EXISTS pattern_terms (
+    pattern_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (pattern_id, kind, term)
+);
+CREATE INDEX IF NOT EXISTS idx_pattern_terms_lookup ON pattern_terms (kind, term);
+
+CREATE TABLE IF NOT EXISTS project_history (
+    project_id TEXT PRIMARY KEY,
+    project_type TEXT,
+    outcome TEXT,
+    timestamp TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_project_history_timestamp ON project_history (timestamp DESC);
+"""
+
+# Pattern list fields mirrored into pattern_terms, keyed by term kind
+_PATTERN_TERM_FIELDS = {
+    "recommended_for": "recommended_for",
+    "avoid_for": "avoid_for",
+    "project_type": "associated_project_types",
+}
+
+_DATA_TABLES = (
+    "improvements",
+    "cycles",
+    "blocking_reasons",
+    "category_success_rates",
+    "patterns",
+    "pattern_terms",
+    "project_history",
+)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a record the same way the JSON backend does."""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class SqliteLearningDatabase(LearningDatabase):
+    """LearningDatabase stored in a WAL-mode SQLite file.
+
+    Drop-in replacement for the JSON-backed LearningDatabase: every public
+    method has the same signature and returns the same records.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+    """
+
+    def __init__(self, db_path: Path | str, legacy_json_path: Path | str | None = None) -> None:
+        """Initialize the SqliteLearningDatabase.
+
+        Args:
+            db_path: Path to the SQLite file. Will be created if it doesn't exist.
+            legacy_json_path: Optional JSON learning database to import the
+                first time this SQLite database is opened while still empty.
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._load()
+
+        if legacy_json_path is not None and self._is_empty():
+            legacy_json_path = Path(legacy_json_path)
+            if legacy_json_path.exists():
+                self.import_json(legacy_json_path)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Open the database file and create the schema if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=SQLITE_BUSY_TIMEOUT,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+        with self._transaction() as tx:
+            now = datetime.now().isoformat()
+            tx.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(self.SCHEMA_VERSION),),
+            )
+            tx.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('created_at', ?)", (now,))
+            tx.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('updated_at', ?)", (now,))
+
+        logger.debug("Opened SQLite learning database: %s", self.db_path)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, committing on success and rolling back on error."""
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                raise sqlite3.ProgrammingError("Learning database is closed")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute(
+                    "UPDATE meta SET value = ? WHERE key = 'updated_at'",
+                    (datetime.now().isoformat(),),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple | list = ()) -> list[tuple]:
+        """Run a read query and return all rows."""
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("Learning database is closed")
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write(self, label: str, fn) -> bool:
+        """Run ``fn(conn)`` in a transaction, logging and returning False on failure."""
+        try:
+            with self._transaction() as tx:
+                fn(tx)
+            return True
+        except sqlite3.Error as e:
+            logger.error("Failed to %s in learning database %s: %s", label, self.db_path, e)
+            return False
+
+    def _save(self) -> bool:
+        """Writes are committed per operation; nothing is buffered."""
+        return True
+
+    def _is_empty(self) -> bool:
+        """Return True if no records of any kind have been stored."""
+        for table in ("improvements", "cycles", "patterns", "project_history"):
+            if self._query(f"SELECT 1 FROM {table} LIMIT 1"):
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Cycles and improvements
+    # ------------------------------------------------------------------
+
+    def record_cycle_outcome(
+        self,
+        cycle_id: str,
+        metrics: dict[str, Any],
+    ) -> bool:
+        """Store outcome of a discovery cycle.
+
+        See LearningDatabase.record_cycle_outcome for the expected metrics.
+        """
+        if not cycle_id:
+            logger.warning("Cannot record cycle outcome: empty cycle_id")
+            return False
+
+        cycle_record = self._build_cycle_record(cycle_id, metrics)
+
+        def write(tx: sqlite3.Connection) -> None:
+            self._upsert_cycle(tx, cycle_record)
+            for reason in cycle_record.get("blocking_reasons", []):
+                row = tx.execute(
+                    "SELECT count, cycles FROM blocking_reasons WHERE reason = ?", (reason,)
+                ).fetchone()
+                count, cycles = (row[0], json.loads(row[1])) if row else (0, [])
+                cycles.append(cycle_id)
+                tx.execute(
+                    "INSERT INTO blocking_reasons (reason, count, cycles) VALUES (?, ?, ?) "
+                    "ON CONFLICT(reason) DO UPDATE SET "
+                    "count = excluded.count, cycles = excluded.cycles",
+                    (reason, count + 1, _dumps(cycles)),
+                )
+
+        if not self._write("record cycle outcome", write):
+            return False
+
+        logger.info(
+            "Recorded cycle outcome: %s (completion_rate=%.1f%%)",
+            cycle_id,
+            cycle_record["metrics"]["completion_rate"] * 100,
+        )
+        return True
+
+    def record_improvement_outcome(
+        self,
+        imp_id: str,
+        outcome: str,
+        notes: str = "",
+        category: str | None = None,
+        priority: str | None = None,
+        cycle_id: str | None = None,
+    ) -> bool:
+        """Track whether an improvement succeeded or why it failed.
+
+        See LearningDatabase.record_improvement_outcome for the arguments.
+        """
+        outcome_lower = self._normalize_outcome(imp_id, outcome)
+        if outcome_lower is None:
+            return False
+
+        def write(tx: sqlite3.Connection) -> None:
+            row = tx.execute("SELECT data FROM improvements WHERE imp_id = ?", (imp_id,)).fetchone()
+            imp_record = self._apply_improvement_outcome(
+                json.loads(row[0]) if row else None,
+                imp_id,
+                outcome_lower,
+                notes,
+                category,
+                priority,
+                cycle_id,
+            )
+            self._upsert_improvement(tx, imp_record)
+            if category:
+                self._bump_category_success_rate(tx, category, outcome_lower)
+
+        if not self._write("record improvement outcome", write):
+            return False
+
+        logger.info(
+            "Recorded improvement outcome: %s -> %s (category=%s)",
+            imp_id,
+            outcome_lower,
+            category or "unknown",
+        )
+        return True
+
+    @staticmethod
+    def _upsert_cycle(tx: sqlite3.Connection, cycle_record: dict[str, Any]) -> None:
+        tx.execute(
+            "INSERT INTO cycles (cycle_id, recorded_at, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(cycle_id) DO UPDATE SET "
+            "recorded_at = excluded.recorded_at, data = excluded.data",
+            (
+                cycle_record["cycle_id"],
+                str(cycle_record.get("recorded_at", "")),
+                _dumps(cycle_record),
+            ),
+        )
+
+    @staticmethod
+    def _upsert_improvement(tx: sqlite3.Connection, imp_record: dict[str, Any]) -> None:
+        tx.execute(
+            "INSERT INTO improvements (imp_id, category, current_outcome, data) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(imp_id) DO UPDATE SET category = excluded.category, "
+            "current_outcome = excluded.current_outcome, data = excluded.data",
+            (
+                imp_record["imp_id"],
+                imp_record.get("category"),
+                imp_record.get("current_outcome"),
+                _dumps(imp_record),
+            ),
+        )
+
+    @staticmethod
+    def _bump_category_success_rate(tx: sqlite3.Connection, category: str, outcome: str) -> None:
+        tx.execute(
+            "INSERT OR IGNORE INTO category_success_rates (category) VALUES (?)", (category,)
+        )
+        tx.execute(
+            "UPDATE category_success_rates SET total = total + 1 WHERE category = ?", (category,)
+        )
+        if outcome in ("implemented", "blocked", "abandoned"):
+            tx.execute(
+                f"UPDATE category_success_rates SET {outcome} = {outcome} + 1 WHERE category = ?",
+                (category,),
+            )
+
+    def get_historical_patterns(self) -> dict[str, Any]:
+        """Query past learnings for pattern matching.
+
+        Returns the same summary as LearningDatabase.get_historical_patterns.
+        """
+        top_blocking_reasons = [
+            {"reason": reason, "count": count}
+            for reason, count in self._query(
+                "SELECT reason, count FROM blocking_reasons ORDER BY count DESC, rowid LIMIT 10"
+            )
+        ]
+
+        category_rates = {}
+        for category, total, implemented, blocked, abandoned in self._query(
+            "SELECT category, total, implemented, blocked, abandoned "
+            "FROM category_success_rates WHERE total > 0 ORDER BY rowid"
+        ):
+            category_rates[category] = {
+                "total": total,
+                "implemented": implemented,
+                "blocked": blocked,
+                "abandoned": abandoned,
+                "success_rate": round(implemented / total, 3),
+            }
+
+        recent_cycles = self.list_cycles(limit=10)
+        if recent_cycles:
+            avg_completion = sum(
+                c.get("metrics", {}).get("completion_rate", 0) for c in recent_cycles
+            ) / len(recent_cycles)
+            avg_escalations = sum(
+                c.get("metrics", {}).get("total_escalations", 0) for c in recent_cycles
+            ) / len(recent_cycles)
+            trend = {
+                "sample_size": len(recent_cycles),
+                "avg_completion_rate": round(avg_completion, 3),
+                "avg_escalations": round(avg_escalations, 2),
+            }
+        else:
+            trend = {"sample_size": 0}
+
+        outcome_summary = dict(
+            self._query(
+                "SELECT current_outcome, COUNT(*) FROM improvements "
+                "WHERE current_outcome IS NOT NULL AND current_outcome != '' "
+                "GROUP BY current_outcome ORDER BY MIN(rowid)"
+            )
+        )
+
+        return {
+            "top_blocking_reasons": top_blocking_reasons,
+            "category_success_rates": category_rates,
+            "recent_trends": trend,
+            "improvement_outcome_summary": outcome_summary,
+            "total_improvements_tracked": self._count("improvements"),
+            "total_cycles_tracked": self._count("cycles"),
+        }
+
+    def get_success_rate(self, category: str) -> float:
+        """Calculate success rate for improvement category."""
+        rows = self._query(
+            "SELECT total, implemented FROM category_success_rates WHERE category = ?",
+            (category,),
+        )
+        if not rows:
+            logger.debug("No success rate data for category: %s", category)
+            return 0.0
+
+        total, implemented = rows[0]
+        if total == 0:
+            return 0.0
+        return round(implemented / total, 3)
+
+    def get_improvement(self, imp_id: str) -> dict[str, Any] | None:
+        """Get a specific improvement record."""
+        rows = self._query("SELECT data FROM improvements WHERE imp_id = ?", (imp_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def get_cycle(self, cycle_id: str) -> dict[str, Any] | None:
+        """Get a specific cycle record."""
+        rows = self._query("SELECT data FROM cycles WHERE cycle_id = ?", (cycle_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def list_improvements(
+        self,
+        category: str | None = None,
+        outcome: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List improvements with optional filtering, in insertion order."""
+        clauses, params = [], []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if outcome:
+            clauses.append("current_outcome = ?")
+            params.append(outcome)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [
+            json.loads(data)
+            for (data,) in self._query(
+                f"SELECT data FROM improvements{where} ORDER BY rowid", params
+            )
+        ]
+
+    def list_cycles(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List cycles ordered by recency, most recent first."""
+        sql = "SELECT data FROM cycles ORDER BY recorded_at DESC, rowid"
+        params: tuple = ()
+        if limit is not None and limit > 0:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [json.loads(data) for (data,) in self._query(sql, params)]
+
+    def get_likely_blockers(self, category: str | None = None) -> list[dict[str, Any]]:
+        """Predict what might block improvements in a category."""
+        reason_counts: Counter[str] = Counter()
+        for imp in self.list_improvements(category=category, outcome="blocked"):
+            for entry in imp.get("outcome_history", []):
+                if entry.get("outcome") == "blocked" and entry.get("notes"):
+                    reason_counts[entry["notes"]] += 1
+
+        for reason, count in self._query(
+            "SELECT reason, count FROM blocking_reasons ORDER BY rowid"
+        ):
+            reason_counts[reason] += count
+
+        return [
+            {"reason": reason, "frequency": count, "likelihood": "high" if count >= 3 else "medium"}
+            for reason, count in reason_counts.most_common(10)
+        ]
+
+    def export_data(self) -> dict[str, Any]:
+        """Export the full database in the JSON backend's document layout."""
+        meta = dict(self._query("SELECT key, value FROM meta"))
+        blocking_reasons = {
+            reason: {"count": count, "cycles": json.loads(cycles)}
+            for reason, count, cycles in self._query(
+                "SELECT reason, count, cycles FROM blocking_reasons ORDER BY rowid"
+            )
+        }
+        category_rates = {
+            category: {
+                "total": total,
+                "implemented": implemented,
+                "blocked": blocked,
+                "abandoned": abandoned,
+            }
+            for category, total, implemented, blocked, abandoned in self._query(
+                "SELECT category, total, implemented, blocked, abandoned "
+                "FROM category_success_rates ORDER BY rowid"
+            )
+        }
+        return {
+            "schema_version": int(meta.get("schema_version", self.SCHEMA_VERSION)),
+            "created_at": meta.get("created_at"),
+            "updated_at": meta.get("updated_at"),
+            "improvements": self._records("improvements", "imp_id"),
+            "cycles": self._records("cycles", "cycle_id"),
+            "patterns": {
+                "phase_correlations": json.loads(meta.get("phase_correlations", "{}")),
+                "blocking_reasons": blocking_reasons,
+                "category_success_rates": category_rates,
+            },
+            "successful_patterns": self._records("patterns", "pattern_id"),
+            "project_history": [
+                json.loads(data)
+                for (data,) in self._query("SELECT data FROM project_history ORDER BY rowid")
+            ],
+        }
+
+    def clear_all(self) -> bool:
+        """Clear all data from the database."""
+        logger.warning("Clearing all data from learning database")
+
+        def write(tx: sqlite3.Connection) -> None:
+            for table in _DATA_TABLES:
+                tx.execute(f"DELETE FROM {table}")
+            tx.execute("DELETE FROM meta WHERE key NOT IN ('schema_version', 'updated_at')")
+            tx.execute(
+                "INSERT INTO meta (key, value) VALUES ('created_at', ?)",
+                (datetime.now().isoformat(),),
+            )
+
+        return self._write("clear", write)
+
+    def _records(self, table: str, key: str) -> dict[str, Any]:
+        return {
+            record_id: json.loads(data)
+            for record_id, data in self._query(f"SELECT {key}, data FROM {table} ORDER BY rowid")
+        }
+
+    def _count(self, table: str) -> int:
+        return self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+
+    # ------------------------------------------------------------------
+    # Cross-project learning patterns
+    # ------------------------------------------------------------------
+
+    def store_pattern(
+        self,
+        pattern_id: str,
+        pattern_data: dict[str, Any],
+    ) -> bool:
+        """Store an extracted pattern for cross-project learning.
+
+        See LearningDatabase.store_pattern for the expected pattern_data keys.
+        """
+        if not pattern_id:
+            logger.warning("Cannot store pattern: empty pattern_id")
+            return False
+
+        timestamp = datetime.now().isoformat()
+        pattern = {
+            "pattern_id": pattern_id,
+            "stored_at": timestamp,
+            "updated_at": timestamp,
+            **pattern_data,
+        }
+
+        if not self._write("store pattern", lambda tx: self._upsert_pattern(tx, pattern)):
+            return False
+
+        logger.info(
+            "Stored pattern: %s (type=%s, success_rate=%.1f%%)",
+            pattern_id,
+            pattern_data.get("pattern_type", "unknown"),
+            pattern_data.get("success_rate", 0) * 100,
+        )
+        return True
+
+    @staticmethod
+    def _upsert_pattern(tx: sqlite3.Connection, pattern: dict[str, Any]) -> None:
+        pattern_id = pattern["pattern_id"]
+        confidence = pattern.get("confidence", "low")
+        confidence_rank = CONFIDENCE_ORDER.get(confidence, 0) if isinstance(confidence, str) else 0
+        tx.execute(
+            "INSERT INTO patterns (pattern_id, pattern_type, confidence_rank, success_rate, "
+            "occurrence_count, has_project_types, data) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(pattern_id) DO UPDATE SET pattern_type = excluded.pattern_type, "
+            "confidence_rank = excluded.confidence_rank, success_rate = excluded.success_rate, "
+            "occurrence_count = excluded.occurrence_count, "
+            "has_project_types = excluded.has_project_types, data = excluded.data",
+            (
+                pattern_id,
+                pattern.get("pattern_type"),
+                confidence_rank,
+                pattern.get("success_rate", 0) or 0,
+                pattern.get("occurrence_count", 0) or 0,
+                1 if pattern.get("associated_project_types") else 0,
+                _dumps(pattern),
+            ),
+        )
+        tx.execute("DELETE FROM pattern_terms WHERE pattern_id = ?", (pattern_id,))
+        tx.executemany(
+            "INSERT OR IGNORE INTO pattern_terms (pattern_id, kind, term) VALUES (?, ?, ?)",
+            [
+                (pattern_id, kind, str(term).lower())
+                for kind, field in _PATTERN_TERM_FIELDS.items()
+                for term in pattern.get(field) or []
+            ],
+        )
+
+    def get_pattern(self, pattern_id: str) -> dict[str, Any] | None:
+        """Get a specific pattern by ID."""
+        rows = self._query("SELECT data FROM patterns WHERE pattern_id = ?", (pattern_id,))
+        return json.loads(rows[0][0]) if rows else None
+
+    @staticmethod
+    def _project_type_clause(project_type: str | None) -> tuple[str, list[Any]]:
+        """SQL filter matching patterns for a project type (or universal patterns)."""
+        if not project_type:
+            return "", []
+        clause = (
+            "(p.has_project_types = 0 OR EXISTS (SELECT 1 FROM pattern_terms t "
+            "WHERE t.pattern_id = p.pattern_id AND t.kind = 'project_type' AND t.term = ?))"
+        )
+        return clause, [project_type.lower()]
+
+    def list_patterns(
+        self,
+        pattern_type: str | None = None,
+        min_success_rate: float | None = None,
+        project_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List patterns with optional filtering, in insertion order."""
+        clauses, params = [], []
+        if pattern_type:
+            clauses.append("p.pattern_type = ?")
+            params.append(pattern_type)
+        if min_success_rate is not None:
+            clauses.append("p.success_rate >= ?")
+            params.append(min_success_rate)
+        clause, clause_params = self._project_type_clause(project_type)
+        if clause:
+            clauses.append(clause)
+            params.extend(clause_params)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [
+            json.loads(data)
+            for (data,) in self._query(
+                f"SELECT p.data FROM patterns p{where} ORDER BY p.rowid", params
+            )
+        ]
+
+    def get_top_patterns(
+        self,
+        limit: int = 10,
+        min_confidence: str = "medium",
+    ) -> list[dict[str, Any]]:
+        """Get top patterns by success rate and confidence, using the rank index."""
+        min_conf_value = CONFIDENCE_ORDER.get(min_confidence.lower(), 1)
+        if limit <= 0:
+            return []
+        return [
+            json.loads(data)
+            for (data,) in self._query(
+                "SELECT data FROM patterns WHERE confidence_rank >= ? "
+                "ORDER BY success_rate DESC, occurrence_count DESC, rowid LIMIT ?",
+                (min_conf_value, limit),
+            )
+        ]
+
+    def get_patterns_for_context(
+        self,
+        context_keywords: list[str],
+        project_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get patterns matching a project context, with relevance scores.
+
+        Keyword matches are counted in SQL against the indexed pattern terms;
+        only patterns with positive relevance are decoded.
+        """
+        keywords = [keyword.lower() for keyword in context_keywords]
+        params: list[Any] = []
+        if keywords:
+            ctx = "WITH ctx(term) AS (VALUES " + ", ".join("(?)" for _ in keywords) + ") "
+            params.extend(keywords)
+            match_count = (
+                "(SELECT COUNT(*) FROM ctx JOIN pattern_terms t ON t.term = ctx.term "
+                "WHERE t.pattern_id = p.pattern_id AND t.kind = '{kind}')"
+            )
+            rec_sql = match_count.format(kind="recommended_for")
+            avoid_sql = match_count.format(kind="avoid_for")
+        else:
+            ctx, rec_sql, avoid_sql = "", "0", "0"
+
+        clause, clause_params = self._project_type_clause(project_type)
+        params.extend(clause_params)
+        where = f" WHERE {clause}" if clause else ""
+
+        scored_patterns: list[tuple[float, dict[str, Any]]] = []
+        for data, success_rate, rec_matches, avoid_matches in self._query(
+            f"{ctx}SELECT p.data, p.success_rate, {rec_sql}, {avoid_sql} "
+            f"FROM patterns p{where} ORDER BY p.rowid",
+            params,
+        ):
+            # Same accumulation order as LearningDatabase so scores match exactly
+            score = 0.0
+            for _ in range(rec_matches):
+                score += 0.3
+            for _ in range(avoid_matches):
+                score -= 0.4
+            score += success_rate * 0.4
+
+            if score > 0:
+                pattern = json.loads(data)
+                pattern["relevance_score"] = round(score, 3)
+                scored_patterns.append((score, pattern))
+
+        scored_patterns.sort(key=lambda x: x[0], reverse=True)
+        return [p for _, p in scored_patterns]
+
+    def update_pattern_metrics(
+        self,
+        pattern_id: str,
+        new_occurrence: bool = False,
+        was_successful: bool = True,
+    ) -> bool:
+        """Update pattern metrics based on new usage."""
+        missing = False
+
+        def write(tx: sqlite3.Connection) -> None:
+            nonlocal missing
+            row = tx.execute(
+                "SELECT data FROM patterns WHERE pattern_id = ?", (pattern_id,)
+            ).fetchone()
+            if row is None:
+                missing = True
+                return
+            if new_occurrence:
+                pattern = json.loads(row[0])
+                self._apply_pattern_occurrence(pattern_id, pattern, was_successful)
+                self._upsert_pattern(tx, pattern)
+
+        ok = self._write("update pattern metrics", write)
+        if missing:
+            logger.warning("Pattern not found for metrics update: %s", pattern_id)
+            return False
+        return ok
+
+    def store_project_history(
+        self,
+        project_id: str,
+        project_data: dict[str, Any],
+    ) -> bool:
+        """Store project data for historical analysis, replacing any earlier entry."""
+        if not project_id:
+            logger.warning("Cannot store project: empty project_id")
+            return False
+
+        timestamp = datetime.now().isoformat()
+        project_record = {
+            "project_id": project_id,
+            "recorded_at": timestamp,
+            "timestamp": timestamp,
+            **project_data,
+        }
+
+        if not self._write(
+            "store project history", lambda tx: self._insert_project(tx, project_record)
+        ):
+            return False
+
+        logger.info(
+            "Stored project history: %s (type=%s, outcome=%s)",
+            project_id,
+            project_data.get("project_type", "unknown"),
+            project_data.get("outcome", "unknown"),
+        )
+        return True
+
+    @staticmethod
+    def _insert_project(tx: sqlite3.Connection, project_record: dict[str, Any]) -> None:
+        # Delete then insert so a re-stored project moves to the end, as in the JSON list
+        tx.execute(
+            "DELETE FROM project_history WHERE project_id = ?", (project_record["project_id"],)
+        )
+        tx.execute(
+            "INSERT INTO project_history (project_id, project_type, outcome, timestamp, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                project_record["project_id"],
+                project_record.get("project_type"),
+                project_record.get("outcome"),
+                str(project_record.get("timestamp", "")),
+                _dumps(project_record),
+            ),
+        )
+
+    def get_project_history(
+        self,
+        project_type: str | None = None,
+        outcome: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get project history with optional filtering, most recent first."""
+        clauses, params = [], []
+        if project_type:
+            clauses.append("project_type = ?")
+            params.append(project_type)
+        if outcome:
+            clauses.append("outcome = ?")
+            params.append(outcome)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT data FROM project_history{where} ORDER BY timestamp DESC, rowid"
+        if limit is not None and limit > 0:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(data) for (data,) in self._query(sql, params)]
+
+    def get_cross_project_insights(self) -> dict[str, Any]:
+        """Get cross-project learning insights."""
+        pattern_coverage = {
+            pattern_type if pattern_type is not None else "unknown": count
+            for pattern_type, count in self._query(
+                "SELECT pattern_type, COUNT(*) FROM patterns "
+                "GROUP BY pattern_type ORDER BY MIN(rowid)"
+            )
+        }
+        by_outcome: Counter[str] = Counter()
+        by_type: Counter[str] = Counter()
+        for project_type, outcome, count in self._query(
+            "SELECT project_type, outcome, COUNT(*) FROM project_history "
+            "GROUP BY project_type, outcome"
+        ):
+            by_outcome[outcome if outcome is not None else "unknown"] += count
+            by_type[project_type if project_type is not None else "unknown"] += count
+
+        top_patterns = self.get_top_patterns(limit=5, min_confidence="medium")
+        recommended = [
+            {
+                "approach": pattern.get("name", "Unknown"),
+                "type": pattern.get("pattern_type", "unknown"),
+                "success_rate": pattern.get("success_rate", 0),
+                "basis": f"Based on {pattern.get('occurrence_count', 0)} occurrences",
+            }
+            for pattern in top_patterns
+            if pattern.get("success_rate", 0) >= 0.7
+        ]
+
+        return {
+            "total_patterns": self._count("patterns"),
+            "top_patterns": top_patterns,
+            "pattern_coverage": pattern_coverage,
+            "project_history_summary": {
+                "total_projects": self._count("project_history"),
+                "by_outcome": dict(by_outcome),
+                "by_type": dict(by_type),
+            },
+            "recommended_approaches": recommended,
+        }
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def import_json(self, json_path: Path | str) -> dict[str, int]:
+        """Import a JSON learning database in a single transaction.
+
+        Records already present with the same ID are overwritten; blocking
+        reason and category counters are replaced by the JSON values.
+
+        Args:
+            json_path: Path to the JSON file written by LearningDatabase.
+
+        Returns:
+            Number of records imported per section.
+        """
+        json_path = Path(json_path)
+        legacy = LearningDatabase(json_path).export_data()
+        patterns = legacy.get("patterns", {})
+        counts = {
+            "improvements": len(legacy.get("improvements", {})),
+            "cycles": len(legacy.get("cycles", {})),
+            "patterns": len(legacy.get("successful_patterns", {})),
+            "projects": len(legacy.get("project_history", [])),
+        }
+
+        with self._transaction() as tx:
+            for imp_id, imp in legacy.get("improvements", {}).items():
+                self._upsert_improvement(tx, {"imp_id": imp_id, **imp})
+            for cycle_id, cycle in legacy.get("cycles", {}).items():
+                self._upsert_cycle(tx, {"cycle_id": cycle_id, **cycle})
+            for reason, data in patterns.get("blocking_reasons", {}).items():
+                tx.execute(
+                    "INSERT OR REPLACE INTO blocking_reasons (reason, count, cycles) "
+                    "VALUES (?, ?, ?)",
+                    (reason, data.get("count", 0), _dumps(data.get("cycles", []))),
+                )
+            for category, stats in patterns.get("category_success_rates", {}).items():
+                tx.execute(
+                    "INSERT OR REPLACE INTO category_success_rates "
+                    "(category, total, implemented, blocked, abandoned) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        category,
+                        stats.get("total", 0),
+                        stats.get("implemented", 0),
+                        stats.get("blocked", 0),
+                        stats.get("abandoned", 0),
+                    ),
+                )
+            for pattern_id, pattern in legacy.get("successful_patterns", {}).items():
+                self._upsert_pattern(tx, {"pattern_id": pattern_id, **pattern})
+            for project in legacy.get("project_history", []):
+                if project.get("project_id"):
+                    self._insert_project(tx, project)
+
+            meta = {
+                "phase_correlations": _dumps(patterns.get("phase_correlations", {})),
+                "migrated_from": str(json_path),
+                "migrated_at": datetime.now().isoformat(),
+            }
+            if legacy.get("created_at"):
+                meta["created_at"] = str(legacy["created_at"])
+            tx.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+
+        logger.info(
+            "[IMP-PERF-016] Migrated learning database %s -> %s (%s)",
+            json_path,
+            self.db_path,
+            ", ".join(f"{k}={v}" for k, v in counts.items()),
+        )
+        return counts
+
+
+def migrate_json_learning_db(
+    json_path: Path | str,
+    sqlite_path: Path | str | None = None,
+) -> SqliteLearningDatabase:
+    """One-shot migration of a JSON learning database to SQLite.
+
+    Args:
+        json_path: Existing JSON learning database.
+        sqlite_path: Target SQLite file (defaults to json_path with a .sqlite3 suffix).
+
+    Returns:
+        The opened SqliteLearningDatabase containing the imported data.
+
+    Raises:
+        FileNotFoundError: If json_path does not exist.
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        raise FileNotFoundError(f"Learning database not found: {json_path}")
+    db = SqliteLearningDatabase(sqlite_path or json_path.with_suffix(".sqlite3"))
+    db.import_json(json_path)
+    return db
+
+
+def open_learning_database(db_path: Path | str) -> SqliteLearningDatabase:
+    """Open the SQLite learning database for a path, migrating legacy JSON once.
+
+    A path ending in .db/.sqlite/.sqlite3 is opened directly. Any other path is
+    treated as a legacy JSON database: its SQLite sibling (same name, .sqlite3
+    suffix) is opened and, while still empty, populated from the JSON file.
+
+    Args:
+        db_path: SQLite path or legacy JSON path.
+
+    Returns:
+        The opened SqliteLearningDatabase.
+    """
+    db_path = Path(db_path)
+    if db_path.suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteLearningDatabase(db_path)
+    return SqliteLearningDatabase(db_path.with_suffix(".sqlite3"), legacy_json_path=db_path)
@@ -14,17 +14,19 @@ Payload schema:
 - type: summary | error | hint | code
 """
 
+import contextvars
 import hashlib
 import logging
 import os
 import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
@@ -32,12 +34,20 @@ from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
 # IMP-MEM-005: Import retrieval quality tracker for metrics collection
 from ..telemetry.meta_metrics import RetrievalQualityTracker
 
+# IMP-PERF-014: Batched embedding pipeline for bulk indexing
+from .bulk_indexer import BulkIndexer, BulkIndexStats
+
 # IMP-LOOP-034: Import confidence manager for decay lifecycle
 from .confidence_manager import ConfidenceManager
 
 # IMP-MAINT-003: Import extracted helper modules
 from .deduplication import ContentDeduplicator
-from .embeddings import EMBEDDING_SIZE, MAX_EMBEDDING_CHARS, sync_embed_text
+from .embeddings import (
+    EMBEDDING_SIZE,
+    MAX_EMBEDDING_CHARS,
+    sync_embed_text,
+    sync_embed_texts_cached,
+)
 from .faiss_store import FaissStore
 
 # IMP-MAINT-005: Import extracted freshness and vector store modules
@@ -64,6 +74,7 @@ from .freshness_filter import (
     is_fresh,
     parse_timestamp,
 )
+from .goal_drift import cosine_similarity
 from .insight_retrieval import InsightRetriever
 from .memory_patterns import ProjectNamespaceError  # noqa: F401 - Re-exported for public API
 from .memory_patterns import (
@@ -71,6 +82,7 @@ from .memory_patterns import (
     SafeOperationExecutor,
 )
 from .qdrant_store import QDRANT_AVAILABLE, QdrantStore
+from .sot_indexing import SotIndexManifest
 from .vector_store_ops import VectorStoreOperations
 
 logger = logging.getLogger(__name__)
@@ -225,6 +237,32 @@ class MemoryQualityReport:
     collection_stats: Dict[str, Dict[str, Any]] = dataclass_field(default_factory=dict)
 
 
+# ---------------------------------------------------------------------------
+# IMP-PERF-012: Multi-collection retrieval
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MultiCollectionRetrieval:
+    """Result of a multi-collection context retrieval.
+
+    IMP-PERF-012: The query is embedded once and every collection search runs
+    concurrently against that vector; timings are recorded per collection.
+
+    Attributes:
+        results: Per-collection results keyed like retrieve_context() (or
+            ContextMetadata lists for retrieve_context_with_metadata_multi())
+        timings_ms: Wall-clock milliseconds spent on each collection searched
+        embed_ms: Milliseconds spent embedding the query (0.0 if not needed)
+        total_ms: Milliseconds for the whole retrieval
+    """
+
+    results: Dict[str, List[Any]]
+    timings_ms: Dict[str, float] = dataclass_field(default_factory=dict)
+    embed_ms: float = 0.0
+    total_ms: float = 0.0
+
+
 # ---------------------------------------------------------------------------
 # IMP-LOOP-002: Telemetry Feedback Validation
 # ---------------------------------------------------------------------------
@@ -710,6 +748,15 @@ class MemoryService:
     max_embed_chars: int
     planning_collection: str
 
+    # IMP-PERF-012: Upper bound on concurrent collection searches per retrieval
+    RETRIEVAL_MAX_WORKERS = 8
+
+    # IMP-PERF-014: Embedding batches in flight during bulk indexing
+    BULK_EMBED_CONCURRENCY = 4
+
+    # IMP-PERF-015: Max stored chunks scanned when reconciling an SOT file
+    SOT_RECONCILE_SCROLL_LIMIT = 10000
+
     def __init__(
         self,
         index_dir: Optional[str] = None,
@@ -1021,13 +1068,74 @@ class MemoryService:
         # IMP-MEM-015: Validate project namespace isolation
         _validate_project_id(project_id, "index_file")
 
+        point_id, text, payload = self._code_point(path, content, project_id, run_id)
+
+        # Generate embedding
+        vector = sync_embed_text(text)
+
+        self._safe_store_call(
+            "index_file/upsert",
+            lambda: self.store.upsert(
+                COLLECTION_CODE_DOCS,
+                [{"id": point_id, "vector": vector, "payload": payload}],
+            ),
+            0,
+        )
+        logger.debug(f"[MemoryService] Indexed file: {path}")
+        return point_id
+
+    def index_files(
+        self,
+        files: Dict[str, str],
+        project_id: str,
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Index many workspace files through the batched embedding pipeline.
+
+        IMP-PERF-014: Equivalent to calling index_file for each file, but chunks
+        are embedded in provider-sized batches and upserted in bulk.
+
+        Args:
+            files: Mapping of relative file path to content
+            project_id: Project identifier
+            run_id: Optional run identifier
+
+        Returns:
+            Dict with "indexed" count and "throughput" stats
+
+        Raises:
+            ProjectNamespaceError: If project_id is empty or None (IMP-MEM-015)
+        """
+        if not self.enabled:
+            return {"indexed": 0, "throughput": BulkIndexStats().to_dict()}
+
+        # IMP-MEM-015: Validate project namespace isolation
+        _validate_project_id(project_id, "index_files")
+
+        indexer = BulkIndexer(
+            self.store,
+            COLLECTION_CODE_DOCS,
+            max_concurrent_batches=self.BULK_EMBED_CONCURRENCY,
+        )
+        with indexer:
+            for path, content in files.items():
+                indexer.add(*self._code_point(path, content, project_id, run_id))
+
+        return {"indexed": indexer.stats.upserted, "throughput": indexer.stats.to_dict()}
+
+    def _code_point(
+        self,
+        path: str,
+        content: str,
+        project_id: str,
+        run_id: Optional[str],
+    ) -> tuple:
+        """Build (point_id, embed_text, payload) for a workspace file."""
         # Truncate content for embedding
         content_truncated = content[: self.max_embed_chars]
         content_hash = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()[:16]
 
-        # Generate embedding
-        vector = sync_embed_text(f"File: {path}\n\n{content_truncated}")
-
         point_id = f"code:{project_id}:{path}:{content_hash}"
         payload = {
             "type": "code",
@@ -1038,17 +1146,7 @@ class MemoryService:
             "content_preview": content_truncated[:500],
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-
-        self._safe_store_call(
-            "index_file/upsert",
-            lambda: self.store.upsert(
-                COLLECTION_CODE_DOCS,
-                [{"id": point_id, "vector": vector, "payload": payload}],
-            ),
-            0,
-        )
-        logger.debug(f"[MemoryService] Indexed file: {path}")
-        return point_id
+        return point_id, f"File: {path}\n\n{content_truncated}", payload
 
     def search_code(
         self,
@@ -1056,6 +1154,7 @@ class MemoryService:
         project_id: str,
         limit: Optional[int] = None,
         max_age_hours: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search code_docs collection.
@@ -1066,6 +1165,8 @@ class MemoryService:
             limit: Max results (default: top_k from config)
             max_age_hours: Optional maximum age in hours for freshness filtering.
                           IMP-MEM-010: When provided, filters out stale results.
+            query_vector: Precomputed embedding of ``query`` (IMP-PERF-012); embedded
+                          here when omitted.
 
         Returns:
             List of {"id", "score", "payload"} dicts
@@ -1082,7 +1183,8 @@ class MemoryService:
         limit = limit or self.top_k
         # IMP-MEM-010: Over-fetch when filtering to ensure enough fresh results
         fetch_limit = limit * 2 if max_age_hours is not None else limit
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         results = self._safe_store_call(
             "search_code/search",
             lambda: self.store.search(
@@ -1145,11 +1247,34 @@ class MemoryService:
         # IMP-MEM-015: Validate project namespace isolation
         _validate_project_id(project_id, "write_phase_summary")
 
+        text, point = self._phase_summary_point(
+            run_id, phase_id, project_id, summary, changes, ci_result, task_type
+        )
+        point["vector"] = sync_embed_text(text)
+
+        self._safe_store_call(
+            "write_phase_summary/upsert",
+            lambda: self.store.upsert(COLLECTION_RUN_SUMMARIES, [point]),
+            0,
+        )
+        logger.info(f"[MemoryService] Wrote phase summary: {phase_id}")
+        return point["id"]
+
+    def _phase_summary_point(
+        self,
+        run_id: str,
+        phase_id: str,
+        project_id: str,
+        summary: str,
+        changes: List[str],
+        ci_result: Optional[str] = None,
+        task_type: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the embedding text and point (without vector) for a phase summary."""
         # IMP-MEM-012: Compress summary if too long
         compressed_summary, was_compressed = _compress_content(summary)
 
         text = f"Phase {phase_id}: {compressed_summary}\nChanges: {', '.join(changes)}\nCI: {ci_result or 'N/A'}"
-        vector = sync_embed_text(text)
 
         point_id = f"summary:{run_id}:{phase_id}"
         payload = {
@@ -1164,17 +1289,7 @@ class MemoryService:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "compressed": was_compressed,  # IMP-MEM-012: Track compression status
         }
-
-        self._safe_store_call(
-            "write_phase_summary/upsert",
-            lambda: self.store.upsert(
-                COLLECTION_RUN_SUMMARIES,
-                [{"id": point_id, "vector": vector, "payload": payload}],
-            ),
-            0,
-        )
-        logger.info(f"[MemoryService] Wrote phase summary: {phase_id}")
-        return point_id
+        return text, {"id": point_id, "payload": payload}
 
     def search_summaries(
         self,
@@ -1183,6 +1298,7 @@ class MemoryService:
         run_id: Optional[str] = None,
         limit: Optional[int] = None,
         max_age_hours: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Search run_summaries collection.
 
@@ -1193,6 +1309,8 @@ class MemoryService:
             limit: Max results (default: top_k from config)
             max_age_hours: Optional maximum age in hours for freshness filtering.
                           IMP-MEM-010: When provided, filters out stale results.
+            query_vector: Precomputed embedding of ``query`` (IMP-PERF-012); embedded
+                          here when omitted.
 
         Returns:
             List of {"id", "score", "payload"} dicts
@@ -1209,7 +1327,8 @@ class MemoryService:
         limit = limit or self.top_k
         # IMP-MEM-010: Over-fetch when filtering to ensure enough fresh results
         fetch_limit = limit * 2 if max_age_hours is not None else limit
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         filter_dict = {"project_id": project_id}
         if run_id:
             filter_dict["run_id"] = run_id
@@ -1273,13 +1392,35 @@ class MemoryService:
         # IMP-MEM-015: Validate project namespace isolation
         _validate_project_id(project_id, "write_error")
 
+        text, point = self._error_point(
+            run_id, phase_id, project_id, error_text, error_type, test_name
+        )
+        point["vector"] = sync_embed_text(text)
+
+        self._safe_store_call(
+            "write_error/upsert",
+            lambda: self.store.upsert(COLLECTION_ERRORS_CI, [point]),
+            0,
+        )
+        logger.info(f"[MemoryService] Wrote error: {error_type} in {phase_id}")
+        return point["id"]
+
+    def _error_point(
+        self,
+        run_id: str,
+        phase_id: str,
+        project_id: str,
+        error_text: str,
+        error_type: Optional[str] = None,
+        test_name: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the embedding text and point (without vector) for an error."""
         # IMP-MEM-012: Compress error text if too long
         compressed_error, was_compressed = _compress_content(error_text)
 
         text = f"Error in {phase_id}: {compressed_error[:2000]}"
         if test_name:
             text = f"Test {test_name} failed: {compressed_error[:2000]}"
-        vector = sync_embed_text(text)
 
         point_id = (
             f"error:{run_id}:{phase_id}:{hashlib.sha256(error_text.encode()).hexdigest()[:8]}"
@@ -1295,17 +1436,7 @@ class MemoryService:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "compressed": was_compressed,  # IMP-MEM-012: Track compression status
         }
-
-        self._safe_store_call(
-            "write_error/upsert",
-            lambda: self.store.upsert(
-                COLLECTION_ERRORS_CI,
-                [{"id": point_id, "vector": vector, "payload": payload}],
-            ),
-            0,
-        )
-        logger.info(f"[MemoryService] Wrote error: {error_type} in {phase_id}")
-        return point_id
+        return text, {"id": point_id, "payload": payload}
 
     def search_errors(
         self,
@@ -1313,6 +1444,7 @@ class MemoryService:
         project_id: str,
         limit: Optional[int] = None,
         max_age_hours: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Search errors_ci collection for similar errors.
 
@@ -1322,6 +1454,8 @@ class MemoryService:
             limit: Max results (default: top_k from config)
             max_age_hours: Optional maximum age in hours for freshness filtering.
                           IMP-MEM-010: When provided, filters out stale results.
+            query_vector: Precomputed embedding of ``query`` (IMP-PERF-012); embedded
+                          here when omitted.
 
         Returns:
             List of {"id", "score", "payload"} dicts
@@ -1338,7 +1472,8 @@ class MemoryService:
         limit = limit or self.top_k
         # IMP-MEM-010: Over-fetch when filtering to ensure enough fresh results
         fetch_limit = limit * 2 if max_age_hours is not None else limit
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         results = self._safe_store_call(
             "search_errors/search",
             lambda: self.store.search(
@@ -1399,8 +1534,28 @@ class MemoryService:
         # IMP-MEM-015: Validate project namespace isolation
         _validate_project_id(project_id, "write_doctor_hint")
 
+        text, point = self._doctor_hint_point(run_id, phase_id, project_id, hint, action, outcome)
+        point["vector"] = sync_embed_text(text)
+
+        self._safe_store_call(
+            "write_doctor_hint/upsert",
+            lambda: self.store.upsert(COLLECTION_DOCTOR_HINTS, [point]),
+            0,
+        )
+        logger.info(f"[MemoryService] Wrote doctor hint: {action} in {phase_id}")
+        return point["id"]
+
+    def _doctor_hint_point(
+        self,
+        run_id: str,
+        phase_id: str,
+        project_id: str,
+        hint: str,
+        action: Optional[str] = None,
+        outcome: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the embedding text and point (without vector) for a doctor hint."""
         text = f"Doctor hint for {phase_id}: {hint}\nAction: {action or 'N/A'}\nOutcome: {outcome or 'pending'}"
-        vector = sync_embed_text(text)
 
         point_id = f"hint:{run_id}:{phase_id}:{hashlib.sha256(hint.encode()).hexdigest()[:8]}"
         payload = {
@@ -1413,17 +1568,7 @@ class MemoryService:
             "outcome": outcome,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-
-        self._safe_store_call(
-            "write_doctor_hint/upsert",
-            lambda: self.store.upsert(
-                COLLECTION_DOCTOR_HINTS,
-                [{"id": point_id, "vector": vector, "payload": payload}],
-            ),
-            0,
-        )
-        logger.info(f"[MemoryService] Wrote doctor hint: {action} in {phase_id}")
-        return point_id
+        return text, {"id": point_id, "payload": payload}
 
     def write_telemetry_insight(
         self,
@@ -1462,14 +1607,7 @@ class MemoryService:
 
         # IMP-LOOP-002: Validate telemetry insight before storage
         if validate:
-            is_valid, errors = TelemetryFeedbackValidator.validate_insight(insight, strict=strict)
-            if not is_valid:
-                logger.warning(
-                    f"[IMP-LOOP-002] Telemetry insight validation failed: {errors}. "
-                    f"Sanitizing and proceeding."
-                )
-                # Sanitize the insight to make it storable
-                insight = TelemetryFeedbackValidator.sanitize_insight(insight)
+            insight = self._validated_insight(insight, strict)
 
         insight_type = insight.get("insight_type", "unknown")
         description = insight.get("description", "")
@@ -1559,6 +1697,248 @@ class MemoryService:
                 task_type="telemetry_insight",
             )
 
+    def _validated_insight(self, insight: Dict[str, Any], strict: bool) -> Dict[str, Any]:
+        """Validate an insight, returning a sanitized copy if it is invalid.
+
+        IMP-LOOP-002: Raises TelemetryFeedbackValidationError when strict.
+        """
+        is_valid, errors = TelemetryFeedbackValidator.validate_insight(insight, strict=strict)
+        if not is_valid:
+            logger.warning(
+                f"[IMP-LOOP-002] Telemetry insight validation failed: {errors}. "
+                f"Sanitizing and proceeding."
+            )
+            # Sanitize the insight to make it storable
+            insight = TelemetryFeedbackValidator.sanitize_insight(insight)
+        return insight
+
+    def _telemetry_insight_point(
+        self, insight: Dict[str, Any], project_id: str
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Build (collection, embedding text, point) for a non-rule telemetry insight.
+
+        Mirrors the routing of write_telemetry_insight so batched writes store
+        exactly what the per-insight writers would.
+        """
+        insight_type = insight.get("insight_type", "unknown")
+        description = insight.get("description", "")
+        phase_id = insight.get("phase_id", "unknown")
+        run_id = insight.get("run_id", "telemetry")
+        suggested_action = insight.get("suggested_action")
+
+        if insight_type == "failure_mode":
+            text, point = self._error_point(
+                run_id=run_id,
+                phase_id=phase_id,
+                project_id=project_id,
+                error_text=f"Recurring failure: {suggested_action or description}",
+                error_type=description,
+                test_name=None,
+            )
+            return COLLECTION_ERRORS_CI, text, point
+        if insight_type == "retry_cause":
+            text, point = self._doctor_hint_point(
+                run_id=run_id,
+                phase_id=phase_id,
+                project_id=project_id,
+                hint=suggested_action or description,
+                action="telemetry_insight",
+                outcome="pending",
+            )
+            return COLLECTION_DOCTOR_HINTS, text, point
+
+        if insight_type == "cost_sink":
+            summary = f"Cost sink detected: {description}"
+        else:
+            summary = f"Telemetry insight: {description}"
+        text, point = self._phase_summary_point(
+            run_id=run_id,
+            phase_id=phase_id,
+            project_id=project_id,
+            summary=summary,
+            changes=[],
+            ci_result=None,
+            task_type="telemetry_insight",
+        )
+        return COLLECTION_RUN_SUMMARIES, text, point
+
+    def write_telemetry_insights_batch(
+        self,
+        insights: List[Dict[str, Any]],
+        project_id: Optional[str] = None,
+        validate: bool = True,
+        strict: bool = False,
+    ) -> List[str]:
+        """Write many telemetry insights with batched deduplication and storage.
+
+        IMP-PERF-026: Batch form of write_telemetry_insight. Instead of one
+        embed + search + upsert per insight:
+        - near-duplicate lookup embeds all insights in one call and searches
+          each collection once (ContentDeduplicator.find_similar_insights_batch)
+        - insights matching the same stored insight are merged with one update
+        - insights that are near-duplicates of each other within the batch are
+          folded together in memory
+        - the remaining points are embedded together and upserted with one
+          call per collection
+        Rules keep the per-insight lifecycle path.
+
+        Args:
+            insights: TelemetryInsight dicts to persist
+            project_id: Optional project ID for namespacing
+            validate: If True, validate insights before storage (default: True)
+            strict: If True with validate=True, raise exception on validation failure
+
+        Returns:
+            Document IDs aligned with insights: the stored point ID, the ID of
+            the insight it was merged into, or empty string for duplicates.
+
+        Raises:
+            TelemetryFeedbackValidationError: If strict=True and validation fails
+            Exception: If embedding or upserting fails; content hashes of the
+                insights that were not stored are released first, so a retry
+                writes them instead of skipping them as duplicates
+        """
+        ids = [""] * len(insights)
+        if not self.enabled or not insights:
+            return ids
+
+        project_id = project_id or "default"
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        pending_hashes: List[str] = []
+        duplicates = 0
+        for i, insight in enumerate(insights):
+            if validate:
+                insight = self._validated_insight(insight, strict)
+
+            insight_type = insight.get("insight_type", "unknown")
+            if insight.get("is_rule", False) or insight_type in (
+                "promoted_rule",
+                "effectiveness_rule",
+            ):
+                # IMP-REL-002: Rules use lifecycle tracking, written individually
+                ids[i] = self.write_telemetry_insight(insight, project_id, validate=False)
+                continue
+
+            # IMP-AUTO-003: Content-hash deduplication (also catches repeats within the batch)
+            content = insight.get("content", insight.get("description", ""))
+            content_hash = self._deduplicator.compute_content_hash(insight_type, content)
+            if not self._deduplicator.check_and_track_hash(content_hash):
+                duplicates += 1
+                continue
+            pending.append((i, insight))
+            pending_hashes.append(content_hash)
+
+        if not pending:
+            return ids
+
+        # Positions in pending whose insight is not stored yet; if the batch fails,
+        # their hashes are released so a retry does not skip them as duplicates
+        unstored = set(range(len(pending)))
+        try:
+            # IMP-MEM-006: One embed call and one search per collection for all insights
+            similar, search_vectors = self._deduplicator.find_similar_insights_batch(
+                [insight for _, insight in pending],
+                enabled=self.enabled,
+                store=self.store,
+                safe_store_call=self._safe_store_call,
+                collection_errors_ci=COLLECTION_ERRORS_CI,
+                collection_doctor_hints=COLLECTION_DOCTOR_HINTS,
+                collection_run_summaries=COLLECTION_RUN_SUMMARIES,
+                threshold=0.9,
+            )
+
+            # Merge into stored insights, one update per stored insight
+            merge_groups: Dict[Tuple[str, str], List[int]] = {}
+            to_store: List[int] = []
+            for pos, hits in enumerate(similar):
+                if hits:
+                    merge_groups.setdefault((hits[0]["collection"], hits[0]["id"]), []).append(
+                        pos
+                    )
+                else:
+                    to_store.append(pos)
+            merged = 0
+            for positions in merge_groups.values():
+                merged_id = self._deduplicator.merge_insight_group(
+                    similar[positions[0]][0],
+                    [pending[pos][1] for pos in positions],
+                    enabled=self.enabled,
+                    store=self.store,
+                    safe_store_call=self._safe_store_call,
+                    collection_run_summaries=COLLECTION_RUN_SUMMARIES,
+                )
+                if merged_id:
+                    for pos in positions:
+                        ids[pending[pos][0]] = merged_id
+                    merged += len(positions)
+                    unstored.difference_update(positions)
+                else:
+                    # If merge failed, fall through to normal storage
+                    to_store.extend(positions)
+            to_store.sort()
+
+            built = [
+                (pos, *self._telemetry_insight_point(pending[pos][1], project_id))
+                for pos in to_store
+            ]
+            vectors = sync_embed_texts_cached([text for _, _, text, _ in built])
+
+            # Fold near-duplicates within the batch the way sequential writes would
+            # have merged a later insight into an earlier one just stored
+            points_by_collection: Dict[str, List[Dict[str, Any]]] = {}
+            positions_by_collection: Dict[str, List[int]] = {}
+            folded = 0
+            for (pos, collection, _, point), vector in zip(built, vectors):
+                point["vector"] = vector
+                index, insight = pending[pos]
+                positions_by_collection.setdefault(collection, []).append(pos)
+                target = self._most_similar_pending_insight(
+                    search_vectors[pos], points_by_collection.get(collection, []), threshold=0.9
+                )
+                if target is not None:
+                    target["payload"].update(
+                        self._deduplicator.merged_payload_fields(target["payload"], [insight])
+                    )
+                    ids[index] = target["id"]
+                    folded += 1
+                    continue
+                points_by_collection.setdefault(collection, []).append(point)
+                ids[index] = point["id"]
+
+            # Upsert failures propagate so the caller can retry or queue the batch
+            for collection, points in points_by_collection.items():
+                self.store.upsert(collection, points)
+                unstored.difference_update(positions_by_collection[collection])
+        except Exception:
+            self._deduplicator.untrack_hashes([pending_hashes[pos] for pos in unstored])
+            raise
+
+        stored = sum(len(points) for points in points_by_collection.values())
+        logger.info(
+            f"[IMP-PERF-026] Wrote {len(insights)} telemetry insights in batch: "
+            f"{stored} stored, {merged} merged, {folded} folded, {duplicates} duplicates"
+        )
+        return ids
+
+    @staticmethod
+    def _most_similar_pending_insight(
+        search_vector: Optional[List[float]],
+        points: List[Dict[str, Any]],
+        threshold: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the not-yet-stored insight point a search would match, if any."""
+        if search_vector is None:
+            return None
+        best, best_score = None, threshold
+        for point in points:
+            # Same filter as the store search in find_similar_insights
+            if point["payload"].get("task_type") != "telemetry_insight":
+                continue
+            score = cosine_similarity(search_vector, point["vector"])
+            if score >= best_score:
+                best, best_score = point, score
+        return best
+
     # -------------------------------------------------------------------------
     # IMP-MEM-006/IMP-MAINT-003: Content-based deduplication for insights
     # Delegated to ContentDeduplicator module
@@ -1837,6 +2217,7 @@ class MemoryService:
         project_id: str,
         limit: Optional[int] = None,
         max_age_hours: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Search doctor_hints collection for similar situations.
 
@@ -1846,6 +2227,8 @@ class MemoryService:
             limit: Max results (default: top_k from config)
             max_age_hours: Optional maximum age in hours for freshness filtering.
                           IMP-MEM-010: When provided, filters out stale results.
+            query_vector: Precomputed embedding of ``query`` (IMP-PERF-012); embedded
+                          here when omitted.
 
         Returns:
             List of {"id", "score", "payload"} dicts
@@ -1862,7 +2245,8 @@ class MemoryService:
         limit = limit or self.top_k
         # IMP-MEM-010: Over-fetch when filtering to ensure enough fresh results
         fetch_limit = limit * 2 if max_age_hours is not None else limit
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         results = self._safe_store_call(
             "search_doctor_hints/search",
             lambda: self.store.search(
@@ -2084,7 +2468,9 @@ class MemoryService:
             docs_dir: Optional explicit docs directory path (defaults to workspace_root/docs)
 
         Returns:
-            Dict with indexing statistics: {"indexed": N, "skipped": bool}
+            Dict with indexing statistics: {"indexed": N, "skipped": bool, "throughput": {...}}.
+            IMP-PERF-015: Also "unchanged_files" (skipped via the manifest) and
+            "deleted" (vanished chunks removed from the store).
         """
         from ..config import settings
         from .sot_indexing import chunk_sot_file, chunk_sot_json
@@ -2113,140 +2499,149 @@ class MemoryService:
             "LEARNED_RULES.json": docs_dir / "LEARNED_RULES.json",
         }
 
-        indexed_count = 0
         max_chars = settings.autopack_sot_chunk_max_chars
         overlap_chars = settings.autopack_sot_chunk_overlap_chars
+        chunk_params = {"max_chars": max_chars, "overlap_chars": overlap_chars}
 
-        # Index markdown files
-        for sot_file, file_path in sot_markdown_files.items():
-            if not file_path.exists():
-                logger.debug(f"[MemoryService] SOT file not found: {sot_file}")
-                continue
-
-            # Chunk the file
-            chunk_docs = chunk_sot_file(
-                file_path,
-                project_id,
-                max_chars=max_chars,
-                overlap_chars=overlap_chars,
-            )
-
-            if not chunk_docs:
-                continue
-
-            # Create points with embeddings (skip existing chunks to avoid re-embedding)
-            points = []
-            skipped_existing = 0
-            for doc in chunk_docs:
-                try:
-                    # Check if point already exists
-                    existing = self._safe_store_call(
-                        f"index_sot_docs/{sot_file}/get_payload",
-                        lambda: self.store.get_payload(COLLECTION_SOT_DOCS, doc["id"]),
-                        None,
-                    )
-                    if existing:
-                        skipped_existing += 1
-                        continue
-
-                    # Embed and add to points
-                    vector = sync_embed_text(doc["content"])
-                    points.append(
-                        {
-                            "id": doc["id"],
-                            "vector": vector,
-                            "payload": doc["metadata"],
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"[MemoryService] Failed to embed SOT chunk: {e}")
+        # IMP-PERF-015: Manifest of indexed chunks so unchanged files are skipped
+        manifest = SotIndexManifest(
+            workspace_root / settings.autonomous_runs_dir / "sot_index" / f"{project_id}.json"
+        )
+        sot_files = [(name, path, chunk_sot_file) for name, path in sot_markdown_files.items()]
+        sot_files += [(name, path, chunk_sot_json) for name, path in sot_json_files.items()]
+        unchanged_files = 0
+        deleted = 0
+
+        # IMP-PERF-014: Stream every new chunk through one batched embed/upsert pipeline
+        indexer = BulkIndexer(
+            self.store,
+            COLLECTION_SOT_DOCS,
+            max_concurrent_batches=self.BULK_EMBED_CONCURRENCY,
+        )
+        with indexer:
+            for sot_file, file_path, chunker in sot_files:
+                if not file_path.exists():
+                    logger.debug(f"[MemoryService] SOT file not found: {sot_file}")
+                    deleted += self._delete_sot_chunks(sot_file, manifest.remove(sot_file))
                     continue
 
-            if skipped_existing > 0:
-                logger.debug(
-                    f"[MemoryService] Skipped {skipped_existing} existing chunks from {sot_file}"
-                )
+                if manifest.is_unchanged(
+                    sot_file, file_path, chunk_params
+                ) and self._sot_chunks_present(project_id, sot_file, manifest):
+                    unchanged_files += 1
+                    continue
 
-            # Upsert to store
-            if points:
-                self._safe_store_call(
-                    f"index_sot_docs/{sot_file}/upsert",
-                    lambda: self.store.upsert(COLLECTION_SOT_DOCS, points),
-                    0,
+                # Chunk the file (markdown with overlap, JSON field-selective)
+                chunk_docs = chunker(
+                    file_path,
+                    project_id,
+                    max_chars=max_chars,
+                    overlap_chars=overlap_chars,
                 )
-                indexed_count += len(points)
-                logger.info(f"[MemoryService] Indexed {len(points)} chunks from {sot_file}")
-
-        # Index JSON files with field-selective chunking
-        for sot_file, file_path in sot_json_files.items():
-            if not file_path.exists():
-                logger.debug(f"[MemoryService] SOT file not found: {sot_file}")
-                continue
+                changed_docs, vanished_ids = manifest.diff(sot_file, chunk_docs)
+                if not manifest.chunk_ids(sot_file):
+                    # No record yet: also drop stale chunks indexed before the manifest
+                    vanished_ids = self._untracked_sot_chunk_ids(project_id, sot_file, chunk_docs)
+                self._queue_sot_chunks(indexer, sot_file, changed_docs)
+                deleted += self._delete_sot_chunks(sot_file, vanished_ids)
+                manifest.update(sot_file, file_path, chunk_docs, chunk_params)
+
+        # Only trust the manifest if every queued chunk reached the store
+        if indexer.stats.failed == 0:
+            try:
+                manifest.save()
+            except OSError as e:
+                logger.warning(f"[MemoryService] Failed to save SOT index manifest: {e}")
 
-            # Chunk the JSON file
-            chunk_docs = chunk_sot_json(
-                file_path,
-                project_id,
-                max_chars=max_chars,
-                overlap_chars=overlap_chars,
-            )
+        return {
+            "indexed": indexer.stats.upserted,
+            "skipped": False,
+            "unchanged_files": unchanged_files,
+            "deleted": deleted,
+            "throughput": indexer.stats.to_dict(),
+        }
 
-            if not chunk_docs:
-                continue
+    def _sot_chunks_present(
+        self, project_id: str, sot_file: str, manifest: SotIndexManifest
+    ) -> bool:
+        """Check the store still holds as many chunks of a file as the manifest records.
 
-            # Create points with embeddings (skip existing chunks to avoid re-embedding)
-            points = []
-            skipped_existing = 0
-            for doc in chunk_docs:
-                try:
-                    # Check if point already exists
-                    existing = self._safe_store_call(
-                        f"index_sot_docs/{sot_file}/get_payload",
-                        lambda: self.store.get_payload(COLLECTION_SOT_DOCS, doc["id"]),
-                        None,
-                    )
-                    if existing:
-                        skipped_existing += 1
-                        continue
+        IMP-PERF-015: Guards against a manifest that outlived its vector store.
+        """
+        stored = self._safe_store_call(
+            f"index_sot_docs/{sot_file}/count",
+            lambda: self.store.count(
+                COLLECTION_SOT_DOCS, filter={"project_id": project_id, "sot_file": sot_file}
+            ),
+            -1,
+        )
+        return stored == len(manifest.chunk_ids(sot_file))
+
+    def _untracked_sot_chunk_ids(
+        self, project_id: str, sot_file: str, chunk_docs: List[Dict[str, Any]]
+    ) -> List[str]:
+        """IDs of stored chunks of a file that are not in its current chunking."""
+        current_ids = {doc["id"] for doc in chunk_docs}
+        stored = self._safe_store_call(
+            f"index_sot_docs/{sot_file}/scroll",
+            lambda: self.store.scroll(
+                COLLECTION_SOT_DOCS,
+                filter={"project_id": project_id, "sot_file": sot_file},
+                limit=self.SOT_RECONCILE_SCROLL_LIMIT,
+            ),
+            [],
+        )
+        return [point["id"] for point in stored if point["id"] not in current_ids]
 
-                    # Embed and add to points
-                    vector = sync_embed_text(doc["content"])
-                    points.append(
-                        {
-                            "id": doc["id"],
-                            "vector": vector,
-                            "payload": doc["metadata"],
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"[MemoryService] Failed to embed SOT JSON chunk: {e}")
-                    continue
+    def _delete_sot_chunks(self, sot_file: str, chunk_ids: List[str]) -> int:
+        """Delete vanished SOT chunks from the store."""
+        if not chunk_ids:
+            return 0
+        deleted = self._safe_store_call(
+            f"index_sot_docs/{sot_file}/delete",
+            lambda: self.store.delete(COLLECTION_SOT_DOCS, chunk_ids),
+            0,
+        )
+        logger.info(f"[MemoryService] Removed {len(chunk_ids)} vanished chunks from {sot_file}")
+        return deleted or 0
 
-            if skipped_existing > 0:
-                logger.debug(
-                    f"[MemoryService] Skipped {skipped_existing} existing JSON chunks from {sot_file}"
-                )
+    def _queue_sot_chunks(
+        self, indexer: BulkIndexer, sot_file: str, chunk_docs: List[Dict[str, Any]]
+    ) -> int:
+        """Queue SOT chunks that are not yet stored on the bulk indexer.
 
-            # Upsert to store
-            if points:
-                self._safe_store_call(
-                    f"index_sot_docs/{sot_file}/upsert",
-                    lambda: self.store.upsert(COLLECTION_SOT_DOCS, points),
-                    0,
-                )
-                indexed_count += len(points)
-                logger.info(f"[MemoryService] Indexed {len(points)} JSON chunks from {sot_file}")
+        Returns:
+            Number of chunks queued
+        """
+        queued = 0
+        skipped_existing = 0
+        for doc in chunk_docs:
+            # Skip existing chunks to avoid re-embedding
+            existing = self._safe_store_call(
+                f"index_sot_docs/{sot_file}/get_payload",
+                lambda: self.store.get_payload(COLLECTION_SOT_DOCS, doc["id"]),
+                None,
+            )
+            if existing:
+                skipped_existing += 1
+                continue
+            indexer.add(doc["id"], doc["content"], doc["metadata"])
+            queued += 1
 
-        return {
-            "indexed": indexed_count,
-            "skipped": False,
-        }
+        if skipped_existing > 0:
+            logger.debug(
+                f"[MemoryService] Skipped {skipped_existing} existing chunks from {sot_file}"
+            )
+        if queued:
+            logger.info(f"[MemoryService] Queued {queued} chunks from {sot_file} for indexing")
+        return queued
 
     def search_sot(
         self,
         query: str,
         project_id: str,
         limit: Optional[int] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search SOT docs collection.
@@ -2255,6 +2650,8 @@ class MemoryService:
             query: Search query
             project_id: Project to search within
             limit: Max results (default: top_k from config)
+            query_vector: Precomputed embedding of ``query`` (IMP-PERF-012); embedded
+                          here when omitted.
 
         Returns:
             List of {"id", "score", "payload"} dicts
@@ -2269,7 +2666,8 @@ class MemoryService:
         _validate_project_id(project_id, "search_sot")
 
         limit = limit or self.top_k
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         results = self._safe_store_call(
             "search_sot/search",
             lambda: self.store.search(
@@ -2457,6 +2855,7 @@ class MemoryService:
         project_id: str,
         limit: Optional[int] = None,
         types: Optional[List[str]] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """Search planning collection (artifacts, plan changes, decisions).
 
@@ -2470,7 +2869,8 @@ class MemoryService:
         _validate_project_id(project_id, "search_planning")
 
         limit = limit or self.top_k
-        query_vector = sync_embed_text(query)
+        if query_vector is None:
+            query_vector = sync_embed_text(query)
         results = self._safe_store_call(
             "search_planning/search",
             lambda: self.store.search(
@@ -2794,22 +3194,54 @@ class MemoryService:
         Raises:
             ProjectNamespaceError: If project_id is empty or None (IMP-MEM-015)
         """
-        from ..config import settings
+        return self.retrieve_context_multi(
+            query,
+            project_id,
+            run_id=run_id,
+            task_type=task_type,
+            include_code=include_code,
+            include_summaries=include_summaries,
+            include_errors=include_errors,
+            include_hints=include_hints,
+            include_planning=include_planning,
+            include_plan_changes=include_plan_changes,
+            include_decisions=include_decisions,
+            include_sot=include_sot,
+        ).results
+
+    def retrieve_context_multi(
+        self,
+        query: str,
+        project_id: str,
+        run_id: Optional[str] = None,
+        task_type: Optional[str] = None,
+        include_code: bool = True,
+        include_summaries: bool = True,
+        include_errors: bool = True,
+        include_hints: bool = True,
+        include_planning: bool = False,
+        include_plan_changes: bool = False,
+        include_decisions: bool = False,
+        include_sot: bool = False,
+    ) -> MultiCollectionRetrieval:
+        """
+        Retrieve combined context with a single query embedding.
 
-        if not self.enabled:
-            return {
-                "code": [],
-                "summaries": [],
-                "errors": [],
-                "hints": [],
-                "planning": [],
-                "plan_changes": [],
-                "decisions": [],
-                "sot": [],
-            }
+        IMP-PERF-012: The query is embedded once and the per-collection searches
+        run concurrently on a thread pool, so a cold embedding cache costs one
+        embedding call instead of one per collection.
 
-        # IMP-MEM-015: Validate project namespace isolation
-        _validate_project_id(project_id, "retrieve_context")
+        Args:
+            Same as retrieve_context().
+
+        Returns:
+            MultiCollectionRetrieval with the retrieve_context() dict in ``results``
+            and per-collection timings in ``timings_ms``
+
+        Raises:
+            ProjectNamespaceError: If project_id is empty or None (IMP-MEM-015)
+        """
+        from ..config import settings
 
         # Initialize results with all possible keys (consistent structure)
         results: Dict[str, List[Dict[str, Any]]] = {
@@ -2822,45 +3254,101 @@ class MemoryService:
             "decisions": [],
             "sot": [],
         }
+        if not self.enabled:
+            return MultiCollectionRetrieval(results=results)
+
+        # IMP-MEM-015: Validate project namespace isolation
+        _validate_project_id(project_id, "retrieve_context")
+
+        started = time.perf_counter()
         limit = self.top_k
+        searches: Dict[str, Any] = {}
 
         if include_code:
-            results["code"] = self.search_code(query, project_id)
+            searches["code"] = lambda vec: self.search_code(query, project_id, query_vector=vec)
 
         if include_summaries:
-            results["summaries"] = self.search_summaries(query, project_id, run_id)
+            searches["summaries"] = lambda vec: self.search_summaries(
+                query, project_id, run_id, query_vector=vec
+            )
 
         if include_errors:
-            results["errors"] = self.search_errors(query, project_id)
+            searches["errors"] = lambda vec: self.search_errors(query, project_id, query_vector=vec)
 
         if include_hints:
-            results["hints"] = self.search_doctor_hints(query, project_id)
+            searches["hints"] = lambda vec: self.search_doctor_hints(
+                query, project_id, query_vector=vec
+            )
 
         if include_planning:
-            results["planning"] = self.search_planning(
+            searches["planning"] = lambda vec: self.search_planning(
                 query,
                 project_id,
                 limit=limit,
                 types=["planning_artifact"],
+                query_vector=vec,
             )
 
         if include_plan_changes:
             # Bias to latest plan changes first
-            results["plan_changes"] = self.latest_plan_change(project_id)[:limit]
+            searches["plan_changes"] = lambda vec: self.latest_plan_change(project_id)[:limit]
 
         if include_decisions:
-            results["decisions"] = self.search_planning(
+            searches["decisions"] = lambda vec: self.search_planning(
                 query,
                 project_id,
                 limit=limit,
                 types=["decision_log"],
+                query_vector=vec,
             )
 
         if include_sot and settings.autopack_sot_retrieval_enabled:
             sot_limit = settings.autopack_sot_retrieval_top_k
-            results["sot"] = self.search_sot(query, project_id, limit=sot_limit)
+            searches["sot"] = lambda vec: self.search_sot(
+                query, project_id, limit=sot_limit, query_vector=vec
+            )
 
-        return results
+        embed_ms = 0.0
+        query_vector: Optional[List[float]] = None
+        if any(key != "plan_changes" for key in searches):
+            embed_started = time.perf_counter()
+            query_vector = sync_embed_text(query)
+            embed_ms = (time.perf_counter() - embed_started) * 1000
+
+        def timed(key: str) -> tuple:
+            search_started = time.perf_counter()
+            found = searches[key](query_vector)
+            return found, (time.perf_counter() - search_started) * 1000
+
+        timings_ms: Dict[str, float] = {}
+        if len(searches) > 1:
+            workers = min(len(searches), self.RETRIEVAL_MAX_WORKERS)
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="memory-retrieve"
+            ) as executor:
+                # Each search runs in a copy of this context so memory read tracking
+                # (IMP-PERF-019) sees the collections read on worker threads
+                futures = {
+                    key: executor.submit(contextvars.copy_context().run, timed, key)
+                    for key in searches
+                }
+                for key, future in futures.items():
+                    results[key], timings_ms[key] = future.result()
+        else:
+            for key in searches:
+                results[key], timings_ms[key] = timed(key)
+
+        total_ms = (time.perf_counter() - started) * 1000
+        logger.debug(
+            f"[IMP-PERF-012] retrieve_context: {len(searches)} collections in {total_ms:.1f}ms "
+            f"(embed {embed_ms:.1f}ms)"
+        )
+        return MultiCollectionRetrieval(
+            results=results,
+            timings_ms=timings_ms,
+            embed_ms=embed_ms,
+            total_ms=total_ms,
+        )
 
     def retrieve_context_with_metadata(
         self,
@@ -2894,6 +3382,44 @@ class MemoryService:
             Each ContextMetadata includes confidence signals to help
             callers determine if the context is reliable.
 
+        Raises:
+            ProjectNamespaceError: If project_id is empty or None (IMP-MEM-015)
+        """
+        return self.retrieve_context_with_metadata_multi(
+            query,
+            project_id,
+            run_id=run_id,
+            include_code=include_code,
+            include_summaries=include_summaries,
+            include_errors=include_errors,
+            include_hints=include_hints,
+            min_confidence=min_confidence,
+        ).results
+
+    def retrieve_context_with_metadata_multi(
+        self,
+        query: str,
+        project_id: str,
+        run_id: Optional[str] = None,
+        include_code: bool = True,
+        include_summaries: bool = True,
+        include_errors: bool = True,
+        include_hints: bool = True,
+        min_confidence: Optional[float] = None,
+    ) -> MultiCollectionRetrieval:
+        """
+        Retrieve context with metadata through the single-embedding retrieval path.
+
+        IMP-PERF-012: Delegates the collection searches to retrieve_context_multi(),
+        so the query is embedded once and the collections are searched concurrently.
+
+        Args:
+            Same as retrieve_context_with_metadata().
+
+        Returns:
+            MultiCollectionRetrieval whose ``results`` hold the
+            retrieve_context_with_metadata() dict, plus the search timings
+
         Raises:
             ProjectNamespaceError: If project_id is empty or None (IMP-MEM-015)
         """
@@ -2905,44 +3431,34 @@ class MemoryService:
         }
 
         if not self.enabled:
-            return results
+            return MultiCollectionRetrieval(results=results)
 
         # IMP-MEM-015: Validate project namespace isolation
         _validate_project_id(project_id, "retrieve_context_with_metadata")
 
+        retrieval = self.retrieve_context_multi(
+            query,
+            project_id,
+            run_id=run_id,
+            include_code=include_code,
+            include_summaries=include_summaries,
+            include_errors=include_errors,
+            include_hints=include_hints,
+        )
+
         now = datetime.now(timezone.utc)
 
-        # Content key mappings for each source type
-        content_keys = {
-            "code": "content_preview",
-            "summaries": "summary",
-            "errors": "error_text",
-            "hints": "hint",
+        # Source type and content key for each collection
+        sources = {
+            "code": ("code", "content_preview"),
+            "summaries": ("summary", "summary"),
+            "errors": ("error", "error_text"),
+            "hints": ("hint", "hint"),
         }
-
-        if include_code:
-            raw_results = self.search_code(query, project_id)
-            results["code"] = [
-                _enrich_with_metadata(r, "code", content_keys["code"], now) for r in raw_results
-            ]
-
-        if include_summaries:
-            raw_results = self.search_summaries(query, project_id, run_id)
-            results["summaries"] = [
-                _enrich_with_metadata(r, "summary", content_keys["summaries"], now)
-                for r in raw_results
-            ]
-
-        if include_errors:
-            raw_results = self.search_errors(query, project_id)
-            results["errors"] = [
-                _enrich_with_metadata(r, "error", content_keys["errors"], now) for r in raw_results
-            ]
-
-        if include_hints:
-            raw_results = self.search_doctor_hints(query, project_id)
-            results["hints"] = [
-                _enrich_with_metadata(r, "hint", content_keys["hints"], now) for r in raw_results
+        for key, (source_type, content_key) in sources.items():
+            results[key] = [
+                _enrich_with_metadata(r, source_type, content_key, now)
+                for r in retrieval.results[key]
             ]
 
         # IMP-MEM-001: Sort all results by confidence (highest first)
@@ -2983,7 +3499,12 @@ class MemoryService:
                 log_msg += f" ({low_confidence_items} low confidence)"
             logger.info(log_msg)
 
-        return results
+        return MultiCollectionRetrieval(
+            results=results,
+            timings_ms=retrieval.timings_ms,
+            embed_ms=retrieval.embed_ms,
+            total_ms=retrieval.total_ms,
+        )
 
     def get_context_quality_summary(
         self,
@@ -24,6 +24,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from autopack.memory.write_generation import bump_memory_write_generation, note_memory_read
+
 logger = logging.getLogger(__name__)
 
 # Try importing qdrant client
@@ -35,6 +37,7 @@ try:
         Filter,
         MatchValue,
         PointStruct,
+        QueryRequest,
         SearchRequest,
         VectorParams,
     )
@@ -539,6 +542,10 @@ class QdrantStore:
             )
 
             logger.debug(f"[Qdrant] Upserted {len(points)} points to '{collection}'")
+            # IMP-PERF-019: Invalidate memory context built before this write
+            bump_memory_write_generation(
+                collection, {point.get("payload", {}).get("project_id") for point in points}
+            )
             # IMP-REL-012: Record successful operation
             self._health_monitor.record_success()
             return len(points)
@@ -576,48 +583,17 @@ class QdrantStore:
         Returns:
             List of {"id": str, "score": float, "payload": Dict}
         """
+        note_memory_read(collection, filter)
         try:
-            # Build Qdrant filter from dict
-            qdrant_filter = None
-            if filter:
-                must_conditions = []
-                for key, value in filter.items():
-                    must_conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value),
-                        )
-                    )
-                if must_conditions:
-                    qdrant_filter = Filter(must=must_conditions)
-
             # Search using query_points API (search is deprecated)
             search_result = self.client.query_points(
                 collection_name=collection,
                 query=query_vector,
-                query_filter=qdrant_filter,
+                query_filter=self._build_filter(filter),
                 limit=limit,
             ).points
 
-            # Convert to common format
-            results = []
-            for hit in search_result:
-                # Filter out tombstoned/superseded/archived entries
-                payload = hit.payload or {}
-                status = payload.get("status")
-                if status in ("tombstoned", "superseded", "archived"):
-                    continue
-
-                # Return original ID from payload
-                original_id = payload.pop("_original_id", str(hit.id))
-
-                results.append(
-                    {
-                        "id": original_id,
-                        "score": float(hit.score),
-                        "payload": payload,
-                    }
-                )
+            results = self._convert_hits(search_result)
 
             # IMP-REL-012: Record successful operation
             self._health_monitor.record_success()
@@ -629,6 +605,97 @@ class QdrantStore:
             self._log_unavailable(f"Search failed in '{collection}'", e)
             return []
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
+        retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
+    )
+    def search_batch(
+        self,
+        collection: str,
+        query_vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors in one request.
+
+        IMP-PERF-026: Uses query_batch_points so N lookups cost one round trip.
+
+        Args:
+            collection: Collection name
+            query_vectors: Query embeddings
+            filter: Optional payload filter applied to every query
+            limit: Max results per query
+
+        Returns:
+            One list of {"id": str, "score": float, "payload": Dict} per query,
+            in the same order as query_vectors (all empty on failure)
+        """
+        if not query_vectors:
+            return []
+
+        note_memory_read(collection, filter)
+        try:
+            qdrant_filter = self._build_filter(filter)
+            responses = self.client.query_batch_points(
+                collection_name=collection,
+                requests=[
+                    QueryRequest(
+                        query=query_vector,
+                        filter=qdrant_filter,
+                        limit=limit,
+                        with_payload=True,
+                    )
+                    for query_vector in query_vectors
+                ],
+            )
+
+            results = [self._convert_hits(response.points) for response in responses]
+
+            # IMP-REL-012: Record successful operation
+            self._health_monitor.record_success()
+            return results
+
+        except Exception as e:
+            # IMP-REL-012: Record failed operation
+            self._health_monitor.record_failure(e)
+            self._log_unavailable(f"Batch search failed in '{collection}'", e)
+            return [[] for _ in query_vectors]
+
+    @staticmethod
+    def _build_filter(filter: Optional[Dict[str, Any]]) -> Optional["Filter"]:
+        """Build a Qdrant filter matching every key/value pair of a payload filter dict."""
+        if not filter:
+            return None
+        must_conditions = [
+            FieldCondition(key=key, match=MatchValue(value=value)) for key, value in filter.items()
+        ]
+        return Filter(must=must_conditions)
+
+    @staticmethod
+    def _convert_hits(points: Any) -> List[Dict[str, Any]]:
+        """Convert Qdrant scored points to the common {"id", "score", "payload"} format."""
+        results = []
+        for hit in points:
+            # Filter out tombstoned/superseded/archived entries
+            payload = hit.payload or {}
+            status = payload.get("status")
+            if status in ("tombstoned", "superseded", "archived"):
+                continue
+
+            # Return original ID from payload
+            original_id = payload.pop("_original_id", str(hit.id))
+
+            results.append(
+                {
+                    "id": original_id,
+                    "score": float(hit.score),
+                    "payload": payload,
+                }
+            )
+        return results
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
@@ -653,6 +720,7 @@ class QdrantStore:
         Returns:
             List of {"id": str, "payload": Dict}
         """
+        note_memory_read(collection, filter)
         try:
             # Build Qdrant filter
             qdrant_filter = None
@@ -762,16 +830,38 @@ class QdrantStore:
             # Preserve original ID in payload
             payload["_original_id"] = point_id
 
+            previous_project = self._get_project_id(collection, qdrant_id)
             self.client.set_payload(
                 collection_name=collection,
                 payload=payload,
                 points=[qdrant_id],
             )
+            # IMP-PERF-019: Invalidate both the project the point left and the one it
+            # joined (set_payload merges, so a missing project_id keeps the old one)
+            bump_memory_write_generation(
+                collection, {previous_project, payload.get("project_id", previous_project)}
+            )
             return True
         except Exception as e:
             self._log_unavailable(f"Update payload failed for '{point_id}'", e)
             return False
 
+    def _get_project_id(self, collection: str, qdrant_id: str) -> Optional[str]:
+        """Return a point's project_id, or None if the point or its project is unknown."""
+        try:
+            points = self.client.retrieve(
+                collection_name=collection,
+                ids=[qdrant_id],
+                with_payload=["project_id"],
+                with_vectors=False,
+            )
+        except Exception as e:
+            logger.debug(f"[Qdrant] Could not read project of '{qdrant_id}': {e}")
+            return None
+        if not points or not points[0].payload:
+            return None
+        return points[0].payload.get("project_id")
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
@@ -803,6 +893,8 @@ class QdrantStore:
                 points_selector=qdrant_ids,
             )
             logger.debug(f"[Qdrant] Deleted {len(ids)} points from '{collection}'")
+            # Deleted points' projects are unknown here, so invalidate every project
+            bump_memory_write_generation(collection)
             # IMP-REL-012: Record successful operation
             self._health_monitor.record_success()
             return len(ids)
@@ -6,15 +6,23 @@ Provides utilities for:
 - Generating stable chunk IDs
 - Extracting metadata (headings, timestamps, etc.)
 - Field-selective JSON embedding
+- Tracking indexed chunks per file for incremental re-indexing (IMP-PERF-015)
 """
 
 import hashlib
 import json
+import logging
+import os
 import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+logger = logging.getLogger(__name__)
+
+# IMP-PERF-015: Bump when the manifest layout changes; older manifests are ignored
+SOT_MANIFEST_VERSION = 1
+
 
 def chunk_text(
     text: str,
@@ -372,3 +380,131 @@ def chunk_sot_json(
         chunk_docs.append(doc)
 
     return chunk_docs
+
+
+class SotIndexManifest:
+    """
+    Record of which SOT chunks are indexed, per file.
+
+    IMP-PERF-015: SOT ledgers are append-only, so most chunks survive between
+    indexing runs. The manifest stores each file's mtime/size, chunking
+    parameters and ``{chunk_id: content_hash}``. With it the indexer can skip an
+    unchanged file without reading it. For a changed file it embeds only the new
+    chunks and deletes the vanished ones.
+
+    Layout::
+
+        {"version": 1, "files": {"BUILD_HISTORY.md": {"mtime": ..., "size": ...,
+         "params": {...}, "chunks": {chunk_id: content_hash}}}}
+    """
+
+    def __init__(self, path: Path):
+        """
+        Load the manifest from ``path`` (an empty manifest if missing or unreadable).
+
+        Args:
+            path: JSON file backing the manifest
+        """
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        if not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"[SOT] Ignoring unreadable index manifest {path}: {e}")
+            return
+        if data.get("version") == SOT_MANIFEST_VERSION:
+            self.files = data.get("files", {})
+
+    def is_unchanged(self, sot_file: str, file_path: Path, params: Dict[str, Any]) -> bool:
+        """
+        True if the file's mtime, size and chunking parameters match the record.
+
+        Args:
+            sot_file: SOT file name
+            file_path: Path to the SOT file on disk
+            params: Chunking parameters used for this run
+        """
+        entry = self.files.get(sot_file)
+        if entry is None:
+            return False
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return (
+            entry.get("mtime") == stat.st_mtime
+            and entry.get("size") == stat.st_size
+            and entry.get("params") == params
+        )
+
+    def chunk_ids(self, sot_file: str) -> List[str]:
+        """Chunk IDs recorded for a file."""
+        return list(self.files.get(sot_file, {}).get("chunks", {}))
+
+    def diff(self, sot_file: str, chunk_docs: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """
+        Compare freshly chunked docs against the recorded chunks.
+
+        Args:
+            sot_file: SOT file name
+            chunk_docs: Output of chunk_sot_file / chunk_sot_json
+
+        Returns:
+            (docs that are new or changed, IDs of recorded chunks that vanished)
+        """
+        recorded = self.files.get(sot_file, {}).get("chunks", {})
+        current_ids = set()
+        changed = []
+        for doc in chunk_docs:
+            chunk_id = doc["id"]
+            current_ids.add(chunk_id)
+            if recorded.get(chunk_id) != doc["metadata"].get("content_hash"):
+                changed.append(doc)
+        vanished = [chunk_id for chunk_id in recorded if chunk_id not in current_ids]
+        return changed, vanished
+
+    def update(
+        self,
+        sot_file: str,
+        file_path: Path,
+        chunk_docs: List[Dict],
+        params: Dict[str, Any],
+    ) -> None:
+        """
+        Record the chunks now indexed for a file.
+
+        Args:
+            sot_file: SOT file name
+            file_path: Path to the SOT file on disk
+            chunk_docs: Chunks that are now in the vector store
+            params: Chunking parameters used for this run
+        """
+        stat = file_path.stat()
+        self.files[sot_file] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "params": params,
+            "chunks": {doc["id"]: doc["metadata"].get("content_hash") for doc in chunk_docs},
+        }
+
+    def remove(self, sot_file: str) -> List[str]:
+        """
+        Forget a file, returning the chunk IDs that were recorded for it.
+
+        Args:
+            sot_file: SOT file name
+        """
+        entry = self.files.pop(sot_file, None)
+        return list(entry.get("chunks", {})) if entry else []
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": SOT_MANIFEST_VERSION, "files": self.files}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
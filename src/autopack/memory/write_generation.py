@@ -0,0 +1,113 @@
+"""Memory write generations, tracked per (collection, project).
+
+IMP-PERF-019: Vector store backends bump a generation on every successful
+write (upsert, payload update, delete). Caches of retrieved memory context
+record the generation of each (collection, project) they read and treat an
+entry as stale once any of those generations has moved on, so prefetched
+context never outlives a write that could change what retrieval returns,
+while writes to other collections or projects leave it valid.
+
+Reads are recorded with track_memory_reads(): the stores call
+note_memory_read() for every search, and the generation observed at read
+time is kept in the active tracker.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# (collection, project_id); project_id None means "any/unknown project"
+ReadKey = Tuple[str, Optional[str]]
+
+_lock = threading.Lock()
+_generation = 0
+# Every write to a collection, regardless of project
+_collection_generations: Dict[str, int] = {}
+# Writes whose project is unknown (deletes by ID, evictions); they affect every project
+_unscoped_generations: Dict[str, int] = {}
+# Writes attributed to one project
+_project_generations: Dict[ReadKey, int] = {}
+
+_active_reads: ContextVar[Optional[Dict[ReadKey, int]]] = ContextVar(
+    "memory_reads", default=None
+)
+
+
+def bump_memory_write_generation(
+    collection: str, project_ids: Iterable[Optional[str]] = (None,)
+) -> int:
+    """Record a memory write.
+
+    Args:
+        collection: Collection that was written
+        project_ids: Projects whose points were written; None marks points
+            whose project is unknown, which invalidates reads of every project
+
+    Returns:
+        The new process-wide generation number
+    """
+    global _generation
+    with _lock:
+        _generation += 1
+        _collection_generations[collection] = _collection_generations.get(collection, 0) + 1
+        for project_id in set(project_ids) or {None}:
+            if project_id is None:
+                _unscoped_generations[collection] = _unscoped_generations.get(collection, 0) + 1
+            else:
+                key = (collection, str(project_id))
+                _project_generations[key] = _project_generations.get(key, 0) + 1
+        return _generation
+
+
+def get_memory_write_generation() -> int:
+    """Get the process-wide memory write generation (bumped by every write)."""
+    return _generation
+
+
+def _read_generation(key: ReadKey) -> int:
+    """Generation visible to a read of key. Caller holds _lock."""
+    collection, project_id = key
+    if project_id is None:
+        return _collection_generations.get(collection, 0)
+    return _unscoped_generations.get(collection, 0) + _project_generations.get(key, 0)
+
+
+def note_memory_read(collection: str, filter: Optional[Dict[str, Any]] = None) -> None:
+    """Record a read of collection in the active tracker, if any.
+
+    Args:
+        collection: Collection being read
+        filter: Search filter; its "project_id" scopes the read to one project
+    """
+    reads = _active_reads.get()
+    if reads is None:
+        return
+    project_id = filter.get("project_id") if isinstance(filter, dict) else None
+    key: ReadKey = (collection, str(project_id) if project_id is not None else None)
+    with _lock:
+        reads.setdefault(key, _read_generation(key))
+
+
+@contextmanager
+def track_memory_reads() -> Iterator[Dict[ReadKey, int]]:
+    """Collect the (collection, project) reads made inside the block.
+
+    The tracker lives in a context variable, so work handed to a thread pool
+    is only tracked when submitted through contextvars.copy_context().run.
+
+    Yields:
+        Map of read key -> generation observed at the first read
+    """
+    reads: Dict[ReadKey, int] = {}
+    token = _active_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _active_reads.reset(token)
+
+
+def reads_are_current(reads: Dict[ReadKey, int]) -> bool:
+    """True if no write has touched any of the recorded reads since they were made."""
+    with _lock:
+        return all(_read_generation(key) == generation for key, generation in reads.items())
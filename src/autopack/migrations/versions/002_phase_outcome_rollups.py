@@ -0,0 +1,66 @@
+"""phase outcome rollups
+
+Revision ID: 002_phase_outcome_rollups
+Revises: 001_initial_schema
+Create Date: 2026-10-16 00:00:00.000000
+
+IMP-PERF-021: Adds hourly phase outcome rollups and the watermark table used
+to maintain them incrementally. Existing events are folded in by
+scripts/telemetry_rollups.py backfill (or lazily by the next
+TelemetryAnalyzer.aggregate_telemetry call).
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_phase_outcome_rollups"
+down_revision: Union[str, None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create phase_outcome_rollups and telemetry_rollup_watermarks."""
+    op.create_table(
+        "phase_outcome_rollups",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("phase_id", sa.String(), nullable=False),
+        sa.Column("phase_type", sa.String(), nullable=True),
+        sa.Column("model_used", sa.String(), nullable=True),
+        sa.Column("phase_outcome", sa.String(length=20), nullable=False),
+        sa.Column("stop_reason", sa.String(), nullable=True),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("token_event_count", sa.Integer(), nullable=False),
+        sa.Column("tokens_sum", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_phase_outcome_rollup_bucket", "phase_outcome_rollups", ["bucket_start"], unique=False
+    )
+    op.create_index(
+        "ix_phase_outcome_rollup_phase",
+        "phase_outcome_rollups",
+        ["phase_id", "phase_type"],
+        unique=False,
+    )
+
+    op.create_table(
+        "telemetry_rollup_watermarks",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("last_event_id", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables."""
+    op.drop_table("telemetry_rollup_watermarks")
+    op.drop_index("ix_phase_outcome_rollup_phase", table_name="phase_outcome_rollups")
+    op.drop_index("ix_phase_outcome_rollup_bucket", table_name="phase_outcome_rollups")
+    op.drop_table("phase_outcome_rollups")
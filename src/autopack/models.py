@@ -528,6 +528,44 @@ class PhaseOutcomeEvent(Base):
     context_item_count = Column(Integer, nullable=True)  # Number of context items injected
 
 
+class PhaseOutcomeRollup(Base):
+    """Hourly pre-aggregated phase outcomes (IMP-PERF-021).
+
+    One row per (hour bucket, phase_id, phase_type, model_used, phase_outcome,
+    stop_reason). Maintained incrementally from phase_outcome_events by
+    autopack.telemetry.outcome_rollups so TelemetryAnalyzer aggregates over
+    rollup rows instead of scanning every raw event in the window.
+    """
+
+    __tablename__ = "phase_outcome_rollups"
+    __table_args__ = (
+        Index("ix_phase_outcome_rollup_bucket", "bucket_start"),
+        Index("ix_phase_outcome_rollup_phase", "phase_id", "phase_type"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    bucket_start = Column(DateTime, nullable=False)  # UTC hour the events fall in
+    phase_id = Column(String, nullable=False)
+    phase_type = Column(String, nullable=True)
+    model_used = Column(String, nullable=True)
+    phase_outcome = Column(String(20), nullable=False)
+    stop_reason = Column(String, nullable=True)
+
+    event_count = Column(Integer, nullable=False, default=0)
+    token_event_count = Column(Integer, nullable=False, default=0)  # Events with tokens_used
+    tokens_sum = Column(BigInteger, nullable=False, default=0)
+
+
+class TelemetryRollupWatermark(Base):
+    """Highest raw event id folded into a rollup table (IMP-PERF-021)."""
+
+    __tablename__ = "telemetry_rollup_watermarks"
+
+    name = Column(String(100), primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=True)
+
+
 class TokenBudgetEscalationEvent(Base):
     """
     Token budget escalation telemetry (BUILD-129 Phase 3 P10).
@@ -17,7 +17,7 @@ import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +61,8 @@ class NDJSONParseResult:
     total_expected: Optional[int]  # From meta line, if present
     lines_parsed: int
     lines_failed: int
+    # IMP-PERF-030: file_path of the operation cut off by truncation, when recoverable
+    truncated_file_path: Optional[str] = None
 
 
 class NDJSONParser:
@@ -133,47 +135,8 @@ class NDJSONParser:
                     operations.append(op)
 
             except json.JSONDecodeError as e:
-                # Some models emit Python-literal dicts/lists (single quotes) instead of strict JSON.
-                # Try to salvage via ast.literal_eval on a per-line basis.
-                salvaged = False
-                try:
-                    candidate = line
-                    # Common when models emit Python list elements: "{...}," at EOL
-                    if candidate.endswith(","):
-                        candidate = candidate[:-1]
-                    lit = ast.literal_eval(candidate)
-                    if isinstance(lit, (dict, list)):
-                        obj = lit
-                        salvaged = True
-                except (ValueError, SyntaxError):
-                    # Expected when content is not valid Python literal
-                    salvaged = False
-
-                # As a last resort, try to coerce "loose JSON" to valid JSON:
-                # - unquoted keys: {type: 'meta'} -> {"type": "meta"}
-                # - python literals: True/False/None -> true/false/null
-                # - single quotes -> double quotes (best-effort)
-                if not salvaged:
-                    try:
-                        candidate = line.strip()
-                        if candidate.endswith(","):
-                            candidate = candidate[:-1]
-                        candidate = re.sub(
-                            r"([{,]\s*)([A-Za-z_][A-Za-z0-9_]*)\s*:", r'\1"\2":', candidate
-                        )
-                        # Replace Python literals with JSON literals
-                        candidate = re.sub(r"\bTrue\b", "true", candidate)
-                        candidate = re.sub(r"\bFalse\b", "false", candidate)
-                        candidate = re.sub(r"\bNone\b", "null", candidate)
-                        # If there are no double-quotes at all, assume single quotes are used for strings.
-                        if '"' not in candidate and "'" in candidate:
-                            candidate = candidate.replace("'", '"')
-                        obj2 = json.loads(candidate)
-                        obj = obj2
-                        salvaged = True
-                    except (json.JSONDecodeError, ValueError):
-                        # Coercion attempt failed - content is not recoverable as JSON
-                        salvaged = False
+                obj = self._salvage_line(line)
+                salvaged = obj is not None
 
                 if salvaged:
                     lines_parsed += 1
@@ -476,6 +439,44 @@ class NDJSONParser:
             lines_failed=lines_failed,
         )
 
+    @staticmethod
+    def _salvage_line(line: str) -> Optional[object]:
+        """Decode a line that is not strict JSON, or return None if unrecoverable."""
+        # Some models emit Python-literal dicts/lists (single quotes) instead of strict JSON.
+        # Try to salvage via ast.literal_eval on a per-line basis.
+        try:
+            candidate = line
+            # Common when models emit Python list elements: "{...}," at EOL
+            if candidate.endswith(","):
+                candidate = candidate[:-1]
+            lit = ast.literal_eval(candidate)
+            if isinstance(lit, (dict, list)):
+                return lit
+        except (ValueError, SyntaxError):
+            # Expected when content is not valid Python literal
+            pass
+
+        # As a last resort, try to coerce "loose JSON" to valid JSON:
+        # - unquoted keys: {type: 'meta'} -> {"type": "meta"}
+        # - python literals: True/False/None -> true/false/null
+        # - single quotes -> double quotes (best-effort)
+        try:
+            candidate = line.strip()
+            if candidate.endswith(","):
+                candidate = candidate[:-1]
+            candidate = re.sub(r"([{,]\s*)([A-Za-z_][A-Za-z0-9_]*)\s*:", r'\1"\2":', candidate)
+            # Replace Python literals with JSON literals
+            candidate = re.sub(r"\bTrue\b", "true", candidate)
+            candidate = re.sub(r"\bFalse\b", "false", candidate)
+            candidate = re.sub(r"\bNone\b", "null", candidate)
+            # If there are no double-quotes at all, assume single quotes are used for strings.
+            if '"' not in candidate and "'" in candidate:
+                candidate = candidate.replace("'", '"')
+            return json.loads(candidate)
+        except (json.JSONDecodeError, ValueError):
+            # Coercion attempt failed - content is not recoverable as JSON
+            return None
+
     def _parse_operation(self, obj: Dict, line_num: int) -> Optional[NDJSONOperation]:
         """Parse a single operation object."""
         op_type = obj.get("type")
@@ -582,6 +583,127 @@ Example (3 operations):
 """.strip()
 
 
+class NDJSONStreamParser:
+    """
+    Incremental NDJSON parser for streamed builder output.
+
+    IMP-PERF-030: NDJSONParser.parse needs the complete output string. This
+    parser is fed text deltas as they arrive from the transport stream and
+    returns each operation as soon as its line is complete, so operations can
+    be validated and staged while the model is still generating.
+
+    Line handling matches NDJSONParser.parse on fence-stripped output (as
+    NDJSONParserWrapper feeds it). Truncation is detected at the exact
+    operation boundary: if the final non-fence line cannot be decoded, the
+    result is marked truncated and carries the file_path of the cut-off
+    operation.
+    """
+
+    _FILE_PATH_RE = re.compile(r'"file_path"\s*:\s*"([^"]+)"')
+
+    def __init__(self):
+        self._parser = NDJSONParser()
+        self._pending: List[str] = []
+        self._line_num = 0
+        self._last_failed_line: Optional[str] = None
+        self.operations: List[NDJSONOperation] = []
+        self.total_expected: Optional[int] = None
+        self.lines_parsed = 0
+        self.lines_failed = 0
+
+    def feed(self, chunk: str) -> List[NDJSONOperation]:
+        """
+        Feed a chunk of streamed output.
+
+        Args:
+            chunk: Next text delta (may contain zero or more newlines)
+
+        Returns:
+            Operations completed by this chunk, in order
+        """
+        if "\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+
+        head, *middle, tail = chunk.split("\n")
+        self._pending.append(head)
+        lines = ["".join(self._pending), *middle]
+        self._pending = [tail] if tail else []
+
+        completed = []
+        for line in lines:
+            op = self._consume_line(line)
+            if op:
+                completed.append(op)
+        return completed
+
+    def close(self) -> NDJSONParseResult:
+        """
+        Flush the unterminated last line and return the overall result.
+
+        Returns:
+            NDJSONParseResult for everything fed so far
+        """
+        if self._pending:
+            tail = "".join(self._pending)
+            self._pending = []
+            self._consume_line(tail)
+
+        was_truncated = self._last_failed_line is not None
+        truncated_file_path = None
+        if was_truncated:
+            match = self._FILE_PATH_RE.search(self._last_failed_line)
+            truncated_file_path = match.group(1) if match else None
+            logger.warning(
+                f"[IMP-PERF-030] Stream ended mid-operation at line #{self._line_num} "
+                f"(file_path={truncated_file_path}). "
+                f"Successfully parsed {len(self.operations)} operations."
+            )
+
+        return NDJSONParseResult(
+            operations=list(self.operations),
+            was_truncated=was_truncated,
+            total_expected=self.total_expected,
+            lines_parsed=self.lines_parsed,
+            lines_failed=self.lines_failed,
+            truncated_file_path=truncated_file_path,
+        )
+
+    def _consume_line(self, line: str) -> Optional[NDJSONOperation]:
+        """Parse one complete line; returns the operation it holds, if any."""
+        self._line_num += 1
+        line = line.strip()
+        # Markdown fences are dropped before one-pass parsing, so a closing fence
+        # must not hide a cut-off final operation
+        if not line or line.startswith("```"):
+            return None
+        self._last_failed_line = None
+        if not (line.startswith("{") or line.startswith("[")):
+            return None
+
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            obj = NDJSONParser._salvage_line(line)
+            if obj is None:
+                self.lines_failed += 1
+                self._last_failed_line = line
+                return None
+
+        self.lines_parsed += 1
+        if not isinstance(obj, dict):
+            return None
+        if obj.get("type") == "meta":
+            self.total_expected = obj.get("total_operations")
+            return None
+
+        op = self._parser._parse_operation(obj, self._line_num)
+        if op:
+            self.operations.append(op)
+        return op
+
+
 class NDJSONApplier:
     """
     Applier for NDJSON operations.
@@ -764,6 +886,258 @@ class NDJSONApplier:
             logger.warning(f"[NDJSON:Apply] Cannot delete non-existent file: {op.file_path}")
 
 
+class NDJSONStagedApplier(NDJSONApplier):
+    """
+    NDJSON applier that stages operations in memory and writes them in one pass.
+
+    IMP-PERF-030: Used by NDJSONStreamPipeline to apply each operation as soon
+    as it is streamed. File contents are kept in an in-memory overlay (a
+    modify reads the staged content, or the file on disk if not yet staged)
+    and nothing touches the workspace until commit(), so aborting the stream
+    on a bad operation leaves the workspace unchanged.
+    """
+
+    def __init__(self, workspace: Path):
+        """Initialize staged applier with workspace root."""
+        super().__init__(workspace)
+        self._staged: Dict[Path, Optional[str]] = {}  # None marks a pending delete
+        self.applied: List[str] = []
+        self.failed: List[Dict] = []
+        self.skipped: List[str] = []
+        self.total_operations = 0
+
+    def stage(self, op: NDJSONOperation) -> bool:
+        """
+        Stage a single operation in memory.
+
+        Args:
+            op: Parsed operation
+
+        Returns:
+            False if the operation failed, True if staged or skipped
+        """
+        index = self.total_operations
+        self.total_operations += 1
+        try:
+            if op.op_type == "create":
+                self._stage_create(op)
+            elif op.op_type == "modify":
+                self._stage_modify(op)
+            elif op.op_type == "delete":
+                self._stage_delete(op)
+            else:
+                return True
+        except NDJSONSkipOperation as e:
+            self.skipped.append(op.file_path)
+            logger.warning(
+                f"[NDJSON:Apply] Skipping operation #{index} ({op.op_type} {op.file_path}): {e}"
+            )
+            return True
+        except Exception as e:
+            self.failed.append(
+                {"operation_index": index, "file_path": op.file_path, "error": str(e)}
+            )
+            logger.error(
+                f"[NDJSON:Apply] Failed to stage operation #{index} ({op.op_type} {op.file_path}): {e}"
+            )
+            return False
+
+        self.applied.append(op.file_path)
+        logger.debug(f"[NDJSON:Apply] Staged {op.op_type} {op.file_path}")
+        return True
+
+    def commit(self) -> Dict:
+        """
+        Write all staged files to the workspace.
+
+        Returns:
+            Dict with applied/failed counts and details (same shape as apply())
+        """
+        for file_path, content in self._staged.items():
+            if content is None:
+                if file_path.exists():
+                    file_path.unlink()
+            else:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text(content, encoding="utf-8")
+
+        logger.info(
+            f"[NDJSON:Apply] Committed {len(self._staged)} staged files: "
+            f"{len(self.applied)} applied, {len(self.failed)} failed"
+        )
+        self._staged.clear()
+
+        return {
+            "applied": list(self.applied),
+            "failed": list(self.failed),
+            "skipped": list(self.skipped),
+            "total_operations": self.total_operations,
+        }
+
+    def discard(self) -> None:
+        """Drop all staged content without touching the workspace."""
+        self._staged.clear()
+
+    def _stage_create(self, op: NDJSONOperation):
+        """Stage create operation."""
+        if not op.file_path:
+            raise ValueError("Create operation missing file_path")
+        if op.content is None:
+            raise ValueError("Create operation missing content")
+
+        self._staged[self.workspace / op.file_path] = op.content
+
+    def _stage_modify(self, op: NDJSONOperation):
+        """Stage modify operation on top of any previously staged content."""
+        if not op.file_path:
+            raise ValueError("Modify operation missing file_path")
+        if not op.operations:
+            raise NDJSONSkipOperation("missing operations list")
+
+        file_path = self.workspace / op.file_path
+        if file_path in self._staged:
+            content = self._staged[file_path]
+            if content is None:
+                raise FileNotFoundError(f"Cannot modify deleted file: {op.file_path}")
+        elif file_path.exists():
+            content = file_path.read_text(encoding="utf-8")
+        else:
+            raise FileNotFoundError(f"Cannot modify non-existent file: {op.file_path}")
+
+        for sub_op in op.operations:
+            content = self._apply_sub_operation(content, sub_op, op.file_path)
+
+        self._staged[file_path] = content
+
+    def _stage_delete(self, op: NDJSONOperation):
+        """Stage delete operation."""
+        if not op.file_path:
+            raise ValueError("Delete operation missing file_path")
+
+        file_path = self.workspace / op.file_path
+        if file_path in self._staged:
+            exists = self._staged[file_path] is not None
+        else:
+            exists = file_path.exists()
+
+        if exists:
+            self._staged[file_path] = None
+        else:
+            logger.warning(f"[NDJSON:Apply] Cannot delete non-existent file: {op.file_path}")
+
+
+class NDJSONStreamPipeline:
+    """
+    Streaming parse -> validate -> stage pipeline for NDJSON builder output.
+
+    IMP-PERF-030: Fed directly from the transport text stream. Each completed
+    operation is validated (e.g. against the deliverables manifest) and staged
+    in memory as soon as its line arrives. On the first invalid or failing
+    operation feed() returns False so the caller can stop generation early
+    instead of paying for the rest of the output.
+
+    Usage:
+        pipeline = NDJSONStreamPipeline(workspace, validate_op=check)
+        transport.send_request(..., on_text=pipeline.feed)
+        parse_result = pipeline.finish()
+        if not pipeline.aborted:
+            apply_result = pipeline.commit()
+    """
+
+    def __init__(
+        self,
+        workspace: Path,
+        validate_op: Optional[Callable[[NDJSONOperation], Optional[Dict]]] = None,
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            workspace: Workspace root files are committed to
+            validate_op: Optional per-operation check returning
+                {"error_code", "messages"} to abort, or None to accept
+        """
+        self.parser = NDJSONStreamParser()
+        self.applier = NDJSONStagedApplier(workspace)
+        self.validate_op = validate_op
+        self.abort_error: Optional[Dict] = None
+
+    @property
+    def aborted(self) -> bool:
+        """True if a bad operation stopped the pipeline."""
+        return self.abort_error is not None
+
+    @property
+    def operations(self) -> List[NDJSONOperation]:
+        """Operations parsed so far."""
+        return self.parser.operations
+
+    def feed(self, text: str) -> bool:
+        """
+        Feed a streamed text delta.
+
+        Returns:
+            False once the pipeline has aborted (caller should stop the stream)
+        """
+        if self.aborted:
+            return False
+        for op in self.parser.feed(text):
+            if not self._stage(op):
+                return False
+        return True
+
+    def finish(self) -> NDJSONParseResult:
+        """Flush the final line and return the parse result."""
+        seen = len(self.parser.operations)
+        result = self.parser.close()
+        for op in result.operations[seen:]:
+            if self.aborted or not self._stage(op):
+                break
+        return result
+
+    def commit(self) -> Dict:
+        """
+        Write staged files to the workspace.
+
+        Raises:
+            RuntimeError: If the pipeline aborted (staged content is discarded)
+        """
+        if self.aborted:
+            self.applier.discard()
+            raise RuntimeError(f"NDJSON stream aborted: {self.abort_error['error_code']}")
+        return self.applier.commit()
+
+    def _stage(self, op: NDJSONOperation) -> bool:
+        """Validate and stage one operation; records abort_error on failure."""
+        if self.validate_op:
+            error = self.validate_op(op)
+            if error:
+                self.abort_error = error
+                self.applier.discard()
+                logger.warning(
+                    f"[IMP-PERF-030] Aborting NDJSON stream at operation "
+                    f"#{self.applier.total_operations} ({op.op_type} {op.file_path}): "
+                    f"{error.get('error_code')}"
+                )
+                return False
+
+        if not self.applier.stage(op):
+            failure = self.applier.failed[-1]
+            self.abort_error = {
+                "error_code": "ndjson_operation_failed",
+                "messages": [
+                    f"NDJSON operation #{failure['operation_index']} "
+                    f"({op.op_type} {op.file_path}) failed: {failure['error']}"
+                ],
+            }
+            self.applier.discard()
+            logger.warning(
+                f"[IMP-PERF-030] Aborting NDJSON stream: {self.abort_error['messages'][0]}"
+            )
+            return False
+        return True
+
+
 def detect_ndjson_format(output: str) -> bool:
     """
     Detect if output is in NDJSON format.
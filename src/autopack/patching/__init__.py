@@ -2,9 +2,12 @@
 
 from .apply_engine import (
     ApplyResult,
+    StagedFile,
+    commit_staged_files,
     execute_git_apply,
     execute_manual_apply,
     recover_from_failed_apply,
+    stage_patch,
 )
 from .diff_generator import (
     DiffStats,
@@ -29,9 +32,12 @@ from .patch_sanitize import (
 __all__ = [
     # apply_engine
     "ApplyResult",
+    "StagedFile",
+    "commit_staged_files",
     "execute_git_apply",
     "execute_manual_apply",
     "recover_from_failed_apply",
+    "stage_patch",
     # diff_generator
     "DiffStats",
     "extract_diff_stats",
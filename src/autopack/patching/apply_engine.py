@@ -4,13 +4,21 @@ Extracted from governed_apply.py as part of Item 1.1 god file refactoring (PR-AP
 
 This module contains the core patch application engine that executes git apply
 and fallback strategies for applying patches to the filesystem.
+
+IMP-PERF-031: stage_patch applies a unified diff to an in-memory overlay of the
+affected files and commit_staged_files writes the overlay atomically, so the
+common case needs neither git subprocesses nor backup/restore round trips.
 """
 
 import logging
+import os
+import re
+import shutil
 import subprocess
-from dataclasses import dataclass
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +28,7 @@ class ApplyResult:
     """Result of patch application attempt."""
 
     success: bool
-    method: str  # "git_apply", "git_apply_lenient", "git_apply_3way", "manual", "failed"
+    method: str  # "git_apply", "git_apply_lenient", "git_apply_3way", "manual", "staged", "failed"
     message: str
     files_modified: List[str]
     error_output: Optional[str] = None
@@ -427,6 +435,383 @@ def recover_from_failed_apply(
     return False
 
 
+# =============================================================================
+# STAGED (IN-MEMORY) APPLY - IMP-PERF-031
+# =============================================================================
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+# Extended headers the in-memory applier does not implement; git apply handles these
+_UNSUPPORTED_HEADER_PREFIXES = (
+    "rename from",
+    "rename to",
+    "copy from",
+    "copy to",
+    "old mode",
+    "new mode",
+    "similarity index",
+    "dissimilarity index",
+    "Binary files",
+    "GIT binary patch",
+)
+
+
+@dataclass
+class StagedFile:
+    """In-memory result of applying a patch to one file."""
+
+    path: str
+    original: Optional[str]  # None for files created by the patch
+    content: Optional[str]  # None for files deleted by the patch
+
+
+@dataclass
+class _Hunk:
+    old_start: int
+    old_count: int
+    old_lines: List[str] = field(default_factory=list)
+    new_lines: List[str] = field(default_factory=list)
+    old_no_eol: bool = False
+    new_no_eol: bool = False
+    trailing: int = 0  # context lines after the last change
+
+
+class _StageError(Exception):
+    """Patch cannot be applied exactly in memory (caller falls back to git apply)."""
+
+
+def stage_patch(
+    patch_content: str, workspace: Path
+) -> Tuple[Optional[Dict[str, StagedFile]], Optional[str]]:
+    """Apply a unified diff to in-memory copies of the affected files.
+
+    Hunks must match exactly (at the header position or the nearest offset, like
+    strict git apply). As in git apply, a hunk starting at line 0 or 1 must match
+    at the beginning of the file and a hunk without trailing context must match
+    at the end. Anything the in-memory applier does not implement - fuzzy
+    context, renames, mode changes, binary patches, CRLF files - is reported
+    so the caller can fall back to execute_git_apply. Nothing is written.
+
+    Args:
+        patch_content: Unified diff patch (LF line endings)
+        workspace: Working directory
+
+    Returns:
+        Tuple of (staged files by relative path, None) on success, or
+        (None, reason) if the patch must go through git apply
+    """
+    try:
+        return _stage_patch(patch_content, workspace), None
+    except _StageError as e:
+        return None, str(e)
+
+
+def commit_staged_files(staged: Dict[str, StagedFile], workspace: Path) -> ApplyResult:
+    """Write staged files to the workspace atomically.
+
+    Every new content is first written to a temp file next to its target;
+    only when all temp files exist are they renamed into place (os.replace),
+    followed by deletions. If a rename or delete fails, files already
+    replaced are restored from their in-memory originals.
+
+    Args:
+        staged: Result of stage_patch
+        workspace: Working directory
+
+    Returns:
+        ApplyResult with method "staged"
+    """
+    pending: List[Tuple[str, Path]] = []  # (temp path, target)
+    try:
+        for staged_file in staged.values():
+            if staged_file.content is None:
+                continue
+            target = workspace / staged_file.path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+            pending.append((tmp, target))
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(staged_file.content)
+            if target.exists():
+                shutil.copymode(target, tmp)
+    except OSError as e:
+        for tmp, _ in pending:
+            _remove_quietly(Path(tmp))
+        logger.error(f"[IMP-PERF-031] Failed to write staged files: {e}")
+        return ApplyResult(
+            success=False,
+            method="staged",
+            message=f"Failed to write staged files: {e}",
+            files_modified=[],
+            error_output=str(e),
+        )
+
+    committed: List[StagedFile] = []
+    try:
+        for (tmp, target), staged_file in zip(
+            pending, [f for f in staged.values() if f.content is not None]
+        ):
+            os.replace(tmp, target)
+            committed.append(staged_file)
+        for staged_file in staged.values():
+            if staged_file.content is None:
+                (workspace / staged_file.path).unlink(missing_ok=True)
+                committed.append(staged_file)
+    except OSError as e:
+        logger.error(f"[IMP-PERF-031] Commit failed after {len(committed)} files, restoring: {e}")
+        for tmp, _ in pending:
+            _remove_quietly(Path(tmp))
+        for staged_file in committed:
+            target = workspace / staged_file.path
+            try:
+                if staged_file.original is None:
+                    target.unlink(missing_ok=True)
+                else:
+                    with open(target, "w", encoding="utf-8", newline="") as f:
+                        f.write(staged_file.original)
+            except OSError as restore_error:
+                logger.error(
+                    f"[IMP-PERF-031] Failed to restore {staged_file.path}: {restore_error}"
+                )
+        return ApplyResult(
+            success=False,
+            method="staged",
+            message=f"Failed to commit staged files: {e}",
+            files_modified=[],
+            error_output=str(e),
+        )
+
+    files_changed = list(staged)
+    logger.info(f"Patch applied successfully (staged) - {len(files_changed)} files modified")
+    return ApplyResult(
+        success=True,
+        method="staged",
+        message=f"Patch applied successfully in staged mode ({len(files_changed)} files)",
+        files_modified=files_changed,
+    )
+
+
+def _stage_patch(patch_content: str, workspace: Path) -> Dict[str, StagedFile]:
+    sections = _split_file_sections(patch_content)
+    if not sections:
+        raise _StageError("no 'diff --git' file sections")
+
+    root = workspace.resolve()
+    staged: Dict[str, StagedFile] = {}
+    for section in sections:
+        path, is_new, is_deleted, hunks = _parse_file_section(section)
+        full_path = workspace / path
+        if root not in full_path.resolve().parents:
+            raise _StageError(f"{path}: outside workspace")
+
+        if path in staged:
+            original = staged[path].original
+            current = staged[path].content
+            if current is None:
+                raise _StageError(f"{path}: patched after deletion")
+            if is_new:
+                raise _StageError(f"{path}: created twice")
+        elif is_new:
+            if full_path.exists():
+                raise _StageError(f"{path}: new file already exists")
+            original = current = None
+        else:
+            if not full_path.is_file():
+                raise _StageError(f"{path}: file not found")
+            try:
+                with open(full_path, "r", encoding="utf-8", newline="") as f:
+                    original = current = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                raise _StageError(f"{path}: unreadable ({e})")
+
+        content: Optional[str] = _apply_hunks(current or "", hunks, path)
+        if is_deleted:
+            if content:
+                raise _StageError(f"{path}: deletion leaves content behind")
+            content = None
+        staged[path] = StagedFile(path=path, original=original, content=content)
+
+    return staged
+
+
+def _split_file_sections(patch_content: str) -> List[List[str]]:
+    sections: List[List[str]] = []
+    for line in patch_content.split("\n"):
+        if line.startswith("diff --git"):
+            sections.append([line])
+        elif sections:
+            sections[-1].append(line)
+    return sections
+
+
+def _parse_file_section(lines: List[str]) -> Tuple[str, bool, bool, List[_Hunk]]:
+    parts = lines[0].split()
+    if (
+        len(parts) != 4
+        or not parts[2].startswith("a/")
+        or not parts[3].startswith("b/")
+        or parts[2][2:] != parts[3][2:]
+    ):
+        raise _StageError(f"unsupported diff header: {lines[0]}")
+    path = parts[3][2:]
+
+    is_new = is_deleted = False
+    i = 1
+    while i < len(lines) and not lines[i].startswith("@@"):
+        line = lines[i]
+        if line.startswith(_UNSUPPORTED_HEADER_PREFIXES):
+            raise _StageError(f"{path}: unsupported header '{line}'")
+        if line.startswith("new file mode"):
+            if line.split()[-1] != "100644":
+                raise _StageError(f"{path}: unsupported header '{line}'")
+            is_new = True
+        elif line.startswith("deleted file mode"):
+            is_deleted = True
+        elif line == "--- /dev/null":
+            is_new = True
+        elif line == "+++ /dev/null":
+            is_deleted = True
+        elif line.startswith(("--- ", "+++ ")) and line[4:].strip()[2:] != path:
+            raise _StageError(f"{path}: mismatched file header '{line}'")
+        i += 1
+
+    hunks: List[_Hunk] = []
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if not line.startswith("@@"):
+            if line.strip():
+                raise _StageError(f"{path}: unexpected line outside hunk '{line[:80]}'")
+            continue
+        match = _HUNK_HEADER_RE.match(line)
+        if not match:
+            raise _StageError(f"{path}: malformed hunk header '{line}'")
+        old_count = int(match.group(2)) if match.group(2) is not None else 1
+        new_count = int(match.group(4)) if match.group(4) is not None else 1
+        hunk = _Hunk(old_start=int(match.group(1)), old_count=old_count)
+
+        last_kind = None
+        while i < len(lines):
+            line = lines[i]
+            if line.startswith("\\"):
+                # "\ No newline at end of file" applies to the preceding line
+                if last_kind in ("-", " "):
+                    hunk.old_no_eol = True
+                if last_kind in ("+", " "):
+                    hunk.new_no_eol = True
+                i += 1
+                continue
+            if len(hunk.old_lines) == old_count and len(hunk.new_lines) == new_count:
+                break
+            # An empty line is an empty context line whose leading space was stripped
+            kind, text = (line[0], line[1:]) if line else (" ", "")
+            if kind == " ":
+                hunk.old_lines.append(text)
+                hunk.new_lines.append(text)
+                hunk.trailing += 1
+            elif kind == "-":
+                hunk.old_lines.append(text)
+                hunk.trailing = 0
+            elif kind == "+":
+                hunk.new_lines.append(text)
+                hunk.trailing = 0
+            else:
+                raise _StageError(f"{path}: unexpected hunk line '{line[:80]}'")
+            if len(hunk.old_lines) > old_count or len(hunk.new_lines) > new_count:
+                raise _StageError(f"{path}: hunk longer than its header counts")
+            last_kind = kind
+            i += 1
+
+        if len(hunk.old_lines) != old_count or len(hunk.new_lines) != new_count:
+            raise _StageError(f"{path}: hunk shorter than its header counts")
+        hunks.append(hunk)
+
+    if not hunks and not (is_new or is_deleted):
+        raise _StageError(f"{path}: no hunks")
+    return path, is_new, is_deleted, hunks
+
+
+def _apply_hunks(content: str, hunks: List[_Hunk], path: str) -> str:
+    lines = content.split("\n") if content else []
+    has_eol = True
+    if lines:
+        if lines[-1] == "":
+            lines.pop()
+        else:
+            has_eol = False
+
+    out: List[str] = []
+    pos = 0
+    new_eol = has_eol
+    for hunk in hunks:
+        at = _locate_hunk(lines, hunk, pos)
+        if at is None:
+            raise _StageError(
+                f"{path}: hunk @@ -{hunk.old_start},{hunk.old_count} does not apply exactly"
+            )
+        out.extend(lines[pos:at])
+        out.extend(hunk.new_lines)
+        pos = at + len(hunk.old_lines)
+
+        if pos == len(lines):
+            # Hunk reaches end of file: its markers decide the trailing newline
+            eol_mismatch = hunk.old_no_eol == has_eol if hunk.old_lines else not has_eol
+            if lines and eol_mismatch:
+                raise _StageError(f"{path}: end-of-file newline does not match")
+            new_eol = not hunk.new_no_eol
+        elif hunk.old_no_eol or hunk.new_no_eol:
+            raise _StageError(f"{path}: no-newline marker before end of file")
+
+    out.extend(lines[pos:])
+    if not out:
+        return ""
+    return "\n".join(out) + ("\n" if new_eol else "")
+
+
+def _locate_hunk(lines: List[str], hunk: _Hunk, lower: int) -> Optional[int]:
+    """Find where a hunk applies, honouring git apply's file anchoring.
+
+    A hunk starting at line 0 or 1 may only match at the beginning of the file,
+    and a hunk without trailing context only at the end; other hunks may move to
+    the nearest offset.
+    """
+    size = len(hunk.old_lines)
+    anchors = set()
+    if hunk.old_start <= 1:
+        anchors.add(0)
+    if hunk.trailing == 0:
+        anchors.add(len(lines) - size)
+    if anchors:
+        if len(anchors) > 1:
+            return None
+        at = anchors.pop()
+        return at if at >= lower and lines[at : at + size] == hunk.old_lines else None
+    start = hunk.old_start - 1 if hunk.old_count else hunk.old_start
+    return _find_hunk(lines, hunk.old_lines, start, lower)
+
+
+def _find_hunk(lines: List[str], old_lines: List[str], start: int, lower: int) -> Optional[int]:
+    """Find where old_lines match exactly, preferring the position nearest start."""
+    size = len(old_lines)
+    upper = len(lines) - size
+    if size == 0:
+        return start if lower <= start <= len(lines) else None
+    for offset in range(len(lines) + 1):
+        for candidate in (start - offset, start + offset) if offset else (start,):
+            if lower <= candidate <= upper and lines[candidate : candidate + size] == old_lines:
+                return candidate
+        if start - offset < lower and start + offset > upper:
+            break
+    return None
+
+
+def _remove_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -2070,6 +2070,12 @@ Analyze the pattern and implement a fix to prevent recurrence.
             existing_queue["updated_at"] = queued_at
             queue_path.write_text(json.dumps(existing_queue, indent=2))
 
+            # IMP-PERF-020: Wake a waiting executor loop so it picks the tasks up promptly
+            if new_tasks_added:
+                from autopack.executor.loop_wakeup import notify_loop_wakeup
+
+                notify_loop_wakeup("roadc_tasks")
+
             logger.info(
                 f"[IMP-LOOP-025] Emitted {new_tasks_added} tasks to executor queue "
                 f"(total in queue: {len(existing_queue['tasks'])})"
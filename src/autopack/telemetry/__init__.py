@@ -47,6 +47,7 @@ from autopack.telemetry.model_performance_tracker import (
     ModelPerformance,
     TelemetryDrivenModelOptimizer,
 )
+from autopack.telemetry.outcome_rollups import PhaseOutcomeRollups, RollupConsistencyReport
 from autopack.telemetry.regression_protector import (
     FixStabilityReport,
     IssueFix,
@@ -55,6 +56,7 @@ from autopack.telemetry.regression_protector import (
     RegressionProtector,
     RegressionSeverity,
 )
+from autopack.telemetry.streaming_stats import CorrelationAccumulator, RingBuffer, WindowedStats
 
 __all__ = [
     "TelemetryAnalyzer",
@@ -95,4 +97,11 @@ __all__ = [
     "LoopEffectivenessMetrics",
     "InsightSource",
     "TaskOutcome",
+    # IMP-PERF-021: Hourly phase outcome rollups
+    "PhaseOutcomeRollups",
+    "RollupConsistencyReport",
+    # IMP-PERF-025: Streaming windowed statistics
+    "RingBuffer",
+    "WindowedStats",
+    "CorrelationAccumulator",
 ]
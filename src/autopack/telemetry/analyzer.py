@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from autopack.telemetry.outcome_rollups import PhaseOutcomeRollups
+
 logger = logging.getLogger(__name__)
 
 
@@ -293,6 +295,8 @@ class TelemetryAnalyzer:
         self.db = db_session
         self.memory_service = memory_service
         self.run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        # IMP-PERF-021: Outcome aggregations read hourly rollups instead of raw events
+        self.rollups = PhaseOutcomeRollups(db_session)
         # IMP-LOOP-020: Telemetry-to-memory persistence is MANDATORY and cannot be disabled
         # The feedback loop requires telemetry to flow to memory for self-improvement
 
@@ -321,6 +325,9 @@ class TelemetryAnalyzer:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
 
+        # IMP-PERF-021: Fold events recorded since the last call into the rollups
+        self.rollups.refresh()
+
         # Find ranked issues
         cost_sinks = self._find_cost_sinks(cutoff)
         failure_modes = self._find_failure_modes(cutoff)
@@ -382,7 +389,8 @@ class TelemetryAnalyzer:
                         "suggested_action": f"Increase timeout or optimize {issue.phase_type}",
                     }
                 )
-            bridge.persist_insights(
+            # IMP-PERF-026: One batched write instead of a round trip per insight
+            bridge.persist_insights_batch(
                 flat_issues,
                 run_id=self.run_id,
                 project_id=None,
@@ -404,17 +412,19 @@ class TelemetryAnalyzer:
         Returns:
             List of RankedIssue objects for top 10 cost sinks
         """
+        source, params = self.rollups.outcome_source(cutoff)
         result = self.db.execute(
-            text("""
-            SELECT phase_id, phase_type, SUM(tokens_used) as total_tokens,
-                   AVG(tokens_used) as avg_tokens, COUNT(*) as count
-            FROM phase_outcome_events
-            WHERE timestamp >= :cutoff AND tokens_used IS NOT NULL
+            text(f"""
+            SELECT phase_id, phase_type, SUM(tokens_sum) as total_tokens,
+                   SUM(tokens_sum) * 1.0 / SUM(token_event_count) as avg_tokens,
+                   SUM(token_event_count) as count
+            FROM ({source}) outcomes
+            WHERE token_event_count > 0
             GROUP BY phase_id, phase_type
             ORDER BY total_tokens DESC
             LIMIT 10
         """),
-            {"cutoff": cutoff},
+            params,
         )
 
         return [
@@ -438,17 +448,18 @@ class TelemetryAnalyzer:
         Returns:
             List of RankedIssue objects for top 10 failure modes
         """
+        source, params = self.rollups.outcome_source(cutoff)
         result = self.db.execute(
-            text("""
+            text(f"""
             SELECT phase_id, phase_type, phase_outcome, stop_reason,
-                   COUNT(*) as count
-            FROM phase_outcome_events
-            WHERE timestamp >= :cutoff AND phase_outcome != 'SUCCESS'
+                   SUM(event_count) as count
+            FROM ({source}) outcomes
+            WHERE phase_outcome != 'SUCCESS'
             GROUP BY phase_id, phase_type, phase_outcome, stop_reason
             ORDER BY count DESC
             LIMIT 10
         """),
-            {"cutoff": cutoff},
+            params,
         )
 
         return [
@@ -473,19 +484,20 @@ class TelemetryAnalyzer:
             List of RankedIssue objects for top 10 retry causes
         """
         # Find phases with multiple attempts (retries)
+        source, params = self.rollups.outcome_source(cutoff)
         result = self.db.execute(
-            text("""
+            text(f"""
             SELECT phase_id, phase_type, stop_reason,
-                   COUNT(*) as retry_count,
-                   SUM(CASE WHEN phase_outcome = 'SUCCESS' THEN 1 ELSE 0 END) as success_count
-            FROM phase_outcome_events
-            WHERE timestamp >= :cutoff
+                   SUM(event_count) as retry_count,
+                   SUM(CASE WHEN phase_outcome = 'SUCCESS' THEN event_count ELSE 0 END)
+                       as success_count
+            FROM ({source}) outcomes
             GROUP BY phase_id, phase_type, stop_reason
-            HAVING COUNT(*) > 1
+            HAVING SUM(event_count) > 1
             ORDER BY retry_count DESC
             LIMIT 10
         """),
-            {"cutoff": cutoff},
+            params,
         )
 
         return [
@@ -516,17 +528,19 @@ class TelemetryAnalyzer:
             - avg_tokens: Average tokens used
             - sample_count: Number of samples
         """
+        source, params = self.rollups.outcome_source(cutoff)
         result = self.db.execute(
-            text("""
+            text(f"""
             SELECT phase_type, model_used,
-                   COUNT(*) as total,
-                   SUM(CASE WHEN phase_outcome = 'SUCCESS' THEN 1 ELSE 0 END) as successes,
-                   AVG(tokens_used) as avg_tokens
-            FROM phase_outcome_events
-            WHERE timestamp >= :cutoff AND phase_type IS NOT NULL
+                   SUM(event_count) as total,
+                   SUM(CASE WHEN phase_outcome = 'SUCCESS' THEN event_count ELSE 0 END)
+                       as successes,
+                   SUM(tokens_sum) * 1.0 / NULLIF(SUM(token_event_count), 0) as avg_tokens
+            FROM ({source}) outcomes
+            WHERE phase_type IS NOT NULL
             GROUP BY phase_type, model_used
         """),
-            {"cutoff": cutoff},
+            params,
         )
 
         stats = {}
@@ -1621,7 +1635,7 @@ class TelemetryAnalyzer:
                         f"{'(resolved)' if issue.details.get('resolved') else '(unresolved)'}",
                     }
                 )
-            bridge.persist_insights(
+            bridge.persist_insights_batch(
                 flat_issues,
                 run_id=run_id or self.run_id,
                 project_id=None,
@@ -12,11 +12,15 @@ Detects:
 """
 
 import logging
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from statistics import mean, quantiles, stdev
-from typing import Dict, List, Optional, Tuple
+from statistics import mean
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from .streaming_stats import CorrelationAccumulator, WindowedStats, ewma_step
 
 logger = logging.getLogger(__name__)
 
@@ -71,20 +75,26 @@ class TelemetryAnomalyDetector:
         self.hint_effectiveness_min_threshold = hint_effectiveness_min_threshold
 
         # Rolling windows per phase type
-        self.token_history: Dict[str, List[int]] = {}
-        self.duration_history: Dict[str, List[float]] = {}
-        self.outcome_history: Dict[str, List[bool]] = {}  # True=success
+        # IMP-PERF-025: Array-backed streaming windows; recording is O(1) and
+        # memory per key is bounded by window_size.
+        self.token_history: Dict[str, WindowedStats] = {}
+        self.duration_history: Dict[str, WindowedStats] = {}
+        self.outcome_history: Dict[str, WindowedStats] = {}  # 1=success
 
         # Alerts generated
         self.pending_alerts: List[AnomalyAlert] = []
 
         # New tracking structures for additional signals
         self.model_update_times: Dict[str, datetime] = {}
-        self.policy_effectiveness_history: Dict[str, List[Tuple[datetime, float]]] = {}
+        self.policy_effectiveness_history: Dict[str, Deque[Tuple[datetime, float]]] = {}
         self.phase_correlation_baseline: Dict[Tuple[str, str], float] = {}
-        self.phase_outcomes_for_correlation: Dict[str, List[Tuple[datetime, bool]]] = {}
-        self.retrieval_quality_history: List[Tuple[datetime, float, int]] = []
-        self.hint_effectiveness_history: List[Tuple[datetime, bool, bool]] = []
+        self.phase_outcomes_for_correlation: Dict[str, Deque[Tuple[datetime, bool]]] = {}
+        self.retrieval_quality_history: Deque[Tuple[datetime, float, int]] = deque(
+            maxlen=window_size * 2
+        )
+        self.hint_effectiveness_history: Deque[Tuple[datetime, bool, bool]] = deque(
+            maxlen=window_size * 3
+        )
 
     def record_phase_outcome(
         self,
@@ -97,26 +107,17 @@ class TelemetryAnomalyDetector:
         """Record a phase outcome and check for anomalies."""
         alerts = []
 
-        # Update histories
+        # Update histories (windows evict the oldest sample themselves)
         key = phase_type or phase_id
 
         if key not in self.token_history:
-            self.token_history[key] = []
-            self.duration_history[key] = []
-            self.outcome_history[key] = []
-
-        self.token_history[key].append(tokens_used)
-        self.duration_history[key].append(duration_seconds)
-        self.outcome_history[key].append(success)
-
-        # Trim to window size
-        for hist in [
-            self.token_history[key],
-            self.duration_history[key],
-            self.outcome_history[key],
-        ]:
-            while len(hist) > self.window_size:
-                hist.pop(0)
+            self.token_history[key] = WindowedStats(self.window_size)
+            self.duration_history[key] = WindowedStats(self.window_size, track_order_stats=True)
+            self.outcome_history[key] = WindowedStats(self.window_size, typecode="b")
+
+        self.token_history[key].push(tokens_used)
+        self.duration_history[key].push(duration_seconds)
+        self.outcome_history[key].push(success)
 
         # Check for anomalies (only if we have enough history)
         if len(self.token_history[key]) >= 5:
@@ -137,11 +138,10 @@ class TelemetryAnomalyDetector:
 
     def _check_token_anomaly(self, key: str, current_tokens: int) -> Optional[AnomalyAlert]:
         """Check if current token usage is anomalous."""
-        history = self.token_history[key][:-1]  # Exclude current
-        if not history:
+        baseline = self.token_history[key].mean_excluding_latest()  # Exclude current
+        if baseline is None:
             return None
 
-        baseline = mean(history)
         threshold = baseline * self.token_spike_multiplier
 
         if current_tokens > threshold:
@@ -159,12 +159,12 @@ class TelemetryAnomalyDetector:
 
     def _check_duration_anomaly(self, key: str, current_duration: float) -> Optional[AnomalyAlert]:
         """Check if current duration exceeds p95."""
-        history = self.duration_history[key][:-1]
-        if len(history) < 5:
+        stats = self.duration_history[key]
+        if len(stats) - 1 < 5:  # History excludes current
             return None
 
         try:
-            p95 = quantiles(history, n=20)[18]  # 95th percentile
+            p95 = stats.percentile_excluding_latest(95)
         except Exception as e:
             logger.debug(f"[IMP-TELE-003] Failed to calculate p95 for {key}: {e}")
             return None
@@ -177,18 +177,18 @@ class TelemetryAnomalyDetector:
                 phase_id=key,
                 current_value=current_duration,
                 threshold=p95,
-                baseline=mean(history),
+                baseline=stats.mean_excluding_latest(),
                 recommendation=f"Duration {current_duration:.1f}s exceeds p95 ({p95:.1f}s). Check for: (1) Network issues, (2) Model overload, (3) Large file processing",
             )
         return None
 
     def _check_failure_rate(self, key: str) -> Optional[AnomalyAlert]:
         """Check if failure rate exceeds threshold."""
-        history = self.outcome_history[key]
-        if len(history) < 5:
+        stats = self.outcome_history[key]
+        if len(stats) < 5:
             return None
 
-        failure_rate = 1 - (sum(history) / len(history))
+        failure_rate = 1 - stats.mean
 
         if failure_rate > self.failure_rate_threshold:
             return AnomalyAlert(
@@ -270,15 +270,11 @@ class TelemetryAnomalyDetector:
         """Record a policy execution outcome for effectiveness tracking."""
         ts = timestamp or datetime.utcnow()
         if policy_name not in self.policy_effectiveness_history:
-            self.policy_effectiveness_history[policy_name] = []
+            # Keep only last window_size entries
+            self.policy_effectiveness_history[policy_name] = deque(maxlen=self.window_size)
 
         # Calculate rolling effectiveness rate
-        history = self.policy_effectiveness_history[policy_name]
-        history.append((ts, 1.0 if success else 0.0))
-
-        # Keep only last window_size entries
-        while len(history) > self.window_size:
-            history.pop(0)
+        self.policy_effectiveness_history[policy_name].append((ts, 1.0 if success else 0.0))
 
     def detect_policy_effectiveness_degradation(self) -> Optional[AnomalyAlert]:
         """Detect if policy effectiveness is degrading over time.
@@ -290,6 +286,7 @@ class TelemetryAnomalyDetector:
         for policy_name, history in self.policy_effectiveness_history.items():
             if len(history) < 10:  # Need minimum history
                 continue
+            history = list(history)
 
             # Split into first half (baseline) and second half (recent)
             mid = len(history) // 2
@@ -337,38 +334,70 @@ class TelemetryAnomalyDetector:
         """Record phase outcome for cross-phase correlation analysis."""
         ts = timestamp or datetime.utcnow()
         if phase_type not in self.phase_outcomes_for_correlation:
-            self.phase_outcomes_for_correlation[phase_type] = []
+            # Keep limited history
+            self.phase_outcomes_for_correlation[phase_type] = deque(maxlen=self.window_size * 2)
 
         self.phase_outcomes_for_correlation[phase_type].append((ts, success))
 
-        # Keep limited history
-        while len(self.phase_outcomes_for_correlation[phase_type]) > self.window_size * 2:
-            self.phase_outcomes_for_correlation[phase_type].pop(0)
-
-    def _calculate_correlation(self, outcomes_a: List[bool], outcomes_b: List[bool]) -> float:
+    def _calculate_correlation(
+        self, outcomes_a: Iterable[bool], outcomes_b: Iterable[bool]
+    ) -> float:
         """Calculate Pearson correlation between two outcome sequences."""
-        if len(outcomes_a) != len(outcomes_b) or len(outcomes_a) < 3:
+        outcomes_a, outcomes_b = list(outcomes_a), list(outcomes_b)
+        if len(outcomes_a) != len(outcomes_b):
             return 0.0
 
-        # Convert to float
-        a = [1.0 if x else 0.0 for x in outcomes_a]
-        b = [1.0 if x else 0.0 for x in outcomes_b]
-
-        try:
-            mean_a, mean_b = mean(a), mean(b)
-            std_a, std_b = stdev(a), stdev(b)
+        accumulator = CorrelationAccumulator()
+        for success_a, success_b in zip(outcomes_a, outcomes_b):
+            accumulator.add(1.0 if success_a else 0.0, 1.0 if success_b else 0.0)
+        return self._correlation_from(accumulator)
 
-            if std_a == 0 or std_b == 0:
-                return 0.0
+    def _correlation_from(self, accumulator: CorrelationAccumulator) -> float:
+        """Correlation of accumulated outcome pairs (0.0 with fewer than 3 pairs).
 
-            covariance = sum((a[i] - mean_a) * (b[i] - mean_b) for i in range(len(a)))
-            covariance /= len(a)
-
-            return covariance / (std_a * std_b)
+        Scaled by (n - 1) / n, i.e. population covariance over sample standard
+        deviations, so values stay comparable with existing correlation baselines.
+        """
+        n = accumulator.n
+        if n < 3:
+            return 0.0
+        try:
+            return accumulator.correlation() * (n - 1) / n
         except Exception as e:
             logger.debug(f"[IMP-TELE-003] Failed to calculate correlation: {e}")
             return 0.0
 
+    @staticmethod
+    def _align_outcomes(
+        outcomes_a: Iterable[Tuple[datetime, bool]],
+        outcomes_b: Iterable[Tuple[datetime, bool]],
+        tolerance: timedelta = timedelta(seconds=60),
+    ) -> CorrelationAccumulator:
+        """Pair each outcome in A with the first-recorded outcome in B within tolerance.
+
+        IMP-PERF-025: Outcomes are normally recorded in time order, in which case
+        the match is found by binary search instead of scanning all of B.
+        """
+        outcomes_b = list(outcomes_b)
+        times_b = [ts for ts, _ in outcomes_b]
+        in_time_order = all(earlier <= later for earlier, later in zip(times_b, times_b[1:]))
+
+        accumulator = CorrelationAccumulator()
+        for ts_a, success_a in outcomes_a:
+            match: Optional[bool] = None
+            if in_time_order:
+                index = bisect_right(times_b, ts_a - tolerance)
+                if index < len(times_b) and times_b[index] - ts_a < tolerance:
+                    match = outcomes_b[index][1]
+            else:
+                for ts_b, success_b in outcomes_b:
+                    if abs(ts_a - ts_b) < tolerance:
+                        match = success_b
+                        break
+            if match is not None:
+                accumulator.add(1.0 if success_a else 0.0, 1.0 if match else 0.0)
+        return accumulator
+
     def detect_cross_phase_correlation(self) -> Optional[AnomalyAlert]:
         """Detect anomalous changes in cross-phase correlations.
 
@@ -386,19 +415,13 @@ class TelemetryAnomalyDetector:
                 outcomes_b = self.phase_outcomes_for_correlation[phase_b]
 
                 # Align by timestamp (within 1 minute tolerance)
-                aligned_a, aligned_b = [], []
-                for ts_a, success_a in outcomes_a:
-                    for ts_b, success_b in outcomes_b:
-                        if abs((ts_a - ts_b).total_seconds()) < 60:
-                            aligned_a.append(success_a)
-                            aligned_b.append(success_b)
-                            break
-
-                if len(aligned_a) < 5:
+                aligned = self._align_outcomes(outcomes_a, outcomes_b)
+
+                if aligned.n < 5:
                     continue
 
                 # Calculate current correlation
-                current_corr = self._calculate_correlation(aligned_a, aligned_b)
+                current_corr = self._correlation_from(aligned)
 
                 # Get or set baseline
                 pair_key = (phase_a, phase_b)
@@ -432,7 +455,9 @@ class TelemetryAnomalyDetector:
                     alerts.append(alert)
 
                 # Update baseline with exponential moving average
-                self.phase_correlation_baseline[pair_key] = 0.9 * baseline_corr + 0.1 * current_corr
+                self.phase_correlation_baseline[pair_key] = ewma_step(
+                    baseline_corr, current_corr, alpha=0.1
+                )
 
         if alerts:
             self.pending_alerts.extend(alerts)
@@ -451,12 +476,9 @@ class TelemetryAnomalyDetector:
     ) -> None:
         """Record memory retrieval quality metrics."""
         ts = timestamp or datetime.utcnow()
+        # Bounded deque keeps limited history
         self.retrieval_quality_history.append((ts, relevance_score, hit_count))
 
-        # Keep limited history
-        while len(self.retrieval_quality_history) > self.window_size * 2:
-            self.retrieval_quality_history.pop(0)
-
     def detect_memory_retrieval_quality(self) -> Optional[AnomalyAlert]:
         """Detect degradation in memory retrieval quality.
 
@@ -466,7 +488,7 @@ class TelemetryAnomalyDetector:
             return None
 
         # Calculate recent average relevance
-        recent = self.retrieval_quality_history[-self.window_size :]
+        recent = list(self.retrieval_quality_history)[-self.window_size :]
         avg_relevance = mean([r for _, r, _ in recent])
         avg_hits = mean([h for _, _, h in recent])
 
@@ -538,12 +560,9 @@ class TelemetryAnomalyDetector:
             timestamp: Optional timestamp (defaults to now)
         """
         ts = timestamp or datetime.utcnow()
+        # Bounded deque keeps limited history
         self.hint_effectiveness_history.append((ts, hint_was_applied, phase_succeeded))
 
-        # Keep limited history
-        while len(self.hint_effectiveness_history) > self.window_size * 3:
-            self.hint_effectiveness_history.pop(0)
-
     def detect_hint_effectiveness_regression(self) -> Optional[AnomalyAlert]:
         """Detect if hints are becoming less effective over time.
 
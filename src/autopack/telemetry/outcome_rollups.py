@@ -0,0 +1,401 @@
+"""Hourly rollups of phase outcome telemetry.
+
+IMP-PERF-021: TelemetryAnalyzer.aggregate_telemetry runs four GROUP BY scans
+over phase_outcome_events for the whole analysis window on every call. As
+the event table grows those scans dominate a loop iteration.
+
+PhaseOutcomeRollups maintains phase_outcome_rollups: one row per UTC hour and
+(phase_id, phase_type, model_used, phase_outcome, stop_reason) with event,
+token-event and token counts. Maintenance is incremental: a watermark records
+the highest event id already folded in, and refresh() folds only newer
+events. outcome_source() gives the analyzer a row source that combines:
+
+- rollup rows for whole hours inside the window,
+- raw events for the partial first hour of the window, and
+- raw events past the watermark (not yet folded in),
+
+so results match a raw scan even when a refresh has not run.
+
+Events are folded in id order. An event committed after a higher id was
+already folded in is skipped; check_consistency() detects that, and
+backfill(rebuild=True) repairs it.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_TABLE = "phase_outcome_rollups"
+WATERMARK_TABLE = "telemetry_rollup_watermarks"
+WATERMARK_NAME = "phase_outcome_rollups"
+DEFAULT_REFRESH_BATCH_SIZE = 5000
+
+ROLLUP_DIMENSIONS = ("phase_id", "phase_type", "model_used", "phase_outcome", "stop_reason")
+
+# Row source used when the rollup tables are missing: one row per raw event.
+_RAW_EVENT_SOURCE = """
+    SELECT phase_id, phase_type, model_used, phase_outcome, stop_reason,
+           1 AS event_count,
+           CASE WHEN tokens_used IS NULL THEN 0 ELSE 1 END AS token_event_count,
+           COALESCE(tokens_used, 0) AS tokens_sum
+    FROM phase_outcome_events
+    WHERE timestamp >= :cutoff
+"""
+
+_ROLLUP_SOURCE = """
+    SELECT phase_id, phase_type, model_used, phase_outcome, stop_reason,
+           event_count, token_event_count, tokens_sum
+    FROM phase_outcome_rollups
+    WHERE bucket_start >= :boundary
+    UNION ALL
+    SELECT phase_id, phase_type, model_used, phase_outcome, stop_reason,
+           COUNT(*), COUNT(tokens_used), COALESCE(SUM(tokens_used), 0)
+    FROM phase_outcome_events
+    WHERE timestamp >= :cutoff AND timestamp < :boundary
+    GROUP BY phase_id, phase_type, model_used, phase_outcome, stop_reason
+    UNION ALL
+    SELECT phase_id, phase_type, model_used, phase_outcome, stop_reason,
+           COUNT(*), COUNT(tokens_used), COALESCE(SUM(tokens_used), 0)
+    FROM phase_outcome_events
+    WHERE id > :watermark AND timestamp >= :boundary
+    GROUP BY phase_id, phase_type, model_used, phase_outcome, stop_reason
+"""
+
+
+def hour_bucket(timestamp: datetime) -> datetime:
+    """Truncate a timestamp to its naive-UTC hour bucket."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def first_full_bucket(cutoff: datetime) -> datetime:
+    """Get the start of the first whole hour at or after cutoff.
+
+    Keeps cutoff's timezone awareness so comparisons against stored
+    timestamps behave exactly like comparisons against cutoff itself.
+    """
+    truncated = cutoff.replace(minute=0, second=0, microsecond=0)
+    return truncated if truncated == cutoff else truncated + timedelta(hours=1)
+
+
+@dataclass
+class RollupConsistencyReport:
+    """Result of comparing rollups against the raw event table."""
+
+    watermark: int
+    keys_checked: int
+    mismatches: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        return not self.mismatches
+
+
+class PhaseOutcomeRollups:
+    """Incrementally maintained hourly rollups of phase_outcome_events.
+
+    IMP-PERF-021: Reads go through the caller's session; refreshes write
+    through a separate session on the same engine so they never commit the
+    caller's pending work.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+        self._available: Optional[bool] = None
+
+    def is_available(self) -> bool:
+        """Check (once) whether the rollup tables exist."""
+        if self._available is None:
+            try:
+                inspector = inspect(self.db.get_bind())
+                self._available = inspector.has_table(ROLLUP_TABLE) and inspector.has_table(
+                    WATERMARK_TABLE
+                )
+            except Exception as e:
+                logger.debug(f"[IMP-PERF-021] Rollup tables unavailable: {e}")
+                self._available = False
+        return self._available
+
+    def get_watermark(self, session: Optional[Session] = None) -> int:
+        """Get the highest event id folded into the rollups."""
+        row = (
+            (session or self.db)
+            .execute(
+                text(f"SELECT last_event_id FROM {WATERMARK_TABLE} WHERE name = :name"),
+                {"name": WATERMARK_NAME},
+            )
+            .fetchone()
+        )
+        return int(row[0]) if row else 0
+
+    def outcome_source(self, cutoff: datetime) -> Tuple[str, Dict[str, Any]]:
+        """Get a SQL row source of outcome counts for events at or after cutoff.
+
+        Each row carries the rollup dimensions plus event_count,
+        token_event_count and tokens_sum, so callers aggregate with SUM()
+        instead of COUNT()/SUM(tokens_used). Falls back to one row per raw
+        event when the rollup tables are missing.
+
+        Args:
+            cutoff: Only count events at or after this timestamp
+
+        Returns:
+            Tuple of (SQL subquery, bind parameters)
+        """
+        if not self.is_available():
+            return _RAW_EVENT_SOURCE, {"cutoff": cutoff}
+        return _ROLLUP_SOURCE, {
+            "cutoff": cutoff,
+            "boundary": first_full_bucket(cutoff),
+            "watermark": self.get_watermark(),
+        }
+
+    def refresh(self, batch_size: int = DEFAULT_REFRESH_BATCH_SIZE) -> int:
+        """Fold events newer than the watermark into the rollups.
+
+        Each batch and its watermark advance commit together. The watermark
+        is advanced with a compare-and-set, so a concurrent refresher that
+        got there first makes this one back off instead of double counting.
+
+        Args:
+            batch_size: Maximum events folded per transaction
+
+        Returns:
+            Number of events folded in
+        """
+        if not self.is_available():
+            return 0
+
+        from autopack.models import PhaseOutcomeEvent, PhaseOutcomeRollup, TelemetryRollupWatermark
+
+        folded = 0
+        session = Session(bind=self.db.get_bind())
+        try:
+            while True:
+                state = session.get(TelemetryRollupWatermark, WATERMARK_NAME)
+                if state is None:
+                    session.add(TelemetryRollupWatermark(name=WATERMARK_NAME, last_event_id=0))
+                    session.flush()
+                    last_event_id = 0
+                else:
+                    last_event_id = state.last_event_id
+
+                events = (
+                    session.query(
+                        PhaseOutcomeEvent.id,
+                        PhaseOutcomeEvent.timestamp,
+                        PhaseOutcomeEvent.phase_id,
+                        PhaseOutcomeEvent.phase_type,
+                        PhaseOutcomeEvent.model_used,
+                        PhaseOutcomeEvent.phase_outcome,
+                        PhaseOutcomeEvent.stop_reason,
+                        PhaseOutcomeEvent.tokens_used,
+                    )
+                    .filter(PhaseOutcomeEvent.id > last_event_id)
+                    .order_by(PhaseOutcomeEvent.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not events:
+                    session.commit()
+                    break
+
+                deltas: Dict[Tuple, List[int]] = defaultdict(lambda: [0, 0, 0])
+                for event in events:
+                    if event.timestamp is None:
+                        continue
+                    key = (hour_bucket(event.timestamp),) + tuple(
+                        getattr(event, dim) for dim in ROLLUP_DIMENSIONS
+                    )
+                    delta = deltas[key]
+                    delta[0] += 1
+                    if event.tokens_used is not None:
+                        delta[1] += 1
+                        delta[2] += event.tokens_used
+
+                buckets = {key[0] for key in deltas}
+                existing = {
+                    (row.bucket_start,) + tuple(getattr(row, dim) for dim in ROLLUP_DIMENSIONS): row
+                    for row in session.query(PhaseOutcomeRollup)
+                    .filter(PhaseOutcomeRollup.bucket_start.in_(buckets))
+                    .all()
+                }
+                for key, (event_count, token_event_count, tokens_sum) in deltas.items():
+                    row = existing.get(key)
+                    if row is None:
+                        session.add(
+                            PhaseOutcomeRollup(
+                                bucket_start=key[0],
+                                **dict(zip(ROLLUP_DIMENSIONS, key[1:])),
+                                event_count=event_count,
+                                token_event_count=token_event_count,
+                                tokens_sum=tokens_sum,
+                            )
+                        )
+                    else:
+                        row.event_count += event_count
+                        row.token_event_count += token_event_count
+                        row.tokens_sum += tokens_sum
+
+                advanced = (
+                    session.query(TelemetryRollupWatermark)
+                    .filter(
+                        TelemetryRollupWatermark.name == WATERMARK_NAME,
+                        TelemetryRollupWatermark.last_event_id == last_event_id,
+                    )
+                    .update(
+                        {
+                            "last_event_id": events[-1].id,
+                            "updated_at": datetime.now(timezone.utc),
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                if not advanced:
+                    session.rollback()
+                    logger.debug(
+                        "[IMP-PERF-021] Rollup refresh raced another refresher, backing off"
+                    )
+                    break
+
+                session.commit()
+                folded += len(events)
+                if len(events) < batch_size:
+                    break
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"[IMP-PERF-021] Rollup refresh failed: {e}")
+        finally:
+            session.close()
+
+        if folded:
+            logger.debug(f"[IMP-PERF-021] Folded {folded} phase outcome events into rollups")
+        return folded
+
+    def backfill(self, rebuild: bool = False, batch_size: int = DEFAULT_REFRESH_BATCH_SIZE) -> int:
+        """Fold every outstanding event into the rollups.
+
+        Args:
+            rebuild: Discard existing rollups and the watermark first
+            batch_size: Maximum events folded per transaction
+
+        Returns:
+            Number of events folded in
+        """
+        if not self.is_available():
+            raise RuntimeError(
+                f"Rollup tables '{ROLLUP_TABLE}'/'{WATERMARK_TABLE}' do not exist; "
+                "run database migrations first"
+            )
+
+        if rebuild:
+            session = Session(bind=self.db.get_bind())
+            try:
+                session.execute(text(f"DELETE FROM {ROLLUP_TABLE}"))
+                session.execute(
+                    text(f"DELETE FROM {WATERMARK_TABLE} WHERE name = :name"),
+                    {"name": WATERMARK_NAME},
+                )
+                session.commit()
+            finally:
+                session.close()
+            logger.info("[IMP-PERF-021] Cleared phase outcome rollups for rebuild")
+
+        total = 0
+        while True:
+            folded = self.refresh(batch_size=batch_size)
+            total += folded
+            if folded < batch_size:
+                break
+        logger.info(f"[IMP-PERF-021] Backfilled {total} phase outcome events into rollups")
+        return total
+
+    def check_consistency(self, window_days: Optional[int] = None) -> RollupConsistencyReport:
+        """Compare rollup totals against a raw scan of the events folded in.
+
+        Args:
+            window_days: Only compare whole hours in the last N days (None compares all)
+
+        Returns:
+            RollupConsistencyReport listing every key whose totals differ
+        """
+        if not self.is_available():
+            raise RuntimeError(f"Rollup table '{ROLLUP_TABLE}' does not exist")
+
+        dims = ", ".join(ROLLUP_DIMENSIONS)
+        watermark = self.get_watermark()
+        params: Dict[str, Any] = {"watermark": watermark}
+        rollup_filter = ""
+        raw_filter = ""
+        if window_days is not None:
+            # Compare whole buckets on both sides, including the oldest one
+            params["boundary"] = hour_bucket(
+                datetime.now(timezone.utc) - timedelta(days=window_days)
+            )
+            rollup_filter = "WHERE bucket_start >= :boundary"
+            raw_filter = "AND timestamp >= :boundary"
+
+        rollup_rows = self.db.execute(
+            text(f"""
+            SELECT {dims}, SUM(event_count) AS event_count,
+                   SUM(token_event_count) AS token_event_count, SUM(tokens_sum) AS tokens_sum
+            FROM {ROLLUP_TABLE}
+            {rollup_filter}
+            GROUP BY {dims}
+        """),
+            params,
+        )
+        raw_rows = self.db.execute(
+            text(f"""
+            SELECT {dims}, COUNT(*) AS event_count,
+                   COUNT(tokens_used) AS token_event_count,
+                   COALESCE(SUM(tokens_used), 0) AS tokens_sum
+            FROM phase_outcome_events
+            WHERE id <= :watermark AND timestamp IS NOT NULL {raw_filter}
+            GROUP BY {dims}
+        """),
+            params,
+        )
+
+        def _totals(rows) -> Dict[Tuple, Tuple[int, int, int]]:
+            return {
+                tuple(getattr(row, dim) for dim in ROLLUP_DIMENSIONS): (
+                    int(row.event_count or 0),
+                    int(row.token_event_count or 0),
+                    int(row.tokens_sum or 0),
+                )
+                for row in rows
+            }
+
+        rollup_totals = _totals(rollup_rows)
+        raw_totals = _totals(raw_rows)
+        keys = set(rollup_totals) | set(raw_totals)
+        mismatches = []
+        for key in keys:
+            rollup_value = rollup_totals.get(key, (0, 0, 0))
+            raw_value = raw_totals.get(key, (0, 0, 0))
+            if rollup_value != raw_value:
+                mismatches.append(
+                    {
+                        "key": dict(zip(ROLLUP_DIMENSIONS, key)),
+                        "rollup": dict(zip(("events", "token_events", "tokens"), rollup_value)),
+                        "raw": dict(zip(("events", "token_events", "tokens"), raw_value)),
+                    }
+                )
+
+        if mismatches:
+            logger.warning(
+                f"[IMP-PERF-021] Rollup consistency check found {len(mismatches)} "
+                f"mismatched key(s) out of {len(keys)}"
+            )
+        return RollupConsistencyReport(
+            watermark=watermark, keys_checked=len(keys), mismatches=mismatches
+        )
@@ -0,0 +1,305 @@
+"""Streaming windowed statistics for telemetry (IMP-PERF-025).
+
+Bounded-memory building blocks used by TelemetryAnomalyDetector so that
+recording an outcome costs O(1) instead of re-scanning Python lists:
+
+- RingBuffer: fixed-capacity circular buffer backed by an ``array``
+- WindowedStats: rolling mean/variance (Welford add/remove), EWMA, and an
+  order-statistics view of the window that excludes the newest sample
+- CorrelationAccumulator: single-pass (co)variance sums for Pearson correlation
+"""
+
+import math
+from array import array
+from bisect import bisect_left, insort
+from typing import Iterator, List, Optional, Sequence, Union
+
+Number = Union[int, float]
+
+
+def ewma_step(previous: Optional[float], value: float, alpha: float) -> float:
+    """Advance an exponentially weighted moving average by one sample.
+
+    Args:
+        previous: Current average, or None if no samples have been seen
+        value: New sample
+        alpha: Weight of the new sample (0 < alpha <= 1)
+
+    Returns:
+        Updated average
+    """
+    if previous is None:
+        return float(value)
+    return (1.0 - alpha) * previous + alpha * value
+
+
+def exclusive_quantile(sorted_data: Sequence[Number], i: int, n: int) -> float:
+    """Return the i-th of n cut points of sorted data.
+
+    Matches ``statistics.quantiles(data, n=n, method="exclusive")[i - 1]``
+    without re-sorting the data.
+
+    Raises:
+        ValueError: If fewer than two data points are given
+    """
+    ld = len(sorted_data)
+    if ld < 2:
+        raise ValueError("must have at least two data points")
+    m = ld + 1
+    j = i * m // n
+    j = 1 if j < 1 else ld - 1 if j > ld - 1 else j
+    delta = i * m - j * n
+    return (sorted_data[j - 1] * (n - delta) + sorted_data[j] * delta) / n
+
+
+class RingBuffer:
+    """Fixed-capacity circular buffer stored in a typed ``array``.
+
+    Supports ``len()``, iteration and indexing (oldest sample first) so it
+    can stand in for the bounded lists it replaces.
+    """
+
+    __slots__ = ("capacity", "_data", "_start", "_size")
+
+    def __init__(self, capacity: int, typecode: str = "d"):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._start = 0
+        self._size = 0
+
+    def append(self, value: Number) -> Optional[Number]:
+        """Append a value, returning the evicted oldest value when full."""
+        if self._size < self.capacity:
+            self._data[(self._start + self._size) % self.capacity] = value
+            self._size += 1
+            return None
+        evicted = self._data[self._start]
+        self._data[self._start] = value
+        self._start = (self._start + 1) % self.capacity
+        return evicted
+
+    def latest(self) -> Optional[Number]:
+        """Return the most recently appended value."""
+        if not self._size:
+            return None
+        return self._data[(self._start + self._size - 1) % self.capacity]
+
+    def to_list(self) -> List[Number]:
+        """Return the buffered values, oldest first."""
+        end = self._start + self._size
+        if end <= self.capacity:
+            return self._data[self._start : end].tolist()
+        return self._data[self._start :].tolist() + self._data[: end - self.capacity].tolist()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Number]:
+        for offset in range(self._size):
+            yield self._data[(self._start + offset) % self.capacity]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_list()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return self._data[(self._start + index) % self.capacity]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, values={self.to_list()!r})"
+
+
+class WindowedStats:
+    """Rolling statistics over the last ``capacity`` samples.
+
+    Every push is O(1) for the moments: the running sum gives the mean
+    (exact for integer samples), Welford add/remove updates keep the
+    variance numerically stable, and both are recomputed from the window
+    once per ``capacity`` evictions to stop floating point drift.
+
+    With ``track_order_stats=True`` a sorted copy of the window *excluding
+    the newest sample* is maintained (O(log W) search + small memmove), so
+    percentile baselines can be read without sorting.
+    """
+
+    __slots__ = (
+        "values",
+        "ewma",
+        "ewma_alpha",
+        "_sum",
+        "_m2",
+        "_evictions",
+        "_sorted_previous",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        typecode: str = "d",
+        ewma_alpha: Optional[float] = None,
+        track_order_stats: bool = False,
+    ):
+        self.values = RingBuffer(capacity, typecode)
+        self.ewma: Optional[float] = None
+        self.ewma_alpha = ewma_alpha if ewma_alpha is not None else 2.0 / (capacity + 1)
+        self._sum: Number = 0
+        self._m2 = 0.0
+        self._evictions = 0
+        self._sorted_previous: Optional[List[Number]] = [] if track_order_stats else None
+
+    def push(self, value: Number) -> None:
+        """Add a sample, evicting the oldest one when the window is full."""
+        previous_latest = self.values.latest()
+        evicted = self.values.append(value)
+
+        if evicted is not None:
+            self._remove_moment(evicted, len(self.values))
+        self._add_moment(value, len(self.values))
+        self.ewma = ewma_step(self.ewma, value, self.ewma_alpha)
+
+        if (
+            self._sorted_previous is not None
+            and previous_latest is not None
+            and self.values.capacity > 1
+        ):
+            # Window-minus-newest loses the evicted sample and gains the old newest
+            if evicted is not None:
+                del self._sorted_previous[bisect_left(self._sorted_previous, evicted)]
+            insort(self._sorted_previous, previous_latest)
+
+        if evicted is not None:
+            self._evictions += 1
+            if self._evictions >= self.values.capacity:
+                self._resync()
+
+    def _add_moment(self, value: Number, count_after: int) -> None:
+        old_mean = self._sum / (count_after - 1) if count_after > 1 else 0.0
+        self._sum += value
+        new_mean = self._sum / count_after
+        self._m2 += (value - old_mean) * (value - new_mean)
+
+    def _remove_moment(self, value: Number, count_before: int) -> None:
+        old_mean = self._sum / count_before
+        self._sum -= value
+        remaining = count_before - 1
+        new_mean = self._sum / remaining if remaining else 0.0
+        self._m2 = max(0.0, self._m2 - (value - old_mean) * (value - new_mean))
+
+    def _resync(self) -> None:
+        values = self.values.to_list()
+        self._evictions = 0
+        if values and all(isinstance(v, int) for v in values):
+            self._sum = sum(values)
+        else:
+            self._sum = math.fsum(values)
+        mean = self._sum / len(values) if values else 0.0
+        self._m2 = math.fsum((v - mean) ** 2 for v in values)
+
+    @property
+    def count(self) -> int:
+        return len(self.values)
+
+    @property
+    def total(self) -> Number:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the window (0.0 with fewer than two samples)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def mean_excluding_latest(self) -> Optional[float]:
+        """Mean of the window without its newest sample (None if empty)."""
+        if self.count < 2:
+            return None
+        return (self._sum - self.values.latest()) / (self.count - 1)
+
+    def percentile_excluding_latest(self, percentile: int) -> float:
+        """Exclusive-method percentile of the window without its newest sample.
+
+        Equivalent to ``statistics.quantiles(window[:-1], n=100)[percentile - 1]``
+        (computed with the reduced fraction so results match exactly).
+
+        Raises:
+            ValueError: If order statistics are not tracked or data is insufficient
+        """
+        if self._sorted_previous is None:
+            raise ValueError("order statistics are not tracked for this window")
+        divisor = math.gcd(percentile, 100)
+        return exclusive_quantile(self._sorted_previous, percentile // divisor, 100 // divisor)
+
+    # Sequence protocol, so a WindowedStats can be read like the list it replaced
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Number]:
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __repr__(self) -> str:
+        return (
+            f"WindowedStats(count={self.count}, mean={self.mean:.4g}, "
+            f"stdev={self.stdev:.4g}, ewma={self.ewma})"
+        )
+
+
+class CorrelationAccumulator:
+    """Single-pass sums for the correlation of two paired sequences."""
+
+    __slots__ = ("n", "sum_a", "sum_b", "sum_aa", "sum_bb", "sum_ab")
+
+    def __init__(self):
+        self.n = 0
+        self.sum_a = 0.0
+        self.sum_b = 0.0
+        self.sum_aa = 0.0
+        self.sum_bb = 0.0
+        self.sum_ab = 0.0
+
+    def add(self, a: float, b: float) -> None:
+        self.n += 1
+        self.sum_a += a
+        self.sum_b += b
+        self.sum_aa += a * a
+        self.sum_bb += b * b
+        self.sum_ab += a * b
+
+    def remove(self, a: float, b: float) -> None:
+        self.n -= 1
+        self.sum_a -= a
+        self.sum_b -= b
+        self.sum_aa -= a * a
+        self.sum_bb -= b * b
+        self.sum_ab -= a * b
+
+    def centered_sums(self):
+        """Return (S_aa, S_bb, S_ab): sums of centered squares and products."""
+        if self.n == 0:
+            return 0.0, 0.0, 0.0
+        s_aa = max(0.0, self.sum_aa - self.sum_a * self.sum_a / self.n)
+        s_bb = max(0.0, self.sum_bb - self.sum_b * self.sum_b / self.n)
+        s_ab = self.sum_ab - self.sum_a * self.sum_b / self.n
+        return s_aa, s_bb, s_ab
+
+    def correlation(self) -> float:
+        """Pearson correlation coefficient (0.0 if either side is constant)."""
+        if self.n < 2:
+            return 0.0
+        s_aa, s_bb, s_ab = self.centered_sums()
+        if s_aa <= 0.0 or s_bb <= 0.0:
+            return 0.0
+        return s_ab / math.sqrt(s_aa * s_bb)
@@ -104,6 +104,82 @@ class TelemetryToMemoryBridge:
 
         return persisted_count
 
+    def persist_insights_batch(
+        self, ranked_issues: List[Dict[str, Any]], run_id: str, project_id: Optional[str] = None
+    ) -> int:
+        """Persist ranked issues to memory service in a single batched write.
+
+        IMP-PERF-026: Same contract as persist_insights, but all new insights go
+        through MemoryService.write_telemetry_insights_batch, so deduplication
+        embeds and searches once per batch and storage is one upsert per
+        collection instead of a round trip per insight.
+
+        Args:
+            ranked_issues: List of ranked issues from TelemetryAnalyzer
+            run_id: Current run ID for correlation
+            project_id: Optional project ID for namespacing
+
+        Returns:
+            Number of insights persisted (or queued if circuit is open)
+        """
+        if not self.memory_service or not self.memory_service.enabled:
+            return 0
+
+        # IMP-REL-011: Try to drain fallback queue first if circuit is available
+        if self._circuit_breaker.is_available() and self._fallback_queue:
+            self._drain_fallback_queue()
+
+        insights: List[Dict[str, Any]] = []
+        insight_keys: List[str] = []
+        for issue in ranked_issues:
+            insight = self._convert_to_insight(issue, run_id)
+            insight_key = f"{insight['insight_type']}:{insight['insight_id']}"
+
+            # Deduplication: don't persist same insight multiple times
+            if insight_key in self._persisted_insights or insight_key in insight_keys:
+                continue
+            insights.append(insight)
+            insight_keys.append(insight_key)
+
+        if not insights:
+            return 0
+
+        try:
+            self._circuit_breaker.call(self._persist_batch_with_retry, insights, project_id)
+        except CircuitBreakerOpenError:
+            # Circuit is open, queue for later
+            logger.warning(f"[IMP-REL-011] Circuit breaker open, queuing {len(insights)} insights")
+            for insight in insights:
+                self._queue_to_fallback(insight, project_id)
+        except Exception as e:
+            # Unexpected error after retries
+            logger.error(f"[IMP-REL-011] Failed to persist insight batch after retries: {e}")
+            for insight in insights:
+                self._queue_to_fallback(insight, project_id)
+
+        self._persisted_insights.update(insight_keys)
+        return len(insights)
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    def _persist_batch_with_retry(
+        self, insights: List[Dict[str, Any]], project_id: Optional[str] = None
+    ) -> None:
+        """Persist a batch of insights with retry logic.
+
+        IMP-REL-011: Implements exponential backoff retry.
+
+        Args:
+            insights: Insight data to persist
+            project_id: Optional project ID
+
+        Raises:
+            Exception: If persistence fails
+        """
+        if not self.memory_service:
+            return
+
+        self.memory_service.write_telemetry_insights_batch(insights, project_id)
+
     def _convert_to_insight(self, issue: Dict[str, Any], run_id: str) -> Dict[str, Any]:
         """Convert issue dict to TelemetryInsight object."""
         insight_type = issue.get("issue_type", "unknown")
@@ -0,0 +1,510 @@
+"""Buffered, batched LLM usage recording.
+
+IMP-PERF-022: Recording usage used to cost a synchronous INSERT + COMMIT +
+SELECT on the LLM call path, plus a read-modify-write of DoctorUsageStats for
+Doctor calls. Under parallel phases that is a DB round trip per LLM call and
+a contention point on the connection pool.
+
+BufferedUsageRecorder takes UsageEventData on a bounded in-memory queue and
+returns immediately. A background flusher bulk-inserts events every
+``flush_events`` events or ``flush_interval_ms`` milliseconds (whichever
+comes first) and folds Doctor stats for the whole batch into one update per
+run.
+
+Events that cannot reach the database are appended to a JSONL spill file:
+events submitted while the queue is full, batches whose flush failed, and
+events still queued at shutdown. The spill file is replayed when the
+recorder starts and after the next successful flush.
+
+Rows land in the same tables as usage_recorder.record_usage, so the existing
+query functions (get_doctor_stats, aggregate_usage_by_run, ...) work
+unchanged. They see buffered events after the next flush; call flush() first
+when read-your-writes is required.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .usage_recorder import DoctorUsageStats, LlmUsageEvent, UsageEventData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_EVENTS = 100
+DEFAULT_FLUSH_INTERVAL_MS = 500
+DEFAULT_MAX_QUEUE_SIZE = 10000
+SPILL_FILENAME = ".usage_spill.jsonl"
+
+
+def default_spill_file() -> Path:
+    """Get the usage spill file under the autonomous runs directory."""
+    from autopack.config import settings
+
+    return Path(settings.autonomous_runs_dir) / SPILL_FILENAME
+
+
+def _event_row(event: UsageEventData, created_at: datetime) -> Dict[str, Any]:
+    """Build an llm_usage_events row for event."""
+    return {
+        "provider": event.provider,
+        "model": event.model,
+        "run_id": event.run_id,
+        "phase_id": event.phase_id,
+        "role": event.role,
+        "total_tokens": event.total_tokens,
+        "prompt_tokens": event.prompt_tokens,
+        "completion_tokens": event.completion_tokens,
+        "created_at": created_at,
+        "is_doctor_call": event.is_doctor_call,
+        "doctor_model": event.doctor_model,
+        "doctor_action": event.doctor_action,
+        "phase_type": event.phase_type,
+        "intent": event.intent,
+    }
+
+
+class _FlushRequest:
+    """Queue marker asking the flusher to write everything queued before it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BufferedUsageRecorder:
+    """Asynchronous usage recorder with a bounded queue and batched writes.
+
+    IMP-PERF-022: submit() never touches the database.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        flush_events: int = DEFAULT_FLUSH_EVENTS,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        spill_file: Optional[Path] = None,
+    ):
+        """Initialize the recorder (call start() to begin flushing).
+
+        Args:
+            session_factory: Creates DB sessions for flushes (defaults to SessionLocal)
+            flush_events: Flush once this many events are buffered
+            flush_interval_ms: Flush buffered events at least this often
+            max_queue_size: Queue capacity; overflow goes to the spill file
+            spill_file: JSONL file for events that could not be written
+        """
+        if session_factory is None:
+            from .database import SessionLocal
+
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self.flush_events = max(1, int(flush_events))
+        self.flush_interval = max(1, int(flush_interval_ms)) / 1000.0
+        self.spill_file = spill_file
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(max_queue_size)))
+        self._spill_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._spill_pending = False
+        self._atexit_registered = False
+
+        # Metrics
+        self._events_submitted = 0
+        self._events_flushed = 0
+        self._flushes = 0
+        self._flush_failures = 0
+        self._events_spilled = 0
+        self._events_replayed = 0
+        self._max_queue_depth = 0
+        self._total_flush_s = 0.0
+        self._max_flush_s = 0.0
+        self._last_flush_s: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Replay any spilled events and start the background flusher."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._spill_pending = self._has_spill()
+        self._thread = threading.Thread(target=self._run, name="usage-flusher", daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+        logger.info(
+            f"[IMP-PERF-022] Buffered usage recorder started "
+            f"(flush_events={self.flush_events}, flush_interval={self.flush_interval * 1000:.0f}ms)"
+        )
+
+    def submit(self, event: UsageEventData) -> bool:
+        """Queue a usage event for the next batch.
+
+        Args:
+            event: Usage event data
+
+        Returns:
+            True if the event was queued or spilled, False if it was lost
+        """
+        row = _event_row(event, datetime.now(timezone.utc))
+        with self._stats_lock:
+            self._events_submitted += 1
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("[IMP-PERF-022] Usage queue full, spilling event to disk")
+            return self._spill([row])
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._max_queue_depth = max(self._max_queue_depth, depth)
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until every event submitted so far has been written.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the flusher confirmed the write within timeout
+        """
+        if not self.running:
+            return self._drain_inline() == 0
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush buffered events and stop the flusher.
+
+        Events that cannot be written before timeout are spilled to disk.
+
+        Args:
+            timeout: Maximum seconds to wait for the final flush
+        """
+        if self._atexit_registered:
+            try:
+                atexit.unregister(self.close)
+            except Exception:
+                pass  # May fail if atexit is already running
+            self._atexit_registered = False
+
+        thread = self._thread
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+            self._thread = None
+            if thread.is_alive():
+                logger.warning("[IMP-PERF-022] Usage flusher did not stop in time")
+
+        leftover = self._drain_inline()
+        if leftover:
+            logger.warning(f"[IMP-PERF-022] Spilled {leftover} usage events on shutdown")
+
+    def _run(self) -> None:
+        """Flusher loop: batch events by count or age and write them."""
+        if self._spill_pending:
+            self._replay_spill()
+
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+
+            batch: List[Dict[str, Any]] = []
+            requests: List[_FlushRequest] = []
+            item = first
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, _FlushRequest):
+                    requests.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.flush_events:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 and not self._stop.is_set():
+                    break
+                try:
+                    item = (
+                        self._queue.get_nowait()
+                        if self._stop.is_set()
+                        else self._queue.get(timeout=remaining)
+                    )
+                except queue.Empty:
+                    break
+
+            if batch and self._write_or_spill(batch) and self._spill_pending:
+                self._replay_spill()
+            for request in requests:
+                request.done.set()
+
+    def _drain_inline(self) -> int:
+        """Write whatever is queued from the calling thread.
+
+        Returns:
+            Number of events that had to be spilled
+        """
+        batch: List[Dict[str, Any]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            else:
+                batch.append(item)
+
+        spilled = 0
+        for start in range(0, len(batch), self.flush_events):
+            chunk = batch[start : start + self.flush_events]
+            if not self._write_or_spill(chunk):
+                spilled += len(chunk)
+        return spilled
+
+    def _write_or_spill(self, rows: List[Dict[str, Any]]) -> bool:
+        """Write rows, spilling them to disk if the write fails."""
+        started = time.monotonic()
+        try:
+            self._write_batch(rows)
+        except Exception as e:
+            with self._stats_lock:
+                self._flush_failures += 1
+            logger.warning(f"[IMP-PERF-022] Usage flush of {len(rows)} events failed: {e}")
+            self._spill(rows)
+            return False
+
+        elapsed = time.monotonic() - started
+        with self._stats_lock:
+            self._flushes += 1
+            self._events_flushed += len(rows)
+            self._total_flush_s += elapsed
+            self._max_flush_s = max(self._max_flush_s, elapsed)
+            self._last_flush_s = elapsed
+        logger.debug(f"[IMP-PERF-022] Flushed {len(rows)} usage events in {elapsed * 1000:.1f}ms")
+        return True
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Bulk insert usage rows and fold Doctor stats in one transaction.
+
+        Doctor escalations are counted exactly as update_doctor_stats does
+        one event at a time: a strong call is an escalation if a cheap Doctor
+        call for the same run and phase was recorded before it.
+        """
+        session = self._session_factory()
+        try:
+            doctor_rows = [r for r in rows if r["is_doctor_call"] and r["run_id"]]
+            cheap_seen = set()
+            strong_pairs = {
+                (r["run_id"], r["phase_id"]) for r in doctor_rows if r["doctor_model"] == "strong"
+            }
+            if strong_pairs:
+                prior_cheap = (
+                    session.query(LlmUsageEvent.run_id, LlmUsageEvent.phase_id)
+                    .filter(
+                        LlmUsageEvent.run_id.in_({run_id for run_id, _ in strong_pairs}),
+                        LlmUsageEvent.is_doctor_call,
+                        LlmUsageEvent.doctor_model == "cheap",
+                    )
+                    .distinct()
+                )
+                cheap_seen = {(run_id, phase_id) for run_id, phase_id in prior_cheap}
+
+            session.execute(insert(LlmUsageEvent), rows)
+
+            deltas: Dict[str, Dict[str, Any]] = defaultdict(
+                lambda: {
+                    "calls": 0,
+                    "cheap": 0,
+                    "strong": 0,
+                    "escalations": 0,
+                    "actions": Counter(),
+                }
+            )
+            for row in doctor_rows:
+                delta = deltas[row["run_id"]]
+                pair = (row["run_id"], row["phase_id"])
+                delta["calls"] += 1
+                if row["doctor_model"] == "cheap":
+                    delta["cheap"] += 1
+                    cheap_seen.add(pair)
+                elif row["doctor_model"] == "strong":
+                    delta["strong"] += 1
+                    if pair in cheap_seen:
+                        delta["escalations"] += 1
+                if row["doctor_action"]:
+                    delta["actions"][row["doctor_action"]] += 1
+
+            if deltas:
+                existing = {
+                    stats.run_id: stats
+                    for stats in session.query(DoctorUsageStats)
+                    .filter(DoctorUsageStats.run_id.in_(list(deltas)))
+                    .all()
+                }
+                now = datetime.now(timezone.utc)
+                for run_id, delta in deltas.items():
+                    stats = existing.get(run_id)
+                    if stats is None:
+                        stats = DoctorUsageStats(
+                            run_id=run_id,
+                            doctor_calls_total=0,
+                            doctor_cheap_calls=0,
+                            doctor_strong_calls=0,
+                            doctor_escalations=0,
+                            doctor_actions={},
+                        )
+                        session.add(stats)
+                    stats.doctor_calls_total += delta["calls"]
+                    stats.doctor_cheap_calls += delta["cheap"]
+                    stats.doctor_strong_calls += delta["strong"]
+                    stats.doctor_escalations += delta["escalations"]
+                    actions = dict(stats.doctor_actions or {})
+                    for action, count in delta["actions"].items():
+                        actions[action] = actions.get(action, 0) + count
+                    stats.doctor_actions = actions
+                    stats.updated_at = now
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _has_spill(self) -> bool:
+        return self.spill_file is not None and self.spill_file.exists()
+
+    def _spill(self, rows: List[Dict[str, Any]]) -> bool:
+        """Append rows to the spill file."""
+        if self.spill_file is None:
+            logger.error(f"[IMP-PERF-022] No spill file configured, dropping {len(rows)} events")
+            return False
+        try:
+            with self._spill_lock:
+                self.spill_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spill_file, "a", encoding="utf-8") as f:
+                    for row in rows:
+                        record = dict(row, created_at=row["created_at"].isoformat())
+                        f.write(json.dumps(record) + "\n")
+                    f.flush()
+                self._spill_pending = True
+            with self._stats_lock:
+                self._events_spilled += len(rows)
+            return True
+        except OSError as e:
+            logger.error(f"[IMP-PERF-022] Failed to spill {len(rows)} usage events: {e}")
+            return False
+
+    def _replay_spill(self) -> None:
+        """Write spilled events back to the database."""
+        with self._spill_lock:
+            if not self._has_spill():
+                self._spill_pending = False
+                return
+            try:
+                lines = self.spill_file.read_text(encoding="utf-8").splitlines()
+                self.spill_file.unlink()
+            except OSError as e:
+                logger.warning(f"[IMP-PERF-022] Could not read usage spill file: {e}")
+                return
+            self._spill_pending = False
+
+        rows = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+                record["created_at"] = datetime.fromisoformat(record["created_at"])
+                rows.append(record)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"[IMP-PERF-022] Skipping corrupt spilled usage event: {e}")
+
+        for start in range(0, len(rows), self.flush_events):
+            chunk = rows[start : start + self.flush_events]
+            if not self._write_or_spill(chunk):
+                # Database still unavailable: the rest stays on disk for the next attempt
+                self._spill(rows[start + self.flush_events :])
+                return
+            with self._stats_lock:
+                self._events_replayed += len(chunk)
+        if rows:
+            logger.info(f"[IMP-PERF-022] Replayed {len(rows)} spilled usage events")
+
+    def get_stats(self) -> Dict:
+        """Get queue and flush metrics.
+
+        Returns:
+            Dictionary with queue depth, event counts and flush latency in milliseconds
+        """
+        with self._stats_lock:
+            return {
+                "running": self.running,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "events_submitted": self._events_submitted,
+                "events_flushed": self._events_flushed,
+                "flushes": self._flushes,
+                "flush_failures": self._flush_failures,
+                "events_spilled": self._events_spilled,
+                "events_replayed": self._events_replayed,
+                "avg_flush_latency_ms": (
+                    round(self._total_flush_s / self._flushes * 1000, 2) if self._flushes else 0.0
+                ),
+                "max_flush_latency_ms": round(self._max_flush_s * 1000, 2),
+                "last_flush_latency_ms": (
+                    round(self._last_flush_s * 1000, 2) if self._last_flush_s is not None else None
+                ),
+            }
+
+
+_recorder: Optional[BufferedUsageRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_usage_buffer() -> BufferedUsageRecorder:
+    """Get the process-wide buffered recorder, starting it on first use."""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            from .config import settings
+
+            _recorder = BufferedUsageRecorder(
+                flush_events=getattr(settings, "usage_buffer_flush_events", DEFAULT_FLUSH_EVENTS),
+                flush_interval_ms=getattr(
+                    settings, "usage_buffer_flush_interval_ms", DEFAULT_FLUSH_INTERVAL_MS
+                ),
+                spill_file=default_spill_file(),
+            )
+            _recorder.start()
+        return _recorder
+
+
+def shutdown_usage_buffer(timeout: float = 10.0) -> None:
+    """Flush and stop the process-wide buffered recorder, if started."""
+    global _recorder
+    with _recorder_lock:
+        recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.close(timeout)
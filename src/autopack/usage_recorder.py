@@ -1,14 +1,31 @@
 """LLM usage tracking for token consumption monitoring"""
 
+import copy
+import threading
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
-
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Index, Integer, String
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    case,
+    func,
+)
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from .database import Base
+from .llm_response_cache import CACHED_ROLE_SUFFIX
 
 # Role constants for usage tracking
 BUILDER_ROLE = "builder"
@@ -286,12 +303,11 @@ def update_doctor_stats(db: Session, event: UsageEventData) -> None:
             stats.doctor_escalations += 1
 
     # Update action distribution
+    # Reassign a copy: in-place changes to a JSON column are not persisted
     if event.doctor_action:
-        if stats.doctor_actions is None:
-            stats.doctor_actions = {}
-        stats.doctor_actions[event.doctor_action] = (
-            stats.doctor_actions.get(event.doctor_action, 0) + 1
-        )
+        actions = dict(stats.doctor_actions or {})
+        actions[event.doctor_action] = actions.get(event.doctor_action, 0) + 1
+        stats.doctor_actions = actions
 
     stats.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -333,6 +349,148 @@ def get_doctor_stats(db: Session, run_id: str) -> Optional[Dict]:
     }
 
 
+def get_llm_response_cache_stats(db: Session, run_id: Optional[str] = None) -> Dict:
+    """
+    Get LLM response cache hits and misses per role.
+
+    IMP-PERF-028: Cache hits are recorded as zero-token events with a
+    "<role>:cached" role; every other event for a cacheable role is a real
+    (uncached) call. Dual-audit roles (auditor:primary, ...) count as auditor
+    misses since those calls bypass the cache.
+
+    Args:
+        db: Database session
+        run_id: Optional run identifier (all runs if None)
+
+    Returns:
+        Dictionary with per-role hits, misses and hit_rate, plus totals
+    """
+    query = db.query(LlmUsageEvent.role, func.count(LlmUsageEvent.id))
+    if run_id is not None:
+        query = query.filter(LlmUsageEvent.run_id == run_id)
+    rows = query.group_by(LlmUsageEvent.role).all()
+
+    by_role: Dict[str, Dict[str, Any]] = {}
+    for role, count in rows:
+        base_role, _, suffix = role.partition(":")
+        if base_role not in (BUILDER_ROLE, AUDITOR_ROLE, "doctor"):
+            continue
+        entry = by_role.setdefault(base_role, {"hits": 0, "misses": 0})
+        if f":{suffix}" == CACHED_ROLE_SUFFIX:
+            entry["hits"] += count
+        else:
+            entry["misses"] += count
+
+    for entry in by_role.values():
+        lookups = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = entry["hits"] / lookups if lookups else 0.0
+
+    hits = sum(entry["hits"] for entry in by_role.values())
+    misses = sum(entry["misses"] for entry in by_role.values())
+    return {
+        "run_id": run_id,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        "by_role": by_role,
+    }
+
+
+# IMP-PERF-023: Summary results are cached per engine and invalidated whenever
+# record_token_efficiency_metrics / record_phase6_metrics insert a row. The TTL
+# bounds staleness for rows written by other processes (e.g. the executor
+# writing while the API serves dashboards).
+METRICS_SUMMARY_CACHE_TTL_SECONDS = 30.0
+
+
+class _MetricsSummaryCache:
+    """Thread-safe cache of metric summaries keyed by engine, kind and run.
+
+    Entries are held per engine in a WeakKeyDictionary so that separate
+    databases (and engines that are garbage collected) never share results.
+    """
+
+    def __init__(self, ttl_seconds: float = METRICS_SUMMARY_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "weakref.WeakKeyDictionary[Engine, Dict[tuple, tuple]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Bumped by invalidate(); a value computed across a bump is not stored
+        self._generations: "weakref.WeakKeyDictionary[Engine, int]" = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _engine_for(db: Session) -> Optional[Engine]:
+        try:
+            bind = db.get_bind()
+        except Exception:
+            return None
+        engine = getattr(bind, "engine", bind)
+        return engine if isinstance(engine, Engine) else None
+
+    def get_or_compute(
+        self,
+        db: Session,
+        kind: str,
+        run_id: Optional[str],
+        compute: Callable[[], Any],
+        params: Hashable = None,
+    ) -> Any:
+        """Return the cached value for (kind, run_id, params), computing it on a miss.
+
+        Cross-run summaries pass run_id=None and are invalidated by any insert.
+
+        Callers always receive a deep copy so mutating a result cannot
+        corrupt the cache.
+        """
+        engine = self._engine_for(db)
+        if engine is None or self.ttl_seconds <= 0:
+            return compute()
+
+        key = (kind, run_id, params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(engine, {}).get(key)
+            generation = self._generations.setdefault(engine, 0)
+        if entry is not None and now - entry[0] <= self.ttl_seconds:
+            return copy.deepcopy(entry[1])
+
+        value = compute()
+        with self._lock:
+            # An insert invalidated the cache while computing: the value may predate it
+            if self._generations.get(engine) == generation:
+                self._entries.setdefault(engine, {})[key] = (now, value)
+        return copy.deepcopy(value)
+
+    def invalidate(self, run_id: Optional[str] = None) -> None:
+        """Drop cached summaries for run_id (and every cross-run summary).
+
+        With run_id=None the whole cache is cleared.
+        """
+        with self._lock:
+            for engine in list(self._generations):
+                self._generations[engine] += 1
+            for entries in self._entries.values():
+                if run_id is None:
+                    entries.clear()
+                    continue
+                for key in list(entries):
+                    if key[1] is None or key[1] == run_id:
+                        del entries[key]
+
+
+_summary_cache = _MetricsSummaryCache()
+
+
+def invalidate_metrics_summary_cache(run_id: Optional[str] = None) -> None:
+    """Invalidate cached token efficiency / Phase 6 summaries (IMP-PERF-023).
+
+    Args:
+        run_id: Run whose summaries changed, or None to clear everything
+    """
+    _summary_cache.invalidate(run_id)
+
+
 def record_token_efficiency_metrics(
     db: Session,
     run_id: str,
@@ -431,6 +589,7 @@ def record_token_efficiency_metrics(
     try:
         # BUILD-146 P17.x: Attempt commit
         db.commit()
+        invalidate_metrics_summary_cache(run_id)
         db.refresh(metrics)
         return metrics
     except IntegrityError:
@@ -460,53 +619,76 @@ def record_token_efficiency_metrics(
         raise
 
 
-def get_token_efficiency_stats(db: Session, run_id: str) -> Dict:
-    """Get aggregated token efficiency statistics for a run.
-
-    Args:
-        db: Database session
-        run_id: Run identifier
+def _empty_token_efficiency_stats(run_id: str) -> Dict:
+    return {
+        "run_id": run_id,
+        "total_phases": 0,
+        "total_artifact_substitutions": 0,
+        "total_tokens_saved_artifacts": 0,
+        "total_budget_used": 0,
+        "total_budget_cap": 0,
+        "total_files_kept": 0,
+        "total_files_omitted": 0,
+        "semantic_mode_count": 0,
+        "lexical_mode_count": 0,
+        "avg_artifact_substitutions_per_phase": 0.0,
+        "avg_tokens_saved_per_phase": 0.0,
+        "budget_utilization": 0.0,
+    }
 
-    Returns:
-        Dictionary with aggregated token efficiency stats
-    """
-    metrics = db.query(TokenEfficiencyMetrics).filter(TokenEfficiencyMetrics.run_id == run_id).all()
 
-    if not metrics:
-        return {
-            "run_id": run_id,
-            "total_phases": 0,
-            "total_artifact_substitutions": 0,
-            "total_tokens_saved_artifacts": 0,
-            "total_budget_used": 0,
-            "total_budget_cap": 0,
-            "total_files_kept": 0,
-            "total_files_omitted": 0,
-            "semantic_mode_count": 0,
-            "lexical_mode_count": 0,
-            "avg_artifact_substitutions_per_phase": 0.0,
-            "avg_tokens_saved_per_phase": 0.0,
-            "budget_utilization": 0.0,
-        }
+def _query_token_efficiency_groups(db: Session, run_ids: Optional[List[str]]) -> List[tuple]:
+    """Aggregate token efficiency metrics per (run_id, phase_outcome) in SQL.
 
-    total_artifact_substitutions = sum(m.artifact_substitutions for m in metrics)
-    total_tokens_saved_artifacts = sum(m.tokens_saved_artifacts for m in metrics)
-    total_budget_used = sum(m.budget_used for m in metrics)
-    total_budget_cap = sum(m.budget_cap for m in metrics)
-    total_files_kept = sum(m.files_kept for m in metrics)
-    total_files_omitted = sum(m.files_omitted for m in metrics)
-    semantic_mode_count = sum(1 for m in metrics if m.budget_mode == "semantic")
-    lexical_mode_count = sum(1 for m in metrics if m.budget_mode == "lexical")
-
-    # BUILD-145 deployment hardening: Add phase outcome breakdown
-    outcome_counts = {}
-    for m in metrics:
-        outcome = m.phase_outcome or "UNKNOWN"
-        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
+    IMP-PERF-023: One GROUP BY query replaces loading every row as an ORM
+    object; the handful of outcome groups per run are folded in Python.
+    """
+    m = TokenEfficiencyMetrics
+    query = db.query(
+        m.run_id,
+        m.phase_outcome,
+        func.count(m.id),
+        func.coalesce(func.sum(m.artifact_substitutions), 0),
+        func.coalesce(func.sum(m.tokens_saved_artifacts), 0),
+        func.coalesce(func.sum(m.budget_used), 0),
+        func.coalesce(func.sum(m.budget_cap), 0),
+        func.coalesce(func.sum(m.files_kept), 0),
+        func.coalesce(func.sum(m.files_omitted), 0),
+        func.sum(case((m.budget_mode == "semantic", 1), else_=0)),
+        func.sum(case((m.budget_mode == "lexical", 1), else_=0)),
+    )
+    if run_ids is not None:
+        query = query.filter(m.run_id.in_(run_ids))
+    return query.group_by(m.run_id, m.phase_outcome).all()
+
+
+def _build_token_efficiency_stats(run_id: str, groups: List[tuple]) -> Dict:
+    if not groups:
+        return _empty_token_efficiency_stats(run_id)
+
+    totals = [0] * 9
+    outcome_counts: Dict[str, int] = {}
+    for row in groups:
+        outcome = row[1] or "UNKNOWN"
+        outcome_counts[outcome] = outcome_counts.get(outcome, 0) + int(row[2])
+        for i, value in enumerate(row[2:]):
+            totals[i] += int(value or 0)
+
+    (
+        total_phases,
+        total_artifact_substitutions,
+        total_tokens_saved_artifacts,
+        total_budget_used,
+        total_budget_cap,
+        total_files_kept,
+        total_files_omitted,
+        semantic_mode_count,
+        lexical_mode_count,
+    ) = totals
 
     return {
         "run_id": run_id,
-        "total_phases": len(metrics),
+        "total_phases": total_phases,
         "total_artifact_substitutions": total_artifact_substitutions,
         "total_tokens_saved_artifacts": total_tokens_saved_artifacts,
         "total_budget_used": total_budget_used,
@@ -515,12 +697,8 @@ def get_token_efficiency_stats(db: Session, run_id: str) -> Dict:
         "total_files_omitted": total_files_omitted,
         "semantic_mode_count": semantic_mode_count,
         "lexical_mode_count": lexical_mode_count,
-        "avg_artifact_substitutions_per_phase": (
-            total_artifact_substitutions / len(metrics) if metrics else 0.0
-        ),
-        "avg_tokens_saved_per_phase": (
-            total_tokens_saved_artifacts / len(metrics) if metrics else 0.0
-        ),
+        "avg_artifact_substitutions_per_phase": total_artifact_substitutions / total_phases,
+        "avg_tokens_saved_per_phase": total_tokens_saved_artifacts / total_phases,
         "budget_utilization": (
             total_budget_used / total_budget_cap if total_budget_cap > 0 else 0.0
         ),
@@ -528,6 +706,56 @@ def get_token_efficiency_stats(db: Session, run_id: str) -> Dict:
     }
 
 
+def get_token_efficiency_stats(db: Session, run_id: str) -> Dict:
+    """Get aggregated token efficiency statistics for a run.
+
+    IMP-PERF-023: Aggregated in SQL and cached until the next metrics insert.
+
+    Args:
+        db: Database session
+        run_id: Run identifier
+
+    Returns:
+        Dictionary with aggregated token efficiency stats
+    """
+    return _summary_cache.get_or_compute(
+        db,
+        "token_efficiency",
+        run_id,
+        lambda: _build_token_efficiency_stats(run_id, _query_token_efficiency_groups(db, [run_id])),
+    )
+
+
+def get_token_efficiency_stats_by_run(
+    db: Session, run_ids: Optional[List[str]] = None
+) -> Dict[str, Dict]:
+    """Get token efficiency statistics for many runs in a single query.
+
+    IMP-PERF-023: Cross-run variant of get_token_efficiency_stats for
+    dashboards that would otherwise issue one query per run.
+
+    Args:
+        db: Database session
+        run_ids: Runs to summarize; None summarizes every run with metrics
+
+    Returns:
+        Mapping of run_id to the same dictionary get_token_efficiency_stats returns.
+        Requested runs without metrics map to zeroed stats.
+    """
+    run_key = None if run_ids is None else tuple(sorted(set(run_ids)))
+
+    def compute() -> Dict[str, Dict]:
+        groups_by_run: Dict[str, List[tuple]] = {run_id: [] for run_id in run_key or ()}
+        for row in _query_token_efficiency_groups(db, run_ids):
+            groups_by_run.setdefault(row[0], []).append(row)
+        return {
+            run_id: _build_token_efficiency_stats(run_id, groups)
+            for run_id, groups in groups_by_run.items()
+        }
+
+    return _summary_cache.get_or_compute(db, "token_efficiency_by_run", None, compute, run_key)
+
+
 def estimate_doctor_tokens_avoided(
     db: Session,
     run_id: str,
@@ -676,70 +904,103 @@ def record_phase6_metrics(
 
     db.add(metrics)
     db.commit()
+    invalidate_metrics_summary_cache(run_id)
     db.refresh(metrics)
 
     return metrics
 
 
-def get_phase6_metrics_summary(db: Session, run_id: str, limit: int = 1000) -> Dict:
-    """
-    Get aggregated Phase 6 metrics for a run.
-
-    Args:
-        db: Database session
-        run_id: Run ID
-        limit: Maximum number of phase metrics to aggregate (default 1000, prevents slow queries)
+def _empty_phase6_metrics_summary() -> Dict:
+    return {
+        "total_phases": 0,
+        "failure_hardening_triggered_count": 0,
+        "failure_patterns_detected": {},
+        "doctor_calls_skipped_count": 0,
+        "total_doctor_tokens_avoided_estimate": 0,
+        "estimate_coverage_stats": {},
+        "intention_context_injected_count": 0,
+        "total_intention_context_chars": 0,
+        "plan_normalization_used": False,
+    }
 
-    Returns:
-        Dictionary with aggregated Phase 6 metrics
-    """
-    # BUILD-146 Ops hardening: Add limit to prevent slow queries on huge runs
-    metrics = db.query(Phase6Metrics).filter(Phase6Metrics.run_id == run_id).limit(limit).all()
 
-    if not metrics:
-        return {
-            "total_phases": 0,
-            "failure_hardening_triggered_count": 0,
-            "failure_patterns_detected": {},
-            "doctor_calls_skipped_count": 0,
-            "total_doctor_tokens_avoided_estimate": 0,
-            "estimate_coverage_stats": {},
-            "intention_context_injected_count": 0,
-            "total_intention_context_chars": 0,
-            "plan_normalization_used": False,
-        }
+def _query_phase6_groups(db: Session, source, run_ids: Optional[List[str]] = None) -> List[tuple]:
+    """Aggregate Phase 6 metrics per (run_id, estimate_source, failure pattern) in SQL.
 
-    # Aggregate metrics
-    failure_hardening_triggered_count = sum(1 for m in metrics if m.failure_hardening_triggered)
-    doctor_calls_skipped_count = sum(1 for m in metrics if m.doctor_call_skipped)
-    total_doctor_tokens_avoided_estimate = sum(m.doctor_tokens_avoided_estimate for m in metrics)
-    intention_context_injected_count = sum(1 for m in metrics if m.intention_context_injected)
-    total_intention_context_chars = sum(m.intention_context_chars for m in metrics)
-
-    # BUILD-146 P3: Collect estimate coverage stats
-    estimate_coverage_stats = {}
-    for m in metrics:
-        if m.estimate_source:
-            source = m.estimate_source
-            if source not in estimate_coverage_stats:
-                estimate_coverage_stats[source] = {"count": 0, "total_n": 0}
-            estimate_coverage_stats[source]["count"] += 1
-            if m.estimate_coverage_n:
-                estimate_coverage_stats[source]["total_n"] += m.estimate_coverage_n
-
-    # Count failure patterns
-    failure_patterns_detected = {}
-    for m in metrics:
-        if m.failure_pattern_detected:
-            failure_patterns_detected[m.failure_pattern_detected] = (
-                failure_patterns_detected.get(m.failure_pattern_detected, 0) + 1
-            )
+    IMP-PERF-023: Grouping by the two categorical columns lets a single query
+    produce both the totals and the per-source / per-pattern breakdowns.
 
-    # Check if plan normalization was used (run-level, not phase-level)
-    plan_normalization_used = any(m.plan_normalization_used for m in metrics)
+    Args:
+        db: Database session
+        source: Phase6Metrics table or a (limited) subquery over it
+        run_ids: Optional run filter
+    """
+    c = source.c
+    query = db.query(
+        c.run_id,
+        c.estimate_source,
+        c.failure_pattern_detected,
+        func.count(),
+        func.sum(case((c.failure_hardening_triggered.is_(True), 1), else_=0)),
+        func.sum(case((c.doctor_call_skipped.is_(True), 1), else_=0)),
+        func.coalesce(func.sum(c.doctor_tokens_avoided_estimate), 0),
+        func.sum(case((c.intention_context_injected.is_(True), 1), else_=0)),
+        func.coalesce(func.sum(c.intention_context_chars), 0),
+        func.coalesce(func.sum(c.estimate_coverage_n), 0),
+        func.max(case((c.plan_normalization_used.is_(True), 1), else_=0)),
+    ).select_from(source)
+    if run_ids is not None:
+        query = query.filter(c.run_id.in_(run_ids))
+    return query.group_by(c.run_id, c.estimate_source, c.failure_pattern_detected).all()
+
+
+def _build_phase6_metrics_summary(groups: List[tuple]) -> Dict:
+    if not groups:
+        return _empty_phase6_metrics_summary()
+
+    total_phases = 0
+    failure_hardening_triggered_count = 0
+    doctor_calls_skipped_count = 0
+    total_doctor_tokens_avoided_estimate = 0
+    intention_context_injected_count = 0
+    total_intention_context_chars = 0
+    plan_normalization_used = False
+    # BUILD-146 P3: Estimate coverage stats
+    estimate_coverage_stats: Dict[str, Dict[str, int]] = {}
+    failure_patterns_detected: Dict[str, int] = {}
+
+    for (
+        _run_id,
+        source,
+        pattern,
+        count,
+        triggered,
+        skipped,
+        tokens_avoided,
+        injected,
+        context_chars,
+        coverage_n,
+        normalization_used,
+    ) in groups:
+        count = int(count)
+        total_phases += count
+        failure_hardening_triggered_count += int(triggered or 0)
+        doctor_calls_skipped_count += int(skipped or 0)
+        total_doctor_tokens_avoided_estimate += int(tokens_avoided or 0)
+        intention_context_injected_count += int(injected or 0)
+        total_intention_context_chars += int(context_chars or 0)
+        # Plan normalization is run-level, not phase-level
+        plan_normalization_used = plan_normalization_used or bool(normalization_used)
+
+        if source:
+            stats = estimate_coverage_stats.setdefault(source, {"count": 0, "total_n": 0})
+            stats["count"] += count
+            stats["total_n"] += int(coverage_n or 0)
+        if pattern:
+            failure_patterns_detected[pattern] = failure_patterns_detected.get(pattern, 0) + count
 
     return {
-        "total_phases": len(metrics),
+        "total_phases": total_phases,
         "failure_hardening_triggered_count": failure_hardening_triggered_count,
         "failure_patterns_detected": failure_patterns_detected,
         "doctor_calls_skipped_count": doctor_calls_skipped_count,
@@ -754,3 +1015,59 @@ def get_phase6_metrics_summary(db: Session, run_id: str, limit: int = 1000) -> D
         ),
         "plan_normalization_used": plan_normalization_used,
     }
+
+
+def get_phase6_metrics_summary(db: Session, run_id: str, limit: int = 1000) -> Dict:
+    """
+    Get aggregated Phase 6 metrics for a run.
+
+    IMP-PERF-023: Aggregated in SQL and cached until the next metrics insert.
+
+    Args:
+        db: Database session
+        run_id: Run ID
+        limit: Maximum number of phase metrics to aggregate (default 1000, prevents slow queries)
+
+    Returns:
+        Dictionary with aggregated Phase 6 metrics
+    """
+
+    def compute() -> Dict:
+        # BUILD-146 Ops hardening: Limit rows aggregated to prevent slow queries on huge runs
+        rows = (
+            db.query(Phase6Metrics).filter(Phase6Metrics.run_id == run_id).limit(limit).subquery()
+        )
+        return _build_phase6_metrics_summary(_query_phase6_groups(db, rows))
+
+    return _summary_cache.get_or_compute(db, "phase6", run_id, compute, limit)
+
+
+def get_phase6_metrics_summary_by_run(
+    db: Session, run_ids: Optional[List[str]] = None
+) -> Dict[str, Dict]:
+    """Get Phase 6 metric summaries for many runs in a single query.
+
+    IMP-PERF-023: Cross-run variant of get_phase6_metrics_summary for
+    dashboards. The per-run row limit does not apply; aggregation happens
+    entirely in the database.
+
+    Args:
+        db: Database session
+        run_ids: Runs to summarize; None summarizes every run with metrics
+
+    Returns:
+        Mapping of run_id to the same dictionary get_phase6_metrics_summary returns.
+        Requested runs without metrics map to zeroed summaries.
+    """
+    run_key = None if run_ids is None else tuple(sorted(set(run_ids)))
+
+    def compute() -> Dict[str, Dict]:
+        groups_by_run: Dict[str, List[tuple]] = {run_id: [] for run_id in run_key or ()}
+        for row in _query_phase6_groups(db, Phase6Metrics.__table__, run_ids):
+            groups_by_run.setdefault(row[0], []).append(row)
+        return {
+            run_id: _build_phase6_metrics_summary(groups)
+            for run_id, groups in groups_by_run.items()
+        }
+
+    return _summary_cache.get_or_compute(db, "phase6_by_run", None, compute, run_key)
@@ -0,0 +1,409 @@
+"""Workspace File Index
+
+IMP-PERF-017: ContextSelector used to re-glob patterns such as ``src/**/*.py``
+and re-read every matching file for every phase (and once more per matching
+description keyword). On large target repos that filesystem walking costs
+hundreds of milliseconds to seconds per phase.
+
+WorkspaceFileIndex keeps, per workspace:
+- A file index (path, size, mtime, language, category) refreshed incrementally:
+  directories whose mtime is unchanged are not re-listed, files are re-stat'ed
+- Glob resolution against the index, memoized until files are added or removed
+- A byte-bounded LRU content cache keyed by (path, mtime, size), so unchanged
+  files are read from disk once
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directories never indexed (VCS metadata, dependency trees, tool caches)
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+    }
+)
+
+# Default byte budget for cached file contents
+DEFAULT_CONTENT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Seconds an index snapshot is reused before lookups trigger a refresh
+DEFAULT_MAX_INDEX_AGE_S = 2.0
+
+# Entries modified this close to when they were observed may change again within
+# the same mtime tick, so their listings/contents are not reused (as in git's
+# "racy" index entries)
+_RACY_WINDOW_NS = 1_000_000_000
+
+_LANGUAGES = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".go": "go",
+    ".rs": "rust",
+    ".rb": "ruby",
+    ".php": "php",
+    ".cs": "csharp",
+    ".sql": "sql",
+    ".md": "markdown",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".toml": "toml",
+}
+
+_CONFIG_SUFFIXES = frozenset({".yaml", ".yml", ".json", ".toml", ".ini", ".cfg", ".env"})
+_DOC_SUFFIXES = frozenset({".md", ".rst", ".txt"})
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """Metadata for one indexed workspace file.
+
+    Attributes:
+        path: POSIX path relative to the workspace root
+        size: Size in bytes
+        mtime_ns: Modification time in nanoseconds
+        language: Language detected from the file extension ("unknown" if none)
+        category: Coarse category (tests, docs, config, source, other)
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    language: str
+    category: str
+
+
+def _classify(rel_path: str) -> Tuple[str, str]:
+    """Return (language, category) for a relative POSIX path."""
+    name = rel_path.rsplit("/", 1)[-1]
+    suffix = os.path.splitext(name)[1].lower()
+    language = _LANGUAGES.get(suffix, "unknown")
+
+    if rel_path.startswith("tests/") or "/tests/" in rel_path or name.startswith("test_"):
+        category = "tests"
+    elif suffix in _DOC_SUFFIXES or rel_path.startswith("docs/"):
+        category = "docs"
+    elif suffix in _CONFIG_SUFFIXES or rel_path.startswith("config/"):
+        category = "config"
+    elif language != "unknown":
+        category = "source"
+    else:
+        category = "other"
+    return language, category
+
+
+def _segment_to_regex(segment: str) -> str:
+    """Translate one glob path segment; wildcards never cross '/'."""
+    out = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] in "!^":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+            else:
+                body = segment[i:j].replace("\\", "\\\\")
+                if body[:1] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a pathlib-style glob (``**`` = zero or more directories) for file paths."""
+    segments = [s for s in pattern.replace("\\", "/").split("/") if s not in ("", ".")]
+    if not segments or segments[-1] == "**":
+        # pathlib yields only directories for a trailing "**"; files never match
+        return re.compile(r"(?!)")
+    parts = []
+    for segment in segments[:-1]:
+        parts.append("(?:[^/]+/)*" if segment == "**" else _segment_to_regex(segment) + "/")
+    parts.append(_segment_to_regex(segments[-1]))
+    return re.compile("".join(parts) + r"\Z")
+
+
+class WorkspaceFileIndex:
+    """Incrementally refreshed file index plus content cache for one workspace.
+
+    Thread-safe. Lookups refresh the index when the last snapshot is older than
+    ``max_age_s``; callers that need an exact view (e.g. at the start of a
+    phase) call ``refresh()`` explicitly.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_content_bytes: int = DEFAULT_CONTENT_CACHE_BYTES,
+        max_age_s: float = DEFAULT_MAX_INDEX_AGE_S,
+        ignored_dirs: frozenset = IGNORED_DIRS,
+    ):
+        """Initialize the index (no filesystem access until first use).
+
+        Args:
+            root: Workspace root directory
+            max_content_bytes: Byte budget for the content cache (0 disables it)
+            max_age_s: Seconds a snapshot is reused by lookups before refreshing
+            ignored_dirs: Directory names skipped during indexing
+        """
+        self.root = Path(root)
+        self.max_content_bytes = max_content_bytes
+        self.max_age_s = max_age_s
+        self.ignored_dirs = ignored_dirs
+
+        self._lock = threading.RLock()
+        self._files: Dict[str, IndexedFile] = {}
+        # rel dir -> (mtime_ns, subdir names, file names, listed at ns)
+        self._dirs: Dict[str, Tuple[int, List[str], List[str], int]] = {}
+        self._sorted_paths: List[str] = []
+        self._generation = 0
+        self._refreshed_at: Optional[float] = None
+        self._glob_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+        # abs path -> (mtime_ns, size, content)
+        self._contents: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._content_bytes = 0
+        self.content_hits = 0
+        self.content_misses = 0
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the filesystem.
+
+        Returns:
+            Counts of added, removed and modified files
+
+        Raises:
+            OSError: If the workspace root exists but cannot be listed
+        """
+        with self._lock:
+            stats = {"added": 0, "removed": 0, "modified": 0}
+            seen: set = set()
+            dirs: Dict[str, Tuple[int, List[str], List[str], int]] = {}
+            stack = [""]
+
+            while stack:
+                rel_dir = stack.pop()
+                listing = self._list_dir(rel_dir)
+                if listing is None:
+                    continue
+                dirs[rel_dir] = listing
+                _, subdirs, names, _ = listing
+                prefix = f"{rel_dir}/" if rel_dir else ""
+                stack.extend(prefix + d for d in subdirs)
+
+                for name in names:
+                    rel_path = prefix + name
+                    try:
+                        st = os.stat(self.root / rel_path)
+                    except OSError:
+                        continue
+                    seen.add(rel_path)
+                    current = self._files.get(rel_path)
+                    if current is None:
+                        language, category = _classify(rel_path)
+                        self._files[rel_path] = IndexedFile(
+                            rel_path, st.st_size, st.st_mtime_ns, language, category
+                        )
+                        stats["added"] += 1
+                    elif current.mtime_ns != st.st_mtime_ns or current.size != st.st_size:
+                        self._files[rel_path] = IndexedFile(
+                            rel_path, st.st_size, st.st_mtime_ns, current.language, current.category
+                        )
+                        stats["modified"] += 1
+
+            for rel_path in [p for p in self._files if p not in seen]:
+                del self._files[rel_path]
+                stats["removed"] += 1
+
+            self._dirs = dirs
+            if stats["added"] or stats["removed"] or self._refreshed_at is None:
+                self._generation += 1
+                self._sorted_paths = sorted(self._files)
+                self._glob_cache.clear()
+            self._refreshed_at = time.monotonic()
+
+            if any(stats.values()):
+                logger.debug(
+                    f"[IMP-PERF-017] Indexed {self.root}: {len(self._files)} files "
+                    f"(+{stats['added']} -{stats['removed']} ~{stats['modified']})"
+                )
+            return stats
+
+    def _list_dir(self, rel_dir: str) -> Optional[Tuple[int, List[str], List[str], int]]:
+        """List a directory, reusing the cached listing if its mtime is unchanged."""
+        abs_dir = self.root / rel_dir if rel_dir else self.root
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+            cached = self._dirs.get(rel_dir)
+            if (
+                cached is not None
+                and cached[0] == mtime_ns
+                and cached[3] - mtime_ns > _RACY_WINDOW_NS
+            ):
+                return cached
+
+            listed_ns = time.time_ns()
+            subdirs, names = [], []
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignored_dirs:
+                            subdirs.append(entry.name)
+                    elif entry.is_file():
+                        names.append(entry.name)
+            return mtime_ns, subdirs, names, listed_ns
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            if not rel_dir:
+                raise
+            logger.debug("Skipping unreadable directory %s: %s", abs_dir, e)
+            return None
+
+    def _ensure_fresh(self) -> None:
+        """Refresh if the index was never built or its snapshot is too old."""
+        if self._refreshed_at is None or time.monotonic() - self._refreshed_at > self.max_age_s:
+            self.refresh()
+
+    def glob(self, pattern: str) -> List[str]:
+        """Return indexed file paths matching a pathlib-style glob, sorted.
+
+        Args:
+            pattern: Glob relative to the workspace root (e.g. ``src/**/*.py``)
+
+        Returns:
+            Matching relative POSIX paths
+        """
+        with self._lock:
+            self._ensure_fresh()
+            cached = self._glob_cache.get(pattern)
+            if cached is not None and cached[0] == self._generation:
+                return list(cached[1])
+            regex = glob_to_regex(pattern)
+            matches = [p for p in self._sorted_paths if regex.match(p)]
+            self._glob_cache[pattern] = (self._generation, matches)
+            return list(matches)
+
+    def get(self, rel_path: str) -> Optional[IndexedFile]:
+        """Return index metadata for a relative path, if indexed."""
+        with self._lock:
+            self._ensure_fresh()
+            return self._files.get(rel_path.replace("\\", "/"))
+
+    def files(self, category: Optional[str] = None) -> List[IndexedFile]:
+        """Return indexed files, optionally restricted to one category."""
+        with self._lock:
+            self._ensure_fresh()
+            return [
+                self._files[p]
+                for p in self._sorted_paths
+                if category is None or self._files[p].category == category
+            ]
+
+    # ------------------------------------------------------------------
+    # Content cache
+    # ------------------------------------------------------------------
+
+    def read_text(self, path: Path) -> str:
+        """Read a file as UTF-8, serving unchanged files from the content cache.
+
+        Args:
+            path: Absolute path of the file
+
+        Returns:
+            File contents
+
+        Raises:
+            OSError, UnicodeDecodeError: Propagated from the underlying read
+        """
+        key = str(path)
+        st = os.stat(path)
+        read_ns = time.time_ns()
+        with self._lock:
+            cached = self._contents.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._contents.move_to_end(key)
+                self.content_hits += 1
+                return cached[2]
+
+        content = path.read_text(encoding="utf-8")
+
+        with self._lock:
+            self.content_misses += 1
+            if read_ns - st.st_mtime_ns > _RACY_WINDOW_NS:
+                self._store_content(key, st.st_mtime_ns, st.st_size, content)
+        return content
+
+    def _store_content(self, key: str, mtime_ns: int, size: int, content: str) -> None:
+        """Insert into the LRU content cache and evict down to the byte budget."""
+        previous = self._contents.pop(key, None)
+        if previous is not None:
+            self._content_bytes -= previous[1]
+        if size > self.max_content_bytes:
+            return
+        self._contents[key] = (mtime_ns, size, content)
+        self._content_bytes += size
+        while self._content_bytes > self.max_content_bytes and self._contents:
+            _, (_, evicted_size, _) = self._contents.popitem(last=False)
+            self._content_bytes -= evicted_size
+
+    def clear_content_cache(self) -> None:
+        """Drop all cached file contents."""
+        with self._lock:
+            self._contents.clear()
+            self._content_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return index and content cache statistics."""
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "directories": len(self._dirs),
+                "cached_files": len(self._contents),
+                "cached_bytes": self._content_bytes,
+                "content_hits": self.content_hits,
+                "content_misses": self.content_misses,
+            }
@@ -0,0 +1,343 @@
+"""Tests for batched telemetry insight persistence (IMP-PERF-026).
+
+Tests that verify:
+- FaissStore.search_batch returns the same hits as per-query search
+- QdrantStore.search_batch issues a single query_batch_points call
+- find_similar_insights_batch embeds once and searches each collection once
+- write_telemetry_insights_batch merges, folds and upserts once per collection
+- A failed batch write can be retried without its insights counting as duplicates
+- TelemetryToMemoryBridge.persist_insights_batch writes the batch in one call
+"""
+
+import random
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from autopack.memory.deduplication import ContentDeduplicator
+from autopack.memory.faiss_store import FaissStore
+from autopack.memory.memory_service import (
+    COLLECTION_DOCTOR_HINTS,
+    COLLECTION_ERRORS_CI,
+    COLLECTION_RUN_SUMMARIES,
+    MemoryService,
+)
+from autopack.memory.qdrant_store import QDRANT_AVAILABLE
+from autopack.telemetry.telemetry_to_memory_bridge import TelemetryToMemoryBridge
+
+DIM = 1536
+
+
+def _unit(axis: int) -> list:
+    vector = [0.0] * DIM
+    vector[axis] = 1.0
+    return vector
+
+
+def _insight(insight_type: str, description: str, **extra) -> dict:
+    insight = {
+        "insight_type": insight_type,
+        "description": description,
+        "phase_id": "phase_build",
+        "run_id": "run-1",
+        "suggested_action": "Reduce context window",
+    }
+    insight.update(extra)
+    return insight
+
+
+@pytest.fixture
+def faiss_store(tmp_path):
+    return FaissStore(index_dir=str(tmp_path / "faiss"))
+
+
+@pytest.fixture
+def memory_service(faiss_store):
+    """MemoryService backed by a real FaissStore, without running __init__."""
+    with patch.object(MemoryService, "__init__", lambda self, **kwargs: None):
+        service = MemoryService()
+        service.enabled = True
+        service._write_lock = threading.Lock()
+        service._content_hashes = set()
+        service._deduplicator = ContentDeduplicator()
+        service.store = faiss_store
+        yield service
+
+
+class TestFaissSearchBatch:
+    """Tests for FaissStore.search_batch."""
+
+    def test_matches_per_query_search(self, faiss_store):
+        rng = random.Random(5)
+        faiss_store.ensure_collection("docs", size=8)
+        faiss_store.upsert(
+            "docs",
+            [
+                {
+                    "id": f"doc-{i}",
+                    "vector": [rng.uniform(-1, 1) for _ in range(8)],
+                    "payload": {"kind": "even" if i % 2 == 0 else "odd"},
+                }
+                for i in range(30)
+            ],
+        )
+        queries = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(4)]
+
+        for search_filter in (None, {"kind": "odd"}):
+            batch = faiss_store.search_batch("docs", queries, filter=search_filter, limit=3)
+            single = [faiss_store.search("docs", q, filter=search_filter, limit=3) for q in queries]
+
+            assert [[h["id"] for h in hits] for hits in batch] == [
+                [h["id"] for h in hits] for hits in single
+            ]
+            for batch_hits, single_hits in zip(batch, single):
+                for b, s in zip(batch_hits, single_hits):
+                    assert b["score"] == pytest.approx(s["score"], abs=1e-5)
+
+    def test_empty_collection_returns_empty_per_query(self, faiss_store):
+        assert faiss_store.search_batch("empty", [_unit(0), _unit(1)]) == [[], []]
+        assert faiss_store.search_batch("empty", []) == []
+
+
+@pytest.mark.skipif(not QDRANT_AVAILABLE, reason="qdrant-client not installed")
+class TestQdrantSearchBatch:
+    """Tests for QdrantStore.search_batch."""
+
+    @pytest.fixture
+    def qdrant(self):
+        from autopack.memory.qdrant_store import QdrantStore
+
+        with (
+            patch("autopack.memory.qdrant_store.QdrantClient") as client_cls,
+            patch.object(QdrantStore, "_check_qdrant_health", return_value=(True, "")),
+        ):
+            client = MagicMock()
+            client.get_collections.return_value = Mock(collections=[])
+            client_cls.return_value = client
+            yield QdrantStore(host="localhost", port=6333), client
+
+    def test_single_round_trip(self, qdrant):
+        store, client = qdrant
+        hit = Mock(id="uuid-1", score=0.95, payload={"_original_id": "doc-1", "task_type": "x"})
+        client.query_batch_points.return_value = [Mock(points=[hit]), Mock(points=[])]
+
+        results = store.search_batch("docs", [[0.1, 0.2], [0.3, 0.4]], filter={"task_type": "x"})
+
+        client.query_batch_points.assert_called_once()
+        requests = client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert results == [[{"id": "doc-1", "score": 0.95, "payload": {"task_type": "x"}}], []]
+
+    def test_failure_returns_empty_per_query(self, qdrant):
+        store, client = qdrant
+        client.query_batch_points.side_effect = ValueError("bad request")
+
+        assert store.search_batch("docs", [[0.1], [0.2]]) == [[], []]
+
+
+class TestFindSimilarInsightsBatch:
+    """Tests for ContentDeduplicator.find_similar_insights_batch."""
+
+    def _find(self, store, insights):
+        return ContentDeduplicator().find_similar_insights_batch(
+            insights,
+            enabled=True,
+            store=store,
+            safe_store_call=lambda label, fn, default: fn(),
+            collection_errors_ci=COLLECTION_ERRORS_CI,
+            collection_doctor_hints=COLLECTION_DOCTOR_HINTS,
+            collection_run_summaries=COLLECTION_RUN_SUMMARIES,
+            threshold=0.9,
+        )
+
+    @patch("autopack.memory.deduplication.sync_embed_texts_cached")
+    def test_one_embed_and_one_search_per_collection(self, mock_embed):
+        mock_embed.side_effect = lambda texts: [_unit(i) for i in range(len(texts))]
+        store = Mock()
+        store.search_batch.side_effect = lambda collection, vectors, filter, limit: [
+            [{"id": f"{collection}-hit", "score": 0.95, "payload": {}}]
+            if collection == COLLECTION_RUN_SUMMARIES
+            else [{"id": "weak", "score": 0.5, "payload": {}}]
+            for _ in vectors
+        ]
+
+        similar, vectors = self._find(
+            store,
+            [
+                _insight("cost_sink", "High tokens"),
+                _insight("failure_mode", "Timeouts"),
+                _insight("unknown", "Other"),
+            ],
+        )
+
+        mock_embed.assert_called_once()
+        assert store.search_batch.call_count == 2
+        assert [len(hits) for hits in similar] == [1, 0, 1]
+        assert similar[0][0]["collection"] == COLLECTION_RUN_SUMMARIES
+        assert vectors == [_unit(0), _unit(1), _unit(2)]
+
+    @patch("autopack.memory.deduplication.sync_embed_texts_cached")
+    def test_falls_back_to_search_without_batch_support(self, mock_embed):
+        mock_embed.side_effect = lambda texts: [_unit(0) for _ in texts]
+        store = Mock(spec=["search"])
+        store.search.return_value = [{"id": "hit", "score": 0.92, "payload": {}}]
+
+        similar, _ = self._find(store, [_insight("cost_sink", "A"), _insight("cost_sink", "B")])
+
+        assert store.search.call_count == 2
+        assert [[h["id"] for h in hits] for hits in similar] == [["hit"], ["hit"]]
+
+
+class TestWriteTelemetryInsightsBatch:
+    """Tests for MemoryService.write_telemetry_insights_batch."""
+
+    def test_upserts_once_per_collection(self, memory_service, faiss_store):
+        insights = [
+            _insight("cost_sink", "High token usage in build"),
+            _insight("cost_sink", "Slow audit phase with long prompts", phase_id="phase_audit"),
+            _insight("failure_mode", "Recurring timeout"),
+            _insight("retry_cause", "Retry after rate limit"),
+        ]
+
+        with patch.object(faiss_store, "upsert", wraps=faiss_store.upsert) as upsert:
+            ids = memory_service.write_telemetry_insights_batch(insights, validate=False)
+
+        assert all(ids)
+        assert len(set(ids)) == 4
+        assert sorted(call.args[0] for call in upsert.call_args_list) == sorted(
+            [COLLECTION_RUN_SUMMARIES, COLLECTION_ERRORS_CI, COLLECTION_DOCTOR_HINTS]
+        )
+        assert faiss_store.get_payload(COLLECTION_RUN_SUMMARIES, ids[0]) is not None
+
+    def test_folds_and_merges_near_duplicates(self, memory_service, faiss_store):
+        # Every text embeds to the same vector, so all insights are near-duplicates
+        same_vector = lambda texts: [_unit(0) for _ in texts]  # noqa: E731
+        with (
+            patch("autopack.memory.deduplication.sync_embed_texts_cached", same_vector),
+            patch("autopack.memory.memory_service.sync_embed_texts_cached", same_vector),
+        ):
+            first = memory_service.write_telemetry_insights_batch(
+                [_insight("cost_sink", "Token spike A"), _insight("cost_sink", "Token spike B")],
+                validate=False,
+            )
+            with patch.object(
+                faiss_store, "update_payload", wraps=faiss_store.update_payload
+            ) as update:
+                second = memory_service.write_telemetry_insights_batch(
+                    [
+                        _insight("cost_sink", "Token spike C"),
+                        _insight("cost_sink", "Token spike D"),
+                    ],
+                    validate=False,
+                )
+
+        # Second insight of the first batch folded into the first one
+        assert first[0] == first[1]
+        # Both insights of the second batch merged into it with a single update
+        assert second == [first[0], first[0]]
+        update.assert_called_once()
+        payload = faiss_store.get_payload(COLLECTION_RUN_SUMMARIES, first[0])
+        assert payload["occurrence_count"] == 4
+        assert payload["merge_count"] == 3
+
+    def test_content_hash_duplicates_return_empty_id(self, memory_service):
+        insight = _insight("cost_sink", "Exactly the same")
+
+        ids = memory_service.write_telemetry_insights_batch(
+            [insight, dict(insight)], validate=False
+        )
+
+        assert ids[0]
+        assert ids[1] == ""
+
+    def test_failed_upsert_releases_hashes_for_retry(self, memory_service, faiss_store):
+        insights = [_insight("cost_sink", "High tokens"), _insight("failure_mode", "Timeouts")]
+
+        with patch.object(faiss_store, "upsert", side_effect=RuntimeError("store down")):
+            with pytest.raises(RuntimeError):
+                memory_service.write_telemetry_insights_batch(insights, validate=False)
+        ids = memory_service.write_telemetry_insights_batch(insights, validate=False)
+
+        assert all(ids)
+        assert faiss_store.get_payload(COLLECTION_RUN_SUMMARIES, ids[0]) is not None
+        assert faiss_store.get_payload(COLLECTION_ERRORS_CI, ids[1]) is not None
+
+    def test_rules_use_lifecycle_path(self, memory_service):
+        rule = _insight("promoted_rule", "Always cap context", is_rule=True)
+        with patch.object(
+            memory_service, "write_telemetry_insight", return_value="rule-1"
+        ) as write_single:
+            ids = memory_service.write_telemetry_insights_batch(
+                [rule, _insight("cost_sink", "High tokens")], validate=False
+            )
+
+        write_single.assert_called_once_with(rule, "default", validate=False)
+        assert ids[0] == "rule-1"
+        assert ids[1]
+
+    def test_disabled_service_writes_nothing(self, memory_service):
+        memory_service.enabled = False
+
+        assert memory_service.write_telemetry_insights_batch(
+            [_insight("cost_sink", "High tokens")]
+        ) == [""]
+
+
+class TestPersistInsightsBatch:
+    """Tests for TelemetryToMemoryBridge.persist_insights_batch."""
+
+    @pytest.fixture
+    def ranked_issues(self):
+        return [
+            {
+                "issue_type": "cost_sink",
+                "phase_id": "phase_build",
+                "metric_value": 350000.0,
+                "occurrences": 10,
+                "suggested_action": "Reduce context window by 30%",
+                "rank": 1,
+                "details": {},
+            },
+            {
+                "issue_type": "failure_mode",
+                "phase_id": "phase_test",
+                "metric_value": 15.0,
+                "occurrences": 15,
+                "suggested_action": "Add token budget check",
+                "rank": 2,
+                "details": {},
+            },
+        ]
+
+    @pytest.fixture
+    def service(self):
+        mock = Mock(spec=MemoryService)
+        mock.enabled = True
+        mock.write_telemetry_insights_batch.return_value = ["doc-1", "doc-2"]
+        return mock
+
+    def test_single_batched_write(self, service, ranked_issues, tmp_path):
+        bridge = TelemetryToMemoryBridge(service, fallback_queue_path=str(tmp_path / "q.json"))
+
+        assert bridge.persist_insights_batch(ranked_issues, run_id="run-1") == 2
+        assert bridge.persist_insights_batch(ranked_issues, run_id="run-1") == 0
+
+        service.write_telemetry_insights_batch.assert_called_once()
+        insights = service.write_telemetry_insights_batch.call_args.args[0]
+        assert [i["insight_type"] for i in insights] == ["cost_sink", "failure_mode"]
+        service.write_telemetry_insight.assert_not_called()
+
+    def test_failure_queues_every_insight(self, service, ranked_issues, tmp_path):
+        service.write_telemetry_insights_batch.side_effect = Exception("Connection failed")
+        bridge = TelemetryToMemoryBridge(service, fallback_queue_path=str(tmp_path / "q.json"))
+
+        with patch.object(
+            TelemetryToMemoryBridge,
+            "_persist_batch_with_retry",
+            side_effect=Exception("Connection failed"),
+        ):
+            count = bridge.persist_insights_batch(ranked_issues, run_id="run-1")
+
+        assert count == 2
+        assert bridge.get_fallback_queue_size() == 2
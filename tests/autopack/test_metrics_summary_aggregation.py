@@ -0,0 +1,241 @@
+"""Tests for SQL-side metric summary aggregation (IMP-PERF-023).
+
+Tests that verify:
+- Token efficiency and Phase 6 summaries match the per-row definitions
+- The Phase 6 row limit is still honoured
+- Cross-run variants return the same per-run summaries in one call
+- Cached summaries are invalidated by new metric inserts, even mid-compute
+- Separate databases never share cached summaries
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from autopack.database import Base
+from autopack.usage_recorder import (
+    TokenEfficiencyMetrics,
+    _MetricsSummaryCache,
+    get_phase6_metrics_summary,
+    get_phase6_metrics_summary_by_run,
+    get_token_efficiency_stats,
+    get_token_efficiency_stats_by_run,
+    invalidate_metrics_summary_cache,
+    record_phase6_metrics,
+    record_token_efficiency_metrics,
+)
+
+
+@pytest.fixture
+def db():
+    """Create in-memory test database"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _token_metrics(db, run_id, phase_id, outcome=None, mode="semantic", used=5000):
+    return record_token_efficiency_metrics(
+        db=db,
+        run_id=run_id,
+        phase_id=phase_id,
+        artifact_substitutions=2,
+        tokens_saved_artifacts=1000,
+        budget_mode=mode,
+        budget_used=used,
+        budget_cap=10000,
+        files_kept=10,
+        files_omitted=2,
+        phase_outcome=outcome,
+    )
+
+
+def _phase6_metrics(db, run_id, phase_id, **kwargs):
+    return record_phase6_metrics(db=db, run_id=run_id, phase_id=phase_id, **kwargs)
+
+
+class TestTokenEfficiencyAggregation:
+    """Tests for get_token_efficiency_stats and its cross-run variant."""
+
+    def test_outcome_breakdown_and_totals(self, db):
+        _token_metrics(db, "run-1", "p1", "COMPLETE")
+        _token_metrics(db, "run-1", "p2", "COMPLETE", mode="lexical", used=3000)
+        _token_metrics(db, "run-1", "p3", "FAILED")
+        _token_metrics(db, "run-1", "p4")
+
+        stats = get_token_efficiency_stats(db, "run-1")
+
+        assert stats["total_phases"] == 4
+        assert stats["total_budget_used"] == 18000
+        assert stats["semantic_mode_count"] == 3
+        assert stats["lexical_mode_count"] == 1
+        assert stats["budget_utilization"] == 0.45
+        assert stats["phase_outcome_counts"] == {"COMPLETE": 2, "FAILED": 1, "UNKNOWN": 1}
+
+    def test_by_run_matches_single_run(self, db):
+        _token_metrics(db, "run-1", "p1", "COMPLETE")
+        _token_metrics(db, "run-2", "p1", "FAILED", mode="lexical")
+        _token_metrics(db, "run-2", "p2", "COMPLETE")
+
+        by_run = get_token_efficiency_stats_by_run(db)
+
+        assert set(by_run) == {"run-1", "run-2"}
+        for run_id in by_run:
+            assert by_run[run_id] == get_token_efficiency_stats(db, run_id)
+
+    def test_by_run_includes_requested_runs_without_metrics(self, db):
+        _token_metrics(db, "run-1", "p1")
+
+        by_run = get_token_efficiency_stats_by_run(db, ["run-1", "missing"])
+
+        assert by_run["run-1"]["total_phases"] == 1
+        assert by_run["missing"] == get_token_efficiency_stats(db, "missing")
+
+
+class TestPhase6Aggregation:
+    """Tests for get_phase6_metrics_summary and its cross-run variant."""
+
+    def test_summary_matches_per_row_definitions(self, db):
+        _phase6_metrics(
+            db,
+            "run-1",
+            "p1",
+            failure_hardening_triggered=True,
+            failure_pattern_detected="python_missing_dep",
+            doctor_call_skipped=True,
+            doctor_tokens_avoided_estimate=10000,
+            estimate_coverage_n=5,
+            estimate_source="run_local",
+        )
+        _phase6_metrics(
+            db,
+            "run-1",
+            "p2",
+            failure_hardening_triggered=True,
+            failure_pattern_detected="python_missing_dep",
+            estimate_source="run_local",
+            intention_context_injected=True,
+            intention_context_chars=300,
+        )
+        _phase6_metrics(
+            db,
+            "run-1",
+            "p3",
+            estimate_coverage_n=100,
+            estimate_source="global",
+            intention_context_injected=True,
+            intention_context_chars=100,
+            plan_normalization_used=True,
+        )
+
+        summary = get_phase6_metrics_summary(db, "run-1")
+
+        assert summary == {
+            "total_phases": 3,
+            "failure_hardening_triggered_count": 2,
+            "failure_patterns_detected": {"python_missing_dep": 2},
+            "doctor_calls_skipped_count": 1,
+            "total_doctor_tokens_avoided_estimate": 10000,
+            "estimate_coverage_stats": {
+                "run_local": {"count": 2, "total_n": 5},
+                "global": {"count": 1, "total_n": 100},
+            },
+            "intention_context_injected_count": 2,
+            "total_intention_context_chars": 400,
+            "avg_intention_context_chars_per_phase": 200.0,
+            "plan_normalization_used": True,
+        }
+
+    def test_empty_run(self, db):
+        summary = get_phase6_metrics_summary(db, "missing")
+
+        assert summary["total_phases"] == 0
+        assert summary["plan_normalization_used"] is False
+        assert "avg_intention_context_chars_per_phase" not in summary
+
+    def test_limit_caps_rows_aggregated(self, db):
+        for i in range(5):
+            _phase6_metrics(db, "run-1", f"p{i}", doctor_call_skipped=True)
+
+        assert get_phase6_metrics_summary(db, "run-1", limit=3)["total_phases"] == 3
+        assert get_phase6_metrics_summary(db, "run-1")["total_phases"] == 5
+
+    def test_by_run_matches_single_run(self, db):
+        _phase6_metrics(db, "run-1", "p1", estimate_source="fallback")
+        _phase6_metrics(db, "run-2", "p1", failure_pattern_detected="timeout")
+        _phase6_metrics(db, "run-2", "p2", plan_normalization_used=True)
+
+        by_run = get_phase6_metrics_summary_by_run(db, ["run-1", "run-2"])
+
+        for run_id in ("run-1", "run-2"):
+            assert by_run[run_id] == get_phase6_metrics_summary(db, run_id)
+
+
+class TestSummaryCache:
+    """Tests for summary caching and invalidation."""
+
+    def test_insert_invalidates_cached_summaries(self, db):
+        _token_metrics(db, "run-1", "p1")
+        _phase6_metrics(db, "run-1", "p1")
+        assert get_token_efficiency_stats(db, "run-1")["total_phases"] == 1
+        assert get_token_efficiency_stats_by_run(db)["run-1"]["total_phases"] == 1
+        assert get_phase6_metrics_summary(db, "run-1")["total_phases"] == 1
+
+        _token_metrics(db, "run-1", "p2")
+        _phase6_metrics(db, "run-1", "p2")
+
+        assert get_token_efficiency_stats(db, "run-1")["total_phases"] == 2
+        assert get_token_efficiency_stats_by_run(db)["run-1"]["total_phases"] == 2
+        assert get_phase6_metrics_summary(db, "run-1")["total_phases"] == 2
+
+    def test_cached_until_invalidated(self, db):
+        _token_metrics(db, "run-1", "p1")
+        first = get_token_efficiency_stats(db, "run-1")
+
+        # Rows written outside record_token_efficiency_metrics (e.g. by another
+        # process) are picked up once the cache is invalidated or expires.
+        db.add(
+            TokenEfficiencyMetrics(
+                run_id="run-1",
+                phase_id="p2",
+                budget_mode="lexical",
+            )
+        )
+        db.commit()
+        assert get_token_efficiency_stats(db, "run-1") == first
+
+        invalidate_metrics_summary_cache("run-1")
+        assert get_token_efficiency_stats(db, "run-1")["total_phases"] == 2
+
+    def test_invalidation_during_compute_is_not_overwritten(self, db):
+        cache = _MetricsSummaryCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            if len(calls) == 1:
+                # A metric insert lands while the summary is being computed
+                cache.invalidate("run-1")
+            return len(calls)
+
+        assert cache.get_or_compute(db, "token_efficiency", "run-1", compute) == 1
+        # The value computed across the invalidation was not cached
+        assert cache.get_or_compute(db, "token_efficiency", "run-1", compute) == 2
+        assert cache.get_or_compute(db, "token_efficiency", "run-1", compute) == 2
+
+    def test_results_are_copies(self, db):
+        _token_metrics(db, "run-1", "p1", "COMPLETE")
+        get_token_efficiency_stats(db, "run-1")["phase_outcome_counts"]["COMPLETE"] = 99
+
+        assert get_token_efficiency_stats(db, "run-1")["phase_outcome_counts"] == {"COMPLETE": 1}
+
+    def test_databases_do_not_share_cache(self, db):
+        _token_metrics(db, "run-1", "p1")
+        assert get_token_efficiency_stats(db, "run-1")["total_phases"] == 1
+
+        other_engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(other_engine)
+        with sessionmaker(bind=other_engine)() as other:
+            assert get_token_efficiency_stats(other, "run-1")["total_phases"] == 0
@@ -0,0 +1,202 @@
+"""Tests for buffered LLM usage recording (IMP-PERF-022).
+
+Tests that verify:
+- Submitted events are bulk-inserted by the background flusher
+- Batches flush by event count and by age
+- Doctor stats match per-event update_doctor_stats, including escalations
+- Failed flushes and queue overflow spill to disk and are replayed
+- LlmService routes usage through the buffer only when enabled
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from autopack.database import Base
+from autopack.llm_service import LlmService
+from autopack.usage_buffer import BufferedUsageRecorder
+from autopack.usage_recorder import (
+    LlmUsageEvent,
+    UsageEventData,
+    get_doctor_stats,
+    record_usage,
+)
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'usage.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _event(run_id="run-1", phase_id="p1", tokens=100, **kwargs):
+    return UsageEventData(
+        provider="anthropic",
+        model="claude-sonnet",
+        run_id=run_id,
+        phase_id=phase_id,
+        role="builder",
+        total_tokens=tokens,
+        prompt_tokens=tokens // 2,
+        completion_tokens=tokens - tokens // 2,
+        **kwargs,
+    )
+
+
+def _doctor(model, action, phase_id="p1"):
+    return UsageEventData(
+        provider="anthropic",
+        model="claude-sonnet",
+        run_id="run-1",
+        phase_id=phase_id,
+        role="doctor",
+        total_tokens=50,
+        prompt_tokens=None,
+        completion_tokens=None,
+        is_doctor_call=True,
+        doctor_model=model,
+        doctor_action=action,
+    )
+
+
+class TestBufferedUsageRecorder:
+    """Tests for BufferedUsageRecorder."""
+
+    def test_events_flushed_in_batches(self, session_factory, tmp_path):
+        recorder = BufferedUsageRecorder(
+            session_factory, flush_events=3, flush_interval_ms=5000, spill_file=tmp_path / "spill"
+        )
+        recorder.start()
+        for i in range(6):
+            assert recorder.submit(_event(tokens=100 + i))
+
+        deadline = time.monotonic() + 5
+        while recorder.get_stats()["events_flushed"] < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = recorder.get_stats()
+        recorder.close()
+
+        assert stats["events_flushed"] == 6
+        assert stats["flushes"] == 2
+        with session_factory() as db:
+            assert db.query(LlmUsageEvent).count() == 6
+
+    def test_partial_batch_flushed_by_age(self, session_factory, tmp_path):
+        recorder = BufferedUsageRecorder(
+            session_factory, flush_events=100, flush_interval_ms=20, spill_file=tmp_path / "spill"
+        )
+        recorder.start()
+        recorder.submit(_event())
+
+        deadline = time.monotonic() + 5
+        while recorder.get_stats()["events_flushed"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert recorder.get_stats()["events_flushed"] == 1
+        assert recorder.get_stats()["avg_flush_latency_ms"] > 0
+        recorder.close()
+
+    def test_flush_gives_read_your_writes(self, session_factory, tmp_path):
+        recorder = BufferedUsageRecorder(
+            session_factory,
+            flush_events=100,
+            flush_interval_ms=60000,
+            spill_file=tmp_path / "spill",
+        )
+        recorder.start()
+        recorder.submit(_event(tokens=42))
+
+        assert recorder.flush(timeout=5)
+        with session_factory() as db:
+            assert db.query(LlmUsageEvent).one().total_tokens == 42
+        recorder.close()
+
+    def test_doctor_stats_match_unbuffered_recording(self, session_factory, tmp_path):
+        events = [
+            _doctor("strong", "replan", "p1"),  # No earlier cheap call: not an escalation
+            _doctor("cheap", "retry_with_fix", "p1"),
+            _doctor("strong", "replan", "p1"),  # Escalation
+            _doctor("strong", "skip_phase", "p2"),
+        ]
+        recorder = BufferedUsageRecorder(session_factory, spill_file=tmp_path / "spill")
+        for event in events:
+            recorder.submit(event)
+        recorder.flush()
+        with session_factory() as db:
+            buffered = get_doctor_stats(db, "run-1")
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            for event in events:
+                record_usage(db, event)
+            unbuffered = get_doctor_stats(db, "run-1")
+
+        assert buffered == unbuffered
+        assert buffered["doctor_escalations"] == 1
+        assert buffered["doctor_actions"] == {"replan": 2, "retry_with_fix": 1, "skip_phase": 1}
+
+    def test_failed_flush_spills_and_replays(self, session_factory, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        broken = Mock(side_effect=RuntimeError("database down"))
+        recorder = BufferedUsageRecorder(broken, spill_file=spill)
+        recorder.submit(_event(tokens=7))
+        recorder.close()
+
+        assert spill.exists()
+        assert recorder.get_stats()["events_spilled"] == 1
+
+        recovered = BufferedUsageRecorder(session_factory, spill_file=spill)
+        recovered.start()
+        recovered.close()
+
+        assert not spill.exists()
+        assert recovered.get_stats()["events_replayed"] == 1
+        with session_factory() as db:
+            assert db.query(LlmUsageEvent).one().total_tokens == 7
+
+    def test_queue_overflow_spills_to_disk(self, session_factory, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        recorder = BufferedUsageRecorder(session_factory, max_queue_size=2, spill_file=spill)
+
+        for _ in range(3):
+            assert recorder.submit(_event())
+
+        stats = recorder.get_stats()
+        assert stats["queue_depth"] == 2
+        assert stats["max_queue_depth"] == 2
+        assert stats["events_spilled"] == 1
+        assert len(spill.read_text().splitlines()) == 1
+
+
+class TestLlmServiceBuffering:
+    """LlmService must only use the buffer when enabled."""
+
+    @pytest.fixture
+    def service(self):
+        with patch("autopack.llm_service.ModelRouter"):
+            return LlmService(db=Mock(spec=Session))
+
+    def test_buffer_used_when_enabled(self, service):
+        buffer = Mock()
+        buffer.submit.return_value = True
+        with (
+            patch("autopack.config.settings.usage_buffer_enabled", True),
+            patch("autopack.usage_buffer.get_usage_buffer", return_value=buffer),
+        ):
+            service._record_usage("anthropic", "claude-sonnet", "builder", 10, 5, "run-1", "p1")
+
+        event = buffer.submit.call_args[0][0]
+        assert (event.total_tokens, event.prompt_tokens, event.completion_tokens) == (15, 10, 5)
+        service.db.add.assert_not_called()
+
+    def test_direct_write_when_disabled(self, service):
+        with patch("autopack.config.settings.usage_buffer_enabled", False):
+            service._record_usage_total_only("anthropic", "claude-sonnet", "builder", 15)
+
+        service.db.add.assert_called_once()
+        service.db.commit.assert_called_once()
@@ -0,0 +1,184 @@
+"""Tests for workspace_file_index.py.
+
+IMP-PERF-017: Incrementally refreshed workspace file index and content cache.
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from autopack.context_selector import ContextSelector
+from autopack.workspace_file_index import WorkspaceFileIndex, glob_to_regex
+
+
+def _age(path: Path, seconds: float = 60.0) -> None:
+    """Backdate a file's mtime so it is outside the racy window."""
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "src" / "pkg" / "routes").mkdir(parents=True)
+    (tmp_path / "src" / "main.py").write_text("main")
+    (tmp_path / "src" / "pkg" / "models.py").write_text("models")
+    (tmp_path / "src" / "pkg" / "routes" / "users.py").write_text("users")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_main.py").write_text("test")
+    (tmp_path / "README.md").write_text("readme")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.py").write_text("ignored")
+    return tmp_path
+
+
+class TestGlobToRegex:
+    """Tests for pathlib-style glob translation."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,expected",
+        [
+            ("src/**/*.py", "src/main.py", True),
+            ("src/**/*.py", "src/pkg/routes/users.py", True),
+            ("src/*.py", "src/pkg/models.py", False),
+            ("*.md", "README.md", True),
+            ("*.md", "docs/guide.md", False),
+            ("src/**/*auth*.py", "src/pkg/oauth_client.py", True),
+            ("src/**/routes/**/*", "src/pkg/routes/users.py", True),
+            ("test_[ab].py", "test_a.py", True),
+            ("test_[!ab].py", "test_a.py", False),
+            ("src/**", "src/main.py", False),
+        ],
+    )
+    def test_matches_like_pathlib(self, pattern, path, expected):
+        assert bool(glob_to_regex(pattern).match(path)) is expected
+
+
+class TestWorkspaceFileIndex:
+    """Tests for indexing and incremental refresh."""
+
+    def test_indexes_files_with_metadata(self, workspace: Path):
+        index = WorkspaceFileIndex(workspace)
+
+        entry = index.get("src/pkg/models.py")
+        assert entry is not None
+        assert entry.language == "python"
+        assert entry.category == "source"
+        assert entry.size == len("models")
+        assert index.get("tests/test_main.py").category == "tests"
+        assert index.get("README.md").category == "docs"
+        assert index.get("node_modules/dep.py") is None
+
+    def test_glob_matches_pathlib(self, workspace: Path):
+        index = WorkspaceFileIndex(workspace)
+
+        for pattern in ["src/**/*.py", "src/**/routes/**/*", "*.md", "tests/**/*.py"]:
+            expected = sorted(
+                p.relative_to(workspace).as_posix()
+                for p in workspace.glob(pattern)
+                if p.is_file() and "node_modules" not in p.parts
+            )
+            assert index.glob(pattern) == expected
+
+    def test_refresh_detects_added_removed_and_modified(self, workspace: Path):
+        index = WorkspaceFileIndex(workspace)
+        index.refresh()
+
+        (workspace / "src" / "new.py").write_text("new")
+        (workspace / "README.md").unlink()
+        (workspace / "src" / "main.py").write_text("main changed")
+
+        stats = index.refresh()
+
+        assert stats == {"added": 1, "removed": 1, "modified": 1}
+        assert "src/new.py" in index.glob("src/*.py")
+        assert index.get("README.md") is None
+
+    def test_unchanged_directories_not_relisted(self, workspace: Path):
+        for directory in [workspace, *[p for p in workspace.rglob("*") if p.is_dir()]]:
+            _age(directory)
+        index = WorkspaceFileIndex(workspace)
+        index.refresh()
+
+        with patch("autopack.workspace_file_index.os.scandir") as mock_scandir:
+            stats = index.refresh()
+
+        mock_scandir.assert_not_called()
+        assert stats == {"added": 0, "removed": 0, "modified": 0}
+
+    def test_missing_root_is_empty(self, tmp_path: Path):
+        index = WorkspaceFileIndex(tmp_path / "missing")
+        assert index.glob("**/*") == []
+
+
+class TestContentCache:
+    """Tests for the mtime-keyed content cache."""
+
+    def test_unchanged_file_read_once(self, workspace: Path):
+        path = workspace / "src" / "main.py"
+        _age(path)
+        index = WorkspaceFileIndex(workspace)
+
+        assert index.read_text(path) == "main"
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert index.read_text(path) == "main"
+        assert index.stats()["content_hits"] == 1
+
+    def test_modified_file_re_read(self, workspace: Path):
+        path = workspace / "src" / "main.py"
+        _age(path, 120)
+        index = WorkspaceFileIndex(workspace)
+        index.read_text(path)
+
+        path.write_text("updated content")
+        _age(path, 60)
+
+        assert index.read_text(path) == "updated content"
+
+    def test_recently_modified_file_not_cached(self, workspace: Path):
+        index = WorkspaceFileIndex(workspace)
+        index.read_text(workspace / "src" / "main.py")
+        assert index.stats()["cached_files"] == 0
+
+    def test_cache_bounded_by_bytes(self, workspace: Path):
+        paths = [workspace / "src" / "main.py", workspace / "src" / "pkg" / "models.py"]
+        for path in paths:
+            _age(path)
+        index = WorkspaceFileIndex(workspace, max_content_bytes=8)
+
+        for path in paths:
+            index.read_text(path)
+
+        stats = index.stats()
+        assert stats["cached_bytes"] <= 8
+        assert stats["cached_files"] == 1
+
+
+class TestContextSelectorUsesIndex:
+    """ContextSelector should resolve globs and reads through the index."""
+
+    def test_repeated_phases_served_from_cache(self, workspace: Path):
+        for path in workspace.rglob("*"):
+            _age(path)
+        index = WorkspaceFileIndex(workspace)
+        selector = ContextSelector(workspace, file_index=index)
+        phase = {"task_category": "general", "description": "api database change"}
+
+        first = selector.get_context_for_phase(phase)
+        misses = index.stats()["content_misses"]
+        second = selector.get_context_for_phase(phase)
+
+        assert first == second
+        assert "src/pkg/models.py" in first
+        assert index.stats()["content_misses"] == misses
+
+    def test_new_files_visible_to_next_phase(self, workspace: Path):
+        selector = ContextSelector(workspace)
+        phase = {"task_category": "general", "description": ""}
+        selector.get_context_for_phase(phase)
+
+        (workspace / "src" / "added.py").write_text("added")
+
+        assert "src/added.py" in selector.get_context_for_phase(phase)
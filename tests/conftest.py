@@ -17,7 +17,7 @@ import pytest
 
 # Ensure tests do not accidentally require a running Postgres instance.
 # Autopack defaults to Postgres for production; for unit tests we prefer in-memory SQLite.
-# IMPORTANT: This must run before importing `autopack.database` (which creates an engine at import time).
+# IMPORTANT: This must run before the first use of `autopack.database.engine` (created lazily).
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
 # Additional paths for backend compatibility
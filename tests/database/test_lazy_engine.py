@@ -0,0 +1,78 @@
+"""Tests for lazy database engine initialization (IMP-PERF-024).
+
+Tests that verify:
+- Importing autopack.models / autopack.database does not create the engine
+- The engine is created on first use and honours DATABASE_URL set after import
+- Sessions bind to the lazily created engine
+- Patching autopack.database.engine is honoured by internal helpers
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from sqlalchemy import text
+
+import autopack.database as database
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def _run_python(code: str, database_url: str = None) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.pop("DATABASE_URL", None)
+    if database_url:
+        env["DATABASE_URL"] = database_url
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=120
+    )
+
+
+class TestLazyEngine:
+    """Tests for deferred engine creation."""
+
+    def test_import_does_not_create_engine(self):
+        # No DATABASE_URL: the Postgres default driver may not even be installed,
+        # so import must not touch it.
+        result = _run_python(
+            "import autopack.models, autopack.database as db; print('engine' in vars(db))"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+    def test_engine_created_on_first_use_with_late_database_url(self, tmp_path):
+        db_path = tmp_path / "late.db"
+        result = _run_python(
+            "import os, autopack.database as db\n"
+            f"os.environ['DATABASE_URL'] = {f'sqlite:///{db_path.as_posix()}'!r}\n"
+            "from sqlalchemy import text\n"
+            "with db.SessionLocal() as s: print(s.execute(text('SELECT 1')).scalar())\n"
+            "print(db.engine is db.get_engine(), db.engine.url.database)\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["1", "True", db_path.as_posix()]
+
+    def test_sessions_bind_to_shared_engine(self):
+        with database._LazyEngineSession() as session:
+            assert session.get_bind() is database._get_or_create_engine()
+            assert session.execute(text("SELECT 1")).scalar() == 1
+
+    def test_patched_engine_is_honoured(self):
+        mock_engine = Mock()
+        mock_engine.pool.size.return_value = 20
+        mock_engine.pool.checkedout.return_value = 4
+        mock_engine.pool.overflow.return_value = 0
+        mock_engine.pool._max_overflow = 10
+
+        with patch("autopack.database.engine", mock_engine):
+            assert database.get_engine() is mock_engine
+            stats = database.get_pool_stats()
+
+        assert stats["pool_size"] == 20
+        assert stats["checked_out"] == 4
+        assert database.get_engine() is not mock_engine
@@ -0,0 +1,248 @@
+"""Tests for concurrent memory-context prefetch (IMP-PERF-019).
+
+Tests that verify:
+- Context for upcoming phases is retrieved in the background and served from cache
+- Cached context is invalidated by writes to what it read, phase edits and TTL expiry
+- Grouped phases retrieve missing context concurrently
+- Hit rates are exposed in get_loop_stats
+"""
+
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from autopack.autonomy.parallelism_gate import ScopeBasedParallelismChecker
+from autopack.executor.autonomous_loop import AutonomousLoop
+from autopack.executor.context_prefetcher import PhaseContextPrefetcher
+from autopack.memory.faiss_store import FaissStore
+from autopack.memory.qdrant_store import QdrantStore
+from autopack.memory.write_generation import (
+    bump_memory_write_generation,
+    get_memory_write_generation,
+    note_memory_read,
+    reads_are_current,
+    track_memory_reads,
+)
+
+
+def _phase(phase_id: str, description: str = "goal", path: str = "src/a/") -> dict:
+    return {
+        "phase_id": phase_id,
+        "phase_type": "build",
+        "description": description,
+        "status": "QUEUED",
+        "scope": {"paths": [path]},
+    }
+
+
+class TestPhaseContextPrefetcher:
+    """Tests for PhaseContextPrefetcher caching."""
+
+    def test_prefetched_context_served_from_cache(self):
+        build = Mock(side_effect=lambda phase: f"context for {phase['phase_id']}")
+        prefetcher = PhaseContextPrefetcher(build)
+
+        assert prefetcher.prefetch([_phase("p1"), _phase("p2")]) == 2
+        assert prefetcher.prefetch([_phase("p1")]) == 0
+
+        assert prefetcher.get_many([_phase("p1"), _phase("p2")]) == {
+            "p1": "context for p1",
+            "p2": "context for p2",
+        }
+        assert build.call_count == 2
+        stats = prefetcher.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 0
+        assert stats["hit_rate"] == 1.0
+        prefetcher.shutdown()
+
+    def test_memory_write_invalidates_cached_context(self):
+        calls = [0]
+
+        def build(phase):
+            note_memory_read("errors_ci", {"project_id": "proj-a"})
+            calls[0] += 1
+            return f"build {calls[0]}"
+
+        prefetcher = PhaseContextPrefetcher(build)
+
+        prefetcher.prefetch([_phase("p1")])
+        prefetcher.get(_phase("p1"))
+        bump_memory_write_generation("errors_ci", ["proj-a"])
+
+        assert prefetcher.get(_phase("p1")) == "build 2"
+        stats = prefetcher.get_stats()
+        assert stats["stale"] == 1
+        assert stats["misses"] == 1
+        prefetcher.shutdown()
+
+    def test_unrelated_writes_keep_cached_context(self):
+        def read_errors(phase):
+            note_memory_read("errors_ci", {"project_id": "proj-a"})
+            return "context"
+
+        build = Mock(side_effect=read_errors)
+        prefetcher = PhaseContextPrefetcher(build)
+        prefetcher.prefetch([_phase("p1")])
+        prefetcher.get(_phase("p1"))
+
+        bump_memory_write_generation("errors_ci", ["proj-b"])
+        bump_memory_write_generation("run_summaries", ["proj-a"])
+
+        assert prefetcher.get(_phase("p1")) == "context"
+        assert build.call_count == 1
+        assert prefetcher.get_stats()["stale"] == 0
+        prefetcher.shutdown()
+
+    def test_edited_phase_and_expired_entries_refetched(self):
+        now = [0.0]
+        build = Mock(side_effect=lambda phase: phase["description"])
+        prefetcher = PhaseContextPrefetcher(
+            build, ttl_seconds=10, clock=lambda: now[0]
+        )
+        prefetcher.prefetch([_phase("p1", "old goal")])
+
+        assert prefetcher.get(_phase("p1", "new goal")) == "new goal"
+        now[0] = 11.0
+        prefetcher.get(_phase("p1", "new goal"))
+
+        assert build.call_count == 3
+        prefetcher.shutdown()
+
+    def test_get_many_retrieves_misses_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def build(phase):
+            # Deadlocks (and times out) unless all three run at once
+            barrier.wait()
+            return phase["phase_id"]
+
+        prefetcher = PhaseContextPrefetcher(build, max_workers=3)
+
+        results = prefetcher.get_many([_phase("p1"), _phase("p2"), _phase("p3")])
+
+        assert results == {"p1": "p1", "p2": "p2", "p3": "p3"}
+        prefetcher.shutdown()
+
+    def test_failed_retrieval_returns_empty_and_is_not_cached(self):
+        build = Mock(side_effect=[RuntimeError("vector store down"), "recovered"])
+        prefetcher = PhaseContextPrefetcher(build)
+
+        assert prefetcher.get(_phase("p1")) == ""
+        assert prefetcher.get(_phase("p1")) == "recovered"
+        prefetcher.shutdown()
+
+
+class TestMemoryWriteGeneration:
+    """Vector store writes must advance the write generation."""
+
+    def test_faiss_writes_bump_generation(self, tmp_path):
+        store = FaissStore(index_dir=str(tmp_path))
+        point = {"id": "a", "vector": [0.1] * 8, "payload": {"text": "x"}}
+        store.ensure_collection("test", size=8)
+
+        before = get_memory_write_generation()
+        store.upsert("test", [point])
+        after_upsert = get_memory_write_generation()
+        store.update_payload("test", "a", {"text": "y"})
+        after_update = get_memory_write_generation()
+        store.delete("test", ["a"])
+
+        assert before < after_upsert < after_update < get_memory_write_generation()
+
+    def test_reads_scoped_to_collection_and_project(self, tmp_path):
+        store = FaissStore(index_dir=str(tmp_path))
+        store.ensure_collection("test", size=8)
+        store.upsert("test", [{"id": "a", "vector": [0.1] * 8, "payload": {"project_id": "p"}}])
+
+        with track_memory_reads() as project_reads:
+            store.search("test", [0.1] * 8, filter={"project_id": "p"})
+        with track_memory_reads() as all_reads:
+            store.scroll("test")
+
+        store.upsert("other", [{"id": "b", "vector": [0.1] * 8, "payload": {"project_id": "p"}}])
+        store.upsert("test", [{"id": "c", "vector": [0.1] * 8, "payload": {"project_id": "q"}}])
+        assert reads_are_current(project_reads)
+        assert not reads_are_current(all_reads)
+
+        # Deleting a point of the read project invalidates the project-scoped read
+        store.delete("test", ["a"])
+        assert not reads_are_current(project_reads)
+
+    @pytest.mark.parametrize(
+        "retrieve",
+        [
+            Mock(return_value=[Mock(payload={"project_id": "p"})]),
+            # Previous project unknown: every project is invalidated
+            Mock(side_effect=ConnectionError("Connection lost")),
+        ],
+    )
+    def test_qdrant_payload_update_invalidates_previous_project(self, retrieve):
+        client = MagicMock()
+        client.get_collections.return_value = Mock(collections=[])
+        client.retrieve = retrieve
+        with (
+            patch("autopack.memory.qdrant_store.QdrantClient", return_value=client),
+            patch.object(QdrantStore, "_check_qdrant_health", return_value=(True, "")),
+        ):
+            store = QdrantStore(host="localhost", port=6333)
+        with track_memory_reads() as reads:
+            note_memory_read("test", {"project_id": "p"})
+
+        # The point moves from project p to q
+        assert store.update_payload("test", "a", {"project_id": "q"})
+
+        assert not reads_are_current(reads)
+
+
+class TestAutonomousLoopPrefetch:
+    """Tests for prefetch wiring in the parallel path."""
+
+    def _make_loop(self):
+        executor = Mock()
+        executor.workspace = "/test"
+        executor.run_id = "test-run"
+        executor.execute_phase = Mock(return_value=(True, "COMPLETED"))
+
+        with patch("autopack.executor.autonomous_loop.settings") as mock_settings:
+            mock_settings.circuit_breaker_enabled = False
+            mock_settings.context_ceiling_tokens = 50000
+            mock_settings.parallel_phase_execution_enabled = True
+            mock_settings.max_parallel_phases = 2
+            mock_settings.context_prefetch_depth = 2
+            loop = AutonomousLoop(executor)
+
+        loop._parallelism_checker = ScopeBasedParallelismChecker()
+        loop._get_telemetry_adjustments = Mock(return_value={})
+        loop._get_improvement_task_context = Mock(return_value="")
+        loop._get_memory_context = Mock(side_effect=lambda phase_type, goal: f"memory: {goal}")
+        return loop
+
+    def test_upcoming_phases_prefetched_and_hit(self):
+        loop = self._make_loop()
+        p1, p2 = _phase("p1", "one", "src/a/"), _phase("p2", "two", "src/b/")
+        p3 = _phase("p3", "three", "src/c/")
+
+        loop._try_parallel_execution({"phases": [p1, p2, p3]}, p1)
+        loop._drain_phase_scheduler()
+        loop._try_parallel_execution({"phases": [p3, _phase("p4", "four", "src/d/")]}, p3)
+        loop._drain_phase_scheduler()
+
+        stats = loop.get_loop_stats()["parallel_execution"]["context_prefetch"]
+        assert stats["hits"] >= 1
+        assert stats["prefetches_started"] >= 1
+        call = loop.executor.execute_phase.call_args_list
+        contexts = {c.args[0]["phase_id"]: c.kwargs.get("memory_context") for c in call}
+        assert contexts["p3"] == "memory: three"
+
+    def test_prefetch_disabled_with_zero_depth(self):
+        loop = self._make_loop()
+        loop._context_prefetch_depth = 0
+        p1, p2 = _phase("p1", "one", "src/a/"), _phase("p2", "two", "src/b/")
+
+        loop._try_parallel_execution({"phases": [p1, p2]}, p1)
+        loop._drain_phase_scheduler()
+
+        assert loop._context_prefetcher is None
+        assert loop.executor.execute_phase.call_count == 2
@@ -1,6 +1,7 @@
 """Tests for parallel phase execution in autonomous loop (IMP-AUTO-002).
 
-Tests the ThreadPoolExecutor-based parallel execution of phases with non-overlapping scopes.
+Tests the parallel execution of phases with non-overlapping scopes through the
+long-lived PhaseScheduler (IMP-PERF-018).
 """
 
 from unittest.mock import Mock, patch
@@ -137,62 +138,83 @@ class TestGetQueuedPhasesForParallelCheck:
             assert queued[1]["phase_id"] == "p3"
 
 
-class TestExecutePhasesParallel:
-    """Tests for parallel phase execution."""
-
-    def test_single_phase_executes_directly(self):
-        """Test that single phase executes directly without ThreadPoolExecutor."""
-        executor = Mock()
-        executor.workspace = "/test"
-        executor.run_id = "test-run"
-        executor.execute_phase = Mock(return_value=(True, "COMPLETED"))
+class TestSchedulerPhaseExecution:
+    """Tests for phase execution through the loop's PhaseScheduler (IMP-PERF-018)."""
 
+    def _make_loop(self, executor):
         with patch("autopack.executor.autonomous_loop.settings") as mock_settings:
             mock_settings.circuit_breaker_enabled = False
             mock_settings.context_ceiling_tokens = 50000
             mock_settings.parallel_phase_execution_enabled = True
             mock_settings.max_parallel_phases = 2
 
-            loop = AutonomousLoop(executor)
-
-            phases = [{"phase_id": "p1", "scope": {"paths": ["src/a/"]}}]
-
-            results = loop._execute_phases_parallel(phases, {"p1": {}})
-
-            assert len(results) == 1
-            phase, success, status = results[0]
-            assert phase["phase_id"] == "p1"
-            assert success is True
-            assert status == "COMPLETED"
+            return AutonomousLoop(executor)
 
-    def test_multiple_phases_execute_in_parallel(self):
-        """Test that multiple phases execute using ThreadPoolExecutor."""
+    def test_scheduled_phases_execute_with_adjustments(self):
+        """Test that scheduled phases run with their adjustments and are counted."""
         executor = Mock()
         executor.workspace = "/test"
         executor.run_id = "test-run"
         executor.execute_phase = Mock(return_value=(True, "COMPLETED"))
 
-        with patch("autopack.executor.autonomous_loop.settings") as mock_settings:
-            mock_settings.circuit_breaker_enabled = False
-            mock_settings.context_ceiling_tokens = 50000
-            mock_settings.parallel_phase_execution_enabled = True
-            mock_settings.max_parallel_phases = 2
+        loop = self._make_loop(executor)
+        p1 = {"phase_id": "p1", "scope": {"paths": ["src/a/"]}}
+        p2 = {"phase_id": "p2", "scope": {"paths": ["src/b/"]}}
 
-            loop = AutonomousLoop(executor)
+        scheduler = loop._get_phase_scheduler()
+        scheduler.submit(p1, {"memory_context": "ctx"})
+        scheduler.submit(p2)
+        results = loop._drain_phase_scheduler()
 
-            phases = [
-                {"phase_id": "p1", "scope": {"paths": ["src/a/"]}},
-                {"phase_id": "p2", "scope": {"paths": ["src/b/"]}},
-            ]
+        assert {r[0]["phase_id"] for r in results} == {"p1", "p2"}
+        assert all(success and status == "COMPLETED" for _, success, status in results)
+        assert loop._parallel_phases_executed == 2
+        executor.execute_phase.assert_any_call(p1, memory_context="ctx")
 
-            results = loop._execute_phases_parallel(phases, {"p1": {}, "p2": {}})
+    def test_phase_exception_reported_as_failure(self):
+        """Test that an exception in a scheduled phase becomes a failed result."""
+        executor = Mock()
+        executor.workspace = "/test"
+        executor.run_id = "test-run"
+        executor.execute_phase = Mock(side_effect=RuntimeError("boom"))
 
-            assert len(results) == 2
-            assert loop._parallel_phases_executed == 2
+        loop = self._make_loop(executor)
+        loop._get_phase_scheduler().submit({"phase_id": "p1", "scope": {"paths": ["src/a/"]}})
+        results = loop._drain_phase_scheduler()
 
-            # Verify both phases completed
-            phase_ids = {r[0]["phase_id"] for r in results}
-            assert phase_ids == {"p1", "p2"}
+        assert len(results) == 1
+        _, success, status = results[0]
+        assert success is False
+        assert status.startswith("THREAD_ERROR")
+
+
+    def test_running_next_phase_still_refills_free_slots(self):
+        """Test that other queued phases are dispatched when next_phase is already running."""
+        executor = Mock()
+        executor.workspace = "/test"
+        executor.run_id = "test-run"
+        executor.project_root = "."
+        executor._phase_failure_counts = {}
+        executor._run_tokens_used = 0
+        p1 = {"phase_id": "p1", "status": "QUEUED", "scope": {"paths": ["src/a/"]}}
+        p2 = {"phase_id": "p2", "status": "QUEUED", "scope": {"paths": ["src/b/"]}}
+        executor.get_run_status.return_value = {"phases": [p1, p2]}
+        executor.get_next_queued_phase.return_value = p1
+
+        loop = self._make_loop(executor)
+        with (
+            patch.object(loop, "_get_running_phase_ids", return_value={"p1"}),
+            patch.object(
+                loop, "_try_parallel_execution", return_value=([(p2, True, "COMPLETE")], 1)
+            ) as try_parallel,
+            patch.object(loop, "_await_parallel_completions") as await_completions,
+        ):
+            loop._execute_loop(poll_interval=0.01, max_iterations=1, stop_on_first_failure=False)
+
+        try_parallel.assert_called_once()
+        assert try_parallel.call_args.args[1] is p1
+        await_completions.assert_not_called()
+        executor.execute_phase.assert_not_called()
 
 
 class TestTryParallelExecution:
@@ -0,0 +1,183 @@
+"""Tests for event-driven loop wakeups (IMP-PERF-020).
+
+Tests that verify:
+- In-process notifications end a wait immediately
+- Notifications to a registered channel end a wait, filtered by run
+- notify_loop_wakeup is a no-op when no loop is registered
+- _adaptive_sleep blocks on the channel instead of time.sleep
+- Pickup latency is recorded and exposed in get_loop_stats
+"""
+
+import json
+import socket
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from autopack.executor.autonomous_loop import AutonomousLoop
+from autopack.executor.loop_wakeup import LoopWakeupChannel, notify_loop_wakeup
+
+
+class TestLoopWakeupChannel:
+    """Tests for LoopWakeupChannel."""
+
+    def test_wait_times_out_without_notification(self):
+        channel = LoopWakeupChannel()
+
+        assert channel.wait(0.01) is None
+        assert channel.get_stats()["timeouts"] == 1
+
+    def test_pending_notification_returns_immediately(self):
+        channel = LoopWakeupChannel()
+        channel.notify("generated_tasks")
+
+        start = time.monotonic()
+        event = channel.wait(5.0)
+
+        assert event.reason == "generated_tasks"
+        assert time.monotonic() - start < 1.0
+
+    def test_notification_from_other_thread_wakes_waiter(self):
+        channel = LoopWakeupChannel()
+        timer = threading.Timer(0.05, channel.notify, args=("approval",))
+        timer.start()
+
+        start = time.monotonic()
+        event = channel.wait(5.0)
+        timer.join()
+
+        assert event.reason == "approval"
+        assert time.monotonic() - start < 1.0
+
+    def test_registered_channel_woken_by_notify(self, tmp_path):
+        channel = LoopWakeupChannel(run_id="run-1")
+        assert channel.register(tmp_path)
+        try:
+            assert notify_loop_wakeup("phase_queued", run_id="run-1", registry_dir=tmp_path) == 1
+            event = channel.wait(5.0)
+
+            assert event.reason == "phase_queued"
+            # The same notification is not delivered twice
+            assert channel.wait(0.05) is None
+        finally:
+            channel.close()
+
+    def test_datagram_from_other_process_wakes_waiter(self, tmp_path):
+        channel = LoopWakeupChannel(run_id="run-1")
+        channel.register(tmp_path)
+        try:
+            # Simulate another process: the in-process registry shortcut is bypassed
+            with patch.dict("autopack.executor.loop_wakeup._local_channels", clear=True):
+                assert notify_loop_wakeup("phase_queued", run_id="run-1", registry_dir=tmp_path)
+            event = channel.wait(5.0)
+
+            assert event.reason == "phase_queued"
+            assert event.run_id == "run-1"
+        finally:
+            channel.close()
+
+    def test_notification_for_other_run_ignored(self, tmp_path):
+        channel = LoopWakeupChannel(run_id="run-1")
+        channel.register(tmp_path)
+        try:
+            assert notify_loop_wakeup("phase_queued", run_id="run-2", registry_dir=tmp_path) == 0
+
+            # Datagrams carrying another run's ID are dropped by the receiver
+            port = json.loads(channel.registration_file.read_text())["port"]
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                for run_id in ("run-2", "run-1"):
+                    record = {"reason": "phase_queued", "run_id": run_id, "created_at": time.time()}
+                    sock.sendto(json.dumps(record).encode("utf-8"), ("127.0.0.1", port))
+
+            assert channel.wait(5.0).run_id == "run-1"
+            assert channel.get_stats()["wakeups"] == 1
+        finally:
+            channel.close()
+
+    def test_notify_without_registered_loop_is_noop(self, tmp_path):
+        registry_dir = tmp_path / ".wakeup"
+
+        assert notify_loop_wakeup("roadc_tasks", registry_dir=registry_dir) == 0
+        assert not registry_dir.exists()
+
+        registry_dir.mkdir()
+        assert notify_loop_wakeup("roadc_tasks", run_id="run-1", registry_dir=registry_dir) == 0
+        assert list(registry_dir.iterdir()) == []
+
+    def test_close_removes_registration(self, tmp_path):
+        channel = LoopWakeupChannel(run_id="run-1")
+        channel.register(tmp_path)
+        registration = channel.registration_file
+        assert registration.exists()
+
+        channel.close()
+
+        assert not registration.exists()
+        assert not channel.registered
+        assert notify_loop_wakeup("phase_queued", run_id="run-1", registry_dir=tmp_path) == 0
+
+    def test_pickup_latency_recorded(self):
+        now = [100.0]
+        channel = LoopWakeupChannel(clock=lambda: now[0])
+        channel.notify("roadc_tasks")
+        now[0] = 100.25
+
+        channel.wait(1.0)
+        stats = channel.get_stats()
+
+        assert stats["wakeups"] == 1
+        assert stats["wakeups_by_reason"] == {"roadc_tasks": 1}
+        assert stats["avg_pickup_latency_ms"] == 250.0
+        assert stats["last_pickup_latency_ms"] == 250.0
+
+
+class TestAutonomousLoopWakeup:
+    """Tests for wakeup wiring in AutonomousLoop."""
+
+    def test_adaptive_sleep_ends_early_on_notification(self, tmp_path):
+        loop = AutonomousLoop(Mock())
+        loop._wakeup_channel = LoopWakeupChannel()
+        loop._wakeup_channel.register(tmp_path)
+        timer = threading.Timer(0.05, loop.notify_work_available, args=("generated_tasks",))
+        timer.start()
+
+        try:
+            with patch("time.sleep") as mock_sleep:
+                start = time.monotonic()
+                loop._adaptive_sleep(is_idle=True, base_interval=2.0)
+            timer.join()
+        finally:
+            loop._wakeup_channel.close()
+
+        mock_sleep.assert_not_called()
+        assert time.monotonic() - start < 1.0
+
+    def test_registered_idle_wait_uses_max_idle_sleep_as_timeout(self, tmp_path):
+        loop = AutonomousLoop(Mock())
+        loop._wakeup_channel = Mock(registered=True)
+
+        sleep_time = loop._adaptive_sleep(is_idle=True, base_interval=0.5)
+
+        assert sleep_time == loop.max_idle_sleep
+        loop._wakeup_channel.wait.assert_called_once_with(loop.max_idle_sleep)
+
+    def test_injected_tasks_notify_loop(self):
+        loop = AutonomousLoop(Mock())
+        loop._wakeup_channel = LoopWakeupChannel()
+        loop._fetch_generated_tasks = Mock(return_value=[{"phase_id": "gen-1"}])
+
+        loop._inject_generated_tasks_into_backlog({"phases": []})
+
+        assert loop._wakeup_channel.wait(0).reason == "generated_tasks"
+
+    def test_loop_stats_include_wakeup_metrics(self):
+        loop = AutonomousLoop(Mock())
+        assert loop.get_loop_stats()["wakeup"] == {"enabled": False}
+
+        loop._wakeup_channel = LoopWakeupChannel()
+        loop.notify_work_available("approval")
+        loop._adaptive_sleep(is_idle=False, base_interval=0.5)
+
+        stats = loop.get_loop_stats()["wakeup"]
+        assert stats["wakeups"] == 1
+        assert "avg_pickup_latency_ms" in stats
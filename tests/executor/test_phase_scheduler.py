@@ -0,0 +1,205 @@
+"""Tests for the streaming parallel phase scheduler (IMP-PERF-018).
+
+Tests that verify:
+- A freed worker slot is refilled while slower phases are still running
+- New phases are admitted only if compatible with the running scopes
+- Per-slot utilization and queue-wait metrics are reported
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+from autopack.autonomy.parallelism_gate import ScopeBasedParallelismChecker
+from autopack.executor.autonomous_loop import AutonomousLoop
+from autopack.executor.phase_scheduler import PhaseScheduler
+
+
+def _phase(phase_id: str, path: str) -> dict:
+    return {"phase_id": phase_id, "status": "QUEUED", "scope": {"paths": [path]}}
+
+
+class _GatedExecutor:
+    """Executes phases only once their gate is released by the test."""
+
+    def __init__(self):
+        self.gates = {}
+        self.started = []
+
+    def gate(self, phase_id: str) -> threading.Event:
+        return self.gates.setdefault(phase_id, threading.Event())
+
+    def __call__(self, phase, adjustments):
+        self.started.append(phase["phase_id"])
+        self.gate(phase["phase_id"]).wait(timeout=5)
+        return True, "COMPLETED"
+
+
+class TestPhaseScheduler:
+    """Tests for PhaseScheduler slot management."""
+
+    def test_returns_first_completion_without_waiting_for_slow_phase(self):
+        execute = _GatedExecutor()
+        scheduler = PhaseScheduler(execute, max_slots=2)
+        scheduler.submit(_phase("slow", "src/a/"))
+        scheduler.submit(_phase("fast", "src/b/"))
+
+        execute.gate("fast").set()
+        completions = scheduler.wait_for_completions(timeout=5)
+
+        assert [c.phase["phase_id"] for c in completions] == ["fast"]
+        assert scheduler.running_phase_ids == {"slow"}
+        assert scheduler.free_slots == 1
+
+        execute.gate("slow").set()
+        assert [c.phase["phase_id"] for c in scheduler.drain(timeout=5)] == ["slow"]
+        scheduler.shutdown()
+
+    def test_admission_checked_against_running_scopes(self):
+        checker = ScopeBasedParallelismChecker()
+        execute = _GatedExecutor()
+        scheduler = PhaseScheduler(
+            execute, max_slots=3, compatibility_check=checker.can_execute_parallel
+        )
+
+        # A lone phase is always admissible
+        assert scheduler.can_admit(_phase("p1", "src/a/"))[0] is True
+        scheduler.submit(_phase("p1", "src/a/"))
+
+        assert scheduler.can_admit(_phase("p2", "src/b/"))[0] is True
+        assert scheduler.can_admit(_phase("p3", "src/a/"))[0] is False
+        assert scheduler.can_admit(_phase("p1", "src/c/"))[0] is False
+
+        execute.gate("p1").set()
+        scheduler.drain(timeout=5)
+        scheduler.shutdown()
+
+    def test_no_admission_when_slots_full(self):
+        execute = _GatedExecutor()
+        scheduler = PhaseScheduler(execute, max_slots=1)
+        scheduler.submit(_phase("p1", "src/a/"))
+
+        can_admit, reason = scheduler.can_admit(_phase("p2", "src/b/"))
+
+        assert can_admit is False
+        assert reason == "No free worker slot"
+        execute.gate("p1").set()
+        scheduler.drain(timeout=5)
+        scheduler.shutdown()
+
+    def test_exception_reported_as_failed_completion(self):
+        scheduler = PhaseScheduler(Mock(side_effect=RuntimeError("boom")), max_slots=1)
+        scheduler.submit(_phase("p1", "src/a/"))
+
+        (completion,) = scheduler.drain(timeout=5)
+
+        assert completion.success is False
+        assert "boom" in completion.status
+        scheduler.shutdown()
+
+    def test_stats_report_queue_wait_and_slot_utilization(self):
+        now = [0.0]
+        scheduler = PhaseScheduler(
+            Mock(return_value=(True, "COMPLETED")), max_slots=2, clock=lambda: now[0]
+        )
+
+        scheduler.note_queued(["p1"])
+        now[0] = 3.0
+        scheduler.submit(_phase("p1", "src/a/"))
+        now[0] = 5.0
+        scheduler.drain(timeout=5)
+        now[0] = 10.0
+        stats = scheduler.get_stats()
+        scheduler.shutdown()
+
+        assert stats["phases_submitted"] == 1
+        assert stats["phases_completed"] == 1
+        assert stats["avg_queue_wait_seconds"] == 3.0
+        assert stats["slots"][0]["busy_seconds"] == 2.0
+        assert stats["slots"][0]["utilization"] == 0.2
+        assert stats["slots"][1]["utilization"] == 0.0
+
+
+class TestAutonomousLoopStreaming:
+    """Tests for streaming dispatch through AutonomousLoop."""
+
+    def _make_loop(self, execute_phase):
+        executor = Mock()
+        executor.workspace = "/test"
+        executor.run_id = "test-run"
+        executor.execute_phase = execute_phase
+
+        with patch("autopack.executor.autonomous_loop.settings") as mock_settings:
+            mock_settings.circuit_breaker_enabled = False
+            mock_settings.context_ceiling_tokens = 50000
+            mock_settings.parallel_phase_execution_enabled = True
+            mock_settings.max_parallel_phases = 2
+            loop = AutonomousLoop(executor)
+
+        loop._parallelism_checker = ScopeBasedParallelismChecker()
+        loop._build_parallel_phase_adjustments = Mock(return_value={})
+        loop._get_memory_context = Mock(return_value="")
+        return loop
+
+    def test_slot_refilled_while_slow_phase_runs(self):
+        gates = {pid: threading.Event() for pid in ("slow", "fast", "next")}
+
+        def execute_phase(phase, **kwargs):
+            gates[phase["phase_id"]].wait(timeout=5)
+            return True, "COMPLETED"
+
+        loop = self._make_loop(execute_phase)
+        slow, fast, nxt = (
+            _phase("slow", "src/a/"),
+            _phase("fast", "src/b/"),
+            _phase("next", "src/c/"),
+        )
+
+        gates["fast"].set()
+        results, count = loop._try_parallel_execution({"phases": [slow, fast]}, slow)
+        assert [r[0]["phase_id"] for r in results] == ["fast"]
+        assert loop._get_running_phase_ids() == {"slow"}
+
+        # The freed slot is refilled before the slow phase finishes
+        gates["next"].set()
+        results, _ = loop._try_parallel_execution({"phases": [slow, nxt]}, slow)
+        assert [r[0]["phase_id"] for r in results] == ["next"]
+
+        gates["slow"].set()
+        assert [r[0]["phase_id"] for r in loop._drain_phase_scheduler()] == ["slow"]
+        assert loop._parallel_phases_executed == 3
+
+    def test_conflicting_phase_waits_for_running_scope(self):
+        gate = threading.Event()
+        started = []
+
+        def execute_phase(phase, **kwargs):
+            started.append(phase["phase_id"])
+            gate.wait(timeout=5)
+            return True, "COMPLETED"
+
+        loop = self._make_loop(execute_phase)
+        p1, p2, p3 = _phase("p1", "src/a/"), _phase("p2", "src/b/"), _phase("p3", "src/a/")
+        scheduler = loop._get_phase_scheduler()
+        scheduler.submit(p1)
+        scheduler.submit(p2)
+
+        gate.set()
+        results, _ = loop._try_parallel_execution({"phases": [p3]}, p3)
+
+        assert "p3" not in started
+        assert {r[0]["phase_id"] for r in results} <= {"p1", "p2"}
+        loop._drain_phase_scheduler()
+
+    def test_loop_stats_include_scheduler_metrics(self):
+        loop = self._make_loop(Mock(return_value=(True, "COMPLETED")))
+        loop._try_parallel_execution(
+            {"phases": [_phase("p1", "src/a/"), _phase("p2", "src/b/")]}, _phase("p1", "src/a/")
+        )
+        loop._drain_phase_scheduler()
+
+        scheduler_stats = loop.get_loop_stats()["parallel_execution"]["scheduler"]
+
+        assert scheduler_stats["max_slots"] == 2
+        assert scheduler_stats["phases_completed"] == 2
+        assert len(scheduler_stats["slots"]) == 2
+        assert "avg_queue_wait_seconds" in scheduler_stats
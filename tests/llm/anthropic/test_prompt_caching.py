@@ -0,0 +1,187 @@
+"""Tests for the prompt-cache friendly builder prompt layout (IMP-PERF-029).
+
+Tests that verify:
+- Builder user prompts are split into shared -> phase -> attempt segments
+- Cache breakpoints are placed on stable segments and blocks rejoin to the prompt
+- Cache read/write tokens are folded into input_tokens and reported separately
+- Retries reuse the shared and phase prefix; sibling phases reuse the shared prefix
+- Cache reads/writes are recorded in the phase token_budget metadata
+- Caching can be disabled via settings
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from autopack.llm.anthropic.phase_executor import AnthropicPhaseExecutor
+from autopack.llm.prompts.anthropic_builder_prompts import (
+    SegmentedPrompt,
+    build_system_prompt,
+    build_user_prompt,
+)
+from autopack.llm.providers.anthropic_transport import cache_control_blocks, extract_usage
+from autopack.llm.transport import StubTransport
+from autopack.llm_client import BuilderResult
+
+FILE_CONTEXT = {"existing_files": {"src/app.py": "def main():\n    return 1\n" * 200}}
+
+
+def _phase(description: str = "Add logging to main") -> dict:
+    return {
+        "phase_id": "phase-1",
+        "description": description,
+        "task_category": "feature",
+        "complexity": "medium",
+        "scope": {"paths": ["src/app.py"]},
+    }
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client._build_system_prompt = Mock(side_effect=build_system_prompt)
+    client._build_user_prompt = Mock(side_effect=build_user_prompt)
+    client._parse_full_file_output = Mock(
+        return_value=BuilderResult(
+            success=True,
+            patch_content="diff",
+            builder_messages=[],
+            tokens_used=100,
+            model_used="claude-sonnet-4-5",
+        )
+    )
+    return client
+
+
+def _execute(executor, phase_spec, run_hints=None):
+    return executor.execute_phase(
+        phase_spec=phase_spec,
+        file_context=FILE_CONTEXT,
+        max_tokens=4096,
+        model="claude-sonnet-4-5",
+        project_rules=[{"rule_text": "Always add type hints"}],
+        run_hints=run_hints,
+    )
+
+
+class TestSegmentedUserPrompt:
+    """Tests for the stable -> volatile layout of build_user_prompt."""
+
+    def test_sections_are_ordered_by_stability(self):
+        prompt = build_user_prompt(
+            _phase(),
+            FILE_CONTEXT,
+            [{"rule_text": "Always add type hints"}],
+            [{"hint_text": "Tests live in tests/"}],
+            retrieved_context="Earlier phase added a logger",
+        )
+
+        assert isinstance(prompt, SegmentedPrompt)
+        shared, phase, attempt = prompt.segments
+        assert "Output Format (strict)" in shared
+        assert "Always add type hints" in shared
+        assert "def main()" in shared
+        assert "Add logging to main" in phase
+        assert "src/app.py" in phase
+        assert "Tests live in tests/" in attempt
+        assert "Earlier phase added a logger" in attempt
+        assert prompt == "\n".join(prompt.segments)
+
+    def test_shared_segment_is_independent_of_phase_and_hints(self):
+        first = build_user_prompt(_phase(), FILE_CONTEXT, None, [{"hint_text": "a"}])
+        sibling = build_user_prompt(_phase("Add metrics"), FILE_CONTEXT, None, None)
+
+        assert first.segments[0] == sibling.segments[0]
+        assert first.segments[1] != sibling.segments[1]
+
+
+class TestCacheControlBlocks:
+    """Tests for cache_control_blocks and extract_usage."""
+
+    def test_breakpoints_on_stable_segments_only(self):
+        blocks = cache_control_blocks(["shared", "", "phase"], "attempt")
+
+        assert [b["text"] for b in blocks] == ["shared\n", "phase\n", "attempt"]
+        assert [("cache_control" in b) for b in blocks] == [True, True, False]
+        assert "".join(b["text"] for b in blocks) == "shared\nphase\nattempt"
+
+    def test_breakpoint_limit_keeps_latest(self):
+        blocks = cache_control_blocks(["a", "b", "c"], max_breakpoints=1)
+
+        assert [("cache_control" in b) for b in blocks] == [False, False, True]
+        assert blocks[-1]["text"] == "c"
+
+    def test_extract_usage_folds_cache_tokens(self):
+        usage = extract_usage(
+            Mock(
+                input_tokens=100,
+                output_tokens=50,
+                cache_creation_input_tokens=300,
+                cache_read_input_tokens=600,
+            )
+        )
+
+        assert usage.input_tokens == 1000
+        assert usage.uncached_input_tokens == 100
+        assert usage.cache_read_input_tokens == 600
+        assert usage.total_tokens == 1050
+
+    def test_extract_usage_without_cache_fields(self):
+        usage = extract_usage(
+            Mock(spec=["input_tokens", "output_tokens"], input_tokens=10, output_tokens=5)
+        )
+
+        assert usage.input_tokens == 10
+        assert usage.cache_creation_input_tokens == 0
+
+
+class TestBuilderPromptCaching:
+    """Tests for AnthropicPhaseExecutor against the local StubTransport."""
+
+    def test_retry_reads_shared_and_phase_prefix(self, client):
+        transport = StubTransport(responses=['{"files": []}'])
+        executor = AnthropicPhaseExecutor(transport, client)
+
+        _execute(executor, _phase(), run_hints=[{"hint_text": "first attempt"}])
+        phase_spec = _phase()
+        _execute(executor, phase_spec, run_hints=[{"hint_text": "second attempt differs"}])
+
+        first, retry = (request["usage"] for request in transport.requests)
+        assert first.cache_read_input_tokens == 0
+        assert first.cache_creation_input_tokens > 0
+        assert retry.cache_read_input_tokens == first.cache_creation_input_tokens
+        assert retry.cache_creation_input_tokens == 0
+        assert retry.uncached_input_tokens < retry.input_tokens / 10
+
+        token_budget = phase_spec["metadata"]["token_budget"]
+        assert token_budget["cache_read_input_tokens"] == retry.cache_read_input_tokens
+        assert token_budget["cache_creation_input_tokens"] == 0
+
+    def test_sibling_phase_reads_shared_prefix(self, client):
+        transport = StubTransport(responses=['{"files": []}'])
+        executor = AnthropicPhaseExecutor(transport, client)
+
+        _execute(executor, _phase())
+        _execute(executor, _phase("Add metrics to main"))
+
+        first, sibling = (request["usage"] for request in transport.requests)
+        assert 0 < sibling.cache_read_input_tokens < first.cache_creation_input_tokens
+        assert sibling.cache_creation_input_tokens > 0
+
+        system = transport.requests[1]["system"]
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+        content = transport.requests[1]["messages"][0]["content"]
+        assert sum("cache_control" in block for block in content) == 2
+
+    def test_disabled_caching_sends_plain_prompts(self, client):
+        transport = StubTransport(responses=['{"files": []}'])
+        executor = AnthropicPhaseExecutor(transport, client)
+
+        with patch("autopack.llm.anthropic.phase_executor.settings") as settings:
+            settings.anthropic_prompt_caching_enabled = False
+            _execute(executor, _phase())
+            _execute(executor, _phase())
+
+        assert isinstance(transport.requests[0]["system"], str)
+        assert isinstance(transport.requests[0]["messages"][0]["content"], str)
+        assert transport.requests[1]["usage"].cache_read_input_tokens == 0
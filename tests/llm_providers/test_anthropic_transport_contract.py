@@ -479,6 +479,50 @@ def test_stream_empty_chunks_handled(transport, mock_anthropic_client):
     assert response.content == "Hello world"
 
 
+def test_on_text_receives_every_chunk(transport, mock_anthropic_client):
+    """Test that on_text sees each delta and forces streaming mode (IMP-PERF-030)"""
+    final_message = MockMessage(content_text="Response", input_tokens=50, output_tokens=25)
+    mock_anthropic_client.messages.stream.return_value = MockStream(
+        content_chunks=["a", "b", "c"], final_message=final_message
+    )
+    seen = []
+
+    response = transport.send_request(
+        messages=[{"role": "user", "content": "Test"}],
+        model="claude-sonnet-4-5",
+        max_tokens=1000,
+        on_text=seen.append,
+    )
+
+    assert seen == ["a", "b", "c"]
+    assert response.content == "abc"
+    assert response.stop_reason == "end_turn"
+    mock_anthropic_client.messages.create.assert_not_called()
+
+
+def test_on_text_false_aborts_stream(transport, mock_anthropic_client):
+    """Test that on_text returning False stops the stream early (IMP-PERF-030)"""
+    final_message = MockMessage(content_text="Response", input_tokens=50, output_tokens=25)
+    mock_stream = MockStream(content_chunks=["a", "b", "c", "d"], final_message=final_message)
+    mock_stream.current_message_snapshot = MockMessage(
+        content_text="ab", input_tokens=50, output_tokens=2
+    )
+    mock_anthropic_client.messages.stream.return_value = mock_stream
+
+    response = transport.send_request(
+        messages=[{"role": "user", "content": "Test"}],
+        model="claude-sonnet-4-5",
+        max_tokens=1000,
+        stream=True,
+        on_text=lambda text: text != "b",
+    )
+
+    assert response.content == "ab"
+    assert response.stop_reason == "aborted"
+    assert response.usage.output_tokens == 2
+    assert list(mock_stream.text_stream) == ["c", "d"]
+
+
 # ============================================================================
 # Test: Stop Reason Handling
 # ============================================================================
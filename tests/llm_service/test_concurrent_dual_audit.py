@@ -0,0 +1,287 @@
+"""Tests for hedged concurrent dual audit (IMP-PERF-027).
+
+Tests that verify:
+- Concurrent mode overlaps primary and secondary auditor latency
+- A confident primary cancels a secondary that has not launched yet
+- An in-flight secondary is discarded and its tokens accounted separately,
+  with or without the usage buffer
+- Hedge delay is cut short when the primary needs a second opinion
+- Secondary failures still propagate
+- Wall-clock saved and secondary tokens are written to dual audit telemetry,
+  including for early exits
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autopack.llm_client import AuditorResult
+from autopack.llm_service import LlmService
+
+
+def _result(approved: bool, model: str, issues=None, tokens: int = 100) -> AuditorResult:
+    return AuditorResult(
+        approved=approved,
+        issues_found=issues or [],
+        auditor_messages=[],
+        tokens_used=tokens,
+        model_used=model,
+        prompt_tokens=tokens - 20,
+        completion_tokens=20,
+    )
+
+
+def _client(result: AuditorResult, delay: float = 0.0, gate: threading.Event = None):
+    def review_patch(**kwargs):
+        if gate is not None:
+            gate.wait(5)
+        time.sleep(delay)
+        return result
+
+    return MagicMock(review_patch=MagicMock(side_effect=review_patch))
+
+
+@pytest.fixture
+def service():
+    with patch.object(LlmService, "__init__", lambda self, *args, **kwargs: None):
+        service = LlmService.__new__(LlmService)
+        service.db = MagicMock()
+        service._record_usage = MagicMock()
+        service._record_usage_total_only = MagicMock()
+        service._model_to_provider = MagicMock(return_value="anthropic")
+        yield service
+
+
+def _run(service, primary_client, secondary_client, **kwargs):
+    service._resolve_client_and_model = MagicMock(
+        side_effect=[(primary_client, "primary-model"), (secondary_client, "secondary-model")]
+    )
+    timing = {}
+    primary, secondary = service._run_dual_audit(
+        patch_content="diff",
+        phase_spec={},
+        primary_model="primary-model",
+        secondary_model="secondary-model",
+        max_tokens=1000,
+        project_rules=None,
+        run_hints=None,
+        run_id="run-1",
+        phase_id="phase-1",
+        concurrent=True,
+        timing=timing,
+        **kwargs,
+    )
+    return primary, secondary, timing
+
+
+class TestConcurrentDualAudit:
+    """Tests for _run_dual_audit with concurrent=True."""
+
+    def test_overlaps_auditor_latency(self, service):
+        issues = [{"severity": "major", "description": "x"}]
+        primary_client = _client(_result(False, "primary-model", issues), delay=0.3)
+        secondary_client = _client(_result(True, "secondary-model", tokens=80), delay=0.3)
+
+        started = time.perf_counter()
+        primary, secondary, timing = _run(service, primary_client, secondary_client)
+        elapsed = time.perf_counter() - started
+
+        assert secondary is not None
+        assert elapsed < 0.55
+        assert timing["mode"] == "concurrent"
+        assert timing["wall_clock_saved_seconds"] > 0.15
+        assert timing["secondary_tokens"] == 80
+        secondary_client.review_patch.assert_called_once()
+        assert secondary_client.review_patch.call_args.kwargs["max_tokens"] == 500
+        roles = [c.kwargs["role"] for c in service._record_usage.call_args_list]
+        assert roles == ["auditor:primary", "auditor:secondary"]
+
+    def test_early_exit_skips_secondary_within_hedge_delay(self, service):
+        primary_client = _client(_result(True, "primary-model"))
+        secondary_client = _client(_result(True, "secondary-model"))
+
+        started = time.perf_counter()
+        primary, secondary, timing = _run(
+            service, primary_client, secondary_client, hedge_delay_seconds=5.0
+        )
+
+        assert secondary is None
+        assert time.perf_counter() - started < 1.0
+        assert timing["secondary_launched"] is False
+        time.sleep(0.05)
+        secondary_client.review_patch.assert_not_called()
+        assert service._record_usage.call_count == 1
+
+    def test_early_exit_discards_in_flight_secondary(self, service):
+        gate = threading.Event()
+        primary_client = _client(_result(True, "primary-model"))
+        secondary_client = _client(_result(True, "secondary-model", tokens=70), gate=gate)
+        recorded = threading.Event()
+        service._submit_buffered_usage = MagicMock(side_effect=lambda event: recorded.set())
+
+        # Make sure the secondary is already calling the LLM
+        primary_client.review_patch.side_effect = lambda **kw: (
+            time.sleep(0.1) or _result(True, "primary-model")
+        )
+        primary, secondary, timing = _run(service, primary_client, secondary_client)
+
+        assert secondary is None
+        assert timing["secondary_launched"] is True
+        service._submit_buffered_usage.assert_not_called()
+
+        gate.set()
+        assert recorded.wait(5)
+        event = service._submit_buffered_usage.call_args.args[0]
+        assert event.role == "auditor:secondary_discarded"
+        assert event.total_tokens == 70
+        # Only the primary is recorded on the calling thread
+        assert service._record_usage.call_count == 1
+
+    def test_discarded_secondary_recorded_without_usage_buffer(self, service, monkeypatch):
+        from autopack.config import settings
+
+        monkeypatch.setattr(settings, "usage_buffer_enabled", False, raising=False)
+        gate = threading.Event()
+        primary_client = _client(_result(True, "primary-model"))
+        secondary_client = _client(_result(True, "secondary-model", tokens=70), gate=gate)
+        primary_client.review_patch.side_effect = lambda **kw: (
+            time.sleep(0.1) or _result(True, "primary-model")
+        )
+        recorded = threading.Event()
+        worker_session = MagicMock()
+        worker_session.close.side_effect = lambda: recorded.set()
+
+        with patch("autopack.database.SessionLocal", return_value=worker_session):
+            _, secondary, _ = _run(service, primary_client, secondary_client)
+            gate.set()
+            assert recorded.wait(5)
+
+        assert secondary is None
+        (usage_event,) = [c.args[0] for c in worker_session.add.call_args_list]
+        assert usage_event.role == "auditor:secondary_discarded"
+        assert usage_event.total_tokens == 70
+        worker_session.commit.assert_called_once()
+        # The caller's session is never touched from the worker thread
+        service.db.add.assert_not_called()
+
+    def test_low_confidence_primary_cuts_hedge_delay_short(self, service):
+        primary_client = _client(_result(False, "primary-model"))
+        secondary_client = _client(_result(False, "secondary-model"))
+
+        started = time.perf_counter()
+        _, secondary, timing = _run(
+            service, primary_client, secondary_client, hedge_delay_seconds=5.0
+        )
+
+        assert secondary is not None
+        assert time.perf_counter() - started < 1.0
+        assert timing["secondary_launched"] is True
+
+    def test_secondary_failure_propagates(self, service):
+        primary_client = _client(_result(False, "primary-model"))
+        secondary_client = MagicMock()
+        secondary_client.review_patch.side_effect = Exception("Secondary failed")
+
+        with pytest.raises(Exception, match="Secondary failed"):
+            _run(service, primary_client, secondary_client)
+
+        service._record_usage.assert_not_called()
+
+    def test_sequential_mode_is_default(self, service):
+        primary_client = _client(_result(False, "primary-model"))
+        secondary_client = _client(_result(False, "secondary-model"))
+        service._resolve_client_and_model = MagicMock(
+            side_effect=[(primary_client, "primary-model"), (secondary_client, "secondary-model")]
+        )
+        timing = {}
+
+        service._run_dual_audit(
+            patch_content="diff",
+            phase_spec={},
+            primary_model="primary-model",
+            secondary_model="secondary-model",
+            max_tokens=None,
+            project_rules=None,
+            run_hints=None,
+            run_id=None,
+            phase_id=None,
+            timing=timing,
+        )
+
+        assert timing["mode"] == "sequential"
+        assert timing["wall_clock_saved_seconds"] == 0.0
+
+
+class TestDualAuditTimingTelemetry:
+    """Tests for the timing fields in _log_dual_audit_telemetry."""
+
+    def test_records_wall_clock_saved_and_tokens(self, service, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        primary = _result(True, "primary-model")
+        secondary = _result(True, "secondary-model", tokens=80)
+
+        service._log_dual_audit_telemetry(
+            phase_id="phase-1",
+            task_category="security",
+            primary_model="primary-model",
+            secondary_model="secondary-model",
+            primary_result=primary,
+            secondary_result=secondary,
+            disagreement={"has_disagreement": False},
+            judge_result=None,
+            final_result=primary,
+            timing={
+                "mode": "concurrent",
+                "hedge_delay_seconds": 0.5,
+                "primary_seconds": 2.0,
+                "secondary_seconds": 1.5,
+                "wall_clock_seconds": 2.1,
+                "wall_clock_saved_seconds": 1.4,
+                "secondary_tokens": 80,
+            },
+        )
+
+        (telemetry_file,) = (tmp_path / "logs" / "telemetry").glob("dual_audit_telemetry_*.jsonl")
+        record = json.loads(telemetry_file.read_text().splitlines()[-1])
+        assert record["audit_mode"] == "concurrent"
+        assert record["wall_clock_saved_seconds"] == 1.4
+        assert record["secondary_tokens"] == 80
+
+    def test_early_exit_is_logged_with_timing(self, service, tmp_path, monkeypatch):
+        from autopack.config import settings
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(settings, "dual_audit_enabled", True, raising=False)
+        primary = _result(True, "primary-model")
+        primary.confidence = 0.95
+        service.model_router = MagicMock()
+        service.model_router.select_model_with_escalation.return_value = (
+            "primary-model",
+            "medium",
+            {},
+        )
+        service._should_use_dual_audit = MagicMock(return_value=True)
+        service._get_secondary_auditor_model = MagicMock(return_value="secondary-model")
+
+        def run_dual_audit(timing, **kwargs):
+            # Hedged secondary was already in flight when the primary cleared
+            timing.update({"mode": "concurrent", "secondary_launched": True})
+            return primary, None
+
+        service._run_dual_audit = MagicMock(side_effect=run_dual_audit)
+
+        result = service.execute_auditor_review(
+            patch_content="diff", phase_spec={"task_category": "security"}
+        )
+
+        assert result is primary
+        (telemetry_file,) = (tmp_path / "logs" / "telemetry").glob("dual_audit_telemetry_*.jsonl")
+        record = json.loads(telemetry_file.read_text().splitlines()[-1])
+        assert record["early_exit"] is True
+        assert record["secondary_approved"] is None
+        assert record["has_disagreement"] is False
+        assert record["audit_mode"] == "concurrent"
+        assert record["secondary_launched"] is True
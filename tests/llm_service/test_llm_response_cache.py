@@ -0,0 +1,337 @@
+"""Tests for the on-disk LLM response cache (IMP-PERF-028).
+
+Tests that verify:
+- Cache keys ignore formatting-only prompt differences but not model/max_tokens
+- Entries round-trip, expire after the TTL and are evicted LRU-first when over size
+- The cache is disabled by default and can be switched off per role
+- Builder and Doctor calls are served from cache without calling the provider
+- Builder retries (a new attempt_index) always reach the provider
+- Failed and NDJSON (applied-to-disk) builder results are never cached
+- Cache hits are recorded as zero-token "<role>:cached" usage and reported as hit rates
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from autopack import llm_response_cache
+from autopack.database import Base
+from autopack.llm.doctor import _call_doctor_llm
+from autopack.llm.usage import aggregate_usage_by_run
+from autopack.llm_client import BuilderResult
+from autopack.llm_response_cache import (
+    LlmResponseCache,
+    get_llm_response_cache,
+    make_cache_key,
+    reset_llm_response_cache,
+)
+from autopack.llm_service import LlmService
+from autopack.usage_recorder import LlmUsageEvent, get_llm_response_cache_stats
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LlmResponseCache(tmp_path / "cache", ttl_seconds=3600, max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_formatting_only_differences_share_a_key(self):
+        a = make_cache_key("doctor", "m", "line one\r\nline two  \n", max_tokens=100)
+        b = make_cache_key("doctor", "m", "line one\nline two", max_tokens=100)
+        assert a == b
+
+    def test_structured_inputs_are_order_independent(self):
+        a = make_cache_key("builder", "m", {"phase_spec": {"a": 1, "b": 2}, "run_hints": None})
+        b = make_cache_key("builder", "m", {"run_hints": None, "phase_spec": {"b": 2, "a": 1}})
+        assert a == b
+
+    def test_model_max_tokens_and_temperature_change_the_key(self):
+        base = make_cache_key("doctor", "m", "prompt", max_tokens=100, temperature=0.3)
+        assert base != make_cache_key("doctor", "other", "prompt", max_tokens=100, temperature=0.3)
+        assert base != make_cache_key("doctor", "m", "prompt", max_tokens=200, temperature=0.3)
+        assert base != make_cache_key("doctor", "m", "prompt", max_tokens=100, temperature=0.7)
+        assert base != make_cache_key("auditor", "m", "prompt", max_tokens=100, temperature=0.3)
+
+
+class TestLlmResponseCache:
+    """Tests for LlmResponseCache storage, expiry and eviction."""
+
+    def test_round_trip_and_counters(self, cache):
+        assert cache.get("ab" * 32, "builder") is None
+        cache.put("ab" * 32, {"patch_content": "diff"}, "builder", "m")
+
+        assert cache.get("ab" * 32, "builder") == {"patch_content": "diff"}
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["by_role"]["builder"] == {"hits": 1, "misses": 1}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = LlmResponseCache(tmp_path, ttl_seconds=60)
+        cache.put("cd" * 32, {"x": 1})
+
+        with patch("autopack.llm_response_cache.time.time", return_value=time.time() + 120):
+            assert cache.get("cd" * 32) is None
+        assert not list(tmp_path.glob("*/*.json"))
+
+    def test_least_recently_used_entries_are_evicted_over_size(self, tmp_path):
+        cache = LlmResponseCache(tmp_path, max_bytes=3000)
+        keys = [f"{i:02x}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"body": "x" * 900})
+            path = tmp_path / key[:2] / f"{key}.json"
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        # Touch the oldest entry so the second one becomes least recently used
+        assert cache.get(keys[0]) is not None
+        cache.put("ff" * 32, {"body": "x" * 900})
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get("ff" * 32) is not None
+        assert cache.evictions >= 1
+
+    def test_clear_removes_everything(self, cache):
+        cache.put("ab" * 32, {"x": 1})
+        cache.clear()
+        assert cache.get("ab" * 32) is None
+
+
+class TestCacheSettings:
+    """Tests for the settings-gated get_llm_response_cache."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        reset_llm_response_cache()
+        yield
+        reset_llm_response_cache()
+
+    def test_disabled_by_default(self):
+        with patch("autopack.config.settings") as settings:
+            settings.llm_response_cache_enabled = False
+            assert get_llm_response_cache("builder") is None
+
+    def test_per_role_switch(self, tmp_path):
+        with patch("autopack.config.settings") as settings:
+            settings.llm_response_cache_enabled = True
+            settings.llm_response_cache_builder = True
+            settings.llm_response_cache_auditor = False
+            settings.llm_response_cache_ttl_seconds = 60
+            settings.llm_response_cache_max_mb = 1
+            settings.autonomous_runs_dir = str(tmp_path)
+
+            builder_cache = get_llm_response_cache("builder")
+            assert builder_cache is not None
+            assert builder_cache.cache_dir == tmp_path / llm_response_cache.CACHE_DIRNAME
+            assert get_llm_response_cache("auditor") is None
+
+
+@pytest.fixture
+def service():
+    with patch.object(LlmService, "__init__", lambda self, *args, **kwargs: None):
+        service = LlmService.__new__(LlmService)
+        service.db = MagicMock()
+        service.model_router = MagicMock()
+        service.model_router.select_model_with_escalation.return_value = (
+            "claude-sonnet-4-5",
+            "medium",
+            {},
+        )
+        service.record_attempt_outcome = MagicMock()
+        service._record_usage = MagicMock()
+        service._record_usage_total_only = MagicMock()
+        service._model_to_provider = MagicMock(return_value="anthropic")
+        yield service
+
+
+def _builder_result(success: bool = True) -> BuilderResult:
+    return BuilderResult(
+        success=success,
+        patch_content="diff --git a/x b/x",
+        builder_messages=["done"],
+        tokens_used=1500 if success else 0,
+        model_used="claude-sonnet-4-5",
+        error=None if success else "connection error",
+        prompt_tokens=1000 if success else None,
+        completion_tokens=500 if success else None,
+    )
+
+
+class TestBuilderCaching:
+    """Tests for builder calls through LlmService with the cache enabled."""
+
+    def _run(self, service, cache, client, attempt_index=0):
+        service._resolve_client_and_model = MagicMock(return_value=(client, "claude-sonnet-4-5"))
+        with patch("autopack.llm_service.get_llm_response_cache", return_value=cache):
+            return service.execute_builder_phase(
+                phase_spec={"task_category": "general", "description": "Add x"},
+                file_context={"existing_files": {"x.py": "print(1)\n"}},
+                run_id="run-1",
+                phase_id="phase-1",
+                attempt_index=attempt_index,
+            )
+
+    def test_second_identical_call_is_served_from_cache(self, service, cache):
+        client = MagicMock()
+        client.execute_phase.return_value = _builder_result()
+
+        first = self._run(service, cache, client)
+        second = self._run(service, cache, client)
+
+        client.execute_phase.assert_called_once()
+        assert second == first
+        roles = [c.kwargs["role"] for c in service._record_usage.call_args_list]
+        assert roles == ["builder", "builder:cached"]
+        assert service._record_usage.call_args.kwargs["prompt_tokens"] == 0
+        assert service._record_usage.call_args.kwargs["completion_tokens"] == 0
+
+    def test_retry_attempt_is_not_served_from_cache(self, service, cache):
+        client = MagicMock()
+        client.execute_phase.return_value = _builder_result()
+
+        self._run(service, cache, client, attempt_index=0)
+        # The patch was rejected downstream; the retry must reach the model
+        self._run(service, cache, client, attempt_index=1)
+
+        assert client.execute_phase.call_count == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_failed_results_are_not_cached(self, service, cache):
+        client = MagicMock()
+        client.execute_phase.return_value = _builder_result(success=False)
+
+        self._run(service, cache, client)
+        self._run(service, cache, client)
+
+        assert client.execute_phase.call_count == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_ndjson_results_still_change_the_workspace(self, service, cache, tmp_path):
+        # NDJSON builders apply operations to disk and return only a synthetic header,
+        # so replaying a cached result would report success without writing anything
+        target = tmp_path / "x.py"
+
+        def execute_phase(**kwargs):
+            target.write_text("print(2)\n")
+            return BuilderResult(
+                success=True,
+                patch_content="# NDJSON Operations Applied (1 files)\ndiff --git a/x.py b/x.py\n",
+                builder_messages=["done"],
+                tokens_used=1500,
+                model_used="claude-sonnet-4-5",
+                prompt_tokens=1000,
+                completion_tokens=500,
+            )
+
+        client = MagicMock()
+        client.execute_phase.side_effect = execute_phase
+
+        self._run(service, cache, client)
+        target.write_text("print(1)\n")
+        second = self._run(service, cache, client)
+
+        assert second.success
+        assert target.read_text() == "print(2)\n"
+        assert client.execute_phase.call_count == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_disabled_cache_always_calls_provider(self, service):
+        client = MagicMock()
+        client.execute_phase.return_value = _builder_result()
+
+        self._run(service, None, client)
+        self._run(service, None, client)
+
+        assert client.execute_phase.call_count == 2
+
+
+class TestDoctorCaching:
+    """Tests for _call_doctor_llm with a response cache."""
+
+    def test_identical_prompt_skips_llm_call(self, cache):
+        completion = Mock()
+        completion.choices = [
+            Mock(message=Mock(content='{"action": "replan", "confidence": 0.7, "rationale": "r"}'))
+        ]
+        completion.usage = Mock(prompt_tokens=100, completion_tokens=50, total_tokens=150)
+        client = Mock()
+        client.client = Mock(chat=Mock(completions=Mock(create=Mock(return_value=completion))))
+        record_usage = MagicMock()
+
+        responses = [
+            _call_doctor_llm(
+                client,
+                "gpt-4o",
+                "diagnose this",
+                "run-1",
+                "phase-1",
+                record_usage_fn=record_usage,
+                response_cache=cache,
+            )
+            for _ in range(2)
+        ]
+
+        client.client.chat.completions.create.assert_called_once()
+        assert responses[0].action == responses[1].action == "replan"
+        roles = [c.kwargs["role"] for c in record_usage.call_args_list]
+        assert roles == ["doctor", "doctor:cached"]
+
+
+class TestCacheUsageReporting:
+    """Tests for surfacing cache hits through the usage recorder."""
+
+    def _event(self, role: str, tokens: int) -> LlmUsageEvent:
+        return LlmUsageEvent(
+            provider="anthropic",
+            model="claude-sonnet-4-5",
+            run_id="run-1",
+            phase_id="phase-1",
+            role=role,
+            total_tokens=tokens,
+            prompt_tokens=tokens,
+            completion_tokens=0,
+        )
+
+    def test_hit_rates_by_role(self, db_session):
+        for role, tokens in [
+            ("builder", 1000),
+            ("builder:cached", 0),
+            ("builder:cached", 0),
+            ("auditor", 400),
+            ("doctor", 100),
+        ]:
+            db_session.add(self._event(role, tokens))
+        db_session.commit()
+
+        stats = get_llm_response_cache_stats(db_session, run_id="run-1")
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["hit_rate"] == pytest.approx(0.4)
+        assert stats["by_role"]["builder"] == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+        assert stats["by_role"]["auditor"]["hit_rate"] == 0.0
+
+    def test_aggregate_usage_counts_cached_calls(self, db_session):
+        db_session.add(self._event("builder", 1000))
+        db_session.add(self._event("builder:cached", 0))
+        db_session.commit()
+
+        totals = aggregate_usage_by_run(db_session, "run-1")
+
+        assert totals["cached_calls"] == 1
+        assert totals["total_tokens"] == 1000
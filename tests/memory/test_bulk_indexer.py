@@ -0,0 +1,149 @@
+"""Tests for IMP-PERF-014: batched bulk embedding and upsert pipeline."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autopack.memory.bulk_indexer import BulkIndexer
+from autopack.memory.embeddings import (
+    EMBEDDING_SIZE,
+    clear_embedding_cache,
+    sync_embed_text,
+    sync_embed_texts_cached,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_embedding_cache():
+    """Isolate the module-level embedding cache."""
+    clear_embedding_cache()
+    yield
+    clear_embedding_cache()
+
+
+class TestSyncEmbedTextsCached:
+    """Tests for cache-aware batch embedding."""
+
+    def test_cached_and_duplicate_texts_not_re_embedded(self):
+        """Only unseen, distinct texts should reach the provider."""
+        sync_embed_text("already cached")
+
+        with patch(
+            "autopack.memory.embeddings._embed_batch",
+            side_effect=lambda texts, *args: ([[float(len(t))] for t in texts], False),
+        ) as mock_batch:
+            vectors = sync_embed_texts_cached(["already cached", "new", "new", "other"])
+
+        mock_batch.assert_called_once()
+        assert mock_batch.call_args.args[0] == ["new", "other"]
+        assert len(vectors[0]) == EMBEDDING_SIZE
+        assert vectors[1] == vectors[2] == [3.0]
+        assert vectors[3] == [5.0]
+
+    def test_provider_requests_split_by_batch_size(self):
+        """Misses should be sent in requests of at most batch_size inputs."""
+        with patch(
+            "autopack.memory.embeddings._embed_batch",
+            side_effect=lambda texts, *args: ([[0.0] for _ in texts], False),
+        ) as mock_batch:
+            sync_embed_texts_cached([f"text {i}" for i in range(5)], batch_size=2)
+
+        assert [len(c.args[0]) for c in mock_batch.call_args_list] == [2, 2, 1]
+
+    def test_fallback_batch_not_cached(self):
+        """Local stand-ins from a failed provider batch should not be cached."""
+        with patch(
+            "autopack.memory.embeddings._embed_batch",
+            side_effect=lambda texts, *args: ([[0.0] for _ in texts], True),
+        ) as mock_batch:
+            sync_embed_texts_cached(["flaky"])
+            sync_embed_texts_cached(["flaky"])
+
+        assert mock_batch.call_count == 2
+
+
+class TestBulkIndexer:
+    """Tests for BulkIndexer batching, concurrency and stats."""
+
+    def test_chunks_embedded_and_upserted_in_batches(self):
+        """Chunks should be embedded per batch and upserted in large batches."""
+        store = MagicMock()
+        with BulkIndexer(store, "docs", embed_batch_size=3, upsert_batch_size=4) as indexer:
+            for i in range(10):
+                indexer.add(f"p{i}", f"chunk {i}", {"n": i})
+
+        stats = indexer.stats
+        assert stats.chunks == 10
+        assert stats.upserted == 10
+        assert stats.embed_batches == 4
+        assert sum(len(c.args[1]) for c in store.upsert.call_args_list) == 10
+        assert all(len(c.args[1]) <= 4 for c in store.upsert.call_args_list)
+        assert stats.tokens > 0
+        assert set(stats.to_dict()) >= {"chunks_per_s", "tokens_per_s"}
+
+    def test_concurrent_batches_bounded(self):
+        """No more than max_concurrent_batches embeddings should run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_embed(texts, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return [[0.0] for _ in texts]
+
+        with patch("autopack.memory.bulk_indexer.sync_embed_texts_cached", side_effect=slow_embed):
+            with BulkIndexer(
+                MagicMock(), "docs", embed_batch_size=1, max_concurrent_batches=2
+            ) as indexer:
+                for i in range(8):
+                    indexer.add(f"p{i}", "x", {})
+
+        assert peak <= 2
+        assert indexer.stats.upserted == 8
+
+    def test_failed_upsert_counted(self):
+        """A store failure should be reported as failed chunks, not raised."""
+        store = MagicMock()
+        store.upsert.side_effect = RuntimeError("store down")
+
+        with BulkIndexer(store, "docs") as indexer:
+            indexer.add("p1", "text", {})
+
+        assert indexer.stats.upserted == 0
+        assert indexer.stats.failed == 1
+
+    def test_add_after_close_rejected(self):
+        """Adding to a closed indexer should raise."""
+        indexer = BulkIndexer(MagicMock(), "docs")
+        indexer.close()
+
+        with pytest.raises(RuntimeError):
+            indexer.add("p1", "text", {})
+
+
+class TestMemoryServiceIndexFiles:
+    """Tests for MemoryService.index_files."""
+
+    def test_index_files_matches_index_file_points(self, tmp_path):
+        """index_files should upsert the same point IDs index_file would."""
+        from autopack.memory.memory_service import MemoryService
+
+        service = MemoryService(index_dir=str(tmp_path / ".faiss"), enabled=True, use_qdrant=False)
+        service.enabled = True
+        service.store = MagicMock()
+
+        result = service.index_files({"a.py": "print(1)", "b.py": "print(2)"}, "project-1")
+
+        upserted = [p["id"] for c in service.store.upsert.call_args_list for p in c.args[1]]
+        expected_a = service.index_file("a.py", "print(1)", "project-1")
+        assert result["indexed"] == 2
+        assert expected_a in upserted
+        assert result["throughput"]["chunks"] == 2
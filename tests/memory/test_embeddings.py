@@ -8,9 +8,11 @@ Tests cover:
 - Async embedding wrapper
 - Usage recording
 - IMP-PERF-005: Embedding result caching
+- IMP-PERF-013: LRU bounds and persistent cache tier
 """
 
 import asyncio
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 from autopack.memory.embeddings import (
@@ -20,6 +22,7 @@ from autopack.memory.embeddings import (
     _record_embedding_usage,
     async_embed_text,
     clear_embedding_cache,
+    configure_embedding_cache,
     get_embedding_cache_stats,
     semantic_embeddings_enabled,
     sync_embed_text,
@@ -619,3 +622,124 @@ class TestEmbeddingCache:
         stats = get_embedding_cache_stats()
         # Cache should not exceed maxsize
         assert stats["size"] <= _EMBEDDING_CACHE_MAXSIZE
+
+
+class TestEmbeddingCacheTiers:
+    """Tests for IMP-PERF-013: LRU eviction, byte bounds and the disk tier."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_embedding_cache()
+
+    def teardown_method(self):
+        """Clear cache and disable the disk tier after each test."""
+        configure_embedding_cache(None)
+        clear_embedding_cache()
+
+    def test_recently_used_entry_survives_eviction(self):
+        """Test that a cache hit protects an entry from eviction."""
+        with patch("autopack.memory.embeddings._EMBEDDING_CACHE_MAXSIZE", 2):
+            sync_embed_text("first")
+            sync_embed_text("second")
+            sync_embed_text("first")  # hit: "second" becomes least recently used
+            sync_embed_text("third")
+
+            sync_embed_text("first")
+            stats = get_embedding_cache_stats()
+
+        assert stats["size"] == 2
+        assert stats["hits"] == 2
+
+    def test_byte_bound_enforced(self):
+        """Test that the cache stays within its byte budget."""
+        entry_bytes = EMBEDDING_SIZE * 8
+        with patch("autopack.memory.embeddings._EMBEDDING_CACHE_MAX_BYTES", entry_bytes * 3):
+            for i in range(10):
+                sync_embed_text(f"text {i}")
+            stats = get_embedding_cache_stats()
+
+        assert stats["size"] == 3
+        assert stats["bytes"] == entry_bytes * 3
+
+    def test_cached_and_fresh_results_match(self):
+        """Test that packed storage returns the same values on hit and miss."""
+        fresh = sync_embed_text("precision")
+        cached = sync_embed_text("precision")
+
+        assert fresh == cached
+        assert len(cached) == EMBEDDING_SIZE
+
+    def test_disk_tier_survives_memory_clear(self, tmp_path):
+        """Test that embeddings are served from disk after the memory tier is lost."""
+        configure_embedding_cache(tmp_path / "embeddings.sqlite")
+        original = sync_embed_text("persisted text")
+
+        clear_embedding_cache()  # simulate a process restart
+        with patch("autopack.memory.embeddings._local_embed") as mock_embed:
+            restored = sync_embed_text("persisted text")
+
+        mock_embed.assert_not_called()
+        assert restored == original
+        stats = get_embedding_cache_stats()
+        assert stats["disk_hits"] == 1
+        assert stats["size"] == 1
+
+    def test_clear_disk_tier(self, tmp_path):
+        """Test that clear_embedding_cache(disk=True) empties the persistent tier."""
+        configure_embedding_cache(tmp_path / "embeddings.sqlite")
+        sync_embed_text("to be removed")
+
+        clear_embedding_cache(disk=True)
+        sync_embed_text("to be removed")
+
+        assert get_embedding_cache_stats()["disk_hits"] == 0
+
+    @patch("autopack.memory.embeddings._USE_OPENAI", True)
+    def test_fallback_vector_not_cached(self, tmp_path):
+        """Test that a local vector produced by an OpenAI failure is not cached."""
+        configure_embedding_cache(tmp_path / "embeddings.sqlite")
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = Exception("API Error")
+
+        with patch("autopack.memory.embeddings._openai_client", mock_client):
+            first = sync_embed_text("transient failure")
+            second = sync_embed_text("transient failure")
+
+        assert first == second == _local_embed("transient failure")
+        assert mock_client.embeddings.create.call_count == 2
+        assert get_embedding_cache_stats()["size"] == 0
+
+    def test_local_vectors_not_served_to_openai_mode(self):
+        """Test that local embeddings are keyed apart from provider embeddings."""
+        sync_embed_text("shared text")
+
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.3] * EMBEDDING_SIZE)]
+        mock_response.usage = MagicMock(total_tokens=5)
+        mock_client = MagicMock()
+        mock_client.embeddings.create.return_value = mock_response
+        with (
+            patch("autopack.memory.embeddings._USE_OPENAI", True),
+            patch("autopack.memory.embeddings._openai_client", mock_client),
+        ):
+            result = sync_embed_text("shared text")
+
+        mock_client.embeddings.create.assert_called_once()
+        assert result == [0.3] * EMBEDDING_SIZE
+
+    def test_disk_tier_row_bound(self, tmp_path):
+        """Test that the disk tier evicts least recently used rows past its bound."""
+        db_path = tmp_path / "embeddings.sqlite"
+        configure_embedding_cache(db_path)
+        with patch("autopack.memory.embeddings._EMBEDDING_DISK_CACHE_MAX_ROWS", 10):
+            for i in range(25):
+                sync_embed_text(f"row {i}")
+
+        with sqlite3.connect(str(db_path)) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        assert 0 < rows <= 10
+
+        clear_embedding_cache()  # the newest row must still be served from disk
+        with patch("autopack.memory.embeddings._local_embed") as mock_embed:
+            sync_embed_text("row 24")
+        mock_embed.assert_not_called()
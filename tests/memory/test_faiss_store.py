@@ -20,7 +20,7 @@ from unittest.mock import patch
 
 import pytest
 
-from autopack.memory.faiss_store import FAISS_AVAILABLE, FaissStore
+from autopack.memory.faiss_store import FAISS_AVAILABLE, NUMPY_AVAILABLE, FaissStore
 
 
 class TestFaissStoreLRUEviction:
@@ -1337,3 +1337,546 @@ class TestFaissStoreEdgeCases:
     def test_matches_filter_matching(self, store):
         """Test _matches_filter with matching filter returns True."""
         assert store._matches_filter({"key": "value"}, {"key": "value"}) is True
+
+
+class TestFaissStoreJournal:
+    """Tests for append-only journal persistence (IMP-PERF-007)."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for FAISS indices."""
+        return str(tmp_path)
+
+    def _make_point(self, point_id: str, value: int):
+        """Create a test point with a dummy vector."""
+        return {
+            "id": point_id,
+            "vector": [0.1 * (value + 1)] + [0.0] * 1535,
+            "payload": {"value": value},
+        }
+
+    def _journal_lines(self, temp_dir, name="test_collection"):
+        path = Path(temp_dir) / f"{name}.journal.jsonl"
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+    def test_first_write_creates_snapshot(self, temp_dir):
+        """Test that the first write snapshots the collection and leaves no journal."""
+        store = FaissStore(index_dir=temp_dir)
+        store.upsert("test_collection", [self._make_point("p1", 1)])
+
+        assert (Path(temp_dir) / "test_collection.payloads.json").exists()
+        assert (Path(temp_dir) / "test_collection.meta.json").exists()
+        assert self._journal_lines(temp_dir) == []
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_subsequent_writes_append_to_journal(self, temp_dir):
+        """Test that later writes append to the journal instead of rewriting the snapshot."""
+        store = FaissStore(index_dir=temp_dir)
+        store.upsert("test_collection", [self._make_point("p1", 1)])
+        payload_path = Path(temp_dir) / "test_collection.payloads.json"
+        snapshot_before = payload_path.read_text()
+
+        store.upsert("test_collection", [self._make_point("p2", 2)])
+        store.update_payload("test_collection", "p1", {"value": 10})
+        store.delete("test_collection", ["p2"])
+
+        assert payload_path.read_text() == snapshot_before
+        ops = [entry["op"] for entry in self._journal_lines(temp_dir)]
+        assert ops == ["upsert", "payload", "delete"]
+        seqs = [entry["seq"] for entry in self._journal_lines(temp_dir)]
+        assert seqs == sorted(seqs)
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_compaction_at_threshold(self, temp_dir):
+        """Test that reaching the journal threshold rewrites the snapshot."""
+        store = FaissStore(index_dir=temp_dir)
+        store.JOURNAL_COMPACT_THRESHOLD = 3
+        store.upsert("test_collection", [self._make_point("p0", 0)])
+
+        for i in range(1, 3):
+            store.upsert("test_collection", [self._make_point(f"p{i}", i)])
+        assert len(self._journal_lines(temp_dir)) == 2
+
+        store.upsert("test_collection", [self._make_point("p3", 3)])
+        assert self._journal_lines(temp_dir) == []
+        with open(Path(temp_dir) / "test_collection.payloads.json") as f:
+            assert set(json.load(f)) == {"p0", "p1", "p2", "p3"}
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_evictions_are_journaled(self, temp_dir):
+        """Test that LRU evictions are recorded as explicit deletes."""
+        store = FaissStore(index_dir=temp_dir)
+        store.MAX_PAYLOAD_ENTRIES = 2
+        store.upsert("test_collection", [self._make_point("p0", 0), self._make_point("p1", 1)])
+        store.upsert("test_collection", [self._make_point("p2", 2)])
+
+        entries = self._journal_lines(temp_dir)
+        assert entries[-1] == {"seq": entries[-1]["seq"], "op": "delete", "ids": ["p0"]}
+
+    def test_fallback_mode_does_not_journal(self, temp_dir):
+        """Test that writes without a FAISS index skip the never-replayed journal."""
+        with patch("autopack.memory.faiss_store.FAISS_AVAILABLE", False):
+            store = FaissStore(index_dir=temp_dir)
+            store.JOURNAL_COMPACT_THRESHOLD = 3
+            store.upsert("test_collection", [self._make_point("p0", 0)])
+            for i in range(1, 4):
+                store.upsert("test_collection", [self._make_point(f"p{i}", i)])
+
+        assert not (Path(temp_dir) / "test_collection.journal.jsonl").exists()
+        # Payload sidecars are still refreshed on the snapshot cadence
+        with open(Path(temp_dir) / "test_collection.payloads.json") as f:
+            assert set(json.load(f)) == {"p0", "p1", "p2", "p3"}
+
+    def test_journal_disabled_rewrites_snapshot(self, temp_dir):
+        """Test that journal=False keeps the full-rewrite behaviour."""
+        store = FaissStore(index_dir=temp_dir, journal=False)
+        store.upsert("test_collection", [self._make_point("p1", 1)])
+        store.upsert("test_collection", [self._make_point("p2", 2)])
+
+        assert self._journal_lines(temp_dir) == []
+        with open(Path(temp_dir) / "test_collection.payloads.json") as f:
+            assert set(json.load(f)) == {"p1", "p2"}
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_journal_replayed_on_reopen(self, temp_dir):
+        """Test that journaled writes are replayed by ensure_collection."""
+        store1 = FaissStore(index_dir=temp_dir)
+        store1.upsert("test_collection", [self._make_point("p1", 1)])
+        store1.upsert("test_collection", [self._make_point("p2", 2)])
+        store1.update_payload("test_collection", "p1", {"value": 10})
+        store1.delete("test_collection", ["p2"])
+        store1.upsert("test_collection", [self._make_point("p3", 3)])
+
+        store2 = FaissStore(index_dir=temp_dir)
+        store2.ensure_collection("test_collection")
+
+        assert store2.get_payload("test_collection", "p1") == {"value": 10}
+        assert store2.get_payload("test_collection", "p2") is None
+        assert store2.get_payload("test_collection", "p3") == {"value": 3}
+        results = store2.search("test_collection", [1.0] + [0.0] * 1535, limit=5)
+        assert {r["id"] for r in results} == {"p1", "p3"}
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_torn_journal_entry_is_ignored(self, temp_dir):
+        """Test that a partially written trailing entry does not break replay."""
+        store1 = FaissStore(index_dir=temp_dir)
+        store1.upsert("test_collection", [self._make_point("p1", 1)])
+        store1.upsert("test_collection", [self._make_point("p2", 2)])
+        journal_path = Path(temp_dir) / "test_collection.journal.jsonl"
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "op": "upsert", "id": "p9"')
+
+        store2 = FaissStore(index_dir=temp_dir)
+        store2.ensure_collection("test_collection")
+
+        assert store2.count("test_collection") == 2
+        assert store2.get_payload("test_collection", "p9") is None
+        # Replay re-snapshots so new appends start on a clean journal
+        assert not journal_path.exists()
+
+
+class TestFaissStoreCompaction:
+    """Tests for dead-vector tracking and index compaction (IMP-PERF-008)."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for FAISS indices."""
+        return str(tmp_path)
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        """Create a FaissStore that never compacts on its own."""
+        store = FaissStore(index_dir=temp_dir)
+        store.COMPACT_MIN_DEAD = 10**9
+        return store
+
+    def _make_point(self, point_id: str, axis: int, payload=None):
+        """Create a test point pointing along a single axis."""
+        vector = [0.0] * 1536
+        vector[axis] = 1.0
+        return {"id": point_id, "vector": vector, "payload": payload or {"axis": axis}}
+
+    def _wait_for_compaction(self, store, collection):
+        thread = store._compaction_threads.get(collection)
+        if thread is not None:
+            thread.join(timeout=10)
+
+    def test_delete_counts_dead_vectors(self, store):
+        """Test that deleted points are reported as dead until compaction."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(4)])
+        store.delete("test_collection", ["p0", "p1"])
+
+        stats = store.get_collection_stats("test_collection")
+        assert stats["live"] == 2
+        assert stats["dead"] == 2
+        assert stats["total_vectors"] == 4
+        assert stats["dead_ratio"] == pytest.approx(0.5)
+
+    def test_reupsert_replaces_vector(self, store):
+        """Test that re-upserting an ID replaces its vector instead of duplicating it."""
+        store.upsert("test_collection", [self._make_point("p1", 0)])
+        store.upsert("test_collection", [self._make_point("p1", 1, {"version": 2})])
+
+        query = [0.0] * 1536
+        query[1] = 1.0
+        results = store.search("test_collection", query, limit=5)
+
+        assert [r["id"] for r in results] == ["p1"]
+        assert results[0]["score"] == pytest.approx(1.0)
+        assert results[0]["payload"] == {"version": 2}
+        assert store.get_collection_stats("test_collection")["dead"] == 1
+
+    def test_compact_removes_dead_vectors(self, store):
+        """Test that compaction physically drops dead vectors and keeps search intact."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(6)])
+        store.delete("test_collection", ["p0", "p2", "p4"])
+
+        removed = store.compact("test_collection")
+
+        assert removed == 3
+        stats = store.get_collection_stats("test_collection")
+        assert stats["dead"] == 0
+        assert stats["total_vectors"] == 3
+        query = [0.0] * 1536
+        query[3] = 1.0
+        assert store.search("test_collection", query, limit=1)[0]["id"] == "p3"
+
+    def test_search_not_short_after_deletes(self, store):
+        """Test that dead vectors near the query do not starve the result set."""
+        points = [self._make_point(f"near{i}", 0) for i in range(20)]
+        points += [self._make_point(f"far{i}", 1) for i in range(5)]
+        store.upsert("test_collection", points)
+        store.delete("test_collection", [f"near{i}" for i in range(20)])
+
+        query = [0.0] * 1536
+        query[0] = 1.0
+        results = store.search("test_collection", query, limit=5)
+
+        assert len(results) == 5
+        assert all(r["id"].startswith("far") for r in results)
+
+    def test_background_compaction_triggered_by_dead_ratio(self, temp_dir):
+        """Test that crossing the dead ratio schedules a background compaction."""
+        store = FaissStore(index_dir=temp_dir)
+        store.COMPACT_MIN_DEAD = 2
+        store.COMPACT_DEAD_RATIO = 0.5
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(4)])
+
+        store.delete("test_collection", ["p0"])
+        assert store.get_collection_stats("test_collection")["dead"] == 1
+
+        store.delete("test_collection", ["p1"])
+        self._wait_for_compaction(store, "test_collection")
+
+        stats = store.get_collection_stats("test_collection")
+        assert stats["dead"] == 0
+        assert stats["live"] == 2
+        assert stats["compacting"] is False
+
+    def test_interrupted_compaction_snapshot_is_rolled_forward(self, store, temp_dir):
+        """Test that a snapshot committed but not fully renamed is completed on load."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(4)])
+        store.delete("test_collection", ["p0", "p2"])
+
+        id_map_path = Path(temp_dir) / "test_collection.idmap.json"
+        before = id_map_path.read_text()
+
+        # Crash right after the commit point: staged files written, none renamed
+        with patch.object(FaissStore, "_finish_snapshot"):
+            store.compact("test_collection")
+        assert id_map_path.read_text() == before
+
+        FaissStore(index_dir=temp_dir).ensure_collection("test_collection")
+
+        assert json.loads(id_map_path.read_text()) == {"p1": 0, "p3": 1}
+        meta = json.loads((Path(temp_dir) / "test_collection.meta.json").read_text())
+        assert "pending" not in meta
+        assert not list(Path(temp_dir).glob("*.staged"))
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_compaction_crash_before_commit_keeps_consistent_snapshot(self, store, temp_dir):
+        """Test that an uncommitted compaction snapshot never mixes with the old one."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(4)])
+        store.delete("test_collection", ["p0", "p2"])
+
+        # Crash while writing the commit record: staged files exist but are not committed
+        with patch.object(FaissStore, "_write_json_atomic", side_effect=OSError("crash")):
+            store.compact("test_collection")
+
+        reloaded = FaissStore(index_dir=temp_dir)
+        for axis in (1, 3):
+            query = [0.0] * 1536
+            query[axis] = 1.0
+            assert reloaded.search("test_collection", query, limit=1)[0]["id"] == f"p{axis}"
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_legacy_flat_index_is_migrated(self, temp_dir):
+        """Test that a pre-IDMap flat index snapshot loads with positional ids."""
+        import faiss
+        import numpy as np
+
+        vectors = np.eye(3, 1536, dtype=np.float32)
+        flat = faiss.IndexFlatIP(1536)
+        flat.add(vectors)
+        faiss.write_index(flat, str(Path(temp_dir) / "legacy.index"))
+        (Path(temp_dir) / "legacy.payloads.json").write_text(
+            json.dumps({"a": {"n": 0}, "c": {"n": 2}})
+        )
+        (Path(temp_dir) / "legacy.idmap.json").write_text(json.dumps({"a": 0, "c": 2}))
+
+        store = FaissStore(index_dir=temp_dir)
+        store.COMPACT_MIN_DEAD = 10**9
+        stats = store.get_collection_stats("legacy")
+
+        assert stats == {**stats, "live": 2, "dead": 1, "total_vectors": 3}
+        query = [0.0] * 1536
+        query[2] = 1.0
+        assert store.search("legacy", query, limit=1)[0]["id"] == "c"
+        store.upsert("legacy", [self._make_point("d", 5)])
+        assert store._collections["legacy"]["id_map"]["d"] == 3
+
+
+class TestFaissStoreReverseIdMap:
+    """Tests for the incrementally maintained reverse id map (IMP-PERF-009)."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for FAISS indices."""
+        return str(tmp_path)
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        """Create a FaissStore that never compacts on its own."""
+        store = FaissStore(index_dir=temp_dir)
+        store.COMPACT_MIN_DEAD = 10**9
+        return store
+
+    def _make_point(self, point_id: str, value: int):
+        """Create a test point with a dummy vector."""
+        return {"id": point_id, "vector": [0.1] * 1536, "payload": {"value": value}}
+
+    def _assert_in_sync(self, col):
+        for point_id, faiss_id in col["id_map"].items():
+            assert col["rev_ids"][faiss_id] == point_id
+        assert sum(1 for p in col["rev_ids"] if p is not None) == len(col["id_map"])
+
+    def test_rev_ids_track_upsert_delete_and_evict(self, store):
+        """Test that rev_ids mirrors id_map through every mutation."""
+        store.MAX_PAYLOAD_ENTRIES = 4
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(3)])
+        store.upsert("test_collection", [self._make_point("p1", 10)])
+        store.delete("test_collection", ["p2"])
+        store.upsert("test_collection", [self._make_point(f"q{i}", i) for i in range(4)])
+
+        col = store._collections["test_collection"]
+        self._assert_in_sync(col)
+        assert "p0" not in col["id_map"]
+
+    def test_rev_ids_dense_after_compaction(self, store):
+        """Test that compaction renumbers ids densely."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(5)])
+        store.delete("test_collection", ["p1", "p3"])
+        store.compact("test_collection")
+
+        col = store._collections["test_collection"]
+        assert col["rev_ids"] == ["p0", "p2", "p4"]
+        self._assert_in_sync(col)
+
+    def test_rev_ids_persisted_with_snapshot(self, store, temp_dir):
+        """Test that the reverse map is written alongside id_map."""
+        store.upsert("test_collection", [self._make_point("p0", 0), self._make_point("p1", 1)])
+
+        with open(Path(temp_dir) / "test_collection.revids.json") as f:
+            assert json.load(f) == ["p0", "p1"]
+
+    @pytest.mark.skipif(not FAISS_AVAILABLE, reason="FAISS not installed")
+    def test_stale_rev_ids_rebuilt_on_load(self, store, temp_dir):
+        """Test that a missing or inconsistent reverse map is rebuilt from id_map."""
+        store.upsert("test_collection", [self._make_point(f"p{i}", i) for i in range(3)])
+        (Path(temp_dir) / "test_collection.revids.json").write_text(json.dumps(["x"]))
+
+        store2 = FaissStore(index_dir=temp_dir)
+        store2.ensure_collection("test_collection")
+
+        col = store2._collections["test_collection"]
+        assert col["rev_ids"] == ["p0", "p1", "p2"]
+        assert len(store2.search("test_collection", [0.1] * 1536, limit=5)) == 3
+
+
+class TestFaissStorePayloadIndex:
+    """Tests for payload field indexes and pre-filtered search (IMP-PERF-010)."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for FAISS indices."""
+        return str(tmp_path)
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        """Create a FaissStore instance."""
+        return FaissStore(index_dir=temp_dir)
+
+    def _make_point(self, point_id: str, axis: int, **payload):
+        """Create a test point pointing mostly along a single axis."""
+        vector = [0.01] * 1536
+        vector[axis] = 1.0
+        return {"id": point_id, "vector": vector, "payload": payload}
+
+    def test_field_index_tracks_payload_changes(self, store):
+        """Test that the field index follows upsert, update_payload and delete."""
+        store.upsert(
+            "test_collection",
+            [
+                self._make_point("p1", 0, project_id="a", task_type="build"),
+                self._make_point("p2", 0, project_id="b"),
+            ],
+        )
+        store.update_payload("test_collection", "p1", {"project_id": "b", "status": "active"})
+        store.delete("test_collection", ["p2"])
+
+        field_index = store._collections["test_collection"]["field_index"]
+        assert field_index["project_id"] == {"b": {"p1"}}
+        assert field_index["task_type"] == {}
+        assert field_index["status"] == {"active": {"p1"}}
+
+    def test_small_project_not_starved(self, store):
+        """Test that a filtered search finds a small project's points among many closer ones."""
+        points = [self._make_point(f"big{i}", 0, project_id="big") for i in range(200)]
+        points += [self._make_point(f"small{i}", 1, project_id="small") for i in range(3)]
+        store.upsert("test_collection", points)
+
+        query = [0.0] * 1536
+        query[0] = 1.0
+        results = store.search("test_collection", query, filter={"project_id": "small"}, limit=3)
+
+        assert sorted(r["id"] for r in results) == ["small0", "small1", "small2"]
+
+    def test_prefilter_combines_indexed_and_unindexed_fields(self, store):
+        """Test that unindexed filter fields are still applied on the candidate subset."""
+        store.upsert(
+            "test_collection",
+            [
+                self._make_point("p1", 0, project_id="a", run_id="r1"),
+                self._make_point("p2", 0, project_id="a", run_id="r2"),
+                self._make_point("p3", 0, project_id="b", run_id="r1"),
+            ],
+        )
+
+        results = store.search(
+            "test_collection", [0.1] * 1536, filter={"project_id": "a", "run_id": "r1"}, limit=5
+        )
+
+        assert [r["id"] for r in results] == ["p1"]
+
+    def test_prefilter_excludes_tombstoned(self, store):
+        """Test that excluded statuses are removed from the candidate set."""
+        store.upsert(
+            "test_collection",
+            [
+                self._make_point("p1", 0, project_id="a", status="tombstoned"),
+                self._make_point("p2", 0, project_id="a"),
+            ],
+        )
+
+        results = store.search("test_collection", [0.1] * 1536, filter={"project_id": "a"})
+
+        assert [r["id"] for r in results] == ["p2"]
+
+    def test_prefilter_no_matches(self, store):
+        """Test that a filter matching nothing returns no results without scanning."""
+        store.upsert("test_collection", [self._make_point("p1", 0, project_id="a")])
+
+        assert store.search("test_collection", [0.1] * 1536, filter={"project_id": "z"}) == []
+
+    def test_candidate_ids_ignores_unindexed_filters(self, store):
+        """Test that filters without indexed fields fall back to post-filtering."""
+        store.upsert("test_collection", [self._make_point("p1", 0, project_id="a")])
+        col = store._collections["test_collection"]
+
+        assert store._candidate_ids(col, {"run_id": "r1"}) is None
+        assert store._candidate_ids(col, {"project_id": "a"}) == {"p1"}
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed")
+class TestFaissStoreVectorizedFallback:
+    """Tests for the NumPy matrix fallback search (IMP-PERF-011)."""
+
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Create a temporary directory for FAISS indices."""
+        return str(tmp_path)
+
+    @pytest.fixture
+    def store(self, temp_dir):
+        """Create a FaissStore forced onto the fallback path."""
+        with patch("autopack.memory.faiss_store.FAISS_AVAILABLE", False):
+            store = FaissStore(index_dir=temp_dir)
+            store.COMPACT_MIN_DEAD = 10**9
+            yield store
+
+    def _make_point(self, point_id: str, vector, **payload):
+        """Create a test point with the given vector."""
+        return {"id": point_id, "vector": vector, "payload": payload}
+
+    def test_matrix_rows_normalized_and_extended(self, store):
+        """Test that the matrix is pre-normalized and grows with new upserts."""
+        store.upsert("test_collection", [self._make_point("p1", [3.0, 4.0, 0.0])])
+        store.search("test_collection", [1.0, 0.0, 0.0])
+        store.upsert("test_collection", [self._make_point("p2", [0.0, 0.0, 2.0])])
+        store.search("test_collection", [1.0, 0.0, 0.0])
+
+        col = store._collections["test_collection"]
+        assert col["matrix_rows"] == 2
+        assert col["matrix"][0].tolist() == pytest.approx([0.6, 0.8, 0.0])
+        assert col["matrix"][1].tolist() == pytest.approx([0.0, 0.0, 1.0])
+
+    def test_top_k_matches_brute_force(self, store):
+        """Test that argpartition top-k returns the same ranking as the pure-Python path."""
+        points = [
+            self._make_point(f"p{i}", [float(i % 7), float(i % 5) - 2.0, 1.0, float(i % 3)])
+            for i in range(60)
+        ]
+        store.upsert("test_collection", points)
+        col = store._collections["test_collection"]
+        query = [1.0, -0.5, 0.25, 2.0]
+
+        fast = store._fallback_search(col, query, None, 5)
+        slow = store._python_fallback_search(col, query, None, 5)
+
+        assert [r["score"] for r in fast] == pytest.approx([r["score"] for r in slow], abs=1e-5)
+        assert len(fast) == 5
+
+    def test_dead_and_excluded_vectors_skipped(self, store):
+        """Test that replaced, deleted and tombstoned points never surface."""
+        store.upsert(
+            "test_collection",
+            [
+                self._make_point("p1", [1.0, 0.0]),
+                self._make_point("p2", [0.9, 0.1]),
+                self._make_point("p3", [0.8, 0.2], status="tombstoned"),
+                self._make_point("p4", [0.0, 1.0]),
+            ],
+        )
+        store.upsert("test_collection", [self._make_point("p1", [0.0, 1.0])])
+        store.delete("test_collection", ["p2"])
+
+        results = store.search("test_collection", [1.0, 0.0], limit=2)
+
+        assert [r["id"] for r in results] == ["p4", "p1"]
+
+    def test_matrix_follows_compaction(self, store):
+        """Test that compaction reorders the matrix rows with the vectors."""
+        store.upsert(
+            "test_collection",
+            [self._make_point(f"p{i}", [float(i == j) for j in range(4)]) for i in range(4)],
+        )
+        store.delete("test_collection", ["p0", "p2"])
+        store.compact("test_collection")
+
+        col = store._collections["test_collection"]
+        assert col["matrix_rows"] == 2
+        results = store.search("test_collection", [0.0, 0.0, 0.0, 1.0], limit=1)
+        assert results[0]["id"] == "p3"
+        assert results[0]["score"] == pytest.approx(1.0)
@@ -0,0 +1,235 @@
+"""Tests for IMP-PERF-016: SQLite-backed learning database.
+
+Tests that verify:
+- SqliteLearningDatabase returns the same records as the JSON LearningDatabase
+- Writes persist across instances and concurrent threads
+- JSON databases migrate once, preserving all sections
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from autopack.memory.learning_db import LearningDatabase
+from autopack.memory.learning_db_sqlite import (
+    SqliteLearningDatabase,
+    migrate_json_learning_db,
+    open_learning_database,
+)
+
+
+def _populate(db: LearningDatabase) -> None:
+    """Apply the same sequence of writes to any backend."""
+    db.record_improvement_outcome("IMP-001", "implemented", category="memory", priority="high")
+    db.record_improvement_outcome("IMP-002", "blocked", notes="API limit", category="memory")
+    db.record_improvement_outcome("IMP-003", "blocked", notes="API limit", category="telemetry")
+    db.record_improvement_outcome("IMP-002", "implemented", category="memory")
+    db.record_cycle_outcome(
+        "cycle-1", {"completion_rate": 0.5, "blocking_reasons": ["flaky CI", "API limit"]}
+    )
+    db.record_cycle_outcome("cycle-2", {"completion_rate": 0.9, "blocking_reasons": ["flaky CI"]})
+    db.store_pattern(
+        "pat-a",
+        {
+            "pattern_type": "tech_stack",
+            "name": "FastAPI",
+            "success_rate": 0.9,
+            "occurrence_count": 4,
+            "confidence": "medium",
+            "recommended_for": ["API", "backend"],
+            "avoid_for": ["static"],
+            "associated_project_types": ["Web"],
+        },
+    )
+    db.store_pattern(
+        "pat-b",
+        {
+            "pattern_type": "architecture",
+            "name": "Monolith",
+            "success_rate": 0.25,
+            "occurrence_count": 6,
+            "confidence": "high",
+            "recommended_for": ["mvp"],
+            "avoid_for": ["api"],
+        },
+    )
+    db.store_pattern(
+        "pat-c",
+        {
+            "pattern_type": "tech_stack",
+            "name": "Django",
+            "success_rate": 0.9,
+            "occurrence_count": 2,
+            "confidence": "low",
+            "associated_project_types": ["cli"],
+        },
+    )
+    db.update_pattern_metrics("pat-c", new_occurrence=True, was_successful=True)
+    db.store_project_history("proj-1", {"project_type": "web", "outcome": "success"})
+    db.store_project_history("proj-2", {"project_type": "cli", "outcome": "failed"})
+
+
+@pytest.fixture
+def json_db(tmp_path: Path) -> LearningDatabase:
+    db = LearningDatabase(tmp_path / "learning.json")
+    _populate(db)
+    return db
+
+
+@pytest.fixture
+def sqlite_db(tmp_path: Path) -> SqliteLearningDatabase:
+    db = SqliteLearningDatabase(tmp_path / "learning.sqlite3")
+    _populate(db)
+    yield db
+    db.close()
+
+
+_TIME_FIELDS = frozenset(
+    {
+        "recorded_at",
+        "first_seen",
+        "last_updated",
+        "stored_at",
+        "updated_at",
+        "last_seen",
+        "timestamp",
+    }
+)
+
+
+def _strip_times(value):
+    """Drop wall-clock fields so records from two runs can be compared."""
+    if isinstance(value, dict):
+        return {k: _strip_times(v) for k, v in value.items() if k not in _TIME_FIELDS}
+    if isinstance(value, list):
+        return [_strip_times(v) for v in value]
+    return value
+
+
+class TestSqliteParity:
+    """The SQLite backend should answer every query like the JSON backend."""
+
+    def test_is_a_learning_database(self, sqlite_db: SqliteLearningDatabase) -> None:
+        assert isinstance(sqlite_db, LearningDatabase)
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            lambda db: db.get_historical_patterns(),
+            lambda db: db.get_success_rate("memory"),
+            lambda db: db.get_improvement("IMP-002"),
+            lambda db: db.list_improvements(category="memory"),
+            lambda db: db.list_improvements(outcome="blocked"),
+            lambda db: db.get_likely_blockers("telemetry"),
+            lambda db: db.get_pattern("pat-c"),
+            lambda db: db.list_patterns(pattern_type="tech_stack", min_success_rate=0.5),
+            lambda db: db.list_patterns(project_type="WEB"),
+            lambda db: db.get_top_patterns(limit=2, min_confidence="low"),
+            lambda db: db.get_patterns_for_context(["api", "MVP"]),
+            lambda db: db.get_patterns_for_context(["static"], project_type="web"),
+            lambda db: db.get_project_history(outcome="failed"),
+            lambda db: db.get_cross_project_insights(),
+            lambda db: db.export_data()["patterns"],
+        ],
+    )
+    def test_queries_match_json_backend(self, json_db, sqlite_db, query) -> None:
+        assert _strip_times(query(sqlite_db)) == _strip_times(query(json_db))
+
+    def test_list_cycles_most_recent_first(self, sqlite_db: SqliteLearningDatabase) -> None:
+        assert [c["cycle_id"] for c in sqlite_db.list_cycles()] == ["cycle-2", "cycle-1"]
+        assert [c["cycle_id"] for c in sqlite_db.list_cycles(limit=1)] == ["cycle-2"]
+
+    def test_invalid_inputs_rejected(self, sqlite_db: SqliteLearningDatabase) -> None:
+        assert sqlite_db.record_improvement_outcome("IMP-X", "bogus") is False
+        assert sqlite_db.record_cycle_outcome("", {}) is False
+        assert sqlite_db.update_pattern_metrics("missing", new_occurrence=True) is False
+
+
+class TestSqliteStorage:
+    """Tests for persistence and concurrency of the SQLite backend."""
+
+    def test_data_persists_across_instances(self, sqlite_db: SqliteLearningDatabase) -> None:
+        reopened = SqliteLearningDatabase(sqlite_db.db_path)
+        assert reopened.get_improvement("IMP-001")["current_outcome"] == "implemented"
+        assert reopened.get_pattern("pat-c")["confidence"] == "medium"
+        reopened.close()
+
+    def test_wal_journal_mode(self, sqlite_db: SqliteLearningDatabase) -> None:
+        with sqlite3.connect(sqlite_db.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_concurrent_writes_all_recorded(self, tmp_path: Path) -> None:
+        db = SqliteLearningDatabase(tmp_path / "concurrent.db")
+        other = SqliteLearningDatabase(tmp_path / "concurrent.db")
+
+        def write(target: SqliteLearningDatabase, start: int) -> None:
+            for i in range(start, start + 20):
+                target.record_improvement_outcome(f"IMP-{i:03d}", "implemented", category="c")
+
+        threads = [
+            threading.Thread(target=write, args=(target, start))
+            for target, start in ((db, 0), (other, 20), (db, 40), (other, 60))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(db.list_improvements()) == 80
+        assert db.get_historical_patterns()["category_success_rates"]["c"]["total"] == 80
+        db.close()
+        other.close()
+
+    def test_clear_all(self, sqlite_db: SqliteLearningDatabase) -> None:
+        assert sqlite_db.clear_all() is True
+        data = sqlite_db.export_data()
+        assert data["improvements"] == {}
+        assert data["successful_patterns"] == {}
+        assert data["patterns"]["blocking_reasons"] == {}
+
+    def test_closed_database_reports_failure(self, sqlite_db: SqliteLearningDatabase) -> None:
+        sqlite_db.close()
+        assert sqlite_db.record_improvement_outcome("IMP-9", "implemented") is False
+
+
+class TestJsonMigration:
+    """Tests for the one-shot JSON to SQLite migration."""
+
+    def test_migrate_preserves_all_sections(self, json_db: LearningDatabase) -> None:
+        migrated = migrate_json_learning_db(json_db.db_path)
+
+        assert migrated.db_path == json_db.db_path.with_suffix(".sqlite3")
+        source, target = json_db.export_data(), migrated.export_data()
+        for section in ("improvements", "cycles", "patterns", "successful_patterns"):
+            assert target[section] == source[section]
+        assert target["project_history"] == source["project_history"]
+        assert target["created_at"] == source["created_at"]
+        migrated.close()
+
+    def test_migrate_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            migrate_json_learning_db(tmp_path / "missing.json")
+
+    def test_open_learning_database_migrates_once(self, json_db: LearningDatabase) -> None:
+        db = open_learning_database(json_db.db_path)
+        assert isinstance(db, SqliteLearningDatabase)
+        assert len(db.list_improvements()) == 3
+        db.record_improvement_outcome("IMP-NEW", "pending")
+        db.close()
+
+        # Later changes to the JSON file are not re-imported
+        json_db.record_improvement_outcome("IMP-JSON-ONLY", "pending")
+        reopened = open_learning_database(json_db.db_path)
+        assert reopened.get_improvement("IMP-NEW") is not None
+        assert reopened.get_improvement("IMP-JSON-ONLY") is None
+        reopened.close()
+
+    def test_open_learning_database_sqlite_path(self, tmp_path: Path) -> None:
+        db = open_learning_database(tmp_path / "learning.db")
+        assert db.db_path == tmp_path / "learning.db"
+        assert db.list_cycles() == []
+        db.close()
@@ -0,0 +1,102 @@
+"""Tests for IMP-PERF-012: single-embedding multi-collection retrieval."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autopack.memory.memory_service import MemoryService, MultiCollectionRetrieval
+
+
+@pytest.fixture
+def memory_service():
+    """Create a MemoryService with a mocked store and embedder."""
+    with patch("autopack.memory.memory_service.FaissStore"):
+        with patch("autopack.memory.memory_service.sync_embed_text") as mock_embed:
+            mock_embed.return_value = [0.5] * 1536
+            service = MemoryService(enabled=True, use_qdrant=False)
+            service.enabled = True
+            service.store = MagicMock()
+            service.store.search.return_value = [{"id": "p1", "score": 0.9, "payload": {}}]
+            service.store.scroll.return_value = []
+            service.mock_embed = mock_embed
+            yield service
+
+
+class TestRetrieveContextMulti:
+    """Tests for MemoryService.retrieve_context_multi."""
+
+    def test_query_embedded_once_for_all_collections(self, memory_service):
+        """Every collection search should reuse one query embedding."""
+        retrieval = memory_service.retrieve_context_multi(
+            "query",
+            "project-1",
+            include_planning=True,
+            include_decisions=True,
+        )
+
+        assert isinstance(retrieval, MultiCollectionRetrieval)
+        assert memory_service.mock_embed.call_count == 1
+        assert memory_service.store.search.call_count == 6
+        for call in memory_service.store.search.call_args_list:
+            assert call.args[1] == [0.5] * 1536
+
+    def test_timings_reported_per_collection(self, memory_service):
+        """Timings should cover exactly the collections that were searched."""
+        retrieval = memory_service.retrieve_context_multi(
+            "query", "project-1", include_errors=False, include_hints=False
+        )
+
+        assert set(retrieval.timings_ms) == {"code", "summaries"}
+        assert all(ms >= 0.0 for ms in retrieval.timings_ms.values())
+        assert retrieval.total_ms >= retrieval.embed_ms
+        assert retrieval.results["code"][0]["id"] == "p1"
+        assert retrieval.results["errors"] == []
+
+    def test_plan_changes_only_skips_embedding(self, memory_service):
+        """A retrieval with no vector searches should not embed the query."""
+        retrieval = memory_service.retrieve_context_multi(
+            "query",
+            "project-1",
+            include_code=False,
+            include_summaries=False,
+            include_errors=False,
+            include_hints=False,
+            include_plan_changes=True,
+        )
+
+        memory_service.mock_embed.assert_not_called()
+        assert retrieval.embed_ms == 0.0
+        assert set(retrieval.timings_ms) == {"plan_changes"}
+
+    def test_retrieve_context_returns_plain_results(self, memory_service):
+        """retrieve_context should keep returning the per-collection dict."""
+        context = memory_service.retrieve_context("query", "project-1")
+
+        assert set(context) == {
+            "code",
+            "summaries",
+            "errors",
+            "hints",
+            "planning",
+            "plan_changes",
+            "decisions",
+            "sot",
+        }
+        assert memory_service.mock_embed.call_count == 1
+
+    def test_metadata_retrieval_embeds_once_and_reports_timings(self, memory_service):
+        """retrieve_context_with_metadata should go through the shared-vector path."""
+        retrieval = memory_service.retrieve_context_with_metadata_multi(
+            "query", "project-1", min_confidence=0.0
+        )
+
+        assert memory_service.mock_embed.call_count == 1
+        assert memory_service.store.search.call_count == 4
+        assert set(retrieval.timings_ms) == {"code", "summaries", "errors", "hints"}
+        assert retrieval.results["code"][0].relevance_score == 0.9
+
+        context = memory_service.retrieve_context_with_metadata(
+            "query", "project-1", include_code=False, include_summaries=False
+        )
+        assert memory_service.mock_embed.call_count == 2
+        assert context["code"] == []
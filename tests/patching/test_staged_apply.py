@@ -0,0 +1,309 @@
+"""Tests for staged in-memory patch application (IMP-PERF-031).
+
+Tests that verify:
+- stage_patch applies modify/create/delete hunks in memory without writing
+- Hunks are located at the nearest exact offset; inexact patches fall back
+- Hunks anchored at the beginning or end of the file match only there, like git apply
+- End-of-file newline markers are honoured
+- commit_staged_files writes atomically and preserves file modes
+- GovernedApplyPath uses the staged path without git subprocesses or backups
+- Invalid staged content is rejected with the workspace untouched
+- Patches the staged path cannot apply still go through git apply
+"""
+
+import os
+import stat
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from autopack.governed_apply import GovernedApplyPath
+from autopack.patching.apply_engine import (
+    ApplyResult,
+    StagedFile,
+    commit_staged_files,
+    stage_patch,
+)
+
+MODIFY_PATCH = """diff --git a/app.py b/app.py
+index 1234567..89abcde 100644
+--- a/app.py
++++ b/app.py
+@@ -1,2 +1,2 @@
+ def main():
+-    return 1
++    return 2
+"""
+
+NEW_FILE_PATCH = """diff --git a/pkg/new.py b/pkg/new.py
+new file mode 100644
+index 0000000..e69de29
+--- /dev/null
++++ b/pkg/new.py
+@@ -0,0 +1,2 @@
++X = 1
++Y = 2
+"""
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "app.py").write_text("def main():\n    return 1\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestStagePatch:
+    """Tests for stage_patch."""
+
+    def test_modify_and_create_are_staged_in_memory(self, workspace):
+        staged, reason = stage_patch(MODIFY_PATCH + NEW_FILE_PATCH, workspace)
+
+        assert reason is None
+        assert staged["app.py"] == StagedFile(
+            path="app.py",
+            original="def main():\n    return 1\n",
+            content="def main():\n    return 2\n",
+        )
+        assert staged["pkg/new.py"].original is None
+        assert staged["pkg/new.py"].content == "X = 1\nY = 2\n"
+        assert not (workspace / "pkg").exists()
+        assert (workspace / "app.py").read_text(encoding="utf-8").endswith("return 1\n")
+
+    def test_hunk_found_at_offset(self, tmp_path):
+        (tmp_path / "a.txt").write_text("x\ny\na\nb\nc\nd\ne\n", encoding="utf-8")
+        diff = "\n".join(
+            [
+                "diff --git a/a.txt b/a.txt",
+                "--- a/a.txt",
+                "+++ b/a.txt",
+                "@@ -2,3 +2,3 @@",
+                " b",
+                "-c",
+                "+C",
+                " d",
+                "",
+            ]
+        )
+
+        staged, _ = stage_patch(diff, tmp_path)
+
+        assert staged["a.txt"].content == "x\ny\na\nb\nC\nd\ne\n"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            # Hunk at line 1 would only match after two inserted lines
+            "import os\nimport sys\ndef main():\n    return 1\n",
+            # Hunk without trailing context would only match before the end
+            "def main():\n    return 1\nmain()\n",
+        ],
+    )
+    def test_anchored_hunk_not_moved(self, workspace, content):
+        (workspace / "app.py").write_text(content, encoding="utf-8")
+
+        staged, reason = stage_patch(MODIFY_PATCH, workspace)
+
+        assert staged is None
+        assert "does not apply exactly" in reason
+
+        subprocess.run(["git", "init", "-q"], cwd=workspace, check=True)
+        (workspace / "fix.patch").write_text(MODIFY_PATCH, encoding="utf-8")
+        git = subprocess.run(
+            ["git", "apply", "--check", "fix.patch"], cwd=workspace, capture_output=True
+        )
+        assert git.returncode != 0
+
+    def test_context_mismatch_falls_back(self, workspace):
+        (workspace / "app.py").write_text("def main():\n    return 3\n", encoding="utf-8")
+
+        staged, reason = stage_patch(MODIFY_PATCH, workspace)
+
+        assert staged is None
+        assert "does not apply exactly" in reason
+
+    def test_no_newline_at_end_of_file(self, tmp_path):
+        (tmp_path / "a.txt").write_text("one\ntwo", encoding="utf-8")
+        diff = "\n".join(
+            [
+                "diff --git a/a.txt b/a.txt",
+                "--- a/a.txt",
+                "+++ b/a.txt",
+                "@@ -1,2 +1,2 @@",
+                " one",
+                "-two",
+                "\\ No newline at end of file",
+                "+three",
+                "",
+            ]
+        )
+
+        staged, _ = stage_patch(diff, tmp_path)
+
+        assert staged["a.txt"].content == "one\nthree\n"
+
+    def test_delete_file(self, tmp_path):
+        (tmp_path / "old.txt").write_text("gone\n", encoding="utf-8")
+        diff = "\n".join(
+            [
+                "diff --git a/old.txt b/old.txt",
+                "deleted file mode 100644",
+                "--- a/old.txt",
+                "+++ /dev/null",
+                "@@ -1 +0,0 @@",
+                "-gone",
+                "",
+            ]
+        )
+
+        staged, _ = stage_patch(diff, tmp_path)
+
+        assert staged["old.txt"].content is None
+
+    @pytest.mark.parametrize(
+        "header",
+        ["rename from a.txt", "old mode 100644", "GIT binary patch"],
+    )
+    def test_unsupported_headers_fall_back(self, tmp_path, header):
+        (tmp_path / "a.txt").write_text("x\n", encoding="utf-8")
+        diff = f"diff --git a/a.txt b/a.txt\n{header}\n"
+
+        staged, reason = stage_patch(diff, tmp_path)
+
+        assert staged is None
+        assert "unsupported header" in reason
+
+    def test_matches_git_apply(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        original = "".join(f"line {i}\n" for i in range(30))
+        updated = original.replace("line 3\n", "line 3\nextra\n").replace("line 25\n", "")
+        (tmp_path / "f.txt").write_text(original, encoding="utf-8")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        (tmp_path / "f.txt").write_text(updated, encoding="utf-8")
+        diff = subprocess.run(
+            ["git", "diff"], cwd=tmp_path, capture_output=True, text=True, check=True
+        ).stdout
+        (tmp_path / "f.txt").write_text(original, encoding="utf-8")
+
+        staged, _ = stage_patch(diff, tmp_path)
+
+        assert staged["f.txt"].content == updated
+
+
+class TestCommitStagedFiles:
+    """Tests for commit_staged_files."""
+
+    def test_writes_all_files_and_preserves_mode(self, workspace):
+        script = workspace / "run.sh"
+        script.write_text("echo 1\n", encoding="utf-8")
+        script.chmod(0o755)
+        staged = {
+            "run.sh": StagedFile("run.sh", "echo 1\n", "echo 2\n"),
+            "pkg/new.py": StagedFile("pkg/new.py", None, "X = 1\n"),
+            "app.py": StagedFile("app.py", "def main():\n    return 1\n", None),
+        }
+
+        result = commit_staged_files(staged, workspace)
+
+        assert result == ApplyResult(
+            success=True,
+            method="staged",
+            message="Patch applied successfully in staged mode (3 files)",
+            files_modified=["run.sh", "pkg/new.py", "app.py"],
+        )
+        assert script.read_text(encoding="utf-8") == "echo 2\n"
+        assert stat.S_IMODE(script.stat().st_mode) == 0o755
+        assert (workspace / "pkg" / "new.py").exists()
+        assert not (workspace / "app.py").exists()
+        assert not list(workspace.rglob("*.tmp"))
+
+    def test_failed_rename_restores_committed_files(self, workspace):
+        staged = {
+            "app.py": StagedFile("app.py", "def main():\n    return 1\n", "changed\n"),
+            "b.py": StagedFile("b.py", None, "B = 1\n"),
+        }
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with patch("autopack.patching.apply_engine.os.replace", side_effect=flaky_replace):
+            result = commit_staged_files(staged, workspace)
+
+        assert result.success is False
+        assert "disk full" in result.message
+        assert (workspace / "app.py").read_text(encoding="utf-8") == "def main():\n    return 1\n"
+        assert not (workspace / "b.py").exists()
+        assert not list(workspace.rglob("*.tmp"))
+
+
+class TestGovernedApplyStaged:
+    """Tests for GovernedApplyPath.apply_patch in staged mode."""
+
+    def test_common_path_skips_git_and_backups(self, workspace):
+        apply_path = GovernedApplyPath(workspace=workspace, run_type="project_build")
+
+        with (
+            patch("autopack.governed_apply.execute_git_apply") as git_apply,
+            patch.object(apply_path, "_backup_files") as backup_files,
+        ):
+            ok, error = apply_path.apply_patch(MODIFY_PATCH + NEW_FILE_PATCH)
+
+        assert (ok, error) == (True, None)
+        git_apply.assert_not_called()
+        backup_files.assert_not_called()
+        assert "return 2" in (workspace / "app.py").read_text(encoding="utf-8")
+        assert (workspace / "pkg" / "new.py").read_text(encoding="utf-8") == "X = 1\nY = 2\n"
+        assert not (workspace / "temp_patch.diff").exists()
+
+    def test_corrupting_patch_leaves_workspace_unchanged(self, workspace):
+        broken = MODIFY_PATCH.replace("+    return 2", "+    return (")
+        apply_path = GovernedApplyPath(workspace=workspace, run_type="project_build")
+
+        with patch("autopack.governed_apply.execute_git_apply") as git_apply:
+            ok, error = apply_path.apply_patch(broken + NEW_FILE_PATCH)
+
+        assert ok is False
+        assert "workspace unchanged" in error
+        git_apply.assert_not_called()
+        assert (workspace / "app.py").read_text(encoding="utf-8") == "def main():\n    return 1\n"
+        assert not (workspace / "pkg").exists()
+
+    def test_inexact_patch_falls_back_to_git_apply(self, workspace):
+        (workspace / "app.py").write_text("def main():\n    return 3\n", encoding="utf-8")
+        apply_path = GovernedApplyPath(workspace=workspace, run_type="project_build")
+        git_result = ApplyResult(
+            success=False, method="failed", message="does not apply", files_modified=[]
+        )
+
+        with patch(
+            "autopack.governed_apply.execute_git_apply", return_value=git_result
+        ) as git_apply:
+            ok, error = apply_path.apply_patch(MODIFY_PATCH)
+
+        git_apply.assert_called_once()
+        assert ok is False
+        assert error == "diff_mode_patch_failed: does not apply"
+
+    def test_disabled_setting_uses_git_apply(self, workspace):
+        apply_path = GovernedApplyPath(workspace=workspace, run_type="project_build")
+        git_result = ApplyResult(
+            success=True, method="git_apply", message="ok", files_modified=["app.py"]
+        )
+
+        with (
+            patch("autopack.governed_apply.settings") as settings,
+            patch(
+                "autopack.governed_apply.execute_git_apply", return_value=git_result
+            ) as git_apply,
+        ):
+            settings.governed_apply_staged_enabled = False
+            ok, _ = apply_path.apply_patch(MODIFY_PATCH)
+
+        assert ok is True
+        git_apply.assert_called_once()
@@ -0,0 +1,187 @@
+"""Tests for hourly phase outcome rollups (IMP-PERF-021).
+
+Tests that verify:
+- refresh() folds only events newer than the watermark
+- Analyzer results from rollups match a raw scan of phase_outcome_events
+- The partial first hour of the window and unfolded events are still counted
+- check_consistency() detects drift and backfill(rebuild=True) repairs it
+- The analyzer falls back to raw scans when the rollup tables are missing
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from autopack.models import Base, PhaseOutcomeEvent, PhaseOutcomeRollup
+from autopack.telemetry.analyzer import TelemetryAnalyzer
+from autopack.telemetry.outcome_rollups import PhaseOutcomeRollups, first_full_bucket
+
+
+@pytest.fixture
+def db_session():
+    """Create in-memory SQLite database for testing."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+def _event(phase_id, outcome="SUCCESS", stop_reason="completed", tokens=1000, hours_ago=1.0):
+    return PhaseOutcomeEvent(
+        run_id="run-1",
+        phase_id=phase_id,
+        phase_type="build",
+        phase_outcome=outcome,
+        stop_reason=stop_reason,
+        tokens_used=tokens,
+        model_used="claude-sonnet",
+        timestamp=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+    )
+
+
+def _add(db_session, *events):
+    db_session.add_all(events)
+    db_session.commit()
+
+
+def _raw_results(db_session, window_days=7):
+    analyzer = TelemetryAnalyzer(db_session)
+    analyzer.rollups._available = False
+    return analyzer.aggregate_telemetry(window_days=window_days)
+
+
+def _summarize(results):
+    return {
+        "cost": [
+            (i.phase_id, i.metric_value, i.details["count"]) for i in results["top_cost_sinks"]
+        ],
+        "failures": sorted((i.phase_id, i.metric_value) for i in results["top_failure_modes"]),
+        "retries": sorted(
+            (i.phase_id, i.details["stop_reason"], i.metric_value, i.details["success_count"])
+            for i in results["top_retry_causes"]
+        ),
+        "stats": results["phase_type_stats"],
+    }
+
+
+class TestRollupMaintenance:
+    """Tests for incremental rollup refresh."""
+
+    def test_refresh_folds_only_new_events(self, db_session):
+        _add(db_session, _event("p1"), _event("p1"), _event("p2", tokens=None))
+        rollups = PhaseOutcomeRollups(db_session)
+
+        assert rollups.refresh() == 3
+        assert rollups.refresh() == 0
+
+        _add(db_session, _event("p1"))
+        assert rollups.refresh() == 1
+        assert rollups.get_watermark() == 4
+
+        p1 = db_session.query(PhaseOutcomeRollup).filter_by(phase_id="p1").all()
+        assert sum(row.event_count for row in p1) == 3
+        assert sum(row.tokens_sum for row in p1) == 3000
+        p2 = db_session.query(PhaseOutcomeRollup).filter_by(phase_id="p2").one()
+        assert (p2.event_count, p2.token_event_count, p2.tokens_sum) == (1, 0, 0)
+
+    def test_refresh_in_batches(self, db_session):
+        _add(db_session, *[_event(f"p{i % 3}", hours_ago=i) for i in range(10)])
+        rollups = PhaseOutcomeRollups(db_session)
+
+        assert rollups.refresh(batch_size=4) == 10
+        assert rollups.check_consistency().consistent
+
+
+class TestAnalyzerOnRollups:
+    """Analyzer output must not change when reading rollups."""
+
+    def _populate(self, db_session):
+        _add(
+            db_session,
+            _event("expensive", tokens=25000, hours_ago=1),
+            _event("expensive", tokens=25000, hours_ago=30),
+            _event("flaky", "FAILED", "max_tokens", 8000, hours_ago=2),
+            _event("flaky", "FAILED", "max_tokens", 8000, hours_ago=3),
+            _event("retry", "FAILED", "rate_limit", 5000, hours_ago=4),
+            _event("retry", "FAILED", "rate_limit", None, hours_ago=5),
+            _event("retry", "SUCCESS", "completed", 5000, hours_ago=6),
+            _event("old", tokens=100000, hours_ago=24 * 30),
+        )
+
+    def test_matches_raw_scan(self, db_session):
+        self._populate(db_session)
+        analyzer = TelemetryAnalyzer(db_session)
+
+        results = analyzer.aggregate_telemetry(window_days=7)
+
+        assert analyzer.rollups.get_watermark() == 8
+        assert _summarize(results) == _summarize(_raw_results(db_session))
+        assert results["top_cost_sinks"][0].phase_id == "expensive"
+        assert results["top_cost_sinks"][0].metric_value == 50000
+        assert results["top_cost_sinks"][0].details["avg_tokens"] == 25000
+
+    def test_unfolded_events_still_counted(self, db_session):
+        self._populate(db_session)
+        analyzer = TelemetryAnalyzer(db_session)
+        analyzer.aggregate_telemetry(window_days=7)
+
+        _add(db_session, _event("flaky", "FAILED", "max_tokens", 8000, hours_ago=0.1))
+        failures = analyzer._find_failure_modes(datetime.now(timezone.utc) - timedelta(days=7))
+
+        assert analyzer.rollups.get_watermark() == 8
+        flaky = next(i for i in failures if i.phase_id == "flaky")
+        assert flaky.metric_value == 3
+
+    def test_partial_first_hour_read_from_raw_events(self, db_session):
+        cutoff = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0) - timedelta(
+            hours=5
+        )
+        bucket = cutoff.replace(minute=0)
+        inside = _event("edge", tokens=10)
+        inside.timestamp = cutoff + timedelta(minutes=10)
+        outside = _event("edge", tokens=1000)
+        outside.timestamp = bucket + timedelta(minutes=5)
+        _add(db_session, inside, outside)
+        analyzer = TelemetryAnalyzer(db_session)
+        analyzer.rollups.refresh()
+
+        sinks = analyzer._find_cost_sinks(cutoff)
+
+        assert first_full_bucket(cutoff) == bucket + timedelta(hours=1)
+        assert [(i.phase_id, i.metric_value) for i in sinks] == [("edge", 10)]
+
+    def test_falls_back_without_rollup_tables(self, db_session):
+        self._populate(db_session)
+        db_session.execute(text("DROP TABLE phase_outcome_rollups"))
+        db_session.commit()
+        analyzer = TelemetryAnalyzer(db_session)
+
+        results = analyzer.aggregate_telemetry(window_days=7)
+
+        assert analyzer.rollups.is_available() is False
+        assert results["top_cost_sinks"][0].metric_value == 50000
+
+
+class TestRollupConsistency:
+    """Tests for check_consistency and backfill."""
+
+    def test_detects_drift_and_rebuild_repairs(self, db_session):
+        _add(db_session, _event("p1"), _event("p1", "FAILED", "timeout"))
+        rollups = PhaseOutcomeRollups(db_session)
+        rollups.backfill()
+        assert rollups.check_consistency(window_days=7).consistent
+
+        db_session.execute(text("UPDATE phase_outcome_rollups SET event_count = event_count + 1"))
+        db_session.commit()
+        report = rollups.check_consistency(window_days=7)
+
+        assert not report.consistent
+        assert report.keys_checked == 2
+        assert report.mismatches[0]["key"]["phase_id"] == "p1"
+
+        assert rollups.backfill(rebuild=True) == 2
+        assert rollups.check_consistency().consistent
@@ -0,0 +1,257 @@
+"""Tests for streaming windowed statistics (IMP-PERF-025).
+
+Tests that verify:
+- RingBuffer evicts oldest-first and behaves like the bounded list it replaces
+- WindowedStats moments, excluded-latest mean and p95 match statistics on the window
+- CorrelationAccumulator matches the direct Pearson formula, including removal
+- TelemetryAnomalyDetector alerts are unchanged versus list-based baselines
+- Per-key memory stays bounded by the window size
+"""
+
+import random
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+from autopack.telemetry.anomaly_detector import TelemetryAnomalyDetector
+from autopack.telemetry.streaming_stats import (
+    CorrelationAccumulator,
+    RingBuffer,
+    WindowedStats,
+    ewma_step,
+    exclusive_quantile,
+)
+
+
+class TestRingBuffer:
+    """Tests for RingBuffer."""
+
+    def test_evicts_oldest_when_full(self):
+        buffer = RingBuffer(3)
+
+        evicted = [buffer.append(v) for v in [1, 2, 3, 4, 5]]
+
+        assert evicted == [None, None, None, 1.0, 2.0]
+        assert buffer.to_list() == [3.0, 4.0, 5.0]
+        assert buffer.latest() == 5.0
+
+    def test_sequence_protocol(self):
+        buffer = RingBuffer(4, typecode="q")
+        for v in range(6):
+            buffer.append(v)
+
+        assert len(buffer) == 4
+        assert list(buffer) == [2, 3, 4, 5]
+        assert buffer[0] == 2
+        assert buffer[-1] == 5
+        assert buffer[1:3] == [3, 4]
+        with pytest.raises(IndexError):
+            buffer[4]
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestWindowedStats:
+    """Tests for WindowedStats against statistics on the same window."""
+
+    @pytest.mark.parametrize("capacity", [1, 2, 5, 20])
+    def test_moments_match_window(self, capacity):
+        rng = random.Random(capacity)
+        stats = WindowedStats(capacity)
+        window = []
+
+        for _ in range(500):
+            value = rng.uniform(0, 1000)
+            stats.push(value)
+            window = (window + [value])[-capacity:]
+
+            assert list(stats) == window
+            assert stats.mean == pytest.approx(statistics.fmean(window))
+            if len(window) > 1:
+                assert stats.stdev == pytest.approx(statistics.stdev(window), abs=1e-6)
+
+    def test_integer_mean_excluding_latest_is_exact(self):
+        rng = random.Random(7)
+        stats = WindowedStats(20)
+        window = []
+
+        for _ in range(300):
+            tokens = rng.randint(100, 50_000)
+            stats.push(tokens)
+            window = (window + [tokens])[-20:]
+            if len(window) > 1:
+                assert stats.mean_excluding_latest() == statistics.mean(window[:-1])
+
+        assert WindowedStats(5).mean_excluding_latest() is None
+
+    def test_p95_excluding_latest_matches_quantiles(self):
+        rng = random.Random(11)
+        stats = WindowedStats(20, track_order_stats=True)
+        window = []
+
+        for _ in range(300):
+            duration = round(rng.lognormvariate(3, 1), 3)
+            stats.push(duration)
+            window = (window + [duration])[-20:]
+            if len(window) > 2:
+                previous = window[:-1]
+                assert (
+                    stats.percentile_excluding_latest(95)
+                    == statistics.quantiles(previous, n=20)[18]
+                )
+
+    def test_percentile_requires_order_stats(self):
+        stats = WindowedStats(5)
+        for v in range(5):
+            stats.push(v)
+
+        with pytest.raises(ValueError):
+            stats.percentile_excluding_latest(95)
+
+    def test_ewma(self):
+        stats = WindowedStats(10, ewma_alpha=0.5)
+        for v in [10, 20, 30]:
+            stats.push(v)
+
+        assert stats.ewma == 22.5
+        assert ewma_step(None, 4, 0.1) == 4.0
+
+    def test_exclusive_quantile_needs_two_points(self):
+        with pytest.raises(ValueError):
+            exclusive_quantile([1.0], 19, 20)
+
+
+class TestCorrelationAccumulator:
+    """Tests for CorrelationAccumulator."""
+
+    def test_matches_pearson(self):
+        rng = random.Random(3)
+        a = [rng.random() for _ in range(50)]
+        b = [x * 0.5 + rng.random() for x in a]
+        accumulator = CorrelationAccumulator()
+        for x, y in zip(a, b):
+            accumulator.add(x, y)
+
+        assert accumulator.correlation() == pytest.approx(statistics.correlation(a, b))
+
+    def test_remove_supports_sliding_window(self):
+        pairs = [(1.0, 2.0), (2.0, 4.5), (3.0, 5.5), (4.0, 9.0)]
+        accumulator = CorrelationAccumulator()
+        for x, y in pairs:
+            accumulator.add(x, y)
+        accumulator.remove(*pairs[0])
+
+        a, b = zip(*pairs[1:])
+        assert accumulator.n == 3
+        assert accumulator.correlation() == pytest.approx(statistics.correlation(a, b))
+
+    def test_constant_side_is_zero(self):
+        accumulator = CorrelationAccumulator()
+        for x in [1.0, 2.0, 3.0]:
+            accumulator.add(x, 1.0)
+
+        assert accumulator.correlation() == 0.0
+
+
+def _legacy_alerts(records, window_size, token_multiplier=2.0, duration_multiplier=1.5):
+    """Token and duration alerts as the list-based detector computed them."""
+    tokens, durations, alerts = {}, {}, []
+    for key, token_count, duration in records:
+        tokens.setdefault(key, []).append(token_count)
+        durations.setdefault(key, []).append(duration)
+        tokens[key] = tokens[key][-window_size:]
+        durations[key] = durations[key][-window_size:]
+        if len(tokens[key]) < 5:
+            continue
+        baseline = statistics.mean(tokens[key][:-1])
+        if token_count > baseline * token_multiplier:
+            alerts.append(("token_spike", key, token_count, baseline))
+        history = durations[key][:-1]
+        if len(history) >= 5:
+            p95 = statistics.quantiles(history, n=20)[18]
+            if duration > p95 * duration_multiplier:
+                alerts.append(("duration_anomaly", key, duration, p95))
+    return alerts
+
+
+class TestDetectorEquivalence:
+    """The streaming detector must raise exactly the alerts the list-based one did."""
+
+    def test_token_and_duration_alerts_unchanged(self):
+        rng = random.Random(42)
+        records = []
+        for _ in range(2000):
+            key = rng.choice(["build", "test", "audit"])
+            token_count = rng.randint(500, 2000) * (5 if rng.random() < 0.03 else 1)
+            duration = round(rng.uniform(10, 60) * (4 if rng.random() < 0.03 else 1), 2)
+            records.append((key, token_count, duration))
+
+        detector = TelemetryAnomalyDetector(window_size=20)
+        alerts = []
+        for i, (key, token_count, duration) in enumerate(records):
+            for alert in detector.record_phase_outcome(f"p{i}", key, True, token_count, duration):
+                if alert.metric == "tokens":
+                    alerts.append(("token_spike", key, token_count, alert.baseline))
+                elif alert.metric == "duration":
+                    alerts.append(("duration_anomaly", key, duration, alert.threshold))
+
+        expected = _legacy_alerts(records, window_size=20)
+        assert alerts == expected
+        assert any(kind == "duration_anomaly" for kind, *_ in expected)
+
+    def test_histories_bounded_by_window(self):
+        detector = TelemetryAnomalyDetector(window_size=10)
+        start = datetime(2026, 1, 1)
+        for i in range(1000):
+            detector.record_phase_outcome(f"p{i}", "build", i % 3 != 0, 1000, 30.0)
+            detector.record_phase_outcome_for_correlation(
+                "build", True, start + timedelta(seconds=i)
+            )
+            detector.record_retrieval_quality(0.8, 3)
+            detector.record_hint_outcome(True, True)
+
+        assert len(detector.token_history["build"]) == 10
+        assert detector.token_history["build"].values.capacity == 10
+        assert len(detector.phase_outcomes_for_correlation["build"]) == 20
+        assert len(detector.retrieval_quality_history) == 20
+        assert len(detector.hint_effectiveness_history) == 30
+
+    def test_correlation_keeps_legacy_scaling(self):
+        detector = TelemetryAnomalyDetector()
+        a = [True, False, True, False, True]
+        b = [True, True, False, False, True]
+        fa = [1.0 if x else 0.0 for x in a]
+        fb = [1.0 if x else 0.0 for x in b]
+        n = len(fa)
+        legacy = (
+            sum((x - statistics.mean(fa)) * (y - statistics.mean(fb)) for x, y in zip(fa, fb))
+            / n
+            / (statistics.stdev(fa) * statistics.stdev(fb))
+        )
+
+        assert detector._calculate_correlation(a, b) == pytest.approx(legacy)
+
+    def test_alignment_matches_scan_for_unordered_timestamps(self):
+        start = datetime(2026, 1, 1)
+        outcomes_a = [(start + timedelta(seconds=30 * i), i % 2 == 0) for i in range(10)]
+        ordered_b = [(start + timedelta(seconds=30 * i + 5), i % 3 == 0) for i in range(10)]
+        unordered_b = list(reversed(ordered_b))
+
+        for outcomes_b in (ordered_b, unordered_b):
+            expected = []
+            for ts_a, success_a in outcomes_a:
+                for ts_b, success_b in outcomes_b:
+                    if abs((ts_a - ts_b).total_seconds()) < 60:
+                        expected.append((success_a, success_b))
+                        break
+            aligned = TelemetryAnomalyDetector._align_outcomes(outcomes_a, outcomes_b)
+            reference = CorrelationAccumulator()
+            for success_a, success_b in expected:
+                reference.add(float(success_a), float(success_b))
+
+            assert aligned.n == len(expected)
+            assert aligned.sum_ab == reference.sum_ab
+            assert aligned.sum_b == reference.sum_b
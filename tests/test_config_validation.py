@@ -63,6 +63,8 @@ def create_settings_with_overrides(**overrides) -> Settings:
         "allowed_external_hosts": [],
         "dual_audit_enabled": True,
         "dual_audit_secondary_model": None,
+        "dual_audit_concurrent": False,
+        "dual_audit_hedge_delay_seconds": 0.0,
         "sot_runtime_enforcement_enabled": True,
         "sot_drift_blocks_execution": False,
         "autopack_bind_address": "127.0.0.1",
@@ -139,6 +141,12 @@ class TestValidateConfig:
         errors = validate_config(config)
         assert any("db_operation_timeout must be > 0" in e for e in errors)
 
+    def test_invalid_dual_audit_hedge_delay(self):
+        """dual_audit_hedge_delay_seconds < 0 should fail validation."""
+        config = create_settings_with_overrides(dual_audit_hedge_delay_seconds=-0.5)
+        errors = validate_config(config)
+        assert any("dual_audit_hedge_delay_seconds must be >= 0" in e for e in errors)
+
     def test_invalid_sot_retrieval_max_chars(self):
         """autopack_sot_retrieval_max_chars < 100 should fail validation."""
         config = create_settings_with_overrides(autopack_sot_retrieval_max_chars=50)
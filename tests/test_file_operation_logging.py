@@ -91,7 +91,8 @@ class TestFileOperationLogging:
         self, selector: ContextSelector, temp_repo: Path, caplog
     ):
         """Verify OSError during glob operation is logged at ERROR level."""
-        with patch.object(Path, "glob", side_effect=OSError("Glob failed")):
+        # IMP-PERF-017: globs resolve against the workspace index, which lists the root
+        with patch("autopack.workspace_file_index.os.scandir", side_effect=OSError("Glob failed")):
             with caplog.at_level(logging.ERROR):
                 result = selector._get_files_by_glob("*.py")
 
@@ -0,0 +1,317 @@
+"""
+Tests for streaming NDJSON parse-and-stage (IMP-PERF-030).
+
+Tests that verify:
+- NDJSONStreamParser yields operations as soon as their line completes
+- Chunked streaming produces the same operations as one-pass parsing
+- Truncation is detected at the operation boundary with the cut-off file_path
+- NDJSONStagedApplier keeps changes in memory until commit()
+- NDJSONStreamPipeline aborts on the first invalid or failing operation
+- The builder executor stops generation early and never writes on abort
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from autopack.llm.anthropic.parsers.ndjson_parser import NDJSONParserWrapper
+from autopack.llm.anthropic.phase_executor import AnthropicPhaseExecutor
+from autopack.llm.prompts.anthropic_builder_prompts import build_system_prompt, build_user_prompt
+from autopack.llm.transport import StubTransport
+from autopack.ndjson_format import (
+    NDJSONOperation,
+    NDJSONParser,
+    NDJSONStagedApplier,
+    NDJSONStreamParser,
+    NDJSONStreamPipeline,
+)
+
+DELIVERABLES = [f"src/mod_{i}.py" for i in range(5)]
+
+
+def _ndjson(*objs) -> str:
+    return "\n".join(json.dumps(obj) for obj in objs)
+
+
+def _create(path: str, content: str = "x = 1\n") -> dict:
+    return {"type": "create", "file_path": path, "content": content}
+
+
+def _feed_in_chunks(target, text: str, size: int):
+    results = []
+    for start in range(0, len(text), size):
+        results.append(target.feed(text[start : start + size]))
+    return results
+
+
+class TestNDJSONStreamParser:
+    """Test incremental parsing of streamed output."""
+
+    def test_operation_yielded_when_line_completes(self):
+        parser = NDJSONStreamParser()
+
+        assert parser.feed('{"type": "create", "file_path": "a.py", ') == []
+        ops = parser.feed('"content": "x"}\n{"type": "delete"')
+
+        assert [op.file_path for op in ops] == ["a.py"]
+        assert parser.feed(', "file_path": "b.py"}') == []
+        result = parser.close()
+        assert [op.op_type for op in result.operations] == ["create", "delete"]
+        assert result.was_truncated is False
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_chunked_stream_matches_one_pass_parse(self, chunk_size):
+        output = "\n".join(
+            [
+                "```ndjson",
+                _ndjson({"type": "meta", "summary": "s", "total_operations": 3}),
+                _ndjson(_create("src/a.py")),
+                "{'type': 'create', 'file_path': 'src/b.py', 'content': 'y'}",
+                _ndjson(
+                    {
+                        "type": "modify",
+                        "file_path": "src/a.py",
+                        "operations": [{"type": "append", "content": "z"}],
+                    }
+                ),
+                "```",
+            ]
+        )
+        parser = NDJSONStreamParser()
+        _feed_in_chunks(parser, output, chunk_size)
+        streamed = parser.close()
+        batch = NDJSONParser().parse(output)
+
+        assert streamed.operations == batch.operations
+        assert streamed.total_expected == batch.total_expected == 3
+        assert streamed.lines_parsed == batch.lines_parsed
+
+    def test_truncation_reports_cut_off_operation(self):
+        output = _ndjson(_create("src/a.py")) + '\n{"type": "create", "file_path": "src/b.py", "con'
+        parser = NDJSONStreamParser()
+        _feed_in_chunks(parser, output, 5)
+        result = parser.close()
+
+        assert [op.file_path for op in result.operations] == ["src/a.py"]
+        assert result.was_truncated is True
+        assert result.truncated_file_path == "src/b.py"
+        assert result.lines_failed == 1
+
+
+    def test_closing_fence_does_not_hide_truncation(self):
+        output = "\n".join(
+            [
+                "```ndjson",
+                _ndjson(_create("src/a.py")),
+                '{"type": "create", "file_path": "src/b.py", "con',
+                "```",
+            ]
+        )
+        parser = NDJSONStreamParser()
+        _feed_in_chunks(parser, output, 7)
+        result = parser.close()
+
+        assert result.was_truncated is True
+        assert result.truncated_file_path == "src/b.py"
+        # Same verdict as the one-pass path, which strips fences before parsing
+        sanitized = "\n".join(ln for ln in output.splitlines() if not ln.startswith("```"))
+        assert NDJSONParser().parse(sanitized).was_truncated is True
+
+class TestNDJSONStagedApplier:
+    """Test in-memory staging of operations."""
+
+    def test_nothing_written_before_commit(self, tmp_path):
+        (tmp_path / "old.py").write_text("old\n", encoding="utf-8")
+        applier = NDJSONStagedApplier(tmp_path)
+
+        assert applier.stage(NDJSONOperation("create", "pkg/new.py", "a\n", None, None))
+        assert applier.stage(
+            NDJSONOperation(
+                "modify",
+                "pkg/new.py",
+                None,
+                [{"type": "replace", "old_text": "a", "new_text": "b"}],
+                None,
+            )
+        )
+        assert applier.stage(NDJSONOperation("delete", "old.py", None, None, None))
+
+        assert not (tmp_path / "pkg").exists()
+        assert (tmp_path / "old.py").exists()
+
+        result = applier.commit()
+        assert (tmp_path / "pkg" / "new.py").read_text(encoding="utf-8") == "b\n"
+        assert not (tmp_path / "old.py").exists()
+        assert result["applied"] == ["pkg/new.py", "pkg/new.py", "old.py"]
+        assert result["failed"] == []
+        assert result["total_operations"] == 3
+
+    def test_failed_and_skipped_operations(self, tmp_path):
+        applier = NDJSONStagedApplier(tmp_path)
+
+        assert applier.stage(NDJSONOperation("modify", "a.py", None, [], None))
+        assert not applier.stage(
+            NDJSONOperation("modify", "missing.py", None, [{"type": "append"}], None)
+        )
+
+        assert applier.skipped == ["a.py"]
+        assert applier.failed[0]["operation_index"] == 1
+        assert "non-existent" in applier.failed[0]["error"]
+
+
+class TestNDJSONStreamPipeline:
+    """Test the parse -> validate -> stage pipeline."""
+
+    def test_commit_writes_streamed_operations(self, tmp_path):
+        pipeline = NDJSONStreamPipeline(tmp_path)
+        output = _ndjson(_create("a.py"), _create("b.py"))
+
+        assert all(_feed_in_chunks(pipeline, output, 10))
+        result = pipeline.finish()
+        apply_result = pipeline.commit()
+
+        assert len(result.operations) == 2
+        assert apply_result["applied"] == ["a.py", "b.py"]
+        assert (tmp_path / "b.py").exists()
+
+    def test_validation_failure_aborts_and_discards(self, tmp_path):
+        def validate(op):
+            if op.file_path == "bad.py":
+                return {"error_code": "bad_path", "messages": ["bad.py not allowed"]}
+            return None
+
+        pipeline = NDJSONStreamPipeline(tmp_path, validate_op=validate)
+
+        assert pipeline.feed(_ndjson(_create("a.py")) + "\n") is True
+        assert pipeline.feed(_ndjson(_create("bad.py")) + "\n") is False
+        assert pipeline.feed(_ndjson(_create("c.py")) + "\n") is False
+
+        assert pipeline.aborted
+        assert pipeline.abort_error["error_code"] == "bad_path"
+        assert [op.file_path for op in pipeline.operations] == ["a.py", "bad.py"]
+        with pytest.raises(RuntimeError):
+            pipeline.commit()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failing_operation_aborts(self, tmp_path):
+        pipeline = NDJSONStreamPipeline(tmp_path)
+        modify = {
+            "type": "modify",
+            "file_path": "missing.py",
+            "operations": [{"type": "append", "content": "x"}],
+        }
+
+        assert pipeline.feed(_ndjson(modify) + "\n") is False
+        assert pipeline.abort_error["error_code"] == "ndjson_operation_failed"
+
+
+class TestNDJSONParserWrapperStreaming:
+    """Test NDJSONParserWrapper.parse with a streamed pipeline."""
+
+    @pytest.fixture
+    def response(self):
+        return Mock(usage=Mock(input_tokens=100, output_tokens=50))
+
+    def _phase_spec(self):
+        return {"phase_id": "p1", "scope": {"deliverables_manifest": ["src/"]}}
+
+    def test_manifest_violation_aborts_before_writing(self, tmp_path, response):
+        wrapper = NDJSONParserWrapper()
+        file_context = {"workspace": str(tmp_path)}
+        pipeline = wrapper.stream_pipeline(file_context, self._phase_spec())
+        output = _ndjson(_create("src/a.py"), _create("outside.py"), _create("src/b.py"))
+
+        fed = _feed_in_chunks(pipeline, output, 16)
+        result = wrapper.parse(
+            output, file_context, response, "m", self._phase_spec(), ndjson_stream=pipeline
+        )
+
+        assert fed[-1] is False
+        assert result.success is False
+        assert result.error == "ndjson_outside_manifest"
+        assert not (tmp_path / "src").exists()
+
+    def test_streamed_operations_committed_with_synthetic_diff(self, tmp_path, response):
+        wrapper = NDJSONParserWrapper()
+        file_context = {"workspace": str(tmp_path)}
+        pipeline = wrapper.stream_pipeline(file_context, self._phase_spec())
+        output = _ndjson(_create("./src/a.py"), _create("src/b.py"))
+
+        _feed_in_chunks(pipeline, output, 16)
+        result = wrapper.parse(
+            output, file_context, response, "m", self._phase_spec(), ndjson_stream=pipeline
+        )
+
+        assert result.success is True
+        assert "diff --git a/src/a.py b/src/a.py" in result.patch_content
+        assert (tmp_path / "src" / "b.py").exists()
+
+    def test_unstreamable_output_falls_back_to_one_pass_parse(self, tmp_path, response):
+        wrapper = NDJSONParserWrapper()
+        file_context = {"workspace": str(tmp_path)}
+        pipeline = wrapper.stream_pipeline(file_context, self._phase_spec())
+        output = json.dumps({"files": [_create("src/a.py")]}, indent=2)
+
+        _feed_in_chunks(pipeline, output, 16)
+        result = wrapper.parse(
+            output, file_context, response, "m", self._phase_spec(), ndjson_stream=pipeline
+        )
+
+        assert result.success is True
+        assert (tmp_path / "src" / "a.py").exists()
+
+
+class TestExecutorStreaming:
+    """Test AnthropicPhaseExecutor wiring against the local StubTransport."""
+
+    @pytest.fixture
+    def client(self):
+        client = Mock()
+        client._build_system_prompt = Mock(side_effect=build_system_prompt)
+        client._build_user_prompt = Mock(side_effect=build_user_prompt)
+        client._parse_ndjson_output = Mock(
+            side_effect=lambda *args, **kwargs: NDJSONParserWrapper().parse(*args, **kwargs)
+        )
+        return client
+
+    def _execute(self, executor, tmp_path):
+        return executor.execute_phase(
+            phase_spec={
+                "phase_id": "phase-1",
+                "description": "Create modules",
+                "task_category": "feature",
+                "complexity": "medium",
+                "scope": {"deliverables": DELIVERABLES, "deliverables_manifest": DELIVERABLES},
+            },
+            file_context={"workspace": str(tmp_path), "existing_files": {}},
+            max_tokens=4096,
+            model="claude-sonnet-4-5",
+        )
+
+    def test_bad_operation_stops_generation(self, client, tmp_path):
+        output = _ndjson(
+            _create(DELIVERABLES[0]), _create("outside.py"), *[_create(p) for p in DELIVERABLES]
+        )
+        transport = StubTransport(responses=[output], chunk_size=32)
+
+        result = self._execute(AnthropicPhaseExecutor(transport, client), tmp_path)
+
+        assert transport.requests[0]["stop_reason"] == "aborted"
+        assert len(result.raw_output) < len(output)
+        assert result.success is False
+        assert result.error == "ndjson_outside_manifest"
+        assert not (tmp_path / "src").exists()
+
+    def test_streamed_phase_writes_all_deliverables(self, client, tmp_path):
+        output = _ndjson(*[_create(p) for p in DELIVERABLES])
+        transport = StubTransport(responses=[output], chunk_size=32)
+
+        result = self._execute(AnthropicPhaseExecutor(transport, client), tmp_path)
+
+        assert result.success is True
+        assert transport.requests[0]["stop_reason"] == "end_turn"
+        assert sorted(p.name for p in (tmp_path / "src").iterdir()) == [
+            f"mod_{i}.py" for i in range(5)
+        ]
+        assert client._parse_ndjson_output.call_args.kwargs["ndjson_stream"] is not None
@@ -6,6 +6,7 @@ Ensures that:
 2. Chunks are indexed into MemoryService
 3. Retrieval works with strict caps
 4. Features are opt-in via env flags
+5. Re-indexing is incremental via the chunk manifest (IMP-PERF-015)
 """
 
 import os
@@ -15,6 +16,7 @@ import pytest
 
 from autopack.memory.memory_service import MemoryService
 from autopack.memory.sot_indexing import (
+    SotIndexManifest,
     chunk_sot_file,
     chunk_sot_json,
     chunk_text,
@@ -25,6 +27,16 @@ from autopack.memory.sot_indexing import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path_factory, monkeypatch):
+    """Run each test from a scratch directory.
+
+    MemoryService falls back to a cwd-relative FAISS index directory, so without
+    this the SOT collections (and their journal/id-map files) land in the repo.
+    """
+    monkeypatch.chdir(tmp_path_factory.mktemp("cwd"))
+
+
 class TestSOTChunking:
     """Test SOT file chunking logic."""
 
@@ -718,5 +730,109 @@ class TestSOT6FileSupport:
             assert result["indexed"] >= 6  # At least one chunk per file
 
 
+class TestSOTIncrementalReindex:
+    """Test manifest-driven incremental re-indexing (IMP-PERF-015)."""
+
+    ENV = {
+        "AUTOPACK_ENABLE_MEMORY": "true",
+        "AUTOPACK_ENABLE_SOT_MEMORY_INDEXING": "true",
+    }
+
+    @staticmethod
+    def _ledger(entries: int) -> str:
+        return "".join(
+            f"### BUILD-{i:03d} | Entry {i}\n" + f"Details for build {i}. " * 20 + "\n\n"
+            for i in range(entries)
+        )
+
+    def test_manifest_diff_reports_new_and_vanished_chunks(self, tmp_path):
+        """Test that diff returns only changed docs and the IDs that disappeared."""
+        sot_path = tmp_path / "BUILD_HISTORY.md"
+        sot_path.write_text(self._ledger(3), encoding="utf-8")
+        docs = chunk_sot_file(sot_path, "autopack", max_chars=400, overlap_chars=50)
+
+        manifest = SotIndexManifest(tmp_path / "manifest.json")
+        manifest.update("BUILD_HISTORY.md", sot_path, docs[:-1], {})
+        changed, vanished = manifest.diff("BUILD_HISTORY.md", docs[1:])
+
+        assert [d["id"] for d in changed] == [docs[-1]["id"]]
+        assert vanished == [docs[0]["id"]]
+
+    def test_manifest_round_trips_and_detects_changes(self, tmp_path):
+        """Test that a saved manifest reloads and notices file or parameter changes."""
+        sot_path = tmp_path / "DEBUG_LOG.md"
+        sot_path.write_text("# Debug\nline\n", encoding="utf-8")
+        params = {"max_chars": 1200, "overlap_chars": 150}
+
+        manifest = SotIndexManifest(tmp_path / "manifest.json")
+        manifest.update("DEBUG_LOG.md", sot_path, [], params)
+        manifest.save()
+        reloaded = SotIndexManifest(tmp_path / "manifest.json")
+
+        assert reloaded.is_unchanged("DEBUG_LOG.md", sot_path, params)
+        assert not reloaded.is_unchanged("DEBUG_LOG.md", sot_path, {"max_chars": 800})
+        sot_path.write_text("# Debug\nline\nmore\n", encoding="utf-8")
+        assert not reloaded.is_unchanged("DEBUG_LOG.md", sot_path, params)
+
+    def test_unchanged_ledger_not_rechunked(self, tmp_path):
+        """Test that re-indexing an unchanged file skips chunking entirely."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "BUILD_HISTORY.md").write_text(self._ledger(5), encoding="utf-8")
+
+        with patch.dict(os.environ, self.ENV):
+            service = MemoryService(
+                index_dir=str(tmp_path / ".faiss"), enabled=True, use_qdrant=False
+            )
+            first = service.index_sot_docs("autopack", tmp_path)
+            with patch("autopack.memory.sot_indexing.chunk_text") as mock_chunk:
+                second = service.index_sot_docs("autopack", tmp_path)
+
+        assert first["indexed"] > 0
+        mock_chunk.assert_not_called()
+        assert second["indexed"] == 0
+        assert second["unchanged_files"] == 1
+
+    def test_appended_entries_only_embed_new_chunks(self, tmp_path):
+        """Test that appending to a ledger embeds only the new tail chunks."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        ledger = docs_dir / "BUILD_HISTORY.md"
+        ledger.write_text(self._ledger(5), encoding="utf-8")
+
+        with patch.dict(os.environ, self.ENV):
+            service = MemoryService(
+                index_dir=str(tmp_path / ".faiss"), enabled=True, use_qdrant=False
+            )
+            first = service.index_sot_docs("autopack", tmp_path)
+            ledger.write_text(self._ledger(6), encoding="utf-8")
+            second = service.index_sot_docs("autopack", tmp_path)
+
+            stored = service.store.count("sot_docs", filter={"sot_file": "BUILD_HISTORY.md"})
+
+        assert 0 < second["indexed"] < first["indexed"]
+        assert stored == first["indexed"] + second["indexed"] - second["deleted"]
+
+    def test_removed_file_chunks_deleted(self, tmp_path):
+        """Test that chunks of a deleted SOT file are removed from the store."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        (docs_dir / "BUILD_HISTORY.md").write_text(self._ledger(2), encoding="utf-8")
+        (docs_dir / "FUTURE_PLAN.md").write_text("# Plan\nShip it.", encoding="utf-8")
+
+        with patch.dict(os.environ, self.ENV):
+            service = MemoryService(
+                index_dir=str(tmp_path / ".faiss"), enabled=True, use_qdrant=False
+            )
+            service.index_sot_docs("autopack", tmp_path)
+            (docs_dir / "FUTURE_PLAN.md").unlink()
+            result = service.index_sot_docs("autopack", tmp_path)
+
+            remaining = service.store.count("sot_docs", filter={"sot_file": "FUTURE_PLAN.md"})
+
+        assert result["deleted"] >= 1
+        assert remaining == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
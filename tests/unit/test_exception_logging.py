@@ -59,11 +59,12 @@ class TestAnomalyDetectorExceptionLogging:
 
         detector = TelemetryAnomalyDetector()
         # Add minimal history that might cause calculation issues
-        detector.duration_history["test_phase"] = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        for i, duration in enumerate([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]):
+            detector.record_phase_outcome(f"phase-{i}", "test_phase", True, 100, duration)
 
         with caplog.at_level(logging.DEBUG):
             with patch(
-                "autopack.telemetry.anomaly_detector.quantiles",
+                "autopack.telemetry.streaming_stats.WindowedStats.percentile_excluding_latest",
                 side_effect=ValueError("statistics error"),
             ):
                 result = detector._check_duration_anomaly("test_phase", 10.0)
@@ -82,7 +83,7 @@ class TestAnomalyDetectorExceptionLogging:
 
         with caplog.at_level(logging.DEBUG):
             with patch(
-                "autopack.telemetry.anomaly_detector.stdev",
+                "autopack.telemetry.streaming_stats.CorrelationAccumulator.correlation",
                 side_effect=ValueError("statistics error"),
             ):
                 result = detector._calculate_correlation(outcomes_a, outcomes_b)